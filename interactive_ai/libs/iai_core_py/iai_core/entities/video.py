@@ -28,6 +28,7 @@ class Video(Media, PersistentEntity):
                   The stride also determines which frames of the video will be analysed upon analysis request.
     :param creation_date: the date time on which the video is created.
         Set to None to automatically assign it to the time of object creation.
+    :param codec: name of the codec of the video stream, as probed at upload time. None if unknown.
     """
 
     def __init__(  # noqa: PLR0913
@@ -45,6 +46,7 @@ class Video(Media, PersistentEntity):
         creation_date: datetime.datetime | None = None,
         ephemeral: bool = True,
         extension: VideoExtensions = VideoExtensions.MP4,
+        codec: str | None = None,
     ) -> None:
         creation_date = now() if creation_date is None else creation_date
         stride = int(fps) if stride is None else stride  # default to 1 Hz
@@ -65,6 +67,7 @@ class Video(Media, PersistentEntity):
         self.stride = stride
         self._fps = fps
         self._total_frames = total_frames
+        self.codec = codec
 
     @property
     def media_identifier(self) -> VideoIdentifier:
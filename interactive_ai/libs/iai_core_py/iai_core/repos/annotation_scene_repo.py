@@ -3,7 +3,7 @@
 
 """This module implements the repository for annotation entities"""
 
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterator, Sequence
 from functools import partial
 from typing import Any, cast
 
@@ -136,6 +136,15 @@ class AnnotationSceneRepo(DatasetStorageBasedSessionRepo[AnnotationScene]):
         query = {"media_identifier.media_id": IDToMongo.forward(media_id)}
         self.delete_all(extra_filter=query)
 
+    def delete_all_by_media_ids(self, media_ids: Sequence[ID]) -> None:
+        """
+        Delete all annotation entities associated with any of the given media from the database, in a single query.
+
+        :param media_ids: IDs of the media to delete entities for
+        """
+        query = {"media_identifier.media_id": {"$in": [IDToMongo.forward(media_id) for media_id in media_ids]}}
+        self.delete_all(extra_filter=query)
+
     def count_all_by_identifier_and_annotation_kind(
         self,
         media_identifier: MediaIdentifierEntity,
@@ -330,6 +339,39 @@ class AnnotationSceneRepo(DatasetStorageBasedSessionRepo[AnnotationScene]):
             },
         ]
 
+    def _build_query_for_video_frame_annotations(
+        self,
+        video_id: ID,
+        annotation_kind: AnnotationSceneKind,
+        start_frame: int | None,
+        end_frame: int | None,
+        frame_skip: int | None,
+        task_id: ID | None,
+        model_ids: set[ID] | None,
+    ) -> list[dict]:
+        """
+        Build the aggregation pipeline matching the latest non-empty annotation scene of each frame of a video.
+
+        See `get_video_frame_annotations_by_video_id` for the meaning of the parameters.
+        """
+        frame_index_query: dict[str, Any] = {}
+        if start_frame is not None:
+            frame_index_query["$gte"] = start_frame
+        if end_frame is not None:
+            frame_index_query["$lte"] = end_frame
+        if frame_skip is not None and frame_skip > 1:
+            frame_index_query["$mod"] = [frame_skip, 0]
+        pipeline: list[dict] = self._build_query_for_latest_annotations_by_media_id(
+            media_id=video_id,
+            kind=[annotation_kind],
+            task_id=task_id,
+            model_ids=model_ids,
+            frame_index_query=frame_index_query if frame_index_query else None,
+        )
+        # Filter out empty annotations which were created when the video was uploaded
+        pipeline.append({"$match": {"annotation.label_ids": {"$not": {"$size": 0}}}})
+        return pipeline
+
     def get_video_frame_annotations_by_video_id(  # noqa: PLR0913
         self,
         video_id: ID,
@@ -356,22 +398,15 @@ class AnnotationSceneRepo(DatasetStorageBasedSessionRepo[AnnotationScene]):
         :return A tuple with a list of annotation scenes and the total matching annotation scenes (without applying a
             limit)
         """
-        frame_index_query: dict[str, Any] = {}
-        if start_frame is not None:
-            frame_index_query["$gte"] = start_frame
-        if end_frame is not None:
-            frame_index_query["$lte"] = end_frame
-        if frame_skip is not None and frame_skip > 1:
-            frame_index_query["$mod"] = [frame_skip, 0]
-        pipeline: list[dict] = self._build_query_for_latest_annotations_by_media_id(
-            media_id=video_id,
-            kind=[annotation_kind],
+        pipeline = self._build_query_for_video_frame_annotations(
+            video_id=video_id,
+            annotation_kind=annotation_kind,
+            start_frame=start_frame,
+            end_frame=end_frame,
+            frame_skip=frame_skip,
             task_id=task_id,
             model_ids=model_ids,
-            frame_index_query=frame_index_query if frame_index_query else None,
         )
-        # Filter out empty annotations which were created when the video was uploaded
-        pipeline.append({"$match": {"annotation.label_ids": {"$not": {"$size": 0}}}})
         sort_and_limit_pipeline: list[dict[str, Any]] = [{"$sort": {"_id.frame_index": 1}}]
         if limit is not None:
             sort_and_limit_pipeline.append({"$limit": limit})
@@ -393,6 +428,116 @@ class AnnotationSceneRepo(DatasetStorageBasedSessionRepo[AnnotationScene]):
 
         return annotation_scenes, count
 
+    def get_video_frame_annotations_cursor_by_video_id(  # noqa: PLR0913
+        self,
+        video_id: ID,
+        annotation_kind: AnnotationSceneKind = AnnotationSceneKind.ANNOTATION,
+        start_frame: int | None = None,
+        end_frame: int | None = None,
+        frame_skip: int | None = None,
+        limit: int | None = None,
+        task_id: ID | None = None,
+        model_ids: set[ID] | None = None,
+    ) -> CursorIterator[AnnotationScene]:
+        """
+        Iterate over the latest annotation scene of the video frames that have annotations of the given type,
+        sorted by frame index.
+
+        Unlike `get_video_frame_annotations_by_video_id`, the annotation scenes are fetched from the database in
+        batches while iterating, instead of being returned all at once; use `count_video_frame_annotations_by_video_id`
+        to get the total number of matching annotation scenes.
+
+        :param video_id: ID of the video
+        :param annotation_kind: Type of annotations to consider (user annotation vs prediction).
+        :param start_frame: return annotation scenes for frame indices greater than or equal to start frame,
+        :param end_frame: return annotation scenes for frame indices smaller than or equal end frame,
+        :param frame_skip: return annotation scenes for frame indices that are a multiple of frame_skip,
+        :param limit: sets a maximum number of annotation scenes to return,
+        :param task_id: ID of the task (only if kind is TASK_PREDICTION).
+        :param model_ids: ID of the models to be used for filtering (only for kind
+            PREDICTION or TASK_PREDICTION)
+        :return: CursorIterator over the annotation scenes
+        """
+        pipeline = self._build_query_for_video_frame_annotations(
+            video_id=video_id,
+            annotation_kind=annotation_kind,
+            start_frame=start_frame,
+            end_frame=end_frame,
+            frame_skip=frame_skip,
+            task_id=task_id,
+            model_ids=model_ids,
+        )
+        pipeline.append({"$sort": {"_id.frame_index": 1}})
+        if limit is not None:
+            pipeline.append({"$limit": limit})
+        pipeline.append({"$replaceRoot": {"newRoot": "$annotation"}})
+        return self.cursor_wrapper(self.aggregate_read(pipeline))
+
+    def count_video_frame_annotations_by_video_id(
+        self,
+        video_id: ID,
+        annotation_kind: AnnotationSceneKind = AnnotationSceneKind.ANNOTATION,
+        start_frame: int | None = None,
+        end_frame: int | None = None,
+        frame_skip: int | None = None,
+        task_id: ID | None = None,
+        model_ids: set[ID] | None = None,
+    ) -> int:
+        """
+        Count the video frames that have annotations of the given type.
+
+        See `get_video_frame_annotations_by_video_id` for the meaning of the parameters.
+
+        :return: number of matching annotation scenes
+        """
+        pipeline = self._build_query_for_video_frame_annotations(
+            video_id=video_id,
+            annotation_kind=annotation_kind,
+            start_frame=start_frame,
+            end_frame=end_frame,
+            frame_skip=frame_skip,
+            task_id=task_id,
+            model_ids=model_ids,
+        )
+        pipeline.append({"$count": "count"})
+        result = next(self.aggregate_read(pipeline), None)
+        return result["count"] if result else 0
+
+    def get_video_frame_label_ids_by_video_id(
+        self,
+        video_id: ID,
+        start_frame: int,
+        end_frame: int,
+        annotation_kind: AnnotationSceneKind = AnnotationSceneKind.ANNOTATION,
+    ) -> Iterator[tuple[int, set[ID]]]:
+        """
+        Stream the label IDs of the latest annotation scene of each annotated frame of a video.
+
+        Only the frame index and the label IDs of the scenes are fetched, with a single query, so that the frames of
+        a long video can be scanned without loading every annotation scene in memory.
+        Frames whose latest annotation scene has no labels are skipped.
+
+        :param video_id: ID of the video
+        :param start_frame: only consider frames whose index is greater than or equal to start frame
+        :param end_frame: only consider frames whose index is smaller than or equal to end frame
+        :param annotation_kind: Type of annotations to consider (user annotation vs prediction).
+        :return: Iterator over (frame index, label IDs including the empty ones) tuples, sorted by frame index
+        """
+        pipeline: list[dict] = self._build_query_for_latest_annotations_by_media_id(
+            media_id=video_id,
+            kind=[annotation_kind],
+            frame_index_query={"$gte": start_frame, "$lte": end_frame},
+        )
+        pipeline.extend(
+            [
+                {"$match": {"annotation.label_ids": {"$not": {"$size": 0}}}},
+                {"$project": {"_id": 0, "frame_index": "$_id.frame_index", "label_ids": "$annotation.label_ids"}},
+                {"$sort": {"frame_index": 1}},
+            ]
+        )
+        for doc in self.aggregate_read(pipeline):
+            yield doc["frame_index"], {IDToMongo.backward(label_id) for label_id in doc["label_ids"]}
+
     def get_annotated_video_frame_identifiers_by_video_id(
         self,
         video_id: ID,
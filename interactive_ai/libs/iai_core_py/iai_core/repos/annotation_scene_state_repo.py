@@ -80,6 +80,15 @@ class AnnotationSceneStateRepo(DatasetStorageBasedSessionRepo[AnnotationSceneSta
         query = {"media_identifier.media_id": IDToMongo.forward(media_id)}
         self.delete_all(extra_filter=query)
 
+    def delete_all_by_media_ids(self, media_ids: Sequence[ID]) -> None:
+        """
+        Delete all AnnotationSceneState that belong to any of the given media, in a single query.
+
+        :param media_ids: IDs of the media to delete entities for
+        """
+        query = {"media_identifier.media_id": {"$in": [IDToMongo.forward(media_id) for media_id in media_ids]}}
+        self.delete_all(extra_filter=query)
+
     def get_all_by_state_for_task(
         self, matchable_annotation_states_per_task: dict[ID, Sequence[AnnotationState]]
     ) -> CursorIterator[AnnotationSceneState]:
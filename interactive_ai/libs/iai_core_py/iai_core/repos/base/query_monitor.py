@@ -0,0 +1,361 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""
+Monitoring of the MongoDB operations issued by the repos.
+
+The collections of the repos are wrapped by `MonitoredCollection`, which reports each operation to the `QueryMonitor`
+once it completes, with its duration and the number of documents returned to the client. The monitor keeps the slowest
+operations in a ring buffer and forwards every operation to the registered listeners, e.g. to record OpenTelemetry
+metrics. `query_budget` counts the operations issued in a block of code, to assert the number of round trips of an
+endpoint in the tests.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Generator, Iterable
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+from pymongo.collection import Collection
+
+logger = logging.getLogger(__name__)
+
+# Operations taking at least this time are kept in the ring buffer of slow operations and logged
+MONGO_SLOW_OPERATION_THRESHOLD_MS = float(os.environ.get("MONGO_SLOW_OPERATION_THRESHOLD_MS", "500"))
+# Number of slow operations kept in the ring buffer
+MONGO_SLOW_OPERATIONS_BUFFER_SIZE = int(os.environ.get("MONGO_SLOW_OPERATIONS_BUFFER_SIZE", "100"))
+
+# Methods of the pymongo collection that return a cursor: the operation completes when the cursor is consumed
+CURSOR_OPERATIONS = frozenset({"aggregate", "find"})
+# Methods of the pymongo collection that return a single document or None
+DOCUMENT_OPERATIONS = frozenset({"find_one", "find_one_and_delete", "find_one_and_replace", "find_one_and_update"})
+# Other methods of the pymongo collection that send a command to the server
+COMMAND_OPERATIONS = frozenset(
+    {
+        "bulk_write",
+        "count_documents",
+        "delete_many",
+        "delete_one",
+        "distinct",
+        "estimated_document_count",
+        "insert_many",
+        "insert_one",
+        "replace_one",
+        "update_many",
+        "update_one",
+    }
+)
+# Methods of the pymongo cursors that return the cursor itself
+CURSOR_CHAINING_METHODS = frozenset(
+    {"add_option", "batch_size", "collation", "comment", "hint", "limit", "max_time_ms", "skip", "sort", "where"}
+)
+
+
+@dataclass(frozen=True)
+class MongoOperation:
+    """
+    Operation issued to a MongoDB collection.
+
+    :param collection: Name of the collection
+    :param operation: Name of the pymongo method, e.g. 'find' or 'update_one'
+    :param duration: Time spent waiting for the server in seconds, over all the batches for cursor operations
+    :param documents: Number of documents returned to the client
+    :param query: Filter or aggregation pipeline of the operation, if any
+    :param timestamp: Time at which the operation completed
+    """
+
+    collection: str
+    operation: str
+    duration: float
+    documents: int
+    query: dict | list | None = field(default=None, repr=False)
+    timestamp: datetime = field(default_factory=lambda: datetime.now(tz=timezone.utc))
+
+
+class QueryBudgetExceededError(AssertionError):
+    """Raised when a block of code issues more MongoDB operations than its query budget"""
+
+
+class QueryBudget:
+    """
+    Counter of the MongoDB operations issued within a `query_budget` block.
+
+    :param max_operations: Maximum number of operations allowed in the block
+    :param collections: If provided, only the operations on these collections are counted
+    """
+
+    def __init__(self, max_operations: int, collections: Iterable[str] | None = None) -> None:
+        self.max_operations = max_operations
+        self.collections = frozenset(collections) if collections is not None else None
+        self.operations: list[tuple[str, str]] = []
+
+    @property
+    def count(self) -> int:
+        """Number of operations issued so far"""
+        return len(self.operations)
+
+    def add(self, collection: str, operation: str) -> None:
+        """Count an operation issued on the collection"""
+        if self.collections is None or collection in self.collections:
+            self.operations.append((collection, operation))
+
+
+_ACTIVE_QUERY_BUDGETS: ContextVar[tuple[QueryBudget, ...]] = ContextVar("active_query_budgets", default=())
+
+
+@contextmanager
+def query_budget(max_operations: int, collections: Iterable[str] | None = None) -> Generator[QueryBudget, None, None]:
+    """
+    Count the MongoDB operations issued within the block, and fail if there are more than `max_operations`.
+
+    Budgets can be nested. The operations issued in threads started within the block are counted if the thread runs
+    in a copy of the context of the block, as for the endpoints run by the FastAPI test client.
+
+    :example:
+
+        .. code-block:: python
+            with query_budget(max_operations=3):
+                client.get(f"{API_PROJECT_PATTERN}/datasets/{dataset_id}/media")
+
+    :param max_operations: Maximum number of operations allowed in the block
+    :param collections: If provided, only the operations on these collections are counted
+    :raises QueryBudgetExceededError: if the block issues more operations than allowed
+    """
+    budget = QueryBudget(max_operations=max_operations, collections=collections)
+    token = _ACTIVE_QUERY_BUDGETS.set((*_ACTIVE_QUERY_BUDGETS.get(), budget))
+    try:
+        yield budget
+    finally:
+        _ACTIVE_QUERY_BUDGETS.reset(token)
+    if budget.count > budget.max_operations:
+        operations = "\n".join(f"  {collection}.{operation}" for collection, operation in budget.operations)
+        raise QueryBudgetExceededError(
+            f"{budget.count} MongoDB operations were issued, the budget is {budget.max_operations}:\n{operations}"
+        )
+
+
+class QueryMonitor:
+    """
+    Collects the MongoDB operations reported by the monitored collections.
+
+    The monitor keeps the operations slower than MONGO_SLOW_OPERATION_THRESHOLD_MS in a ring buffer and forwards every
+    operation to the listeners registered with `add_listener`.
+    """
+
+    _lock = threading.Lock()
+    _slow_operations: deque[MongoOperation] = deque(maxlen=MONGO_SLOW_OPERATIONS_BUFFER_SIZE)
+    _listeners: list[Callable[[MongoOperation], None]] = []
+
+    @staticmethod
+    def add_listener(listener: Callable[[MongoOperation], None]) -> None:
+        """
+        Register a function called with each completed operation. Listeners must be fast.
+
+        :param listener: Function to register
+        """
+        with QueryMonitor._lock:
+            if listener not in QueryMonitor._listeners:
+                QueryMonitor._listeners = [*QueryMonitor._listeners, listener]
+
+    @staticmethod
+    def remove_listener(listener: Callable[[MongoOperation], None]) -> None:
+        """
+        Unregister a listener registered with `add_listener`.
+
+        :param listener: Function to unregister
+        """
+        with QueryMonitor._lock:
+            QueryMonitor._listeners = [registered for registered in QueryMonitor._listeners if registered != listener]
+
+    @staticmethod
+    def get_slow_operations() -> list[MongoOperation]:
+        """Get the most recent slow operations, from the oldest to the newest"""
+        with QueryMonitor._lock:
+            return list(QueryMonitor._slow_operations)
+
+    @staticmethod
+    def clear_slow_operations() -> None:
+        """Empty the ring buffer of slow operations"""
+        with QueryMonitor._lock:
+            QueryMonitor._slow_operations.clear()
+
+    @staticmethod
+    def on_operation_issued(collection: str, operation: str) -> None:
+        """
+        Count an operation in the active query budgets. Called when the operation is issued.
+
+        :param collection: Name of the collection
+        :param operation: Name of the pymongo method
+        """
+        for budget in _ACTIVE_QUERY_BUDGETS.get():
+            budget.add(collection=collection, operation=operation)
+
+    @staticmethod
+    def on_operation_completed(operation: MongoOperation) -> None:
+        """
+        Record a completed operation. Called when the result of the operation is fully received.
+
+        :param operation: Completed operation
+        """
+        if operation.duration * 1000 >= MONGO_SLOW_OPERATION_THRESHOLD_MS:
+            logger.warning(
+                "Slow MongoDB operation: %s.%s took %.0f ms and returned %d documents",
+                operation.collection,
+                operation.operation,
+                operation.duration * 1000,
+                operation.documents,
+            )
+            with QueryMonitor._lock:
+                QueryMonitor._slow_operations.append(operation)
+        for listener in QueryMonitor._listeners:
+            try:
+                listener(operation)
+            except Exception:
+                logger.exception("Failed to report a MongoDB operation to listener %s", listener)
+
+
+def _get_query(operation: str, args: tuple, kwargs: dict) -> dict | list | None:
+    """Returns the filter or the pipeline passed to a pymongo collection method"""
+    if operation == "aggregate":
+        return kwargs.get("pipeline", args[0] if args else None)
+    if operation in ("bulk_write", "insert_many", "insert_one"):
+        return None
+    if operation == "distinct":
+        return kwargs.get("filter", args[1] if len(args) > 1 else None)
+    return kwargs.get("filter", args[0] if args else None)
+
+
+class MonitoredCursor:
+    """
+    Wrapper of a pymongo cursor that reports its operation to the QueryMonitor when the cursor is exhausted or closed.
+
+    :param cursor: Cursor returned by the collection
+    :param collection: Name of the collection
+    :param operation: Name of the pymongo method that returned the cursor
+    :param query: Filter or aggregation pipeline of the operation
+    :param duration: Time spent in the method that returned the cursor, in seconds
+    """
+
+    def __init__(
+        self, cursor: Any, collection: str, operation: str, query: dict | list | None, duration: float
+    ) -> None:
+        self._cursor = cursor
+        self._collection_name = collection
+        self._operation = operation
+        self._query = query
+        self._duration = duration
+        self._documents = 0
+        self._completed = False
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            # Private attributes are not forwarded, in particular while the wrapper is initialized or deleted
+            raise AttributeError(name)
+        attribute = getattr(self._cursor, name)
+        if name not in CURSOR_CHAINING_METHODS:
+            return attribute
+
+        def chain(*args, **kwargs) -> "MonitoredCursor":
+            attribute(*args, **kwargs)
+            return self
+
+        return chain
+
+    def __iter__(self) -> "MonitoredCursor":
+        return self
+
+    def __next__(self) -> Any:
+        start_time = time.perf_counter()
+        try:
+            document = next(self._cursor)
+        except StopIteration:
+            self._duration += time.perf_counter() - start_time
+            self._complete()
+            raise
+        self._duration += time.perf_counter() - start_time
+        self._documents += 1
+        return document
+
+    next = __next__
+
+    def __enter__(self) -> "MonitoredCursor":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        self._complete()
+
+    def close(self) -> None:
+        """Close the cursor"""
+        self._cursor.close()
+        self._complete()
+
+    def _complete(self) -> None:
+        if self._completed:
+            return
+        self._completed = True
+        QueryMonitor.on_operation_completed(
+            MongoOperation(
+                collection=self._collection_name,
+                operation=self._operation,
+                duration=self._duration,
+                documents=self._documents,
+                query=self._query,
+            )
+        )
+
+
+class MonitoredCollection:
+    """
+    Wrapper of a pymongo collection that reports the operations issued through it to the QueryMonitor.
+
+    Methods that do not send an operation to the server are forwarded to the collection as is.
+
+    :param collection: Collection to monitor
+    """
+
+    def __init__(self, collection: Collection) -> None:
+        self._monitored_collection = collection
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._monitored_collection, name)
+        if name in CURSOR_OPERATIONS or name in DOCUMENT_OPERATIONS or name in COMMAND_OPERATIONS:
+            return self._monitor(name, attribute)
+        return attribute
+
+    def _monitor(self, operation: str, method: Callable) -> Callable:
+        collection_name = self._monitored_collection.name
+
+        def monitored_method(*args, **kwargs) -> Any:
+            QueryMonitor.on_operation_issued(collection=collection_name, operation=operation)
+            query = _get_query(operation, args, kwargs)
+            start_time = time.perf_counter()
+            result = method(*args, **kwargs)
+            duration = time.perf_counter() - start_time
+            if operation in CURSOR_OPERATIONS:
+                return MonitoredCursor(
+                    result, collection=collection_name, operation=operation, query=query, duration=duration
+                )
+            if operation in DOCUMENT_OPERATIONS:
+                documents = 0 if result is None else 1
+            elif operation == "distinct":
+                documents = len(result)
+            else:
+                documents = 0
+            QueryMonitor.on_operation_completed(
+                MongoOperation(
+                    collection=collection_name, operation=operation, duration=duration, documents=documents, query=query
+                )
+            )
+            return result
+
+        return monitored_method
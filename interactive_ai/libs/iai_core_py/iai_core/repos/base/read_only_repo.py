@@ -18,6 +18,7 @@ from iai_core.repos.mappers.cursor_iterator import CursorIterator
 from iai_core.repos.mappers.mongodb_mappers.id_mapper import IDToMongo
 
 from .mongo_connector import MongoConnector
+from .query_monitor import MonitoredCollection
 from geti_types import ID, PersistentEntity
 
 PersistedEntityT = TypeVar("PersistedEntityT", bound=PersistentEntity)
@@ -49,7 +50,10 @@ class ReadOnlyRepo(Generic[PersistedEntityT], metaclass=abc.ABCMeta):
     @property
     def _collection(self) -> Collection:
         if self.__collection is None:
-            self.__collection = MongoConnector.get_collection(collection_name=self._collection_name)
+            # The operations issued through the collection are reported to the QueryMonitor
+            self.__collection = cast(
+                "Collection", MonitoredCollection(MongoConnector.get_collection(collection_name=self._collection_name))
+            )
         return self.__collection
 
     @property
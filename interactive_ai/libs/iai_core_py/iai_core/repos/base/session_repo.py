@@ -26,6 +26,7 @@ from iai_core.repos.mappers.mongodb_mappers.id_mapper import IDToMongo
 
 from .constants import ID_FIELD_NAME, LOCATION_FIELD_NAME, ORGANIZATION_ID_FIELD_NAME, WORKSPACE_ID_FIELD_NAME
 from .mongo_connector import MongoConnector
+from .query_monitor import MonitoredCollection
 from geti_types import CTX_SESSION_VAR, ID, PersistentEntity, Session, make_session
 
 PersistedEntityT = TypeVar("PersistedEntityT", bound=PersistentEntity)
@@ -102,7 +103,10 @@ class SessionBasedRepo(Generic[PersistedEntityT], metaclass=abc.ABCMeta):
     @property
     def _collection(self) -> Collection:
         if self.__collection is None:
-            self.__collection = MongoConnector.get_collection(collection_name=self._collection_name)
+            # The operations issued through the collection are reported to the QueryMonitor
+            self.__collection = cast(
+                "Collection", MonitoredCollection(MongoConnector.get_collection(collection_name=self._collection_name))
+            )
             self.__build_indexes(collection_name=self._collection_name, indexes_getter=lambda: self.indexes)
         return self.__collection
 
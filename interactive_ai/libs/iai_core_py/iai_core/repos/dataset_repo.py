@@ -197,6 +197,7 @@ class _DatasetItemRepo(DatasetBasedSessionRepo[DatasetItem]):
         self,
         instances: Sequence[DatasetItem],
         mongodb_session: ClientSession | None = None,
+        persisted_annotation_scene_ids: set[ID] | None = None,
     ) -> None:
         """
         Save multiple DatasetItems and all the other entities referenced internally
@@ -207,8 +208,12 @@ class _DatasetItemRepo(DatasetBasedSessionRepo[DatasetItem]):
 
         :param instances: DatasetItem objects to save
         :param mongodb_session: Optional, ClientSession for MongoDB transactions
+        :param persisted_annotation_scene_ids: Optional, IDs of the annotation scenes
+            already stored in the DB without changes, which are not saved again
         """
-        already_saved_scenes_ids: set[ID] = set()
+        already_saved_scenes_ids: set[ID] = (
+            set(persisted_annotation_scene_ids) if persisted_annotation_scene_ids else set()
+        )
         for instance in instances:
             self._save_annotations_and_metadata_for_item(
                 instance,
@@ -510,6 +515,7 @@ class DatasetRepo(DatasetStorageBasedSessionRepo[Dataset]):
         instance: Dataset,
         deepsave: bool,
         mongodb_session: ClientSession | None = None,
+        persisted_annotation_scene_ids: set[ID] | None = None,
     ) -> None:
         if not instance.ephemeral and not instance.mutable:
             raise ValueError(f"Cannot save non-mutable dataset with id `{instance.id_}` twice")
@@ -518,7 +524,11 @@ class DatasetRepo(DatasetStorageBasedSessionRepo[Dataset]):
         dataset_items = tuple(instance)
         if dataset_items:
             if deepsave:
-                dataset_item_repo.save_many_deep(instances=dataset_items, mongodb_session=mongodb_session)
+                dataset_item_repo.save_many_deep(
+                    instances=dataset_items,
+                    mongodb_session=mongodb_session,
+                    persisted_annotation_scene_ids=persisted_annotation_scene_ids,
+                )
             else:
                 dataset_item_repo.save_many_shallow(instances=dataset_items, mongodb_session=mongodb_session)
 
@@ -548,7 +558,12 @@ class DatasetRepo(DatasetStorageBasedSessionRepo[Dataset]):
         """
         self.__save(instance, deepsave=False, mongodb_session=mongodb_session)
 
-    def save_deep(self, instance: Dataset, mongodb_session: ClientSession | None = None) -> None:
+    def save_deep(
+        self,
+        instance: Dataset,
+        mongodb_session: ClientSession | None = None,
+        persisted_annotation_scene_ids: set[ID] | None = None,
+    ) -> None:
         """
         Save a dataset, its items and all the other entities referenced internally,
         including annotations and metadata.
@@ -558,8 +573,15 @@ class DatasetRepo(DatasetStorageBasedSessionRepo[Dataset]):
 
         :param instance: Dataset to save
         :param mongodb_session: Optional, ClientSession for MongoDB transactions
-        """
-        self.__save(instance, deepsave=True, mongodb_session=mongodb_session)
+        :param persisted_annotation_scene_ids: Optional, IDs of the annotation scenes
+            already stored in the DB without changes, which are not saved again
+        """
+        self.__save(
+            instance,
+            deepsave=True,
+            mongodb_session=mongodb_session,
+            persisted_annotation_scene_ids=persisted_annotation_scene_ids,
+        )
 
     def save(self, instance: Dataset, mongodb_session: ClientSession | None = None) -> None:
         warnings.warn(
@@ -184,6 +184,17 @@ class DatasetStorageFilterRepo(DatasetStorageBasedSessionRepo[DatasetStorageFilt
         query = {"media_identifier.media_id": IDToMongo.forward(media_id)}
         self.delete_all(extra_filter=query)
 
+    def delete_all_by_media_ids(self, media_ids: Sequence[ID]) -> None:
+        """
+        Delete all DatasetStorageFilterData associated with any of the given media, in a single query.
+
+        Like `delete_all_by_media_id`, the entries of the video frames are deleted together with the video ones.
+
+        :param media_ids: IDs of the media to delete entities for
+        """
+        query = {"media_identifier.media_id": {"$in": [IDToMongo.forward(media_id) for media_id in media_ids]}}
+        self.delete_all(extra_filter=query)
+
     def update_annotation_scenes_to_revisit(self, annotation_scene_ids: Sequence[ID]) -> None:
         """
         Update entries annotation state to TO_REVISIT based on annotation_scene_id
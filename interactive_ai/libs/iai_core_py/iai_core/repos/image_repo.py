@@ -6,7 +6,7 @@ This module implements the repository for image entities
 """
 
 import logging
-from collections.abc import Callable, Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from typing import Any
 
 from pymongo.command_cursor import CommandCursor
@@ -139,6 +139,43 @@ class ImageRepo(DatasetStorageBasedSessionRepo[Image]):
 
         return image_deleted
 
+    def delete_by_ids(self, ids: Sequence[ID]) -> tuple[ID, ...]:
+        """
+        Delete several images, their binary data and thumbnails from the database and filesystem.
+
+        The documents are deleted with a single query, then the binaries and the thumbnails are deleted concurrently.
+
+        :param ids: IDs of the images to delete
+        :return: IDs of the images that were found and deleted
+        """
+        query = self.preliminary_query_match_filter(access_mode=QueryAccessMode.READ)
+        query["_id"] = {"$in": [IDToMongo.forward(id_) for id_ in ids]}
+        image_docs = list(self._collection.find(query, {"extension": 1}))
+        if len(image_docs) < len(ids):
+            logger.warning(
+                "%d of the %d image documents to delete were not found, possibly they are already deleted",
+                len(ids) - len(image_docs),
+                len(ids),
+            )
+        if not image_docs:
+            return ()
+
+        # Delete the image documents first, to prevent data corruption in case of error
+        # during the binary deletion stage
+        super().delete_all(extra_filter={"_id": {"$in": [image_doc["_id"] for image_doc in image_docs]}})
+
+        deleted_ids = tuple(IDToMongo.backward(image_doc["_id"]) for image_doc in image_docs)
+        self.thumbnail_binary_repo.delete_by_filenames(
+            [Image.thumbnail_filename_by_image_id(str(id_)) for id_ in deleted_ids]
+        )
+        self.binary_repo.delete_by_filenames(
+            [
+                f"{str(id_)}.{image_doc['extension'].lower()}"
+                for id_, image_doc in zip(deleted_ids, image_docs, strict=True)
+            ]
+        )
+        return deleted_ids
+
     def delete_all(self, extra_filter: dict | None = None) -> bool:
         """
         Delete all the images, their binary data and thumbnails.
@@ -202,6 +202,7 @@ class VideoToMongo(IMapperForward[Video, dict], IMapperBackward[Video, dict]):
             "size": instance.size,
             "extension": str(instance.extension.name),
             "preprocessing": MediaPreprocessingToMongo.forward(instance.preprocessing),
+            "codec": instance.codec,
         }
 
     @staticmethod
@@ -224,4 +225,5 @@ class VideoToMongo(IMapperForward[Video, dict], IMapperBackward[Video, dict]):
             total_frames=instance.get("total_frames"),  # type: ignore
             size=int(instance["size"]),
             preprocessing=MediaPreprocessingToMongo.backward(instance["preprocessing"]),
+            codec=instance.get("codec"),
         )
@@ -121,6 +121,15 @@ class MediaScoreRepo(DatasetStorageBasedSessionRepo[MediaScore]):
         query = {"media_identifier.media_id": IDToMongo.forward(media_id)}
         self.delete_all(extra_filter=query)
 
+    def delete_all_by_media_ids(self, media_ids: Sequence[ID]) -> None:
+        """
+        Delete the MediaScore instances of any of the given media, in a single query
+
+        :param media_ids: Media ids
+        """
+        query = {"media_identifier.media_id": {"$in": [IDToMongo.forward(media_id) for media_id in media_ids]}}
+        self.delete_all(extra_filter=query)
+
     def delete_all_by_model_test_result_id(self, model_test_result_id: ID) -> None:
         """
         Delete all MediaScore instances given its test result id
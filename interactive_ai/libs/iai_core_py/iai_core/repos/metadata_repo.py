@@ -258,8 +258,7 @@ class MetadataRepo(DatasetStorageBasedSessionRepo[MetadataItem]):
                 files_to_delete_by_type.setdefault(type, []).append(binary_filename)
 
         # Delete tensor binaries
-        for tensor_binary_filename in files_to_delete_by_type[tensor_type_str]:
-            self.tensor_binary_repo.delete_by_filename(filename=tensor_binary_filename)
+        self.tensor_binary_repo.delete_by_filenames(files_to_delete_by_type[tensor_type_str])
 
         # Delete the documents last, because if there are problems happening during binaries removal, data will be
         # cleaned from repo and leftover binaries will remain.
@@ -313,3 +312,16 @@ class MetadataRepo(DatasetStorageBasedSessionRepo[MetadataItem]):
         """
         media_filter = {"media_identifier": MediaIdentifierToMongo.forward(media_identifier)}
         self.delete_all(extra_filter=media_filter)
+
+    def delete_all_by_media_identifiers(self, media_identifiers: Sequence[MediaIdentifierEntity]) -> None:
+        """
+        Delete all the metadata items relative to any of the given media, with a single query.
+
+        :param media_identifiers: Identifiers of the media
+        """
+        media_filter = {
+            "media_identifier": {
+                "$in": [MediaIdentifierToMongo.forward(identifier) for identifier in media_identifiers]
+            }
+        }
+        self.delete_all(extra_filter=media_filter)
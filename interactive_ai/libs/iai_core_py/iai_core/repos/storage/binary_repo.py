@@ -9,6 +9,8 @@ import io
 import logging
 import os
 import shutil
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TypeVar
 
@@ -22,6 +24,7 @@ from geti_types import CTX_SESSION_VAR, ID, make_session
 
 logger = logging.getLogger(__name__)
 
+BINARY_DELETION_MAX_WORKERS = int(os.environ.get("BINARY_DELETION_MAX_WORKERS", 8))
 
 T = TypeVar("T")
 
@@ -156,6 +159,23 @@ class BinaryRepo:
         """
         self.storage_client.delete_by_filename(filename=filename)
 
+    def delete_by_filenames(self, filenames: Sequence[str]) -> None:
+        """
+        Delete the binary files with the given names.
+
+        The files are deleted concurrently by at most BINARY_DELETION_MAX_WORKERS threads, so that the latency of
+        the storage requests is not paid once per file.
+
+        :param filenames: Names of the binary files
+        """
+        if len(filenames) <= 1:
+            for filename in filenames:
+                self.delete_by_filename(filename=filename)
+            return
+        with ThreadPoolExecutor(max_workers=min(BINARY_DELETION_MAX_WORKERS, len(filenames))) as executor:
+            # Consume the results to propagate the exceptions raised while deleting
+            list(executor.map(self.delete_by_filename, filenames))
+
     def delete_all(self) -> None:
         """
         Delete all objects in this particular binary repo
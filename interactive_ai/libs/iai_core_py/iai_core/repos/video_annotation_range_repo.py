@@ -5,7 +5,7 @@
 This module implements the repository for VideoAnnotationRange
 """
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 
 from pymongo import DESCENDING, IndexModel
 from pymongo.command_cursor import CommandCursor
@@ -75,6 +75,16 @@ class VideoAnnotationRangeRepo(DatasetStorageBasedSessionRepo[VideoAnnotationRan
         video_filter = {"video_id": IDToMongo.forward(video_id)}
         self.delete_all(extra_filter=video_filter)
 
+    def delete_all_by_video_ids(self, video_ids: Sequence[ID]) -> None:
+        """
+        Delete all VideoAnnotationRange objects from the database that have any of the
+        passed video IDs, in a single query.
+
+        :param video_ids: Video IDs to delete all VideoAnnotationRange objects for
+        """
+        video_filter = {"video_id": {"$in": [IDToMongo.forward(video_id) for video_id in video_ids]}}
+        self.delete_all(extra_filter=video_filter)
+
     def get_latest_by_video_id(self, video_id: ID) -> VideoAnnotationRange:
         """
         Get the latest VideoAnnotationRange by video_id.
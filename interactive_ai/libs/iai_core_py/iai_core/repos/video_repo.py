@@ -6,7 +6,7 @@ This module implements the repository for video entities
 """
 
 import logging
-from collections.abc import Callable, Iterable, Iterator, MutableMapping
+from collections.abc import Callable, Iterable, Iterator, MutableMapping, Sequence
 from threading import Lock
 from typing import Any
 from weakref import WeakValueDictionary
@@ -175,6 +175,56 @@ class VideoRepo(DatasetStorageBasedSessionRepo[Video]):
 
         return video_deleted
 
+    def delete_by_ids(self, ids: Sequence[ID]) -> tuple[ID, ...]:
+        """
+        Deletes several videos and their thumbnail videos from the database and filesystem
+
+        The documents are deleted with a single query, then the binaries and the thumbnails are deleted concurrently.
+
+        :param ids: IDs of the videos to delete
+        :return: IDs of the videos that were found and deleted
+        """
+        query = self.preliminary_query_match_filter(access_mode=QueryAccessMode.READ)
+        query["_id"] = {"$in": [IDToMongo.forward(id_) for id_ in ids]}
+        video_docs = list(self._collection.find(query, {"extension": 1}))
+        if len(video_docs) < len(ids):
+            logger.warning(
+                "%d of the %d video documents to delete were not found, possibly they are already deleted",
+                len(ids) - len(video_docs),
+                len(ids),
+            )
+        if not video_docs:
+            return ()
+
+        deleted_ids = tuple(IDToMongo.backward(video_doc["_id"]) for video_doc in video_docs)
+        # Invalidate the cache entries
+        video_cache = VideoCache()
+        for id_ in deleted_ids:
+            video_cache.remove(dataset_storage_identifier=self.identifier, video_id=id_)
+        # Delete the video documents first, to prevent data corruption in case of error
+        # during the binary deletion stage
+        super().delete_all(extra_filter={"_id": {"$in": [video_doc["_id"] for video_doc in video_docs]}})
+
+        # Delete the thumbnails (both image- and video-like)
+        self.thumbnail_binary_repo.delete_by_filenames(
+            [
+                thumbnail_filename
+                for id_ in deleted_ids
+                for thumbnail_filename in (
+                    Video.thumbnail_filename_by_video_id(str(id_)),
+                    Video.thumbnail_video_filename_by_video_id(str(id_)),
+                )
+            ]
+        )
+        # Delete binaries
+        self.binary_repo.delete_by_filenames(
+            [
+                f"{str(id_)}.{video_doc['extension'].lower()}"
+                for id_, video_doc in zip(deleted_ids, video_docs, strict=True)
+            ]
+        )
+        return deleted_ids
+
     def delete_all(self, extra_filter: dict | None = None) -> bool:
         """
         Delete all the videos, their binary data and thumbnails.
@@ -19,6 +19,7 @@ from iai_core.entities.project import Project
 from iai_core.entities.task_node import TaskNode
 from iai_core.repos import AnnotationSceneStateRepo, ImageRepo, LabelSchemaRepo, VideoRepo
 from iai_core.utils.iteration import grouper
+from iai_core.utils.spatial_index import ShapeSpatialIndex
 from iai_core.utils.type_helpers import SequenceOrSet
 
 from geti_types import ID, DatasetStorageIdentifier, MediaIdentifierEntity, MediaType
@@ -253,16 +254,17 @@ class AnnotationSceneStateHelper:
             ann for ann in first_task_annotations if len(ann.get_labels(include_empty=False)) != 0
         ]
 
-        output_unannotated_rois: list[ID] = []
-        for roi in rois_from_previous_task:
-            for annotation in second_task_annotations:
-                if roi.shape.intersects(annotation.shape):
-                    # first task shape is annotated in second task, continue checking next shape
-                    break
-            else:
-                # if the break clause is not triggered, that means the shape in the first task doesn't intersect with
-                # any labels in the current task, so annotation state must be PARTIALLY_ANNOTATED
-                output_unannotated_rois.append(roi.id_)
+        output_unannotated_rois: list[ID]
+        if rois_from_previous_task and second_task_annotations:
+            # Index the second task shapes, so that each ROI is only tested against the shapes around it
+            second_task_index = ShapeSpatialIndex([annotation.shape for annotation in second_task_annotations])
+            # A ROI is annotated in the second task if it intersects with any of its shapes, otherwise the annotation
+            # state must be PARTIALLY_ANNOTATED
+            output_unannotated_rois = [
+                roi.id_ for roi in rois_from_previous_task if not second_task_index.intersects_any(roi.shape)
+            ]
+        else:
+            output_unannotated_rois = [roi.id_ for roi in rois_from_previous_task]
 
         output_annotation_state = AnnotationSceneStateHelper._compute_task_state_from_unannotated_rois(
             unannotated_rois=output_unannotated_rois,
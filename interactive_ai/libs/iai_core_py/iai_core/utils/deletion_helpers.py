@@ -4,6 +4,8 @@
 """This module contains utilities for cascade deletion of entities"""
 
 import logging
+import os
+from collections.abc import Callable, Sequence
 
 from iai_core.entities.dataset_storage import DatasetStorage, NullDatasetStorage
 from iai_core.entities.datasets import DatasetIdentifier
@@ -37,11 +39,23 @@ from iai_core.repos import (
 from iai_core.repos.dataset_entity_repo import PipelineDatasetRepo
 from iai_core.repos.dataset_storage_filter_repo import DatasetStorageFilterRepo
 from iai_core.repos.training_revision_filter_repo import _TrainingRevisionFilterRepo
-
-from geti_types import CTX_SESSION_VAR, ID, DatasetStorageIdentifier, MediaIdentifierEntity, ProjectIdentifier
+from iai_core.utils.iteration import grouper
+
+from geti_types import (
+    CTX_SESSION_VAR,
+    ID,
+    DatasetStorageIdentifier,
+    ImageIdentifier,
+    MediaIdentifierEntity,
+    ProjectIdentifier,
+    VideoIdentifier,
+)
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of media whose entities are deleted with a single query per collection
+MEDIA_DELETION_CHUNK_SIZE = int(os.environ.get("MEDIA_DELETION_CHUNK_SIZE", 500))
+
 
 class DeletionHelpers:
     """Helper methods for cascade deletion of entities"""
@@ -221,6 +235,71 @@ class DeletionHelpers:
         DatasetStorageFilterRepo(dataset_storage.identifier).delete_all_by_media_id(media_id=video.id_)
         VideoRepo(dataset_storage.identifier).delete_by_id(video.id_)
 
+    @staticmethod
+    def delete_media_by_ids(
+        dataset_storage: DatasetStorage,
+        image_ids: Sequence[ID],
+        video_ids: Sequence[ID],
+        on_chunk_deleted: Callable[[tuple[ID, ...], tuple[ID, ...]], None] | None = None,
+    ) -> tuple[tuple[ID, ...], tuple[ID, ...]]:
+        """
+        Delete several image and video entities and other related entities.
+
+        The cascade is the same as `delete_image_entity` and `delete_video_entity`, but the media are processed in
+        chunks of MEDIA_DELETION_CHUNK_SIZE, and each collection is cleaned with a single query per chunk.
+
+        Cascades to:
+         - Annotation scenes
+         - Dataset items
+
+        :param dataset_storage: Dataset storage containing the media
+        :param image_ids: IDs of the images to delete
+        :param video_ids: IDs of the videos to delete
+        :param on_chunk_deleted: Optional callback invoked after each chunk with the IDs of the images and the IDs
+            of the videos deleted in that chunk, so that the caller can act on partial progress if a later chunk fails
+        :return: Tuple containing the IDs of the images and the IDs of the videos that were found and deleted
+        """
+        logger.debug("Deleting %d images and %d videos", len(image_ids), len(video_ids))
+
+        metadata_repo = MetadataRepo(dataset_storage.identifier)
+        annotation_scene_repo = AnnotationSceneRepo(dataset_storage.identifier)
+        annotation_scene_state_repo = AnnotationSceneStateRepo(dataset_storage.identifier)
+        video_annotation_range_repo = VideoAnnotationRangeRepo(dataset_storage.identifier)
+        media_score_repo = MediaScoreRepo(dataset_storage.identifier)
+        dataset_storage_filter_repo = DatasetStorageFilterRepo(dataset_storage.identifier)
+        image_repo = ImageRepo(dataset_storage.identifier)
+        video_repo = VideoRepo(dataset_storage.identifier)
+
+        deleted_image_ids: list[ID] = []
+        deleted_video_ids: list[ID] = []
+        media_identifiers = [ImageIdentifier(image_id=image_id) for image_id in image_ids] + [
+            VideoIdentifier(video_id=video_id) for video_id in video_ids
+        ]
+        for identifiers_chunk in grouper(media_identifiers, chunk_size=MEDIA_DELETION_CHUNK_SIZE):
+            chunk_media_ids = [identifier.media_id for identifier in identifiers_chunk]
+            chunk_image_ids = [
+                identifier.media_id for identifier in identifiers_chunk if isinstance(identifier, ImageIdentifier)
+            ]
+            chunk_video_ids = [
+                identifier.media_id for identifier in identifiers_chunk if isinstance(identifier, VideoIdentifier)
+            ]
+
+            metadata_repo.delete_all_by_media_identifiers(identifiers_chunk)
+            annotation_scene_repo.delete_all_by_media_ids(chunk_media_ids)
+            annotation_scene_state_repo.delete_all_by_media_ids(chunk_media_ids)
+            if chunk_video_ids:
+                video_annotation_range_repo.delete_all_by_video_ids(chunk_video_ids)
+            media_score_repo.delete_all_by_media_ids(chunk_media_ids)
+            dataset_storage_filter_repo.delete_all_by_media_ids(chunk_media_ids)
+            chunk_deleted_image_ids = tuple(image_repo.delete_by_ids(chunk_image_ids)) if chunk_image_ids else ()
+            chunk_deleted_video_ids = tuple(video_repo.delete_by_ids(chunk_video_ids)) if chunk_video_ids else ()
+            deleted_image_ids.extend(chunk_deleted_image_ids)
+            deleted_video_ids.extend(chunk_deleted_video_ids)
+            if on_chunk_deleted is not None and (chunk_deleted_image_ids or chunk_deleted_video_ids):
+                on_chunk_deleted(chunk_deleted_image_ids, chunk_deleted_video_ids)
+
+        return tuple(deleted_image_ids), tuple(deleted_video_ids)
+
     @staticmethod
     def delete_model_test_result(project_identifier: ProjectIdentifier, model_test_result: ModelTestResult) -> None:
         """
@@ -6,8 +6,9 @@ This module is implements label resolution functionality
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 
 import logging
-from collections.abc import Sequence
+from collections.abc import Hashable, Iterable, Sequence
 
+from iai_core.entities.annotation import Annotation
 from iai_core.entities.label_schema import LabelSchema
 from iai_core.entities.scored_label import LabelSource, ScoredLabel
 
@@ -77,6 +78,56 @@ class LabelResolver:
 
         return result_scored_labels
 
+    @staticmethod
+    def complete_labels_for_annotations(label_schema: LabelSchema, annotations: Iterable[Annotation]) -> None:
+        """
+        Completes the labels of many annotations in place, with the same result as calling `complete_labels` on each
+        of them.
+
+        The annotations of a batch typically share a handful of label combinations: the completion is computed once
+        per distinct combination of input labels, and each annotation receives its own copy of the completed labels.
+
+        :param label_schema: label schema relative to the annotations
+        :param annotations: annotations whose labels are completed
+        """
+        completed_labels_by_key: dict[tuple[Hashable, ...], list[ScoredLabel]] = {}
+        for annotation in annotations:
+            scored_labels = annotation.get_labels(include_empty=True)
+            key = tuple(LabelResolver.__scored_label_key(scored_label) for scored_label in scored_labels)
+            completed_labels = completed_labels_by_key.get(key)
+            if completed_labels is None:
+                completed_labels = LabelResolver.complete_labels(label_schema, scored_labels)
+                completed_labels_by_key[key] = completed_labels
+            label_id_to_label_source = LabelResolver.label_id_to_label_source(scored_labels=scored_labels)
+            annotation.set_labels(
+                [
+                    ScoredLabel(
+                        label_id=label.label_id,
+                        is_empty=label.is_empty,
+                        is_background=label.is_background,
+                        probability=label.probability,
+                        label_source=label_id_to_label_source.get(label.label_id, LabelSource()),
+                    )
+                    for label in completed_labels
+                ]
+            )
+
+    @staticmethod
+    def __scored_label_key(scored_label: ScoredLabel) -> tuple[Hashable, ...]:
+        """
+        Returns a hashable key that is equal for two scored labels if and only if the scored labels are equal
+        """
+        label_source = scored_label.label_source
+        return (
+            scored_label.label_id,
+            scored_label.is_empty,
+            scored_label.is_background,
+            scored_label.probability,
+            label_source.user_id,
+            label_source.model_id,
+            label_source.model_storage_id,
+        )
+
     @staticmethod
     def __unique_ordered(hashable_list: list):  # noqa: ANN205
         """
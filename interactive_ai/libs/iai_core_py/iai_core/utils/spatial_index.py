@@ -0,0 +1,51 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+"""
+This module implements a spatial index of shapes, to find the shapes intersecting a given one
+"""
+
+from collections.abc import Sequence
+
+from shapely.errors import ShapelyError, TopologicalError
+from shapely.strtree import STRtree
+
+from iai_core.entities.shapes import GeometryException, Shape
+
+
+class ShapeSpatialIndex:
+    """
+    Bounding-box index of a set of shapes.
+
+    The shapes are converted to polygons once, and stored in an R-tree on their bounding boxes. A query only tests the
+    exact intersection against the shapes whose bounding box intersects the one of the queried shape, instead of
+    testing every shape of the set. The results are the same as `Shape.intersects`.
+
+    :param shapes: Shapes to index
+    """
+
+    def __init__(self, shapes: Sequence[Shape]) -> None:
+        self._polygons = [shape._as_shapely_polygon() for shape in shapes]
+        self._tree = STRtree(self._polygons)
+
+    def __len__(self) -> int:
+        return len(self._polygons)
+
+    def intersects_any(self, shape: Shape) -> bool:
+        """
+        Check whether a shape intersects with any of the indexed shapes.
+
+        :param shape: Shape to check
+        :return: True if the shape intersects with at least one of the indexed shapes, False otherwise
+        :raises GeometryException: if the intersection of the shapes cannot be computed
+        """
+        if not self._polygons:
+            return False
+        polygon = shape._as_shapely_polygon()
+        # Shapes with disjoint bounding boxes cannot intersect, so only the candidates returned by the tree are tested
+        for index in sorted(self._tree.query(polygon)):
+            try:
+                if polygon.intersects(self._polygons[index]):
+                    return True
+            except (ShapelyError, TopologicalError) as exception:
+                raise GeometryException(f"Error calculating intersection: {exception}") from exception
+        return False
@@ -0,0 +1,133 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+"""
+Benchmark of the annotation state computation of detection -> segmentation scenes of increasing density.
+
+Each synthetic scene contains N detection boxes spread over the image, and a segmentation polygon inside most of them.
+'pairwise' tests every detection box against every segmentation shape with `Shape.intersects`, as the state helper did
+before the spatial index was introduced; 'indexed' runs `AnnotationSceneStateHelper` with the bounding-box index.
+Both must find the same unannotated ROIs.
+
+Usage: PYTHONPATH=. python tests/benchmarks/bench_annotation_scene_state.py [--objects 50 200 800] [--repeat 5]
+"""
+
+import argparse
+import random
+import statistics
+import time
+from collections.abc import Callable
+
+from iai_core.entities.annotation import Annotation, AnnotationScene, AnnotationSceneKind
+from iai_core.entities.label import Domain, Label
+from iai_core.entities.label_schema import LabelGroup, LabelSchema
+from iai_core.entities.scored_label import ScoredLabel
+from iai_core.entities.shapes import Point, Polygon, Rectangle
+from iai_core.repos import AnnotationSceneRepo, LabelSchemaRepo
+from iai_core.utils.annotation_scene_state_helper import AnnotationSceneStateHelper
+
+from geti_types import ID, ImageIdentifier
+
+
+def make_label_schema(name: str, domain: Domain) -> tuple[LabelSchema, Label]:
+    label = Label(id_=LabelSchemaRepo.generate_id(), name=name, domain=domain)
+    label_schema = LabelSchema(id_=LabelSchemaRepo.generate_id(), label_groups=[LabelGroup(name=name, labels=[label])])
+    return label_schema, label
+
+
+def make_scene(objects: int, detection_label: Label, segmentation_label: Label, rng: random.Random) -> AnnotationScene:
+    annotations = []
+    for _ in range(objects):
+        x1, y1 = rng.random() * 0.95, rng.random() * 0.95
+        x2, y2 = x1 + 0.01 + rng.random() * 0.04, y1 + 0.01 + rng.random() * 0.04
+        annotations.append(
+            Annotation(
+                shape=Rectangle(x1=x1, y1=y1, x2=x2, y2=y2),
+                labels=[ScoredLabel(label_id=detection_label.id_, is_empty=False)],
+            )
+        )
+        # One object out of ten is not segmented yet
+        if rng.random() < 0.9:
+            cx, cy = (x1 + x2) / 2, (y1 + y2) / 2
+            points = [Point(x=cx - 0.004, y=cy - 0.004), Point(x=cx + 0.004, y=cy - 0.004), Point(x=cx, y=cy + 0.004)]
+            annotations.append(
+                Annotation(
+                    shape=Polygon(points=points),
+                    labels=[ScoredLabel(label_id=segmentation_label.id_, is_empty=False)],
+                )
+            )
+    return AnnotationScene(
+        kind=AnnotationSceneKind.ANNOTATION,
+        media_identifier=ImageIdentifier(image_id=ID("60d31793d5f1fb7e6e3c1a4f")),
+        media_height=1080,
+        media_width=1920,
+        id_=AnnotationSceneRepo.generate_id(),
+        annotations=annotations,
+    )
+
+
+def unannotated_rois_pairwise(
+    scene: AnnotationScene, detection_schema: LabelSchema, segmentation_schema: LabelSchema
+) -> list[ID]:
+    rois = [
+        annotation
+        for annotation in scene.get_annotations_with_label_ids(detection_schema.get_label_ids(include_empty=True))
+        if annotation.get_labels(include_empty=False)
+    ]
+    shapes = [
+        annotation.shape
+        for annotation in scene.get_annotations_with_label_ids(segmentation_schema.get_label_ids(include_empty=True))
+    ]
+    return [roi.id_ for roi in rois if not any(roi.shape.intersects(shape) for shape in shapes)]
+
+
+def unannotated_rois_indexed(
+    scene: AnnotationScene, detection_schema: LabelSchema, segmentation_schema: LabelSchema
+) -> list[ID]:
+    _, unannotated_rois = AnnotationSceneStateHelper._compute_state_and_unannotated_rois_local_to_local(
+        annotation_scene=scene,
+        previous_task_label_schema=detection_schema,
+        current_task_label_schema=segmentation_schema,
+    )
+    return unannotated_rois
+
+
+def measure(function: Callable[[], list[ID]], repeat: int) -> tuple[float, list[ID]]:
+    durations = []
+    result: list[ID] = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        result = function()
+        durations.append(time.perf_counter() - start_time)
+    return statistics.median(durations), result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--objects", type=int, nargs="+", default=[50, 200, 800])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)  # noqa: S311
+    detection_schema, detection_label = make_label_schema("object", Domain.DETECTION)
+    segmentation_schema, segmentation_label = make_label_schema("mask", Domain.SEGMENTATION)
+    print(f"{'objects':>8} {'pairwise (ms)':>14} {'indexed (ms)':>13} {'speedup':>8} {'unannotated':>12}")
+    for objects in args.objects:
+        scene = make_scene(objects, detection_label, segmentation_label, rng)
+        pairwise_time, pairwise_rois = measure(
+            lambda: unannotated_rois_pairwise(scene, detection_schema, segmentation_schema),  # noqa: B023
+            args.repeat,
+        )
+        indexed_time, indexed_rois = measure(
+            lambda: unannotated_rois_indexed(scene, detection_schema, segmentation_schema),  # noqa: B023
+            args.repeat,
+        )
+        if pairwise_rois != indexed_rois:
+            raise RuntimeError(f"The unannotated ROIs differ for a scene of {objects} objects")
+        print(
+            f"{objects:>8} {pairwise_time * 1000:>14.1f} {indexed_time * 1000:>13.1f} "
+            f"{pairwise_time / indexed_time:>7.1f}x {len(indexed_rois):>12}"
+        )
+
+
+if __name__ == "__main__":
+    main()
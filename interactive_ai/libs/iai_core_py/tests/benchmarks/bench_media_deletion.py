@@ -0,0 +1,178 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+"""
+Benchmark of the deletion of N images with their annotations, binaries and thumbnails.
+
+'per_media' deletes the images one at a time with `DeletionHelpers.delete_image_entity`, as the media endpoints do;
+'bulk' deletes them all with `DeletionHelpers.delete_media_by_ids`, which cleans each collection with one `$in` query
+per chunk and deletes the binaries concurrently. Each mode runs on a fresh in-memory mongomock DB and a temporary
+local storage directory, where every binary deletion is slowed down by `--storage-latency-ms` to mimic an object
+storage request. Mongomock has no network round-trips: the time is also reported with one round-trip of
+`--round-trip-ms` added per query.
+
+Usage: PYTHONPATH=. python tests/benchmarks/bench_media_deletion.py [--media 100 1000 5000] [--storage-latency-ms 2]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from unittest.mock import patch
+
+import mongomock
+from mongomock.collection import Collection
+
+from iai_core.entities.annotation import Annotation, AnnotationScene, AnnotationSceneKind
+from iai_core.entities.dataset_storage import DatasetStorage
+from iai_core.entities.image import Image
+from iai_core.entities.media import ImageExtensions, MediaPreprocessing, MediaPreprocessingStatus
+from iai_core.entities.scored_label import ScoredLabel
+from iai_core.entities.shapes import Rectangle
+from iai_core.repos import AnnotationSceneRepo, ImageRepo
+from iai_core.repos.base.mongo_connector import MongoConnector
+from iai_core.repos.storage.local_storage import LocalStorageClient
+from iai_core.utils.deletion_helpers import DeletionHelpers
+
+from geti_types import ID, RequestSource, make_session, session_context
+
+_QUERY_METHODS = ("find", "find_one", "aggregate", "delete_one", "delete_many")
+_LABEL_ID = ID("60d31793d5f1fb7e6e3c1a4f")
+
+
+def seed_images(dataset_storage: DatasetStorage, media: int) -> list[Image]:
+    """Saves the images with one annotation scene each, and writes their binary and thumbnail."""
+    image_repo = ImageRepo(dataset_storage.identifier)
+    images = [
+        Image(
+            name=f"image {index}",
+            uploader_id="benchmark",
+            id=ImageRepo.generate_id(),
+            extension=ImageExtensions.JPG,
+            width=640,
+            height=480,
+            size=16,
+            preprocessing=MediaPreprocessing(status=MediaPreprocessingStatus.FINISHED),
+        )
+        for index in range(media)
+    ]
+    image_repo.save_many(images)
+    for image in images:
+        image_repo.binary_repo.save(dst_file_name=f"{image.id_}.jpg", data_source=b"0" * 16)
+        image_repo.thumbnail_binary_repo.save(
+            dst_file_name=Image.thumbnail_filename_by_image_id(str(image.id_)), data_source=b"0" * 16
+        )
+    AnnotationSceneRepo(dataset_storage.identifier).save_many(
+        [
+            AnnotationScene(
+                kind=AnnotationSceneKind.ANNOTATION,
+                media_identifier=image.media_identifier,
+                media_height=image.height,
+                media_width=image.width,
+                id_=AnnotationSceneRepo.generate_id(),
+                annotations=[
+                    Annotation(
+                        shape=Rectangle.generate_full_box(), labels=[ScoredLabel(label_id=_LABEL_ID, probability=1)]
+                    )
+                ],
+            )
+            for image in images
+        ]
+    )
+    return images
+
+
+class QueryCounter:
+    """Counts the queries sent to the mongomock collections, ignoring the calls that mongomock makes internally."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self._depth = 0
+
+    def wrap(self, method: Callable) -> Callable:
+        def counted(collection: Collection, *args, **kwargs):
+            self.count += self._depth == 0
+            self._depth += 1
+            try:
+                return method(collection, *args, **kwargs)
+            finally:
+                self._depth -= 1
+
+        return counted
+
+
+def run(media: int, bulk: bool, storage_latency_ms: float) -> tuple[float, int]:
+    """Seeds a fresh in-memory DB and storage directory, then times the deletion of all the images."""
+    delete_by_filename = LocalStorageClient.delete_by_filename
+
+    def slow_delete_by_filename(self, filename: str) -> None:
+        time.sleep(storage_latency_ms / 1000)
+        delete_by_filename(self, filename=filename)
+
+    with (
+        tempfile.TemporaryDirectory() as workdir,
+        patch.dict(os.environ, {"WORKDIR": workdir}),
+        patch.object(MongoConnector, "get_mongo_client", return_value=mongomock.MongoClient()),
+    ):
+        dataset_storage = DatasetStorage(
+            name="dataset", _id=ImageRepo.generate_id(), project_id=ImageRepo.generate_id(), use_for_training=True
+        )
+        images = seed_images(dataset_storage, media)
+
+        query_counter = QueryCounter()
+        with (
+            patch.object(LocalStorageClient, "delete_by_filename", slow_delete_by_filename),
+            patch.multiple(
+                Collection, **{method: query_counter.wrap(getattr(Collection, method)) for method in _QUERY_METHODS}
+            ),
+        ):
+            start_time = time.perf_counter()
+            if bulk:
+                DeletionHelpers.delete_media_by_ids(
+                    dataset_storage=dataset_storage, image_ids=[image.id_ for image in images], video_ids=[]
+                )
+            else:
+                for image in images:
+                    DeletionHelpers.delete_image_entity(dataset_storage=dataset_storage, image=image)
+            duration = time.perf_counter() - start_time
+
+        image_repo = ImageRepo(dataset_storage.identifier)
+        remaining_files = [name for _, _, files in os.walk(workdir) for name in files]
+        if image_repo.count() or AnnotationSceneRepo(dataset_storage.identifier).count() or remaining_files:
+            raise RuntimeError(f"Some entities of the {media} images were not deleted")
+    return duration, query_counter.count
+
+
+def benchmark(media: int, storage_latency_ms: float, round_trip_ms: float) -> dict:
+    result: dict[str, float | int] = {"media": media}
+    for mode in ("per_media", "bulk"):
+        duration, queries = run(media, mode == "bulk", storage_latency_ms)
+        duration_with_round_trips = duration + queries * round_trip_ms / 1000
+        result[f"{mode}_seconds"] = round(duration, 3)
+        result[f"{mode}_queries"] = queries
+        result[f"{mode}_seconds_with_round_trips"] = round(duration_with_round_trips, 3)
+        result[f"{mode}_media_per_second"] = round(media / duration_with_round_trips, 1)
+    result["speedup"] = round(result["bulk_media_per_second"] / result["per_media_media_per_second"], 2)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--media", type=int, nargs="+", default=[100, 1_000, 5_000])
+    parser.add_argument("--storage-latency-ms", type=float, default=2.0, help="Latency of a binary deletion")
+    parser.add_argument("--round-trip-ms", type=float, default=1.0, help="Latency of a request to the DB server")
+    args = parser.parse_args()
+
+    session = make_session(
+        organization_id=ImageRepo.generate_id(),
+        workspace_id=ImageRepo.generate_id(),
+        source=RequestSource.INTERNAL,
+    )
+    with session_context(session=session):
+        for media in args.media:
+            print(json.dumps(benchmark(media, args.storage_latency_ms, args.round_trip_ms)), flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+from unittest.mock import patch
+
+import pytest
+
+from iai_core.repos.base.query_monitor import QueryBudgetExceededError, QueryMonitor, query_budget
+from iai_core.repos.mappers.mongodb_mappers.id_mapper import IDToMongo
+
+from geti_types import make_session
+
+
+@pytest.fixture
+def fxt_reported_operations():
+    operations = []
+    QueryMonitor.add_listener(operations.append)
+    yield operations
+    QueryMonitor.remove_listener(operations.append)
+
+
+class TestQueryMonitor:
+    def test_report_operations(self, fxt_session_repo, fxt_mappable_object, fxt_reported_operations) -> None:
+        # Arrange
+        repo = fxt_session_repo(make_session())
+        repo.delete_all()
+        instances = [fxt_mappable_object(x=x, id_=repo.generate_id()) for x in (1, 2)]
+        collection_name = repo._collection.name
+        fxt_reported_operations.clear()
+
+        # Act
+        for instance in instances:
+            repo.save(instance)
+        repo.get_by_id(instances[0].id_)
+        found_instances = list(repo.get_all())
+        reported_operations = list(fxt_reported_operations)
+        repo.delete_all()
+
+        # Assert
+        assert len(found_instances) == 2
+        assert [
+            (operation.collection, operation.operation, operation.documents) for operation in reported_operations
+        ] == [
+            (collection_name, "update_one", 0),
+            (collection_name, "update_one", 0),
+            (collection_name, "find_one", 1),
+            (collection_name, "find", 2),
+        ]
+        assert reported_operations[2].query["_id"] == IDToMongo.forward(instances[0].id_)
+
+    def test_slow_operations(self, fxt_session_repo, fxt_mappable_object) -> None:
+        # Arrange
+        repo = fxt_session_repo(make_session())
+        instance = fxt_mappable_object(x=1, id_=repo.generate_id())
+        QueryMonitor.clear_slow_operations()
+
+        # Act
+        with patch("iai_core.repos.base.query_monitor.MONGO_SLOW_OPERATION_THRESHOLD_MS", 0):
+            repo.get_by_id(instance.id_)
+        with patch("iai_core.repos.base.query_monitor.MONGO_SLOW_OPERATION_THRESHOLD_MS", 10_000):
+            repo.get_by_id(instance.id_)
+
+        # Assert
+        slow_operations = QueryMonitor.get_slow_operations()
+        assert len(slow_operations) == 1
+        assert slow_operations[0].operation == "find_one"
+        assert slow_operations[0].documents == 0
+
+    def test_query_budget(self, fxt_session_repo, fxt_mappable_object) -> None:
+        # Arrange
+        repo = fxt_session_repo(make_session())
+        instance = fxt_mappable_object(x=1, id_=repo.generate_id())
+        repo.save(instance)
+
+        # Act
+        with query_budget(max_operations=3) as outer_budget:
+            with query_budget(max_operations=1, collections=["other_collection"]) as other_budget:
+                repo.get_by_id(instance.id_)
+            repo.exists(instance.id_)
+        with pytest.raises(QueryBudgetExceededError) as error:
+            with query_budget(max_operations=1):
+                repo.get_by_id(instance.id_)
+                repo.exists(instance.id_)
+
+        repo.delete_by_id(instance.id_)
+
+        # Assert
+        assert outer_budget.count == 2
+        assert other_budget.count == 0
+        assert "2 MongoDB operations were issued, the budget is 1" in str(error.value)
@@ -316,6 +316,54 @@ class TestAnnotationSceneRepo:
 
         assert annotated_frame_annotations == expected_annotations[:limit]
         assert count == len(expected_annotations)
+        frame_query = {
+            "video_id": fxt_video_entity.id_,
+            "start_frame": start_frame,
+            "end_frame": end_frame,
+            "frame_skip": frame_skip,
+        }
+        assert (
+            list(ann_scene_repo.get_video_frame_annotations_cursor_by_video_id(**frame_query, limit=limit))
+            == (expected_annotations[:limit])
+        )
+        assert ann_scene_repo.count_video_frame_annotations_by_video_id(**frame_query) == len(expected_annotations)
+
+    def test_get_video_frame_label_ids_by_video_id(
+        self,
+        request,
+        fxt_video_entity,
+        fxt_dataset_storage,
+        fxt_rectangle_annotation,
+        fxt_scored_label,
+    ) -> None:
+        ann_scene_repo = AnnotationSceneRepo(fxt_dataset_storage.identifier)
+        request.addfinalizer(lambda: ann_scene_repo.delete_all())
+
+        def save_scene(frame_index: int, annotations: list) -> None:
+            ann_scene_repo.save(
+                AnnotationScene(
+                    kind=AnnotationSceneKind.ANNOTATION,
+                    media_identifier=VideoFrameIdentifier(video_id=fxt_video_entity.id_, frame_index=frame_index),
+                    media_height=fxt_video_entity.height,
+                    media_width=fxt_video_entity.width,
+                    id_=AnnotationSceneRepo.generate_id(),
+                    last_annotator_id="Test",
+                    annotations=annotations,
+                )
+            )
+
+        for frame_index in (50, 3, 20, 40):
+            save_scene(frame_index=frame_index, annotations=[fxt_rectangle_annotation])
+        # The latest scene of frame 20 has no annotations, so the frame is skipped
+        save_scene(frame_index=20, annotations=[])
+
+        frame_label_ids = list(
+            ann_scene_repo.get_video_frame_label_ids_by_video_id(
+                video_id=fxt_video_entity.id_, start_frame=0, end_frame=45
+            )
+        )
+
+        assert frame_label_ids == [(3, {fxt_scored_label.id_}), (40, {fxt_scored_label.id_})]
 
     def test_get_annotation_object_sizes(
         self,
@@ -2,14 +2,14 @@
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 from copy import copy
 from typing import cast
-from unittest.mock import call, patch
+from unittest.mock import MagicMock, call, patch
 
 import numpy as np
 import pytest
 
 from iai_core.configuration.enums import ComponentType
 from iai_core.entities.active_model_state import NullActiveModelState
-from iai_core.entities.annotation import NullAnnotationScene
+from iai_core.entities.annotation import AnnotationSceneKind, NullAnnotationScene
 from iai_core.entities.annotation_scene_state import AnnotationSceneState
 from iai_core.entities.dataset_entities import PipelineDataset
 from iai_core.entities.dataset_item import DatasetItem
@@ -104,6 +104,60 @@ class TestDeletionHelpers:
         assert video_repo.get_by_id(video.id_) == NullVideo()
         assert AnnotationSceneRepo(dataset_storage.identifier).get_by_id(video.id_) == NullAnnotationScene()
 
+    def test_delete_media_by_ids(self, project_with_data: TestProject, fxt_random_annotated_video_factory) -> None:
+        project = project_with_data.project
+        dataset_storage = project.get_training_dataset_storage()
+        images = [item.media for item in project_with_data.circle_dataset if isinstance(item.media, Image)]
+        images_to_delete, image_to_keep = images[:2], images[2]
+        video, _, _, _, _, _, _ = fxt_random_annotated_video_factory(project)
+        image_repo = ImageRepo(dataset_storage.identifier)
+        video_repo = VideoRepo(dataset_storage.identifier)
+        ann_scene_repo = AnnotationSceneRepo(dataset_storage.identifier)
+        missing_image_id = ImageRepo.generate_id()
+        mock_on_chunk_deleted = MagicMock()
+
+        with (
+            patch("iai_core.utils.deletion_helpers.MEDIA_DELETION_CHUNK_SIZE", 2),
+            patch.object(
+                AnnotationSceneRepo,
+                "delete_all_by_media_ids",
+                autospec=True,
+                side_effect=AnnotationSceneRepo.delete_all_by_media_ids,
+            ) as mock_delete_scenes,
+        ):
+            deleted_image_ids, deleted_video_ids = DeletionHelpers.delete_media_by_ids(
+                dataset_storage=dataset_storage,
+                image_ids=[image.id_ for image in images_to_delete] + [missing_image_id],
+                video_ids=[video.id_],
+                on_chunk_deleted=mock_on_chunk_deleted,
+            )
+
+        # 4 media in chunks of 2 -> 2 queries per collection
+        assert mock_delete_scenes.call_count == 2
+        # The callback is notified after each chunk with the media deleted in that chunk
+        assert [
+            (set(chunk_image_ids), chunk_video_ids)
+            for chunk_image_ids, chunk_video_ids in (c.args for c in mock_on_chunk_deleted.call_args_list)
+        ] == [({image.id_ for image in images_to_delete}, ()), (set(), (video.id_,))]
+        assert set(deleted_image_ids) == {image.id_ for image in images_to_delete}
+        assert deleted_video_ids == (video.id_,)
+        for image in images_to_delete:
+            assert image_repo.get_by_id(image.id_) == NullImage()
+            assert (
+                ann_scene_repo.count_all_by_identifier_and_annotation_kind(
+                    media_identifier=image.media_identifier, annotation_kind=AnnotationSceneKind.ANNOTATION
+                )
+                == 0
+            )
+        assert video_repo.get_by_id(video.id_) == NullVideo()
+        assert image_repo.get_by_id(image_to_keep.id_) != NullImage()
+        assert (
+            ann_scene_repo.count_all_by_identifier_and_annotation_kind(
+                media_identifier=image_to_keep.media_identifier, annotation_kind=AnnotationSceneKind.ANNOTATION
+            )
+            > 0
+        )
+
     def test_delete_project_by_id(self, project_with_data: TestProject, fxt_random_annotated_video_factory) -> None:
         """
         <b>Description:</b>
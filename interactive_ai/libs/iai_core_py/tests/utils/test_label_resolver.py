@@ -0,0 +1,42 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+from unittest.mock import patch
+
+from iai_core.entities.annotation import Annotation
+from iai_core.entities.scored_label import LabelSource, ScoredLabel
+from iai_core.entities.shapes import Rectangle
+from iai_core.utils.label_resolver import LabelResolver
+
+from geti_types import ID
+
+
+class TestLabelResolver:
+    def test_complete_labels_for_annotations(self, fxt_label_schema, fxt_label, fxt_label_2) -> None:
+        # Arrange
+        label_sets = [
+            [ScoredLabel(label_id=fxt_label.id_, probability=1.0, label_source=LabelSource(user_id="user"))],
+            [ScoredLabel(label_id=fxt_label.id_, probability=1.0, label_source=LabelSource(user_id="user"))],
+            [ScoredLabel(label_id=fxt_label.id_, probability=0.4, label_source=LabelSource(model_id=ID("model")))],
+            [
+                ScoredLabel(label_id=fxt_label.id_, probability=1.0, label_source=LabelSource(user_id="user")),
+                ScoredLabel(label_id=fxt_label_2.id_, probability=1.0, label_source=LabelSource(user_id="user")),
+            ],
+        ]
+        annotations = [
+            Annotation(shape=Rectangle.generate_full_box(), labels=[*labels, *labels]) for labels in label_sets
+        ]
+        expected_labels = [
+            LabelResolver.complete_labels(fxt_label_schema, annotation.get_labels(include_empty=True))
+            for annotation in annotations
+        ]
+
+        # Act
+        with patch.object(
+            LabelResolver, "complete_labels", side_effect=LabelResolver.complete_labels
+        ) as mock_complete_labels:
+            LabelResolver.complete_labels_for_annotations(fxt_label_schema, annotations)
+
+        # Assert
+        assert [annotation.get_labels(include_empty=True) for annotation in annotations] == expected_labels
+        assert mock_complete_labels.call_count == 3
+        assert annotations[0].get_labels()[0] is not annotations[1].get_labels()[0]
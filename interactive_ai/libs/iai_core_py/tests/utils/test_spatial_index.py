@@ -0,0 +1,47 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+import random
+
+import pytest
+
+from iai_core.entities.shapes import Ellipse, Point, Polygon, Rectangle
+from iai_core.utils.spatial_index import ShapeSpatialIndex
+
+
+def _random_shape(rng: random.Random):
+    x1, y1 = rng.random() * 0.9, rng.random() * 0.9
+    x2, y2 = x1 + rng.random() * 0.1 + 0.001, y1 + rng.random() * 0.1 + 0.001
+    shape_type = rng.choice([Rectangle, Ellipse, Polygon])
+    if shape_type is Polygon:
+        return Polygon(points=[Point(x1, y1), Point(x2, y1), Point((x1 + x2) / 2, y2)])
+    return shape_type(x1=x1, y1=y1, x2=x2, y2=y2)
+
+
+class TestShapeSpatialIndex:
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_intersects_any(self, seed) -> None:
+        rng = random.Random(seed)  # noqa: S311
+        indexed_shapes = [_random_shape(rng) for _ in range(100)]
+        queried_shapes = [_random_shape(rng) for _ in range(100)]
+
+        index = ShapeSpatialIndex(indexed_shapes)
+
+        for shape in queried_shapes:
+            expected = any(shape.intersects(indexed_shape) for indexed_shape in indexed_shapes)
+            assert index.intersects_any(shape) == expected
+
+    def test_intersects_any_touching_shapes(self) -> None:
+        index = ShapeSpatialIndex([Rectangle(x1=0.0, y1=0.0, x2=0.5, y2=0.5)])
+
+        # Shapes sharing only an edge or a corner intersect, as with Shape.intersects
+        assert index.intersects_any(Rectangle(x1=0.5, y1=0.0, x2=1.0, y2=0.5))
+        assert index.intersects_any(Rectangle(x1=0.5, y1=0.5, x2=1.0, y2=1.0))
+        assert not index.intersects_any(Rectangle(x1=0.6, y1=0.6, x2=1.0, y2=1.0))
+        # The bounding box of the ellipse overlaps the rectangle, but not the ellipse itself
+        assert not index.intersects_any(Ellipse(x1=0.45, y1=0.45, x2=1.0, y2=1.0))
+
+    def test_intersects_any_empty(self) -> None:
+        index = ShapeSpatialIndex([])
+
+        assert len(index) == 0
+        assert not index.intersects_any(Rectangle.generate_full_box())
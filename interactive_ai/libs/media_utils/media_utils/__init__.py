@@ -9,9 +9,16 @@ from .media_utils import (
     get_video_bytes,
     get_video_frame_numpy,
 )
-from .video_decoder import VideoDecoder, VideoFrameOutOfRangeInternalException, VideoFrameReadingError, VideoInformation
+from .video_decoder import (
+    VideoDecoder,
+    VideoFrameOutOfRangeInternalException,
+    VideoFrameReadingError,
+    VideoInformation,
+    VideoReaderPoolStatistics,
+)
 from .video_file_repair import VideoFileRepair
 from .video_frame_reader import VideoFrameReader
+from .video_metadata import VideoMetadata, VideoMetadataCache, VideoMetadataProbeError
 from .video_thumbnail import generate_thumbnail_video
 
 __all__ = [
@@ -21,6 +28,10 @@ __all__ = [
     "VideoFrameReader",
     "VideoFrameReadingError",
     "VideoInformation",
+    "VideoMetadata",
+    "VideoMetadataCache",
+    "VideoMetadataProbeError",
+    "VideoReaderPoolStatistics",
     "generate_thumbnail_video",
     "get_image_bytes",
     "get_image_numpy",
@@ -13,6 +13,7 @@ from iai_core.entities.video import Video, VideoFrame
 from iai_core.repos.storage.binary_repos import ImageBinaryRepo, VideoBinaryRepo
 
 from .video_frame_reader import VideoFrameReader
+from .video_metadata import VideoMetadata, VideoMetadataCache
 
 logger = logging.getLogger(__name__)
 
@@ -66,12 +67,26 @@ def get_video_frame_numpy(dataset_storage_identifier: DatasetStorageIdentifier,
     :return np.ndarray: video frame numpy array
     """
     video_binary_repo = VideoBinaryRepo(dataset_storage_identifier)
+    video = video_frame.video
+
+    def get_file_location() -> str:
+        file_location = str(video_binary_repo.get_path_or_presigned_url(filename=video.data_binary_filename))
+        # Reuse the metadata probed at upload time, so that the video headers are not probed again
+        VideoMetadataCache().seed(
+            file_location=file_location,
+            metadata=VideoMetadata(
+                fps=video.fps,
+                total_frames=video.total_frames,
+                duration=video.total_frames / video.fps if video.fps else 0.0,
+                codec=video.codec or "",
+            ),
+        )
+        return file_location
+
     return VideoFrameReader.get_frame_numpy(
-        file_location_getter=lambda: str(
-            video_binary_repo.get_path_or_presigned_url(filename=video_frame.video.data_binary_filename)
-        ),
+        file_location_getter=get_file_location,
         frame_index=video_frame.frame_index,
-        fps=video_frame.video.fps,
+        fps=video.fps,
     )
 
 
@@ -3,48 +3,50 @@
 
 """Implementation of VideoDecoder"""
 
-import json
+import bisect
+import dataclasses
 import logging
 import os
-import subprocess
 from abc import abstractmethod
 from collections.abc import Callable
+from dataclasses import dataclass
 from threading import Lock
-from typing import Generic, NamedTuple, TypeVar
+from typing import Any, NamedTuple, TypeVar
 
 import cv2
 import numpy as np
 from cachetools import TTLCache
 from geti_types import Singleton
 
+from media_utils.video_metadata import VideoMetadata, VideoMetadataCache, VideoMetadataProbeError, _clean_file_location
+
 logger = logging.getLogger(__name__)
 
 NUM_VIDEO_FRAME_DECODE_RETRIES = int(os.getenv("NUM_VIDEO_FRAME_DECODE_RETRIES", "5"))
 VIDEO_FRAME_CACHE_MAX_SIZE_BYTES = int(os.getenv("VIDEO_FRAME_CACHE_MAX_SIZE_BYTES", "100000000"))  # def 100MB
 # Note that the VIDEO_CACHE_TTL should be less than the expiry time for a video presigned URL.
 VIDEO_CACHE_TTL = int(os.getenv("VIDEO_FRAME_CACHE_TTL", "300"))  # def 5 minutes
+# Maximum number of videos for which an open reader is kept. Each reader holds a decoder context and a file handle.
+VIDEO_READER_POOL_SIZE = int(os.getenv("VIDEO_READER_POOL_SIZE", "8"))
+# Number of seeks of a reader after which the keyframe index of its video is built. Building the index reads the whole
+# video stream, which only pays off for readers used for random access (e.g. browsing the frames of a video).
+VIDEO_KEYFRAME_INDEX_MIN_SEEKS = int(os.getenv("VIDEO_KEYFRAME_INDEX_MIN_SEEKS", "3"))
 logger.info(
     "VideoDecoder configuration: "
     "Backend: 'OpenCV'; "
     f"Frame cache size: {VIDEO_FRAME_CACHE_MAX_SIZE_BYTES} bytes; "
-    f"Video cache TTL: {VIDEO_CACHE_TTL}s "
+    f"Video cache TTL: {VIDEO_CACHE_TTL}s; "
+    f"Reader pool size: {VIDEO_READER_POOL_SIZE}; "
+    f"Keyframe index after: {VIDEO_KEYFRAME_INDEX_MIN_SEEKS} seeks "
 )
 
 ReaderT = TypeVar("ReaderT", bound=cv2.VideoCapture)
-ReaderLockT = TypeVar("ReaderLockT")
 
 
 class VideoFrameOutOfRangeInternalException(Exception):
     """Raised when a video frame is requested that is outside the video frame range for the video"""
 
 
-def _clean_file_location(file_location: str) -> str:
-    """
-    Remove the variable path from the file location in case of a presigned url to ensure caching works.
-    """
-    return file_location.split("?")[0]
-
-
 class _VideoFrameCache(metaclass=Singleton):
     """LRU cache for video frames with TTL and bounded size in bytes"""
 
@@ -90,9 +92,14 @@ class _VideoFrameCache(metaclass=Singleton):
 
 class VideoTTLCache(TTLCache):
     """
-    Custom TTL cache that can release the video capture when an entry is removed from the cache
+    Custom TTL cache that can release the video capture when an entry is removed from the cache, and that counts the
+    entries evicted because the cache was full or they expired.
     """
 
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.evictions = 0
+
     @staticmethod
     def release_video_capture(value: ReaderT) -> None:
         """Release the videocapture"""
@@ -104,36 +111,126 @@ class VideoTTLCache(TTLCache):
         self.release_video_capture(self[key][0])
         super().__delitem__(key)
 
+    def popitem(self) -> tuple[str, Any]:
+        item = super().popitem()
+        self.evictions += 1
+        return item
+
+    def expire(self, time: float | None = None) -> list[tuple[str, Any]]:
+        expired = super().expire(time)
+        self.evictions += len(expired)
+        return expired
+
+
+@dataclass
+class _ReaderState:
+    """
+    Mutable decoding state of a pooled video reader.
+
+    :param keyframes: Sorted indices of the keyframes of the video, None if not loaded yet, empty if unavailable
+    :param next_frame_index: Index of the frame that the next call to `read()` returns, None if unknown
+    :param seeks: Number of times the reader seeked in the stream
+    """
+
+    keyframes: tuple[int, ...] | None = None
+    next_frame_index: int | None = None
+    seeks: int = 0
+
+    def preceding_keyframe(self, frame_index: int) -> int | None:
+        """
+        Get the index of the nearest keyframe at or before the given frame.
+
+        :param frame_index: Index of the target frame
+        :return: Index of the preceding keyframe, or None if the keyframe index is not available
+        """
+        if not self.keyframes:
+            return None
+        position = bisect.bisect_right(self.keyframes, frame_index)
+        return self.keyframes[position - 1] if position > 0 else None
+
+
+class _PooledVideoReader(NamedTuple):
+    reader: cv2.VideoCapture
+    lock: Lock
+    state: _ReaderState
 
-class _VideoReaderCache(Generic[ReaderT, ReaderLockT], metaclass=Singleton):
-    """LRU cache for video readers"""
+
+@dataclass
+class VideoReaderPoolStatistics:
+    """
+    Counters describing the effectiveness of the video reader pool.
+
+    :param reader_hits: Number of frame requests served by an already open reader
+    :param reader_opens: Number of readers that had to be opened
+    :param reader_evictions: Number of readers closed because the pool was full or they were idle for too long
+    :param seeks: Number of frame requests that required a seek in the stream
+    :param frames_decoded: Total number of frames decoded to reach the requested frames (i.e. the seek distance)
+    :param frames_served: Number of frames decoded by the pooled readers
+    """
+
+    reader_hits: int = 0
+    reader_opens: int = 0
+    reader_evictions: int = 0
+    seeks: int = 0
+    frames_decoded: int = 0
+    frames_served: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of the reader lookups that were served by an already open reader"""
+        lookups = self.reader_hits + self.reader_opens
+        return self.reader_hits / lookups if lookups else 0.0
+
+    @property
+    def mean_seek_distance(self) -> float:
+        """Average number of frames decoded for each served frame (1.0 means no wasted decoding)"""
+        return self.frames_decoded / self.frames_served if self.frames_served else 0.0
+
+
+class _VideoReaderCache(metaclass=Singleton):
+    """LRU pool of video readers, keyed by video"""
 
     def __init__(self) -> None:
         self._lock = Lock()
-        self._cache: VideoTTLCache = VideoTTLCache(maxsize=2, ttl=VIDEO_CACHE_TTL)
+        self._cache: VideoTTLCache = VideoTTLCache(maxsize=VIDEO_READER_POOL_SIZE, ttl=VIDEO_CACHE_TTL)
+        # Per-video locks held while a reader is created, so that opening a video (which may probe it and fetch it
+        # over the network) does not block the lookups of the other videos
+        self._creation_locks: dict[str, Lock] = {}
+        self._statistics = VideoReaderPoolStatistics()
 
-    def get_or_create(
-        self, file_location: str, create_fn: Callable[[], tuple[ReaderT, ReaderLockT]]
-    ) -> tuple[ReaderT, ReaderLockT]:
+    def get_or_create(self, file_location: str, create_fn: Callable[[], _PooledVideoReader]) -> _PooledVideoReader:
         """
         Get a video reader object from the cache, or create a new one if not already present.
 
         :param file_location: Path to the video file, used to uniquely identify the video within the cache
-        :param create_fn: Function to create a new reader object
-        :return: Tuple containing the video reader object and its associate lock
+        :param create_fn: Function to create a new reader object, called without holding the lock of the cache
+        :return: Pooled reader containing the video reader object, its associated lock and its decoding state
         """
         file_location = _clean_file_location(file_location)
-        cached_value = self._cache.get(file_location)
-        if cached_value is not None:
-            return cached_value
-        with self._lock:  # double-checked locking
+        with self._lock:
             cached_value = self._cache.get(file_location)
             if cached_value is not None:
+                self._statistics.reader_hits += 1
                 return cached_value
-            new_reader_with_lock = create_fn()
-            self._cache[file_location] = new_reader_with_lock
+            creation_lock = self._creation_locks.setdefault(file_location, Lock())
+
+        with creation_lock:
+            with self._lock:  # double-checked locking
+                cached_value = self._cache.get(file_location)
+                if cached_value is not None:
+                    self._statistics.reader_hits += 1
+                    return cached_value
+            try:
+                new_reader = create_fn()
+                with self._lock:
+                    self._cache[file_location] = new_reader
+                    self._statistics.reader_opens += 1
+            finally:
+                with self._lock:
+                    if self._creation_locks.get(file_location) is creation_lock:
+                        del self._creation_locks[file_location]
             logger.debug(f"Video adapter cached for {file_location}")
-            return new_reader_with_lock
+            return new_reader
 
     def evict(self, file_location: str) -> None:
         """
@@ -145,6 +242,24 @@ class _VideoReaderCache(Generic[ReaderT, ReaderLockT], metaclass=Singleton):
         with self._lock:
             self._cache.pop(file_location, None)
 
+    def record_decode(self, seeked: bool, frames_decoded: int) -> None:
+        """
+        Record the cost of serving one frame with a pooled reader.
+
+        :param seeked: Whether the reader had to seek in the stream
+        :param frames_decoded: Number of frames decoded to reach the requested frame, including the frame itself
+        """
+        with self._lock:
+            self._statistics.seeks += int(seeked)
+            self._statistics.frames_decoded += frames_decoded
+            self._statistics.frames_served += 1
+
+    @property
+    def statistics(self) -> VideoReaderPoolStatistics:
+        """Snapshot of the reader pool statistics"""
+        with self._lock:
+            return dataclasses.replace(self._statistics, reader_evictions=self._cache.evictions)
+
 
 class VideoInformation(NamedTuple):
     fps: float
@@ -170,39 +285,118 @@ class _VideoDecoderInterface:
     def reset_reader(self, file_location: str) -> None:
         pass
 
+    @abstractmethod
+    def get_reader_pool_statistics(self) -> VideoReaderPoolStatistics:
+        pass
+
+    def get_video_metadata(self, file_location: str) -> VideoMetadata:
+        """
+        Get the stream metadata of the video (fps, frame count, duration and codec).
+
+        Only the headers of the video are probed with ffprobe, the first time; subsequent calls are served from an
+        in-process cache. The keyframe index is not included, it is built by the readers that need it.
+
+        :param file_location: Local path or presigned S3 URL pointing to the video
+        :return: VideoMetadata of the video
+        """
+        return VideoMetadataCache().get_or_probe(file_location)
+
     def get_fps(self, file_location: str) -> float:
-        # Run ffprobe to get video stream information
-        result = subprocess.run(  # noqa: S603
-            [  # noqa: S607
-                "ffprobe",
-                "-v",
-                "error",
-                "-select_streams",
-                "v:0",
-                "-show_entries",
-                "stream=r_frame_rate",
-                "-of",
-                "json",
-                file_location,
-            ],
-            capture_output=True,
-            check=False,
-        )
-        ffprobe_output = json.loads(result.stdout)
-        # Extract the raw frame rate (the frame rate at which the video stream is encoded).
-        # This is a static value that may differ from the playback frame rate, which instead
-        # changes dynamically during playback for VFR (Variable Frame Rate) videos.
-        # The raw frame rate is expressed as a fraction (e.g. 30000/1001 -> 29.97 fps).
-        r_frame_rate = ffprobe_output["streams"][0]["r_frame_rate"]
-        # Calculate FPS from the r_frame_rate fraction
-        num, denominator = map(int, r_frame_rate.split("/"))
-        return num / denominator
+        """
+        Get the raw frame rate of the video, i.e. the frame rate at which the video stream is encoded.
+
+        :param file_location: Local path or presigned S3 URL pointing to the video
+        :return: Frame rate of the video
+        """
+        return self.get_video_metadata(file_location).fps
 
 
 class _VideoDecoderOpenCV(_VideoDecoderInterface, metaclass=Singleton):
     """OpenCV-based video decoder"""
 
-    __video_reader_cache: _VideoReaderCache[cv2.VideoCapture, Lock] = _VideoReaderCache()
+    __video_reader_cache: _VideoReaderCache = _VideoReaderCache()
+
+    @staticmethod
+    def _open_reader(file_location: str) -> _PooledVideoReader:
+        """
+        Open a video reader. The keyframe index of the video is loaded once the reader is used for random access.
+        """
+        return _PooledVideoReader(
+            reader=cv2.VideoCapture(file_location, cv2.CAP_FFMPEG),
+            lock=Lock(),
+            state=_ReaderState(),
+        )
+
+    @staticmethod
+    def _load_keyframes(file_location: str) -> tuple[int, ...]:
+        """
+        Get the keyframe index of the video, which is built at most once per video.
+
+        :return: Sorted indices of the keyframes, empty if the index is not available and the reader must seek
+            directly to the requested frames
+        """
+        try:
+            return VideoMetadataCache().get_or_probe_keyframes(file_location)
+        except (VideoMetadataProbeError, OSError) as exc:
+            logger.debug(f"Keyframe index not available for {file_location}: {exc}")
+            return ()
+
+    @staticmethod
+    def _seek(video_reader: cv2.VideoCapture, frame_index: int, fps: float | None) -> None:
+        if fps is not None and fps > 0.0:
+            # Convert frame index to milliseconds using the same formula as Go implementation
+            milliseconds = int((frame_index / fps) * 1000)
+            video_reader.set(cv2.CAP_PROP_POS_MSEC, milliseconds)
+        else:
+            # Fallback to frame-based seeking if fps is not set
+            video_reader.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+
+    def _position_reader(
+        self,
+        file_location: str,
+        video_reader: cv2.VideoCapture,
+        state: _ReaderState,
+        frame_index: int,
+        fps: float | None,
+    ) -> bool:
+        """
+        Move the reader so that the next `read()` returns the requested frame.
+
+        If the reader is already positioned before the requested frame within the same GOP, it decodes forward without
+        seeking. Otherwise, it seeks to the nearest preceding keyframe and decodes forward from there. Without a
+        keyframe index, it seeks directly to the requested frame; the index is loaded after
+        VIDEO_KEYFRAME_INDEX_MIN_SEEKS seeks.
+
+        :return: True if the reader had to seek in the stream
+        """
+        position = state.next_frame_index
+        if state.keyframes is None and position != frame_index and state.seeks >= VIDEO_KEYFRAME_INDEX_MIN_SEEKS:
+            state.keyframes = self._load_keyframes(file_location)
+        keyframe = state.preceding_keyframe(frame_index)
+        can_decode_forward = position is not None and (
+            position == frame_index or (keyframe is not None and keyframe <= position < frame_index)
+        )
+        if can_decode_forward:
+            start_index = position
+            seeked = False
+        elif keyframe is not None:
+            self._seek(video_reader, keyframe, fps)
+            start_index = keyframe
+            seeked = True
+        else:
+            self._seek(video_reader, frame_index, fps)
+            start_index = frame_index
+            seeked = True
+        state.seeks += seeked
+        for skipped_index in range(start_index, frame_index):  # type: ignore[arg-type]
+            if not video_reader.grab():
+                state.next_frame_index = None
+                raise VideoFrameReadingError(f"Failed to decode video frame at index {skipped_index}")
+        _VideoDecoderOpenCV.__video_reader_cache.record_decode(
+            seeked=seeked,
+            frames_decoded=frame_index - start_index + 1,  # type: ignore[operator]
+        )
+        return seeked
 
     def get_video_information(self, file_location: str) -> VideoInformation:
         """
@@ -211,9 +405,9 @@ class _VideoDecoderOpenCV(_VideoDecoderInterface, metaclass=Singleton):
         :param file_location: Local path or presigned S3 URL pointing to the video
         :return: _VideoInformation object containing information about the video
         """
-        video_reader, video_reader_lock = _VideoDecoderOpenCV.__video_reader_cache.get_or_create(
+        video_reader, video_reader_lock, _ = _VideoDecoderOpenCV.__video_reader_cache.get_or_create(
             file_location=file_location,
-            create_fn=lambda _fl=file_location: (cv2.VideoCapture(_fl, cv2.CAP_FFMPEG), Lock()),  # type: ignore[misc]
+            create_fn=lambda _fl=file_location: self._open_reader(_fl),  # type: ignore[misc]
         )
         with video_reader_lock:
             return VideoInformation(
@@ -239,9 +433,9 @@ class _VideoDecoderOpenCV(_VideoDecoderInterface, metaclass=Singleton):
             return cached_frame
 
         # Acquire the VideoCapture
-        video_reader, video_reader_lock = _VideoDecoderOpenCV.__video_reader_cache.get_or_create(
+        video_reader, video_reader_lock, reader_state = _VideoDecoderOpenCV.__video_reader_cache.get_or_create(
             file_location=file_location,
-            create_fn=lambda _fl=file_location: (cv2.VideoCapture(_fl, cv2.CAP_FFMPEG), Lock()),  # type: ignore[misc]
+            create_fn=lambda _fl=file_location: self._open_reader(_fl),  # type: ignore[misc]
         )
         with video_reader_lock:
             frame_count = int(video_reader.get(cv2.CAP_PROP_FRAME_COUNT))
@@ -250,20 +444,21 @@ class _VideoDecoderOpenCV(_VideoDecoderInterface, metaclass=Singleton):
                     f"The requested frame index `{frame_index}` is out of bounds."
                 )
 
-            if fps is not None and fps > 0.0:
-                # Convert frame index to milliseconds using the same formula as Go implementation
-                milliseconds = int((frame_index / fps) * 1000)
-                video_reader.set(cv2.CAP_PROP_POS_MSEC, milliseconds)
-            else:
-                # Fallback to frame-based seeking if fps is not set
-                video_reader.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+            try:
+                self._position_reader(file_location, video_reader, reader_state, frame_index, fps)
+            except VideoFrameReadingError as exc:
+                raise VideoFrameReadingError(
+                    f"Failed to read video frame at index {frame_index} for video at {file_location}"
+                ) from exc
 
             # Read the frame at the requested position
             read_success, video_frame_raw = video_reader.read()
             if not read_success:
+                reader_state.next_frame_index = None
                 raise VideoFrameReadingError(
                     f"Failed to read video frame at index {frame_index} for video at {file_location}"
                 )
+            reader_state.next_frame_index = frame_index + 1
         # Post-process the frame (because OpenCV output is BGR)
         video_frame = cv2.cvtColor(video_frame_raw, cv2.COLOR_BGR2RGB)
         # Cache the frame
@@ -272,6 +467,15 @@ class _VideoDecoderOpenCV(_VideoDecoderInterface, metaclass=Singleton):
 
     def reset_reader(self, file_location: str) -> None:
         _VideoDecoderOpenCV.__video_reader_cache.evict(file_location=file_location)
+        VideoMetadataCache().evict(file_location=file_location)
+
+    def get_reader_pool_statistics(self) -> VideoReaderPoolStatistics:
+        """
+        Get hit-rate, open-count, eviction and seek-distance statistics of the video reader pool.
+
+        :return: Snapshot of the reader pool statistics
+        """
+        return _VideoDecoderOpenCV.__video_reader_cache.statistics
 
 
 VideoDecoder: _VideoDecoderInterface = _VideoDecoderOpenCV()
@@ -0,0 +1,205 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""Probing and in-process caching of video stream metadata"""
+
+import json
+import logging
+import os
+import subprocess
+from threading import Lock
+from typing import NamedTuple
+
+from cachetools import LRUCache
+from geti_types import Singleton
+
+logger = logging.getLogger(__name__)
+
+VIDEO_METADATA_CACHE_MAX_SIZE = int(os.getenv("VIDEO_METADATA_CACHE_MAX_SIZE", "1000"))
+
+
+class VideoMetadataProbeError(ValueError):
+    """Raised when ffprobe fails to extract the stream metadata of a video"""
+
+
+class VideoMetadata(NamedTuple):
+    """
+    Stream-level metadata of a video, extracted once with ffprobe.
+
+    :param fps: Raw frame rate at which the video stream is encoded
+    :param total_frames: Number of frames in the video stream
+    :param duration: Duration of the video stream in seconds
+    :param codec: Name of the codec of the video stream (e.g. 'h264')
+    :param keyframes: Sorted indices of the frames that are keyframes, None if the keyframe index is not built yet
+    """
+
+    fps: float
+    total_frames: int
+    duration: float
+    codec: str
+    keyframes: tuple[int, ...] | None = None
+
+
+def _clean_file_location(file_location: str) -> str:
+    """
+    Remove the variable path from the file location in case of a presigned url to ensure caching works.
+    """
+    return file_location.split("?")[0]
+
+
+def _parse_frame_rate(r_frame_rate: str) -> float:
+    """
+    Parse a frame rate expressed as a fraction (e.g. 30000/1001 -> 29.97 fps).
+
+    :param r_frame_rate: Frame rate fraction as reported by ffprobe
+    :return: Frame rate as float
+    """
+    num, denominator = map(int, r_frame_rate.split("/"))
+    return num / denominator
+
+
+def _run_ffprobe(file_location: str, *args: str) -> dict:
+    """
+    Run ffprobe on the first video stream and parse its JSON output.
+
+    :param file_location: Local path or presigned S3 URL pointing to the video
+    :param args: ffprobe arguments selecting the entries to show
+    :return: Parsed ffprobe output
+    :raises VideoMetadataProbeError: if ffprobe does not return any output
+    """
+    result = subprocess.run(  # noqa: S603
+        ["ffprobe", "-v", "error", "-select_streams", "v:0", *args, "-of", "json", file_location],  # noqa: S607
+        capture_output=True,
+        check=False,
+    )
+    try:
+        return json.loads(result.stdout)
+    except ValueError as exc:
+        raise VideoMetadataProbeError(f"Failed to probe the video stream at {file_location}") from exc
+
+
+def probe_video_metadata(file_location: str) -> VideoMetadata:
+    """
+    Extract the metadata of the first video stream with a single ffprobe invocation.
+
+    Only the stream and container headers are read, so the video is not downloaded in full when it is stored remotely.
+    The keyframe index, which requires reading the whole stream, is built separately with `probe_video_keyframes`.
+
+    :param file_location: Local path or presigned S3 URL pointing to the video
+    :return: VideoMetadata of the video, without keyframe index
+    :raises VideoMetadataProbeError: if ffprobe does not return the stream information
+    """
+    ffprobe_output = _run_ffprobe(
+        file_location, "-show_entries", "stream=codec_name,r_frame_rate,nb_frames,duration:format=duration"
+    )
+    try:
+        stream = ffprobe_output["streams"][0]
+        # The raw frame rate is the frame rate at which the video stream is encoded. It is a static value that may
+        # differ from the playback frame rate, which changes dynamically during playback for VFR videos.
+        fps = _parse_frame_rate(stream["r_frame_rate"])
+    except (ValueError, KeyError, IndexError, ZeroDivisionError) as exc:
+        raise VideoMetadataProbeError(f"Failed to probe the video stream at {file_location}") from exc
+
+    # Some containers (e.g. WebM) only report the duration of the whole file and no frame count in their headers
+    duration = float(stream.get("duration", ffprobe_output.get("format", {}).get("duration", 0.0)))
+    total_frames = int(stream["nb_frames"]) if "nb_frames" in stream else round(duration * fps)
+    return VideoMetadata(fps=fps, total_frames=total_frames, duration=duration, codec=stream.get("codec_name", ""))
+
+
+def probe_video_keyframes(file_location: str, fps: float) -> tuple[int, ...]:
+    """
+    Build the keyframe index of the first video stream.
+
+    Only the keyframes are decoded, but the whole stream is read: this is only done once a reader needs to seek in
+    the video.
+
+    :param file_location: Local path or presigned S3 URL pointing to the video
+    :param fps: Raw frame rate of the video stream, to convert the timestamps of the keyframes to frame indices
+    :return: Sorted indices of the keyframes
+    :raises VideoMetadataProbeError: if ffprobe does not return the frames of the stream
+    """
+    ffprobe_output = _run_ffprobe(
+        file_location, "-skip_frame", "nokey", "-show_entries", "stream=start_time:frame=pts_time"
+    )
+    try:
+        frames = ffprobe_output["frames"]
+    except KeyError as exc:
+        raise VideoMetadataProbeError(f"Failed to probe the keyframes of the video at {file_location}") from exc
+    pts_times = [float(frame["pts_time"]) for frame in frames if "pts_time" in frame]
+    streams = ffprobe_output.get("streams") or [{}]
+    start_time = float(streams[0].get("start_time", min(pts_times, default=0.0)))
+    return tuple(sorted({round((pts_time - start_time) * fps) for pts_time in pts_times}))
+
+
+class VideoMetadataCache(metaclass=Singleton):
+    """
+    LRU cache for video metadata.
+
+    Metadata is probed at most once per video for the lifetime of the process. Callers that already know the
+    metadata, for example because it was persisted together with the Video entity, can seed the cache to avoid
+    probing altogether. The keyframe index is only built when requested with `get_or_probe_keyframes`.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._cache: LRUCache = LRUCache(maxsize=VIDEO_METADATA_CACHE_MAX_SIZE)
+
+    def get_or_probe(self, file_location: str) -> VideoMetadata:
+        """
+        Get the metadata of a video from the cache, or probe the video if not already present.
+
+        :param file_location: Local path or presigned S3 URL pointing to the video
+        :return: VideoMetadata of the video
+        """
+        key = _clean_file_location(file_location)
+        with self._lock:
+            metadata = self._cache.get(key)
+        if metadata is not None:
+            return metadata
+        # Probing runs outside the lock, so that a slow probe does not block lookups for other videos
+        metadata = probe_video_metadata(file_location)
+        with self._lock:
+            self._cache[key] = metadata
+        logger.debug(f"Video metadata cached for {key}")
+        return metadata
+
+    def get_or_probe_keyframes(self, file_location: str) -> tuple[int, ...]:
+        """
+        Get the keyframe index of a video from the cache, or build it if not already present.
+
+        :param file_location: Local path or presigned S3 URL pointing to the video
+        :return: Sorted indices of the keyframes of the video
+        """
+        metadata = self.get_or_probe(file_location)
+        if metadata.keyframes is not None:
+            return metadata.keyframes
+        keyframes = probe_video_keyframes(file_location, fps=metadata.fps)
+        with self._lock:
+            self._cache[_clean_file_location(file_location)] = metadata._replace(keyframes=keyframes)
+        logger.debug(f"Keyframe index built for {_clean_file_location(file_location)}: {len(keyframes)} keyframes")
+        return keyframes
+
+    def seed(self, file_location: str, metadata: VideoMetadata) -> None:
+        """
+        Store already known metadata for a video in the cache.
+
+        A keyframe index already built for the video is kept if the seeded metadata does not have one.
+
+        :param file_location: Local path or presigned S3 URL pointing to the video
+        :param metadata: VideoMetadata of the video
+        """
+        key = _clean_file_location(file_location)
+        with self._lock:
+            cached_metadata = self._cache.get(key)
+            if metadata.keyframes is None and cached_metadata is not None:
+                metadata = metadata._replace(keyframes=cached_metadata.keyframes)
+            self._cache[key] = metadata
+
+    def evict(self, file_location: str) -> None:
+        """
+        Remove the metadata of a specific video from the cache
+
+        :param file_location: Local path or presigned S3 URL pointing to the video
+        """
+        with self._lock:
+            self._cache.pop(_clean_file_location(file_location), None)
@@ -0,0 +1,78 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""
+Cold/warm benchmark of the video metadata lookup.
+
+'cold' runs a fresh ffprobe for every call (the behaviour before the metadata cache was introduced), while 'warm'
+serves the metadata from the in-process VideoMetadataCache after a single probe.
+
+Usage: PYTHONPATH=. python tests/benchmarks/bench_video_metadata.py [--frames 300] [--calls 50]
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from collections.abc import Callable
+
+import cv2
+import numpy as np
+
+from media_utils.video_metadata import VideoMetadataCache, probe_video_metadata
+
+
+def generate_video(path: str, num_frames: int, width: int = 320, height: int = 240, fps: float = 30.0) -> None:
+    """Write a synthetic video with moving noise so that the encoder produces regular keyframes"""
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), fps, (width, height))
+    rng = np.random.default_rng(seed=0)
+    for _ in range(num_frames):
+        writer.write(rng.integers(0, 255, size=(height, width, 3), dtype=np.uint8))
+    writer.release()
+
+
+def _time_calls(fn: Callable[[], object], calls: int) -> list[float]:
+    timings = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _report(name: str, timings: list[float]) -> None:
+    print(
+        f"{name:>5}: mean {statistics.mean(timings) * 1e3:9.3f} ms | "
+        f"p95 {sorted(timings)[int(0.95 * (len(timings) - 1))] * 1e3:9.3f} ms | "
+        f"total {sum(timings):7.3f} s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=300, help="Number of frames of the generated video")
+    parser.add_argument("--calls", type=int, default=50, help="Number of metadata lookups per scenario")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        video_path = os.path.join(tmp_dir, "benchmark.mp4")
+        generate_video(video_path, num_frames=args.frames)
+        metadata = probe_video_metadata(video_path)
+        print(
+            f"Video: {metadata.total_frames} frames @ {metadata.fps:.2f} fps, codec {metadata.codec}, "
+            f"{metadata.duration:.2f}s"
+        )
+
+        cold = _time_calls(lambda: probe_video_metadata(video_path), args.calls)
+        cache = VideoMetadataCache()
+        cache.evict(video_path)
+        warm = _time_calls(lambda: cache.get_or_probe(video_path), args.calls)
+
+    _report("cold", cold)
+    _report("warm", warm)
+    print(f"Speed-up: {sum(cold) / sum(warm):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""
+Benchmark of random-access frame serving with the pooled video readers.
+
+A number of local videos is generated, then an annotation session is simulated: several annotators interleave their
+requests, each one stepping forward through a different video with a fixed stride and occasionally jumping to a
+random frame. Every configuration runs in a separate process, because the reader pool is configured at import time.
+The frame cache is disabled so that every request is decoded.
+
+The keyframe index is built with ffprobe; without ffprobe on the PATH the readers fall back to direct seeking.
+
+Usage: PYTHONPATH=. python tests/benchmarks/bench_video_reader_pool.py [--videos 6] [--frames 600] [--requests 600]
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+CONFIGURATIONS = [
+    {"name": "2 readers, no keyframe index", "pool_size": 2, "keyframe_index": False},
+    {"name": "2 readers, keyframe index", "pool_size": 2, "keyframe_index": True},
+    {"name": "pooled readers, no keyframe index", "pool_size": None, "keyframe_index": False},
+    {"name": "pooled readers, keyframe index", "pool_size": None, "keyframe_index": True},
+]
+
+
+def generate_videos(directory: str, num_videos: int, num_frames: int) -> list[str]:
+    """Generate local test videos with moving content"""
+    import cv2
+    import numpy as np
+
+    paths = []
+    for video_index in range(num_videos):
+        path = os.path.join(directory, f"video_{video_index}.mp4")
+        writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), 30.0, (320, 240))
+        rng = np.random.default_rng(seed=video_index)
+        background = rng.integers(0, 255, size=(240, 320, 3), dtype=np.uint8)
+        for frame_index in range(num_frames):
+            writer.write(np.roll(background, shift=frame_index * 4, axis=1))
+        writer.release()
+        paths.append(path)
+    return paths
+
+
+def build_requests(paths: list[str], num_frames: int, num_requests: int, stride: int) -> list[tuple[str, int]]:
+    """Interleave the frame requests of one simulated annotator per video"""
+    rng = random.Random(0)  # noqa: S311
+    positions = dict.fromkeys(paths, 0)
+    requests = []
+    for _ in range(num_requests):
+        path = rng.choice(paths)
+        if rng.random() < 0.1:
+            positions[path] = rng.randrange(num_frames)
+        else:
+            positions[path] = (positions[path] + stride) % num_frames
+        requests.append((path, positions[path]))
+    return requests
+
+
+def run_configuration(requests: list[tuple[str, int]], keyframe_index: bool) -> dict:
+    """Serve the requests in the current process and return the timings and pool statistics"""
+    from media_utils.video_decoder import VideoDecoder
+    from media_utils.video_metadata import VideoMetadata, VideoMetadataCache
+
+    if not keyframe_index:
+        for path in {path for path, _ in requests}:
+            VideoMetadataCache().seed(path, VideoMetadata(fps=30.0, total_frames=0, duration=0, codec="", keyframes=()))
+    latencies = []
+    start = time.perf_counter()
+    for path, frame_index in requests:
+        request_start = time.perf_counter()
+        VideoDecoder.decode(file_location=path, frame_index=frame_index)
+        latencies.append(time.perf_counter() - request_start)
+    total = time.perf_counter() - start
+    statistics = VideoDecoder.get_reader_pool_statistics()
+    latencies.sort()
+    return {
+        "total_s": total,
+        "p50_ms": latencies[len(latencies) // 2] * 1e3,
+        "p95_ms": latencies[int(0.95 * (len(latencies) - 1))] * 1e3,
+        "hit_rate": statistics.hit_rate,
+        "reader_opens": statistics.reader_opens,
+        "reader_evictions": statistics.reader_evictions,
+        "seeks": statistics.seeks,
+        "mean_seek_distance": statistics.mean_seek_distance,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--videos", type=int, default=6, help="Number of videos annotated concurrently")
+    parser.add_argument("--frames", type=int, default=600, help="Number of frames per video")
+    parser.add_argument("--requests", type=int, default=600, help="Number of frame requests")
+    parser.add_argument("--stride", type=int, default=3, help="Frame stride of the simulated annotators")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        worker_args = json.loads(args.worker)
+        result = run_configuration(
+            requests=[tuple(request) for request in worker_args["requests"]],  # type: ignore[misc]
+            keyframe_index=worker_args["keyframe_index"],
+        )
+        print(json.dumps(result))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = generate_videos(tmp_dir, num_videos=args.videos, num_frames=args.frames)
+        requests = build_requests(paths, num_frames=args.frames, num_requests=args.requests, stride=args.stride)
+        print(f"{args.videos} videos x {args.frames} frames, {args.requests} requests with stride {args.stride}")
+        for configuration in CONFIGURATIONS:
+            pool_size = configuration["pool_size"] or args.videos
+            env = dict(os.environ, VIDEO_READER_POOL_SIZE=str(pool_size), VIDEO_FRAME_CACHE_MAX_SIZE_BYTES="1")
+            worker_args = json.dumps({"requests": requests, "keyframe_index": configuration["keyframe_index"]})
+            output = subprocess.run(  # noqa: S603
+                [sys.executable, __file__, "--worker", worker_args],
+                env=env,
+                capture_output=True,
+                check=True,
+                text=True,
+            )
+            result = json.loads(output.stdout.strip().splitlines()[-1])
+            print(
+                f"{configuration['name']:>34}: total {result['total_s']:7.3f} s | "
+                f"p50 {result['p50_ms']:7.2f} ms | p95 {result['p95_ms']:7.2f} ms | "
+                f"hit rate {result['hit_rate']:5.1%} | opens {result['reader_opens']:4d} | "
+                f"evictions {result['reader_evictions']:4d} | "
+                f"seeks {result['seeks']:4d} | mean seek distance {result['mean_seek_distance']:5.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
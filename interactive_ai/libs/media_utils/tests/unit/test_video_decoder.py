@@ -2,13 +2,24 @@
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import cv2
 import numpy as np
 import pytest
 
-from media_utils.video_decoder import VideoTTLCache, _clean_file_location, _VideoDecoderOpenCV
+from media_utils.video_decoder import (
+    VideoFrameReadingError,
+    VideoTTLCache,
+    _clean_file_location,
+    _PooledVideoReader,
+    _ReaderState,
+    _VideoDecoderOpenCV,
+    _VideoReaderCache,
+)
+from media_utils.video_metadata import VideoMetadataCache
 
 
 @pytest.fixture
@@ -32,6 +43,17 @@ class TestDecoder:
         del video_ttl_cache["video1"]
         mock_release.release.assert_called_once()
 
+    def test_count_evictions(self, video_ttl_cache):
+        for i in range(3):
+            video_ttl_cache[f"video{i}"] = (MagicMock(), None)
+        # Explicit removals are not evictions
+        del video_ttl_cache["video2"]
+        assert video_ttl_cache.evictions == 1
+
+        video_ttl_cache.expire(time=video_ttl_cache.timer() + 301)
+        assert video_ttl_cache.evictions == 2
+        assert not video_ttl_cache
+
     def test_decode_with_fps_millisecond_seeking(self):
         """Test that fps parameter triggers millisecond-based seeking"""
         # Arrange
@@ -60,7 +82,9 @@ class TestDecoder:
                 mock_frame_cache.return_value = mock_frame_cache_instance
                 mock_frame_cache_instance.get_if_exists.return_value = None
 
-                mock_cache.get_or_create.return_value = (mock_video_reader, MagicMock())
+                mock_cache.get_or_create.return_value = _PooledVideoReader(
+                    reader=mock_video_reader, lock=MagicMock(), state=_ReaderState()
+                )
 
                 result = decoder.decode(file_location, frame_index, fps)
 
@@ -68,3 +92,156 @@ class TestDecoder:
                 expected_milliseconds = int((frame_index / fps) * 1000)  # (30/25)*1000 = 1200ms
                 mock_video_reader.set.assert_called_with(cv2.CAP_PROP_POS_MSEC, expected_milliseconds)
                 assert isinstance(result, np.ndarray)
+
+    @pytest.mark.parametrize(
+        "keyframes, next_frame_index, frame_index, expected_seek, expected_grabs",
+        [
+            ((), None, 30, 30, 0),  # no keyframe index: seek directly to the frame
+            ((), 30, 30, None, 0),  # sequential read: no seek
+            ((0, 25, 50), None, 30, 25, 5),  # seek to the preceding keyframe and decode forward
+            ((0, 25, 50), 27, 30, None, 3),  # same GOP, ahead of the reader: decode forward
+            ((0, 25, 50), 20, 30, 25, 5),  # a keyframe lies in between: seek to it instead
+            ((0, 25, 50), 35, 30, 25, 5),  # reader is past the frame: seek back
+        ],
+    )
+    def test_decode_seeks_to_preceding_keyframe(
+        self, keyframes, next_frame_index, frame_index, expected_seek, expected_grabs
+    ):
+        decoder = _VideoDecoderOpenCV()
+        mock_video_reader = MagicMock(spec=cv2.VideoCapture)
+        mock_video_reader.get.side_effect = lambda prop: 100 if prop == cv2.CAP_PROP_FRAME_COUNT else 0
+        mock_video_reader.grab.return_value = True
+        mock_video_reader.read.return_value = (True, np.zeros((4, 4, 3), dtype=np.uint8))
+        state = _ReaderState(keyframes=keyframes, next_frame_index=next_frame_index)
+
+        with (
+            patch(
+                "media_utils.video_decoder._VideoDecoderOpenCV._VideoDecoderOpenCV__video_reader_cache"
+            ) as mock_cache,
+            patch("media_utils.video_decoder._VideoFrameCache") as mock_frame_cache,
+        ):
+            mock_frame_cache.return_value.get_if_exists.return_value = None
+            mock_cache.get_or_create.return_value = _PooledVideoReader(
+                reader=mock_video_reader, lock=MagicMock(), state=state
+            )
+
+            decoder.decode("test_video.mp4", frame_index)
+
+        if expected_seek is None:
+            mock_video_reader.set.assert_not_called()
+        else:
+            mock_video_reader.set.assert_called_once_with(cv2.CAP_PROP_POS_FRAMES, expected_seek)
+        assert mock_video_reader.grab.call_count == expected_grabs
+        assert state.next_frame_index == frame_index + 1
+        mock_cache.record_decode.assert_called_once_with(
+            seeked=expected_seek is not None, frames_decoded=expected_grabs + 1
+        )
+
+    @pytest.mark.parametrize(
+        "seeks, next_frame_index, expected_load",
+        [
+            (0, None, False),  # fresh reader: seek directly, without reading the whole video
+            (3, 30, False),  # sequential read: the keyframe index is not needed
+            (3, 10, True),  # reader used for random access: build the keyframe index
+        ],
+    )
+    def test_decode_loads_keyframes_lazily(self, seeks, next_frame_index, expected_load):
+        decoder = _VideoDecoderOpenCV()
+        mock_video_reader = MagicMock(spec=cv2.VideoCapture)
+        mock_video_reader.get.side_effect = lambda prop: 100 if prop == cv2.CAP_PROP_FRAME_COUNT else 0
+        mock_video_reader.grab.return_value = True
+        mock_video_reader.read.return_value = (True, np.zeros((4, 4, 3), dtype=np.uint8))
+        state = _ReaderState(next_frame_index=next_frame_index, seeks=seeks)
+
+        with (
+            patch(
+                "media_utils.video_decoder._VideoDecoderOpenCV._VideoDecoderOpenCV__video_reader_cache"
+            ) as mock_cache,
+            patch("media_utils.video_decoder._VideoFrameCache") as mock_frame_cache,
+            patch.object(VideoMetadataCache, "get_or_probe_keyframes", return_value=(0, 25)) as mock_get_keyframes,
+        ):
+            mock_frame_cache.return_value.get_if_exists.return_value = None
+            mock_cache.get_or_create.return_value = _PooledVideoReader(
+                reader=mock_video_reader, lock=MagicMock(), state=state
+            )
+
+            decoder.decode("test_video.mp4", 30)
+
+        if expected_load:
+            mock_get_keyframes.assert_called_once_with("test_video.mp4")
+            mock_video_reader.set.assert_called_once_with(cv2.CAP_PROP_POS_FRAMES, 25)
+            assert state.keyframes == (0, 25)
+        else:
+            mock_get_keyframes.assert_not_called()
+            assert state.keyframes is None
+
+    def test_decode_failure_invalidates_reader_position(self):
+        decoder = _VideoDecoderOpenCV()
+        mock_video_reader = MagicMock(spec=cv2.VideoCapture)
+        mock_video_reader.get.side_effect = lambda prop: 100 if prop == cv2.CAP_PROP_FRAME_COUNT else 0
+        mock_video_reader.read.return_value = (False, None)
+        state = _ReaderState(keyframes=(0, 50), next_frame_index=10)
+
+        with (
+            patch(
+                "media_utils.video_decoder._VideoDecoderOpenCV._VideoDecoderOpenCV__video_reader_cache"
+            ) as mock_cache,
+            patch("media_utils.video_decoder._VideoFrameCache") as mock_frame_cache,
+            pytest.raises(VideoFrameReadingError),
+        ):
+            mock_frame_cache.return_value.get_if_exists.return_value = None
+            mock_cache.get_or_create.return_value = _PooledVideoReader(
+                reader=mock_video_reader, lock=MagicMock(), state=state
+            )
+            decoder.decode("test_video.mp4", 10)
+
+        assert state.next_frame_index is None
+
+    def test_reader_pool_statistics(self):
+        pool = _VideoReaderCache.__new__(_VideoReaderCache)
+        _VideoReaderCache.__init__(pool)
+        create_fn = MagicMock(
+            return_value=_PooledVideoReader(reader=MagicMock(), lock=MagicMock(), state=_ReaderState())
+        )
+
+        pool.get_or_create("video_1.mp4?signature=1", create_fn)
+        pool.get_or_create("video_1.mp4?signature=2", create_fn)
+        pool.get_or_create("video_2.mp4", create_fn)
+        pool.record_decode(seeked=True, frames_decoded=5)
+        pool.record_decode(seeked=False, frames_decoded=1)
+        statistics = pool.statistics
+
+        assert create_fn.call_count == 2
+        assert (statistics.reader_hits, statistics.reader_opens) == (1, 2)
+        assert statistics.hit_rate == pytest.approx(1 / 3)
+        assert statistics.reader_evictions == 0
+        assert statistics.seeks == 1
+        assert statistics.mean_seek_distance == 3.0
+
+    def test_reader_pool_slow_creation_does_not_block_other_videos(self):
+        pool = _VideoReaderCache.__new__(_VideoReaderCache)
+        _VideoReaderCache.__init__(pool)
+        creation_started, release_creation = threading.Event(), threading.Event()
+
+        def slow_create_fn() -> _PooledVideoReader:
+            creation_started.set()
+            release_creation.wait(timeout=5)
+            return _PooledVideoReader(reader=MagicMock(), lock=MagicMock(), state=_ReaderState())
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            slow_readers = [executor.submit(pool.get_or_create, "slow.mp4", slow_create_fn) for _ in range(2)]
+            assert creation_started.wait(timeout=5)
+            # Another video is served while the slow video is still being opened
+            fast_reader = executor.submit(
+                pool.get_or_create,
+                "fast.mp4",
+                lambda: _PooledVideoReader(reader=MagicMock(), lock=MagicMock(), state=_ReaderState()),
+            ).result(timeout=1)
+            release_creation.set()
+            slow_results = [future.result(timeout=5) for future in slow_readers]
+
+        assert fast_reader is not None
+        # The slow video is opened once, the concurrent lookup waits for it
+        assert slow_results[0] is slow_results[1]
+        assert (pool.statistics.reader_opens, pool.statistics.reader_hits) == (2, 1)
+        assert not pool._creation_locks
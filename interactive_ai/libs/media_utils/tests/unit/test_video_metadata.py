@@ -0,0 +1,139 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from media_utils.video_decoder import _VideoDecoderOpenCV
+from media_utils.video_metadata import (
+    VideoMetadata,
+    VideoMetadataCache,
+    VideoMetadataProbeError,
+    probe_video_keyframes,
+    probe_video_metadata,
+)
+
+FFPROBE_OUTPUT = {
+    "streams": [
+        {"codec_name": "h264", "r_frame_rate": "25/1", "nb_frames": "4", "duration": "0.160000"},
+    ],
+    "format": {"duration": "0.200000"},
+}
+FFPROBE_KEYFRAMES_OUTPUT = {
+    "frames": [{"pts_time": "0.040000"}, {"pts_time": "0.160000"}],
+    "streams": [{"start_time": "0.040000"}],
+}
+
+
+@pytest.fixture
+def fxt_video_metadata_cache():
+    cache = VideoMetadataCache()
+    cache._cache.clear()
+    yield cache
+    cache._cache.clear()
+
+
+def _ffprobe_result(output: dict | str) -> MagicMock:
+    result = MagicMock()
+    result.stdout = output if isinstance(output, str) else json.dumps(output)
+    return result
+
+
+class TestVideoMetadata:
+    def test_probe_video_metadata(self) -> None:
+        with patch(
+            "media_utils.video_metadata.subprocess.run", return_value=_ffprobe_result(FFPROBE_OUTPUT)
+        ) as mock_run:
+            metadata = probe_video_metadata("video.mp4")
+
+        assert metadata == VideoMetadata(fps=25.0, total_frames=4, duration=0.16, codec="h264")
+        # Only the headers are probed, the packets and frames of the stream are not read
+        ffprobe_args = mock_run.call_args.args[0]
+        assert "stream=codec_name,r_frame_rate,nb_frames,duration:format=duration" in ffprobe_args
+        assert not any("packet" in arg or "frame=" in arg for arg in ffprobe_args)
+
+    def test_probe_video_metadata_missing_counts(self) -> None:
+        ffprobe_output = {
+            "streams": [{"codec_name": "vp9", "r_frame_rate": "30000/1001"}],
+            "format": {"duration": "10.010000"},
+        }
+        with patch("media_utils.video_metadata.subprocess.run", return_value=_ffprobe_result(ffprobe_output)):
+            metadata = probe_video_metadata("video.webm")
+
+        assert metadata.total_frames == 300
+        assert metadata.duration == pytest.approx(10.01)
+        assert metadata.codec == "vp9"
+
+    def test_probe_video_keyframes(self) -> None:
+        with patch(
+            "media_utils.video_metadata.subprocess.run", return_value=_ffprobe_result(FFPROBE_KEYFRAMES_OUTPUT)
+        ) as mock_run:
+            keyframes = probe_video_keyframes("video.mp4", fps=25.0)
+
+        assert keyframes == (0, 3)
+        assert "nokey" in mock_run.call_args.args[0]
+
+    @pytest.mark.parametrize("ffprobe_output", ["", {"streams": []}, {}])
+    def test_probe_video_metadata_error(self, ffprobe_output) -> None:
+        with (
+            patch("media_utils.video_metadata.subprocess.run", return_value=_ffprobe_result(ffprobe_output)),
+            pytest.raises(VideoMetadataProbeError),
+        ):
+            probe_video_metadata("corrupt.mp4")
+
+    def test_cache_probes_once(self, fxt_video_metadata_cache) -> None:
+        with patch(
+            "media_utils.video_metadata.subprocess.run", return_value=_ffprobe_result(FFPROBE_OUTPUT)
+        ) as mock_run:
+            first = fxt_video_metadata_cache.get_or_probe("http://seaweed/videos/video.mp4?signature=1")
+            second = fxt_video_metadata_cache.get_or_probe("http://seaweed/videos/video.mp4?signature=2")
+
+        mock_run.assert_called_once()
+        assert first is second
+
+    def test_cache_builds_keyframe_index_once(self, fxt_video_metadata_cache) -> None:
+        with patch(
+            "media_utils.video_metadata.subprocess.run",
+            side_effect=[_ffprobe_result(FFPROBE_OUTPUT), _ffprobe_result(FFPROBE_KEYFRAMES_OUTPUT)],
+        ) as mock_run:
+            assert fxt_video_metadata_cache.get_or_probe("video.mp4").keyframes is None
+            first = fxt_video_metadata_cache.get_or_probe_keyframes("video.mp4")
+            second = fxt_video_metadata_cache.get_or_probe_keyframes("video.mp4")
+
+        assert first == second == (0, 3)
+        assert mock_run.call_count == 2
+        assert fxt_video_metadata_cache.get_or_probe("video.mp4").keyframes == (0, 3)
+
+    def test_cache_seed_keeps_keyframe_index(self, fxt_video_metadata_cache) -> None:
+        fxt_video_metadata_cache.seed("video.mp4", VideoMetadata(10.0, 100, 10.0, "h264", keyframes=(0, 50)))
+        fxt_video_metadata_cache.seed("video.mp4?signature=2", VideoMetadata(10.0, 100, 10.0, "h264"))
+
+        assert fxt_video_metadata_cache.get_or_probe("video.mp4").keyframes == (0, 50)
+
+    def test_cache_seed_and_evict(self, fxt_video_metadata_cache) -> None:
+        metadata = VideoMetadata(fps=10.0, total_frames=100, duration=10.0, codec="h264", keyframes=(0, 50))
+        fxt_video_metadata_cache.seed("video.mp4", metadata)
+
+        with patch(
+            "media_utils.video_metadata.subprocess.run", return_value=_ffprobe_result(FFPROBE_OUTPUT)
+        ) as mock_run:
+            assert fxt_video_metadata_cache.get_or_probe("video.mp4") == metadata
+            mock_run.assert_not_called()
+
+            fxt_video_metadata_cache.evict("video.mp4")
+            assert fxt_video_metadata_cache.get_or_probe("video.mp4").fps == 25.0
+            mock_run.assert_called_once()
+
+    def test_decoder_get_fps_uses_cache(self, fxt_video_metadata_cache) -> None:
+        decoder = _VideoDecoderOpenCV()
+        with patch(
+            "media_utils.video_metadata.subprocess.run", return_value=_ffprobe_result(FFPROBE_OUTPUT)
+        ) as mock_run:
+            fps = [decoder.get_fps("video.mp4") for _ in range(3)]
+            decoder.reset_reader("video.mp4")
+            decoder.get_fps("video.mp4")
+
+        assert fps == [25.0, 25.0, 25.0]
+        assert mock_run.call_count == 2
@@ -7,16 +7,42 @@ from collections import Counter
 from collections.abc import Sequence
 
 import numpy as np
-from sklearn.decomposition import PCA
 
+from active_learning.algorithms.feature_guided.pca import FittedPCACache, IncrementalRandomizedPCA
 from active_learning.algorithms.interface import IScoringFunction, ScoringFunctionRequirements
 from active_learning.utils import NullableDataset
 
 from geti_telemetry_tools import unified_tracing
+from geti_types import ID
 from iai_core.entities.dataset_item import DatasetItem
 from iai_core.utils.classes import classproperty
 
 
+def _fit_pca(
+    seen_features: np.ndarray,
+    seen_dataset_items: Sequence[DatasetItem],
+    model_id: ID | None,
+    label: bytes | None,
+) -> IncrementalRandomizedPCA:
+    """
+    Fit a PCA on the seen features, or update the one fitted in a previous round for the same model and label.
+
+    :param seen_features: Features of the seen items
+    :param seen_dataset_items: Seen items, in the same order as the features
+    :param model_id: ID of the model that extracted the features; if None, the PCA is fitted from scratch
+    :param label: ID of the label the items are relative to, or None for class-agnostic PCA
+    :return: Fitted PCA
+    """
+    if model_id is None:
+        return IncrementalRandomizedPCA().fit(seen_features)
+    return FittedPCACache().get_or_fit(
+        model_id=model_id,
+        label=label,
+        keys=[(item.media_identifier, item.roi_id) for item in seen_dataset_items],
+        features=seen_features,
+    )
+
+
 class FeatureReconstructionError(IScoringFunction):
     """
     FRE (Feature Reconstruction Error) algorithm with pseudo stratified sampling.
@@ -50,6 +76,7 @@ class FeatureReconstructionError(IScoringFunction):
         seen_dataset_items_with_annotations: Sequence[DatasetItem],
         unseen_dataset_features: np.ndarray,
         seen_dataset_features: np.ndarray,
+        model_id: ID | None = None,
     ) -> np.ndarray:
         # note: instead of Labels, we use their IDs to identify them uniquely
         unseen_dataset_pred_labels = np.fromiter(
@@ -73,22 +100,24 @@ class FeatureReconstructionError(IScoringFunction):
             unseen_features = unseen_dataset_features[unseen_indices]
 
             # Get the features of seen items whose annotation has this label
-            seen_features = seen_dataset_features[seen_dataset_ann_labels == pred_label]
+            seen_indices = np.where(seen_dataset_ann_labels == pred_label)[0]
+            seen_features = seen_dataset_features[seen_indices]
 
             if len(seen_features) == 0:
-                # No seen items with this label to apply PCA
-                unseen_features_reconstructed = unseen_features
+                # No seen items with this label to apply PCA, so the features are reconstructed exactly
+                fre_scores = np.zeros(len(unseen_features))
             else:
-                # Apply label-conditional PCA to reduce the feature space dimensionality
-                pca_for_label = PCA(0.995)
-                pca_for_label.fit(seen_features)
-                unseen_features_reduced = pca_for_label.transform(unseen_features)
-                unseen_features_reconstructed = pca_for_label.inverse_transform(unseen_features_reduced)
-
-            # Compute the FRE scores as the distance of the original features from the
-            # reconstructed ones; this promotes diversity along the low-variance axes.
-            # The minus sign makes so that better items map to lower scores (Geti)
-            fre_scores = -np.sum(np.square(unseen_features - unseen_features_reconstructed), axis=1)
+                # Apply label-conditional PCA to reduce the feature space dimensionality.
+                # Compute the FRE scores as the distance of the original features from the
+                # reconstructed ones; this promotes diversity along the low-variance axes.
+                # The minus sign makes so that better items map to lower scores (Geti)
+                pca_for_label = _fit_pca(
+                    seen_features=seen_features,
+                    seen_dataset_items=[seen_dataset_items_with_annotations[i] for i in seen_indices],
+                    model_id=model_id,
+                    label=pred_label,
+                )
+                fre_scores = -pca_for_label.reconstruction_error(unseen_features)
 
             # Normalize the scores to be in [0,1) in such a way that non-stratified
             # sampling (class-agnostic) would generate the same output active set
@@ -123,9 +152,10 @@ class FeatureReconstructionErrorClassAgnostic(IScoringFunction):
     def compute_scores(
         unseen_dataset_with_predictions: NullableDataset,  # noqa: ARG004
         seen_dataset_items_with_predictions: Sequence[DatasetItem],  # noqa: ARG004
-        seen_dataset_items_with_annotations: Sequence[DatasetItem],  # noqa: ARG004
+        seen_dataset_items_with_annotations: Sequence[DatasetItem],
         unseen_dataset_features: np.ndarray,
         seen_dataset_features: np.ndarray,
+        model_id: ID | None = None,
     ) -> np.ndarray:
         if len(unseen_dataset_features) == 0:  # Empty unseen dataset
             return np.array([])
@@ -134,15 +164,17 @@ class FeatureReconstructionErrorClassAgnostic(IScoringFunction):
             return np.ones(len(unseen_dataset_features))
 
         # Apply PCA to reduce the feature space dimensionality
-        pca_for_label = PCA(0.995)
-        pca_for_label.fit(seen_dataset_features)
-        unseen_features_reduced = pca_for_label.transform(unseen_dataset_features)
-        unseen_features_reconstructed = pca_for_label.inverse_transform(unseen_features_reduced)
+        pca = _fit_pca(
+            seen_features=seen_dataset_features,
+            seen_dataset_items=seen_dataset_items_with_annotations,
+            model_id=model_id,
+            label=None,
+        )
 
         # Compute the FRE scores as the distance of the original features from the
         # reconstructed ones; this promotes diversity along the low-variance axes.
         # The minus sign makes so that better items map to lower scores (Geti)
-        fre_scores = -np.sum(np.square(unseen_dataset_features - unseen_features_reconstructed), axis=1)
+        fre_scores = -pca.reconstruction_error(unseen_dataset_features)
 
         # Normalize the scores to be in [0,1), while keeping the same order of FRE
         # scores. To do so, the active scores are from the sorting indices of the
@@ -0,0 +1,301 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""
+PCA engine for the feature-guided active learning algorithms, with support for randomized truncated SVD, incremental
+updates and caching of the fitted components across active learning rounds.
+"""
+
+import logging
+import os
+from collections import OrderedDict
+from collections.abc import Hashable, Sequence
+from threading import Lock
+
+import numpy as np
+from sklearn.utils.extmath import randomized_svd
+
+from geti_types import ID, Singleton
+
+logger = logging.getLogger(__name__)
+
+# Fraction of the variance of the fitted features that the selected components must explain
+PCA_EXPLAINED_VARIANCE_RATIO = 0.995
+# Below this size (min of number of samples and features), the exact SVD is cheap enough and is always used
+PCA_EXACT_SVD_MAX_SIZE = int(os.getenv("FRE_PCA_EXACT_SVD_MAX_SIZE", "256"))
+# Number of components computed by the first randomized SVD; doubled until the explained variance is reached
+PCA_RANDOMIZED_SVD_INITIAL_COMPONENTS = 32
+# A cached PCA is refitted from scratch when the reconstruction error of the new features exceeds the one of the
+# fitted features by this factor
+PCA_DRIFT_THRESHOLD = float(os.getenv("FRE_PCA_DRIFT_THRESHOLD", "2.0"))
+# A cached PCA is refitted from scratch when the new features are more than this fraction of the fitted ones
+PCA_MAX_INCREMENTAL_FRACTION = float(os.getenv("FRE_PCA_MAX_INCREMENTAL_FRACTION", "0.5"))
+# Memory budget of the cached PCAs; the least recently used ones are evicted beyond it
+PCA_CACHE_MAX_BYTES = int(os.getenv("FRE_PCA_CACHE_MAX_MB", "256")) * 1024 * 1024
+# Approximate memory taken by each sample key remembered by a cached PCA (hash value and its slot in the set)
+PCA_CACHE_KEY_BYTES = 64
+
+
+class IncrementalRandomizedPCA:
+    """
+    PCA that keeps the smallest number of components explaining a given fraction of the variance, like
+    `sklearn.decomposition.PCA(<float>)`, without whitening.
+
+    Large inputs are decomposed with a randomized truncated SVD, whose rank is grown until the target explained
+    variance is reached, so that the cost depends on the number of components rather than on the size of the data.
+    The fitted model can be updated with new samples (`partial_fit`) without revisiting the old ones.
+
+    :param explained_variance_ratio: Fraction of the variance that the selected components must explain
+    :param random_state: Seed of the randomized SVD, for reproducibility
+    """
+
+    def __init__(self, explained_variance_ratio: float = PCA_EXPLAINED_VARIANCE_RATIO, random_state: int = 0) -> None:
+        self.explained_variance_ratio = explained_variance_ratio
+        self.random_state = random_state
+        self.n_samples = 0
+        self.n_components = 0
+        self.mean = np.empty(0)
+        self.components = np.empty((0, 0))
+        self.singular_values = np.empty(0)
+        # Sum of the squared deviations from the mean of all the samples seen so far
+        self._total_sum_squares = 0.0
+        # Mean reconstruction error of the samples seen so far, used as reference to detect drift
+        self.baseline_error = 0.0
+
+    @property
+    def is_fitted(self) -> bool:
+        return self.n_samples > 0
+
+    def fit(self, features: np.ndarray) -> "IncrementalRandomizedPCA":
+        """
+        Fit the PCA from scratch.
+
+        :param features: NxM array of samples
+        :return: The fitted PCA
+        """
+        features = np.asarray(features, dtype=np.float64)
+        self.n_samples = len(features)
+        self.mean = features.mean(axis=0)
+        centered = features - self.mean
+        self._total_sum_squares = float(np.sum(np.square(centered)))
+        self.singular_values, self.components = self._decompose(centered)
+        self._select_components()
+        self._truncate()
+        return self
+
+    def partial_fit(self, features: np.ndarray) -> bool:
+        """
+        Update the fitted PCA with new samples, merging them into the current decomposition.
+
+        :param features: NxM array of new samples
+        :return: False if the retained components no longer explain the target variance, in which case the PCA
+            should be refitted from scratch
+        """
+        if not self.is_fitted:
+            self.fit(features)
+            return True
+        features = np.asarray(features, dtype=np.float64)
+        if len(features) == 0:
+            return True
+        n_new = len(features)
+        n_total = self.n_samples + n_new
+        new_mean = features.mean(axis=0)
+        new_centered = features - new_mean
+        mean_correction = np.sqrt(self.n_samples * n_new / n_total) * (self.mean - new_mean)
+        stacked = np.vstack((self.singular_values[:, None] * self.components, new_centered, mean_correction))
+        _, self.singular_values, self.components = np.linalg.svd(stacked, full_matrices=False)
+        self.mean = (self.n_samples * self.mean + n_new * new_mean) / n_total
+        self._total_sum_squares += float(np.sum(np.square(new_centered)) + np.sum(np.square(mean_correction)))
+        self.n_samples = n_total
+        is_variance_explained = self._select_components()
+        self._truncate()
+        return is_variance_explained
+
+    @property
+    def nbytes(self) -> int:
+        """Memory taken by the arrays of the fitted PCA"""
+        return self.mean.nbytes + self.components.nbytes + self.singular_values.nbytes
+
+    def reconstruction_error(self, features: np.ndarray) -> np.ndarray:
+        """
+        Compute the squared distance of each sample from its reconstruction through the selected components.
+
+        :param features: NxM array of samples
+        :return: Array with the reconstruction error of each sample
+        """
+        centered = np.asarray(features, dtype=np.float64) - self.mean
+        components = self.components[: self.n_components]
+        reconstructed = (centered @ components.T) @ components
+        return np.sum(np.square(centered - reconstructed), axis=1)
+
+    def drift(self, features: np.ndarray) -> float:
+        """
+        Measure how much new samples deviate from the subspace of the fitted PCA.
+
+        :param features: NxM array of new samples
+        :return: Ratio between the mean reconstruction error of the new samples and the one of the fitted samples
+        """
+        error = float(np.mean(self.reconstruction_error(features)))
+        if self.baseline_error <= np.finfo(np.float64).eps:
+            return 1.0 if error <= np.finfo(np.float32).eps else np.inf
+        return error / self.baseline_error
+
+    def _decompose(self, centered: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Compute the leading singular values and right singular vectors of the centered samples, enough to explain
+        the target variance with twice as many components as needed. The extra components keep the tail of the
+        spectrum accurate, and retain the directions that later incremental updates may need.
+        """
+        max_rank = min(centered.shape)
+        if max_rank <= PCA_EXACT_SVD_MAX_SIZE:
+            return self._exact_svd(centered)
+        num_components = PCA_RANDOMIZED_SVD_INITIAL_COMPONENTS
+        while num_components < max_rank // 2:
+            _, singular_values, components = randomized_svd(
+                centered, n_components=num_components, n_iter=4, random_state=self.random_state
+            )
+            explained_variance = np.cumsum(np.square(singular_values[: num_components // 2]))
+            if explained_variance[-1] >= self.explained_variance_ratio * self._total_sum_squares:
+                return singular_values, components
+            num_components *= 2
+        # The variance is spread over too many components for the randomized SVD to pay off
+        return self._exact_svd(centered)
+
+    @staticmethod
+    def _exact_svd(centered: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        _, singular_values, components = np.linalg.svd(centered, full_matrices=False)
+        return singular_values, components
+
+    def _truncate(self) -> None:
+        """
+        Drop the components beyond twice the selected ones. The extra components are retained so that later updates
+        can shift variance onto them; copies are kept so that the memory of the full decomposition is released.
+        """
+        num_kept = max(2 * self.n_components, PCA_RANDOMIZED_SVD_INITIAL_COMPONENTS)
+        if len(self.components) > num_kept:
+            self.singular_values = self.singular_values[:num_kept].copy()
+            self.components = self.components[:num_kept].copy()
+
+    def _select_components(self) -> bool:
+        """
+        Select the smallest number of components that explain the target variance, and update the baseline error.
+
+        :return: False if the available components do not explain the target variance
+        """
+        explained_variance = np.square(self.singular_values)
+        if self._total_sum_squares <= 0:
+            self.n_components = min(1, len(explained_variance))
+            self.baseline_error = 0.0
+            return True
+        ratio_cumsum = np.cumsum(explained_variance) / self._total_sum_squares
+        # Same selection rule as sklearn.decomposition.PCA with a float number of components
+        self.n_components = min(
+            int(np.searchsorted(ratio_cumsum, self.explained_variance_ratio, side="right")) + 1,
+            len(explained_variance),
+        )
+        self.baseline_error = (
+            max(self._total_sum_squares - float(np.sum(explained_variance[: self.n_components])), 0.0) / self.n_samples
+        )
+        return bool(ratio_cumsum[-1] >= self.explained_variance_ratio - 1e-9) if len(ratio_cumsum) else False
+
+
+class _CachedPCA:
+    def __init__(self, pca: IncrementalRandomizedPCA, fitted_keys: set[int]) -> None:
+        self.pca = pca
+        # Hashes of the keys of the fitted samples, lighter to keep than the keys themselves
+        self.fitted_keys = fitted_keys
+        self.lock = Lock()
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory taken by the cached PCA"""
+        return self.pca.nbytes + len(self.fitted_keys) * PCA_CACHE_KEY_BYTES
+
+
+class FittedPCACache(metaclass=Singleton):
+    """
+    LRU cache of the PCAs fitted on the features extracted by a model for a label, reused across active learning
+    rounds as long as the model does not change.
+
+    On every round, only the samples that were not fitted yet are merged into the cached PCA. The PCA is refitted
+    from scratch when any fitted sample is no longer in the dataset (e.g. deleted or relabeled), when the new samples
+    drift from the fitted subspace, or when they are too many compared to the fitted ones.
+
+    The cache is bounded by the memory taken by the PCAs (`PCA_CACHE_MAX_BYTES`) rather than by their number, since
+    their size depends on the dimension of the features and on the number of retained components.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._cache: OrderedDict[tuple[ID, Hashable], _CachedPCA] = OrderedDict()
+
+    def get_or_fit(
+        self,
+        model_id: ID,
+        label: Hashable,
+        keys: Sequence[Hashable],
+        features: np.ndarray,
+    ) -> IncrementalRandomizedPCA:
+        """
+        Get the PCA of the given model and label, fitted or updated with the given samples.
+
+        :param model_id: ID of the model that extracted the features
+        :param label: Label the samples are relative to
+        :param keys: Keys uniquely identifying each sample, to recognize the samples already fitted
+        :param features: NxM array with the features of the samples
+        :return: Fitted IncrementalRandomizedPCA
+        """
+        cache_key = (model_id, label)
+        with self._lock:
+            cached = self._cache.get(cache_key)
+            if cached is None:
+                cached = _CachedPCA(pca=IncrementalRandomizedPCA(), fitted_keys=set())
+                self._cache[cache_key] = cached
+            self._cache.move_to_end(cache_key)
+
+        pca = self._fit(cached=cached, model_id=model_id, label=label, keys=keys, features=features)
+        self._evict()
+        return pca
+
+    @staticmethod
+    def _fit(
+        cached: _CachedPCA,
+        model_id: ID,
+        label: Hashable,
+        keys: Sequence[Hashable],
+        features: np.ndarray,
+    ) -> IncrementalRandomizedPCA:
+        """Update the cached PCA with the samples not fitted yet, or fit it from scratch if it cannot be updated"""
+        key_hashes = [hash(key) for key in keys]
+        with cached.lock:
+            new_indices = [i for i, key_hash in enumerate(key_hashes) if key_hash not in cached.fitted_keys]
+            if not cached.pca.is_fitted:
+                refit_reason = "initial fit"
+            elif len(cached.fitted_keys) + len(new_indices) > len(set(key_hashes)):
+                # Some fitted samples are not in the dataset anymore; they cannot be removed from the PCA
+                refit_reason = "dataset changed"
+            elif not new_indices:
+                return cached.pca
+            elif len(new_indices) > PCA_MAX_INCREMENTAL_FRACTION * cached.pca.n_samples:
+                refit_reason = "too many new samples"
+            elif (drift := cached.pca.drift(features[new_indices])) > PCA_DRIFT_THRESHOLD:
+                refit_reason = f"drift {drift:.2f}"
+            elif not cached.pca.partial_fit(features[new_indices]):
+                refit_reason = "explained variance not reached"
+            else:
+                cached.fitted_keys.update(key_hashes[i] for i in new_indices)
+                return cached.pca
+            logger.debug("Fitting PCA for model `%s` and label `%s` from scratch (%s)", model_id, label, refit_reason)
+            cached.pca = IncrementalRandomizedPCA().fit(features)
+            cached.fitted_keys = set(key_hashes)
+            return cached.pca
+
+    def _evict(self) -> None:
+        """Evict the least recently used PCAs until the cache fits in its memory budget"""
+        with self._lock:
+            total_bytes = sum(cached.nbytes for cached in self._cache.values())
+            # The most recently used PCA is always kept, even if it exceeds the budget alone
+            while total_bytes > PCA_CACHE_MAX_BYTES and len(self._cache) > 1:
+                cache_key, evicted = self._cache.popitem(last=False)
+                total_bytes -= evicted.nbytes
+                logger.debug("Evicted the cached PCA for model `%s` and label `%s`", *cache_key)
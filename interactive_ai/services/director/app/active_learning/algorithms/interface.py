@@ -10,6 +10,7 @@ import numpy as np
 
 from active_learning.utils import NullableDataset
 
+from geti_types import ID
 from iai_core.entities.dataset_item import DatasetItem
 from iai_core.utils.classes import classproperty
 
@@ -51,6 +52,7 @@ class IScoringFunction(metaclass=abc.ABCMeta):
         seen_dataset_items_with_annotations: Sequence[DatasetItem],
         unseen_dataset_features: np.ndarray,
         seen_dataset_features: np.ndarray,
+        model_id: ID | None = None,
     ) -> np.ndarray:
         """
         Compute active scores for a dataset of unlabeled samples.
@@ -66,6 +68,8 @@ class IScoringFunction(metaclass=abc.ABCMeta):
             If required, it must have the same length of the unseen dataset.
         :param seen_dataset_features: Feature vectors relative to the seen dataset.
             If required, it must have the same length of the seen dataset.
+        :param model_id: ID of the model that generated the predictions and features, if known. Functions may use it
+            to reuse intermediate results across calls relative to the same model.
         :return: Array of active scores for the unlabeled samples.
             The array has the same length and order of the unseen dataset.
         """
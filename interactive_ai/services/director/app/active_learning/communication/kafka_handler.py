@@ -60,17 +60,17 @@ class ActiveLearningKafkaHandler(BaseKafkaHandler, metaclass=Singleton):
         workspace_id = ID(value["workspace_id"])
         project_id = ID(value["project_id"])
         dataset_storage_id = ID(value["dataset_storage_id"])
-        media_id = ID(value["media_id"])
-        media_type = MediaType[value["media_type"].upper()]
-        media_identifier = IdentifierFactory.identifier_from_tuple((media_type, media_id))
+        # Bulk deletions list the deleted media, single deletions describe the media at the top level
+        media_identifiers = tuple(
+            IdentifierFactory.identifier_from_tuple((MediaType[media["media_type"].upper()], ID(media["media_id"])))
+            for media in value.get("media", [value])
+        )
 
-        # TODO 'on_media_deleted' can process multiple media in a single call;
-        #  after AL MS is ready (CVS-86210), batch the events for performance.
         ActiveScoresUpdateUseCase.on_media_deleted(
             workspace_id=workspace_id,
             project_id=project_id,
             dataset_storage_id=dataset_storage_id,
-            media_identifiers=(media_identifier,),
+            media_identifiers=media_identifiers,
             # async to avoid race conditions (updates serialized in the mapper)
             asynchronous=True,
         )
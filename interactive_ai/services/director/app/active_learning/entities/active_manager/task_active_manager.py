@@ -309,6 +309,7 @@ class TaskActiveManager(BaseActiveManager[ActiveLearningTaskConfig]):
                     seen_dataset_items_with_annotations=seen_dataset_items_with_annotations,
                     unseen_dataset_features=unseen_dataset_features,
                     seen_dataset_features=seen_dataset_features,
+                    model_id=model.id_,
                 )
             except Exception:
                 logger.exception(
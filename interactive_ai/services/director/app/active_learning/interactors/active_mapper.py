@@ -12,6 +12,7 @@ from typing import cast
 import numpy as np
 
 from active_learning.entities.active_manager import PipelineActiveManager
+from active_learning.storage.feature_matrix_store import FeatureMatrixStoreRegistry
 from active_learning.utils.exceptions import (
     ActiveLearningDatasetNotFound,
     ActiveLearningModelNotFound,
@@ -108,6 +109,7 @@ class ActiveMapper(metaclass=Singleton):
     def _load_unseen_datasets_and_metadata(
         dataset_storage_identifier: DatasetStorageIdentifier,
         unannotated_dataset_with_predictions_id: ID,
+        model_id: ID,
     ) -> tuple[Dataset, np.ndarray]:
         """
         :return: Tuple (unseen dataset with predictions, feature vectors of unseen dataset)
@@ -115,8 +117,10 @@ class ActiveMapper(metaclass=Singleton):
         unseen_dataset_with_predictions = ActiveMapper.__load_dataset(
             dataset_storage_identifier, unannotated_dataset_with_predictions_id
         )
-        unseen_features = ActiveMapper._extract_features_from_dataset(
-            dataset_items=tuple(unseen_dataset_with_predictions)
+        unseen_features = ActiveMapper._load_features(
+            dataset_storage_identifier=dataset_storage_identifier,
+            model_id=model_id,
+            dataset_items=tuple(unseen_dataset_with_predictions),
         )
 
         # There must be one feature vector for each item
@@ -149,6 +153,7 @@ class ActiveMapper(metaclass=Singleton):
         dataset_storage_identifier: DatasetStorageIdentifier,
         annotated_dataset_id: ID,
         train_dataset_with_predictions_id: ID,
+        model_id: ID,
     ) -> tuple[tuple[DatasetItem, ...], tuple[DatasetItem, ...], np.ndarray]:
         """
         :return: Tuple (
@@ -172,7 +177,11 @@ class ActiveMapper(metaclass=Singleton):
                 media_identifiers=media_identifiers,
             )
         )
-        seen_features = ActiveMapper._extract_features_from_dataset(dataset_items=prediction_dataset_items)
+        seen_features = ActiveMapper._load_features(
+            dataset_storage_identifier=dataset_storage_identifier,
+            model_id=model_id,
+            dataset_items=prediction_dataset_items,
+        )
 
         # The datasets with annotations and predictions must have the same length
         if len(annotation_dataset_items) != len(prediction_dataset_items):
@@ -209,6 +218,40 @@ class ActiveMapper(metaclass=Singleton):
             seen_features,
         )
 
+    @staticmethod
+    @unified_tracing
+    def _load_features(
+        dataset_storage_identifier: DatasetStorageIdentifier,
+        model_id: ID,
+        dataset_items: Sequence[DatasetItem],
+    ) -> np.ndarray:
+        """
+        Get the NxM matrix of features of the given dataset items from the feature matrix store of the dataset
+        storage and model. Only the feature vectors that are not in the store yet are extracted from the items
+        metadata, and then appended to the store.
+
+        :param dataset_storage_identifier: Identifier of the dataset storage containing the items
+        :param model_id: ID of the model that extracted the feature vectors
+        :param dataset_items: Dataset items for which to get the feature matrix
+        :return: NxM array containing a feature vector for each item
+        """
+        feature_store = FeatureMatrixStoreRegistry().get(
+            dataset_storage_identifier=dataset_storage_identifier, model_id=model_id
+        )
+        keys = [(item.media_identifier, item.roi_id) for item in dataset_items]
+        missing_keys = set(feature_store.find_missing(keys))
+        missing_items = {key: item for key, item in zip(keys, dataset_items) if key in missing_keys}
+        if missing_items:
+            missing_features = ActiveMapper._extract_features_from_dataset(dataset_items=tuple(missing_items.values()))
+            try:
+                feature_store.append(keys=list(missing_items), vectors=np.atleast_2d(missing_features))
+            except ValueError as e:
+                logger.error(
+                    "Cannot store the feature vectors of dataset storage `%s`: %s", dataset_storage_identifier, e
+                )
+                raise InvalidFeatureVectors from e
+        return feature_store.get_matrix(keys)
+
     @staticmethod
     def _extract_feature_vector_from_dataset_item(item: DatasetItem) -> np.ndarray:
         try:
@@ -358,6 +401,7 @@ class ActiveMapper(metaclass=Singleton):
         ) = ActiveMapper._load_unseen_datasets_and_metadata(
             dataset_storage_identifier=active_manager.dataset_storage_identifier,
             unannotated_dataset_with_predictions_id=unannotated_dataset_with_predictions_id,
+            model_id=model_id,
         )
 
         # Load the seen datasets and metadata
@@ -369,6 +413,7 @@ class ActiveMapper(metaclass=Singleton):
             dataset_storage_identifier=active_manager.dataset_storage_identifier,
             annotated_dataset_id=annotated_dataset_id,
             train_dataset_with_predictions_id=train_dataset_with_predictions_id,
+            model_id=model_id,
         )
 
         # Find the affected media (all the ones in the unannotated datasets)
@@ -536,6 +581,13 @@ class ActiveMapper(metaclass=Singleton):
             dataset_storage_id=dataset_storage_id,
         )
         active_manager.remove_media(media_identifiers=media_identifiers)
+        feature_store_registry = FeatureMatrixStoreRegistry()
+        if media_identifiers is None:
+            # The dataset storage is being deleted: remove its feature matrices from disk
+            feature_store_registry.delete(active_manager.dataset_storage_identifier)
+        else:
+            for feature_store in feature_store_registry.get_all(active_manager.dataset_storage_identifier):
+                feature_store.delete(media_identifiers=media_identifiers)
 
     def remove_media_async(
         self,
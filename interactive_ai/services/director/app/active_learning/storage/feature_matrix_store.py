@@ -0,0 +1,377 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""
+This module implements a node-local store that consolidates the feature vectors used by active learning into a single
+memory-mapped matrix per dataset storage and model.
+"""
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+from collections import OrderedDict
+from collections.abc import Sequence
+from threading import Lock
+
+import numpy as np
+
+from geti_types import ID, DatasetStorageIdentifier, MediaIdentifierEntity, Singleton
+
+logger = logging.getLogger(__name__)
+
+FEATURE_MATRIX_STORE_DIR = os.getenv(
+    "FEATURE_MATRIX_STORE_DIR", os.path.join(tempfile.gettempdir(), "active_learning_features")
+)
+# Initial number of rows allocated for the matrix; the capacity doubles whenever it is exhausted
+FEATURE_MATRIX_INITIAL_CAPACITY = 1024
+# The matrix is compacted when the fraction of tombstoned rows exceeds this threshold
+FEATURE_MATRIX_MAX_TOMBSTONE_RATIO = 0.5
+# Maximum number of models whose feature matrices are kept for the same dataset storage; the least recently used
+# matrices are deleted beyond this limit
+FEATURE_MATRIX_MAX_MODELS_PER_DATASET_STORAGE = int(os.getenv("FEATURE_MATRIX_MAX_MODELS_PER_DATASET_STORAGE", "4"))
+
+FeatureKey = tuple[MediaIdentifierEntity, ID]
+
+
+class FeatureMatrixStore:
+    """
+    Store of the feature vectors extracted by a model from the items of a dataset storage, kept in one contiguous
+    float32 matrix memory-mapped from disk.
+
+    Each row holds the feature vector of a dataset item, identified by its media identifier and ROI. Vectors are
+    appended at the end of the matrix; deleted or replaced vectors are tombstoned and the matrix is compacted when
+    the tombstones dominate. The vectors are only comparable if extracted by the same model, so each store holds the
+    vectors of a single model.
+
+    The store is not meant to be instantiated directly: use `FeatureMatrixStoreRegistry` to get the instance
+    associated with a dataset storage and a model.
+
+    :param directory: Directory where the matrix and its index are persisted
+    :param model_id: ID of the model that extracts the stored feature vectors
+    """
+
+    MATRIX_FILENAME = "features.f32"
+    INDEX_FILENAME = "index.json"
+
+    def __init__(self, directory: str, model_id: ID) -> None:
+        self._directory = directory
+        self._lock = Lock()
+        self._model_id = model_id
+        self._dim = 0
+        self._num_rows = 0
+        self._capacity = 0
+        self._rows: dict[str, int] = {}
+        self._tombstones: set[int] = set()
+        self._matrix: np.memmap | None = None
+        self._load()
+
+    @property
+    def model_id(self) -> ID:
+        """ID of the model that extracted the stored feature vectors"""
+        return self._model_id
+
+    @property
+    def num_vectors(self) -> int:
+        """Number of feature vectors stored, excluding the tombstoned ones"""
+        return len(self._rows)
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """
+        Zero-copy view over all the rows of the matrix, including the tombstoned ones (see `live_rows`).
+        """
+        with self._lock:
+            if self._matrix is None:
+                return np.empty((0, self._dim), dtype=np.float32)
+            return self._matrix[: self._num_rows]
+
+    @property
+    def live_rows(self) -> np.ndarray:
+        """Boolean mask over the rows of `matrix`, True for the rows that are not tombstoned"""
+        with self._lock:
+            mask = np.ones(self._num_rows, dtype=bool)
+            mask[list(self._tombstones)] = False
+            return mask
+
+    @staticmethod
+    def _key(media_identifier: MediaIdentifierEntity, roi_id: ID) -> str:
+        return f"{media_identifier.as_id()}/{roi_id}"
+
+    def clear(self) -> None:
+        """
+        Drop all the stored feature vectors and delete their files from disk.
+        """
+        with self._lock:
+            self._clear()
+
+    def find_missing(self, keys: Sequence[FeatureKey]) -> list[FeatureKey]:
+        """
+        Find the keys whose feature vector is not in the store.
+
+        :param keys: Media identifiers and ROI IDs of the dataset items
+        :return: Keys that are not in the store, in the given order
+        """
+        with self._lock:
+            return [key for key in keys if self._key(*key) not in self._rows]
+
+    def append(self, keys: Sequence[FeatureKey], vectors: np.ndarray) -> None:
+        """
+        Append feature vectors to the store. Vectors already stored for the same keys are replaced.
+
+        :param keys: Media identifiers and ROI IDs of the dataset items the vectors belong to
+        :param vectors: NxM array with a feature vector per key
+        :raises ValueError: if the number of vectors does not match the keys, or if their size is different from
+            the one of the vectors already in the store
+        """
+        if len(keys) != len(vectors) or vectors.ndim != 2:
+            raise ValueError(f"Expected one feature vector per key, got {vectors.shape} for {len(keys)} keys")
+        if not keys:
+            return
+        with self._lock:
+            if self._dim and vectors.shape[1] != self._dim:
+                raise ValueError(f"Feature vectors of size {vectors.shape[1]} cannot be stored with size {self._dim}")
+            self._dim = vectors.shape[1]
+            self._reserve(self._num_rows + len(keys))
+            start = self._num_rows
+            self._matrix[start : start + len(keys)] = vectors  # type: ignore[index]
+            self._matrix.flush()  # type: ignore[union-attr]
+            for offset, key in enumerate(keys):
+                replaced_row = self._rows.get(self._key(*key))
+                if replaced_row is not None:
+                    self._tombstones.add(replaced_row)
+                self._rows[self._key(*key)] = start + offset
+            self._num_rows += len(keys)
+            if len(self._tombstones) > FEATURE_MATRIX_MAX_TOMBSTONE_RATIO * self._num_rows:
+                self._compact()
+            self._save_index()
+
+    def get_matrix(self, keys: Sequence[FeatureKey]) -> np.ndarray:
+        """
+        Get the feature vectors of the given dataset items.
+
+        If the vectors are stored in consecutive rows and in the same order as the keys, which is the case when they
+        were appended together, the returned matrix is a zero-copy view of the memory-mapped file.
+
+        :param keys: Media identifiers and ROI IDs of the dataset items
+        :return: NxM array with a feature vector per key
+        :raises KeyError: if the feature vector of any key is not in the store
+        """
+        with self._lock:
+            if not keys:
+                return np.empty((0, self._dim), dtype=np.float32)
+            rows = np.fromiter((self._rows[self._key(*key)] for key in keys), dtype=np.int64, count=len(keys))
+            start, stop = int(rows[0]), int(rows[-1]) + 1
+            if stop - start == len(rows) and np.all(np.diff(rows) == 1):
+                return self._matrix[start:stop]  # type: ignore[index]
+            return np.take(self._matrix, rows, axis=0)
+
+    def delete(self, media_identifiers: Sequence[MediaIdentifierEntity] | None = None) -> None:
+        """
+        Tombstone the feature vectors of the given media.
+
+        :param media_identifiers: Identifiers of the media whose vectors (for any ROI) to delete;
+            if None, all the vectors are deleted
+        """
+        if media_identifiers is None:
+            self.clear()
+            return
+        prefixes = tuple(f"{media_identifier.as_id()}/" for media_identifier in media_identifiers)
+        with self._lock:
+            deleted_keys = [key for key in self._rows if key.startswith(prefixes)]
+            if not deleted_keys:
+                return
+            for key in deleted_keys:
+                self._tombstones.add(self._rows.pop(key))
+            if len(self._tombstones) > FEATURE_MATRIX_MAX_TOMBSTONE_RATIO * self._num_rows:
+                self._compact()
+            self._save_index()
+
+    def _reserve(self, num_rows: int) -> None:
+        """Grow the matrix file, if needed, to hold the given number of rows. Must be called holding the lock."""
+        if self._matrix is not None and num_rows <= self._capacity:
+            return
+        capacity = max(self._capacity, FEATURE_MATRIX_INITIAL_CAPACITY)
+        while capacity < num_rows:
+            capacity *= 2
+        os.makedirs(self._directory, exist_ok=True)
+        matrix_path = os.path.join(self._directory, self.MATRIX_FILENAME)
+        with open(matrix_path, "ab") as matrix_file:
+            matrix_file.truncate(capacity * self._dim * np.dtype(np.float32).itemsize)
+        # Views over the previous mapping, if any, remain valid since the file is only extended
+        self._matrix = np.memmap(matrix_path, dtype=np.float32, mode="r+", shape=(capacity, self._dim))
+        self._capacity = capacity
+
+    def _compact(self) -> None:
+        """Rewrite the matrix without the tombstoned rows. Must be called holding the lock."""
+        if self._matrix is None:
+            return
+        live_items = sorted(self._rows.items(), key=lambda item: item[1])
+        live_matrix = np.take(self._matrix, [row for _, row in live_items], axis=0)
+        matrix_path = os.path.join(self._directory, self.MATRIX_FILENAME)
+        # Write a new file rather than rewriting in place, so that views handed out earlier are not altered
+        compacted_path = matrix_path + ".compacted"
+        capacity = max(FEATURE_MATRIX_INITIAL_CAPACITY, len(live_items))
+        compacted = np.memmap(compacted_path, dtype=np.float32, mode="w+", shape=(capacity, self._dim))
+        compacted[: len(live_items)] = live_matrix
+        compacted.flush()
+        del compacted
+        os.replace(compacted_path, matrix_path)
+        self._matrix = np.memmap(matrix_path, dtype=np.float32, mode="r+", shape=(capacity, self._dim))
+        self._capacity = capacity
+        self._num_rows = len(live_items)
+        self._rows = {key: row for row, (key, _) in enumerate(live_items)}
+        self._tombstones = set()
+        logger.debug("Compacted feature matrix at %s to %d rows", self._directory, self._num_rows)
+
+    def _clear(self) -> None:
+        """Drop the stored vectors and their files. Must be called holding the lock."""
+        self._matrix = None
+        shutil.rmtree(self._directory, ignore_errors=True)
+        self._dim, self._num_rows, self._capacity = 0, 0, 0
+        self._rows, self._tombstones = {}, set()
+
+    def _save_index(self) -> None:
+        """Persist the index of the matrix atomically. Must be called holding the lock."""
+        os.makedirs(self._directory, exist_ok=True)
+        index = {
+            "model_id": str(self._model_id),
+            "dim": self._dim,
+            "num_rows": self._num_rows,
+            "capacity": self._capacity,
+            "rows": self._rows,
+            "tombstones": sorted(self._tombstones),
+        }
+        index_path = os.path.join(self._directory, self.INDEX_FILENAME)
+        with open(index_path + ".tmp", "w") as index_file:
+            json.dump(index, index_file)
+        os.replace(index_path + ".tmp", index_path)
+
+    def _load(self) -> None:
+        """Load the matrix and its index persisted by a previous instance, if any"""
+        index_path = os.path.join(self._directory, self.INDEX_FILENAME)
+        matrix_path = os.path.join(self._directory, self.MATRIX_FILENAME)
+        try:
+            with open(index_path) as index_file:
+                index = json.load(index_file)
+            if ID(index["model_id"]) != self._model_id:
+                raise ValueError(f"Feature matrix was extracted by model `{index['model_id']}`")
+            self._dim = index["dim"]
+            self._num_rows = index["num_rows"]
+            self._capacity = index["capacity"]
+            self._rows = index["rows"]
+            self._tombstones = set(index["tombstones"])
+            if self._capacity:
+                self._matrix = np.memmap(matrix_path, dtype=np.float32, mode="r+", shape=(self._capacity, self._dim))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError):
+            logger.warning("Discarding unreadable feature matrix at %s", self._directory, exc_info=True)
+            self._clear()
+
+
+class FeatureMatrixStoreRegistry(metaclass=Singleton):
+    """
+    Registry of the feature matrix stores, one per dataset storage and model.
+
+    The stores of the same dataset storage are kept side by side, so that the tasks of a pipeline, each with its own
+    model, do not evict each other's vectors. Only the `FEATURE_MATRIX_MAX_MODELS_PER_DATASET_STORAGE` most recently
+    used stores of a dataset storage are kept; the older ones, typically left behind by previous model versions, are
+    deleted from disk.
+    """
+
+    def __init__(self, root_dir: str = FEATURE_MATRIX_STORE_DIR) -> None:
+        self._root_dir = root_dir
+        self._lock = Lock()
+        # Stores ordered from the least to the most recently used
+        self._stores: OrderedDict[tuple[DatasetStorageIdentifier, ID], FeatureMatrixStore] = OrderedDict()
+
+    def _dataset_storage_dir(self, dataset_storage_identifier: DatasetStorageIdentifier) -> str:
+        return os.path.join(
+            self._root_dir,
+            str(dataset_storage_identifier.workspace_id),
+            str(dataset_storage_identifier.project_id),
+            str(dataset_storage_identifier.dataset_storage_id),
+        )
+
+    def _get_or_load(
+        self, dataset_storage_identifier: DatasetStorageIdentifier, model_id: ID, used: bool = True
+    ) -> FeatureMatrixStore:
+        """
+        Get a store, loading it from disk if needed. Must be called holding the lock.
+
+        :param used: If True, mark the store as the most recently used one; otherwise a newly loaded store is
+            registered as the least recently used one
+        """
+        key = (dataset_storage_identifier, model_id)
+        store = self._stores.get(key)
+        if store is None:
+            store = FeatureMatrixStore(
+                directory=os.path.join(self._dataset_storage_dir(dataset_storage_identifier), str(model_id)),
+                model_id=model_id,
+            )
+            self._stores[key] = store
+            self._stores.move_to_end(key, last=used)
+        elif used:
+            self._stores.move_to_end(key)
+        return store
+
+    def get(self, dataset_storage_identifier: DatasetStorageIdentifier, model_id: ID) -> FeatureMatrixStore:
+        """
+        Get the feature matrix store of a dataset storage for the vectors extracted by a model.
+
+        :param dataset_storage_identifier: Identifier of the dataset storage
+        :param model_id: ID of the model that extracts the feature vectors
+        :return: FeatureMatrixStore of the dataset storage and model
+        """
+        with self._lock:
+            store = self._get_or_load(dataset_storage_identifier=dataset_storage_identifier, model_id=model_id)
+            evicted_keys = [key for key in self._stores if key[0] == dataset_storage_identifier][
+                :-FEATURE_MATRIX_MAX_MODELS_PER_DATASET_STORAGE
+            ]
+            for key in evicted_keys:
+                logger.debug("Deleting the feature matrix of model `%s` in dataset storage `%s`", key[1], key[0])
+                self._stores.pop(key).clear()
+            return store
+
+    def get_all(self, dataset_storage_identifier: DatasetStorageIdentifier) -> list[FeatureMatrixStore]:
+        """
+        Get the feature matrix stores of a dataset storage for all the models, including those persisted on disk and
+        not loaded yet.
+
+        :param dataset_storage_identifier: Identifier of the dataset storage
+        :return: FeatureMatrixStores of the dataset storage
+        """
+        with self._lock:
+            model_ids = {model_id for identifier, model_id in self._stores if identifier == dataset_storage_identifier}
+            try:
+                with os.scandir(self._dataset_storage_dir(dataset_storage_identifier)) as entries:
+                    model_ids.update(ID(entry.name) for entry in entries if entry.is_dir())
+            except FileNotFoundError:
+                pass
+            return [
+                self._get_or_load(dataset_storage_identifier=dataset_storage_identifier, model_id=model_id, used=False)
+                for model_id in model_ids
+            ]
+
+    def delete(self, dataset_storage_identifier: DatasetStorageIdentifier) -> None:
+        """
+        Delete the feature matrix stores of a dataset storage for all the models, including their files on disk.
+
+        :param dataset_storage_identifier: Identifier of the dataset storage
+        """
+        with self._lock:
+            for key in [key for key in self._stores if key[0] == dataset_storage_identifier]:
+                self._stores.pop(key).clear()
+            dataset_storage_dir = self._dataset_storage_dir(dataset_storage_identifier)
+            shutil.rmtree(dataset_storage_dir, ignore_errors=True)
+            # Remove the project and workspace directories too, once they are left empty
+            for directory in (
+                os.path.dirname(dataset_storage_dir),
+                os.path.dirname(os.path.dirname(dataset_storage_dir)),
+            ):
+                try:
+                    os.rmdir(directory)
+                except OSError:
+                    break
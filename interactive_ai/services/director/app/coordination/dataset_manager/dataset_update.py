@@ -26,6 +26,7 @@ from iai_core.entities.subset import Subset
 from iai_core.entities.task_node import TaskNode
 from iai_core.repos import AnnotationSceneRepo, DatasetRepo, ProjectRepo
 from iai_core.repos.dataset_entity_repo import PipelineDatasetRepo
+from iai_core.repos.mappers import IDToMongo
 from iai_core.utils.dataset_helper import DatasetHelper
 from iai_core.utils.flow_control import FlowControl
 
@@ -70,6 +71,52 @@ class DatasetUpdateUseCase:
             dataset_storage_identifier=dataset_storage.identifier,
         )
 
+    @staticmethod
+    def update_dataset_with_new_annotation_scenes(
+        project_id: ID,
+        annotation_scene_ids: Sequence[ID],
+    ) -> None:
+        """
+        Updates the training dataset with a batch of newly received annotation scenes, in a single read/write pass.
+
+        The annotation scenes are loaded with one query and converted to dataset items, which are then added to the
+        training datasets like in `update_dataset_with_new_annotation_scene`. If the batch contains multiple annotation
+        scenes for the same media, only the last one (in order of `annotation_scene_ids`) is applied, since it
+        supersedes the previous ones.
+
+        :param project_id: Project for which the dataset is updated
+        :param annotation_scene_ids: IDs of the new annotation scenes, in the order they were received
+        """
+        project = ProjectRepo().get_by_id(project_id)
+        dataset_storage = DatasetUpdateUseCase._get_training_dataset_storage_for_project(project)
+        pipeline_dataset_entity = PipelineDatasetRepo.get_or_create(dataset_storage.identifier)
+        ann_scene_repo = AnnotationSceneRepo(dataset_storage.identifier)
+        scene_position = {scene_id: position for position, scene_id in enumerate(annotation_scene_ids)}
+        annotation_scenes = sorted(
+            ann_scene_repo.get_all(
+                extra_filter={"_id": {"$in": [IDToMongo.forward(scene_id) for scene_id in scene_position]}}
+            ),
+            key=lambda scene: scene_position[scene.id_],
+        )
+        latest_scene_per_media = {scene.media_identifier: scene for scene in annotation_scenes}
+        items = [
+            DatasetHelper.annotation_scene_to_dataset_item(
+                annotation_scene=annotation_scene,
+                dataset_storage=dataset_storage,
+                subset=Subset.UNASSIGNED,
+            )
+            for annotation_scene in latest_scene_per_media.values()
+        ]
+        if not items:
+            return
+        new_items_dataset = Dataset(items=items, id=DatasetRepo.generate_id())
+        DatasetUpdateUseCase._update_dataset_with_new_items(
+            new_items_dataset_for_task=new_items_dataset,
+            pipeline_dataset_entity=pipeline_dataset_entity,
+            project=project,
+            dataset_storage_identifier=dataset_storage.identifier,
+        )
+
     @staticmethod
     @lru_cache
     def _get_training_dataset_storage_for_project(project: Project) -> DatasetStorage:
@@ -0,0 +1,223 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+
+"""
+This module coalesces the 'new annotation scene' events, so that bursts of annotations (e.g. bulk annotation sessions
+or imports) are applied to the training dataset in batches rather than one annotation scene at a time.
+"""
+
+import logging
+import os
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from threading import Condition, Thread
+
+from metrics.instruments import (
+    DatasetUpdateBatchAttributes,
+    dataset_update_batch_size_histogram,
+    dataset_update_lag_histogram,
+)
+
+from .dataset_update import DatasetUpdateUseCase
+from geti_types import CTX_SESSION_VAR, ID, Session, Singleton, session_context
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingBatch:
+    """
+    Annotation scene events received for a project and not yet applied to its training dataset.
+
+    :param session: Session of the most recent event, used to apply the batch
+    :param first_received_at: Monotonic time at which the oldest event of the batch was received
+    :param annotation_scene_ids: IDs of the annotation scenes, deduplicated and in order of arrival
+    :param on_processed_callbacks: Functions to call once the batch has been processed
+    """
+
+    session: Session
+    first_received_at: float
+    annotation_scene_ids: dict[ID, None] = field(default_factory=dict)
+    on_processed_callbacks: list[Callable[[], None]] = field(default_factory=list)
+
+
+class AnnotationSceneEventCoalescer(metaclass=Singleton):
+    """
+    Groups the pending 'new annotation scene' events per project over a short window, deduplicates the annotation
+    scene IDs and applies them to the training dataset in a single batched pass.
+
+    A batch is applied when the oldest pending event is older than the coalescing window, or when the batch reaches
+    the maximum size. Events that must be processed in order with respect to the annotation scenes (e.g. media
+    deletions) should call `flush` first. Setting the window to zero disables coalescing: events are then applied
+    synchronously, one at a time.
+
+    The caller is notified through `on_processed` once an annotation scene has been processed, so that the Kafka
+    offset of its event is committed only after the batch is applied. If a batch fails, its annotation scenes are
+    applied one at a time, so that a single failing annotation scene does not prevent the others from being added.
+    """
+
+    def __init__(self) -> None:
+        self._window = float(os.environ.get("DATASET_UPDATE_COALESCING_WINDOW", "1"))
+        self._max_batch_size = int(os.environ.get("DATASET_UPDATE_MAX_BATCH_SIZE", "500"))
+        self._pending: dict[ID, _PendingBatch] = {}
+        # Projects whose batch is being applied; a project has at most one batch in flight to preserve the ordering
+        self._in_flight: set[ID] = set()
+        self._condition = Condition()
+        self._stopped = False
+        self._worker: Thread | None = None
+
+    def submit(self, project_id: ID, annotation_scene_id: ID, on_processed: Callable[[], None] | None = None) -> None:
+        """
+        Submit a new annotation scene to be added to the training dataset of the project.
+
+        :param project_id: ID of the project containing the annotation scene
+        :param annotation_scene_id: ID of the new annotation scene
+        :param on_processed: Optional function called once the annotation scene has been processed, successfully or
+            not; it may be called from the background worker
+        """
+        if self._window <= 0:
+            try:
+                DatasetUpdateUseCase.update_dataset_with_new_annotation_scene(
+                    project_id=project_id, annotation_scene_id=annotation_scene_id
+                )
+            finally:
+                if on_processed is not None:
+                    on_processed()
+            return
+
+        with self._condition:
+            batch = self._pending.get(project_id)
+            if batch is None:
+                batch = _PendingBatch(session=CTX_SESSION_VAR.get(), first_received_at=time.monotonic())
+                self._pending[project_id] = batch
+            batch.session = CTX_SESSION_VAR.get()
+            batch.annotation_scene_ids[annotation_scene_id] = None
+            if on_processed is not None:
+                batch.on_processed_callbacks.append(on_processed)
+            self._ensure_worker_started()
+            self._condition.notify_all()
+
+    def flush(self, project_id: ID | None = None) -> None:
+        """
+        Apply the pending annotation scenes synchronously, after waiting for the batches already being applied.
+
+        :param project_id: ID of the project to flush; if None, all the projects are flushed
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: not self._in_flight if project_id is None else project_id not in self._in_flight
+            )
+            project_ids = list(self._pending) if project_id is None else [project_id]
+            batches = {pid: self._pending.pop(pid) for pid in project_ids if pid in self._pending}
+            self._in_flight.update(batches)
+        self._apply_batches({pid: (batch, "flush") for pid, batch in batches.items()})
+
+    def stop(self) -> None:
+        """Stop the background worker and apply all the pending annotation scenes"""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+        self.flush()
+
+    def _ensure_worker_started(self) -> None:
+        if self._worker is None:
+            self._stopped = False
+            self._worker = Thread(target=self._run, daemon=True, name="Annotation scene event coalescer")
+            self._worker.start()
+
+    def _run(self) -> None:
+        """Loop of the background worker, which applies the batches as they become due"""
+        while True:
+            with self._condition:
+                due_batches = self._wait_for_due_batches()
+                if due_batches is None:
+                    return
+                self._in_flight.update(due_batches)
+            self._apply_batches(due_batches)
+
+    def _wait_for_due_batches(self) -> dict[ID, tuple[_PendingBatch, str]] | None:
+        """
+        Wait until at least one batch is due and pop the due batches. Must be called holding the condition.
+
+        :return: Due batches with the reason why they are due, or None if the coalescer is stopped
+        """
+        while not self._stopped:
+            now = time.monotonic()
+            due_batches: dict[ID, tuple[_PendingBatch, str]] = {}
+            next_deadline: float | None = None
+            for project_id, batch in self._pending.items():
+                if project_id in self._in_flight:
+                    continue
+                deadline = batch.first_received_at + self._window
+                if len(batch.annotation_scene_ids) >= self._max_batch_size:
+                    due_batches[project_id] = (batch, "size")
+                elif deadline <= now:
+                    due_batches[project_id] = (batch, "window")
+                else:
+                    next_deadline = deadline if next_deadline is None else min(next_deadline, deadline)
+            if due_batches:
+                for project_id in due_batches:
+                    del self._pending[project_id]
+                return due_batches
+            self._condition.wait(timeout=None if next_deadline is None else next_deadline - now)
+        return None
+
+    def _apply_batches(self, batches: dict[ID, tuple[_PendingBatch, str]]) -> None:
+        """Apply batches that were marked as in flight, then release them"""
+        try:
+            for project_id, (batch, trigger) in batches.items():
+                self._apply_batch(project_id=project_id, batch=batch, trigger=trigger)
+        finally:
+            with self._condition:
+                self._in_flight.difference_update(batches)
+                self._condition.notify_all()
+
+    @classmethod
+    def _apply_batch(cls, project_id: ID, batch: _PendingBatch, trigger: str) -> None:
+        annotation_scene_ids = list(batch.annotation_scene_ids)
+        logger.info(
+            "Applying %d new annotation scene(s) to the training dataset of project `%s` (trigger: %s)",
+            len(annotation_scene_ids),
+            project_id,
+            trigger,
+        )
+        try:
+            with session_context(session=batch.session):
+                DatasetUpdateUseCase.update_dataset_with_new_annotation_scenes(
+                    project_id=project_id, annotation_scene_ids=annotation_scene_ids
+                )
+        except Exception:
+            logger.exception(
+                "Failed to apply %d new annotation scene(s) to the training dataset of project `%s`, "
+                "applying them one at a time",
+                len(annotation_scene_ids),
+                project_id,
+            )
+            cls._apply_one_at_a_time(project_id=project_id, batch=batch)
+        else:
+            attributes = DatasetUpdateBatchAttributes(trigger=trigger).to_dict()
+            dataset_update_batch_size_histogram.record(len(annotation_scene_ids), attributes)
+            dataset_update_lag_histogram.record(time.monotonic() - batch.first_received_at, attributes)
+        finally:
+            for on_processed in batch.on_processed_callbacks:
+                on_processed()
+
+    @staticmethod
+    def _apply_one_at_a_time(project_id: ID, batch: _PendingBatch) -> None:
+        for annotation_scene_id in batch.annotation_scene_ids:
+            try:
+                with session_context(session=batch.session):
+                    DatasetUpdateUseCase.update_dataset_with_new_annotation_scene(
+                        project_id=project_id, annotation_scene_id=annotation_scene_id
+                    )
+            except Exception:
+                logger.exception(
+                    "Failed to apply the annotation scene `%s` to the training dataset of project `%s`",
+                    annotation_scene_id,
+                    project_id,
+                )
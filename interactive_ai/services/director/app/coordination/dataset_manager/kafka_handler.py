@@ -6,6 +6,7 @@ from service.project_service import ProjectService
 from .dataset_counter import DatasetCounterUseCase
 from .dataset_suspender import DatasetSuspender
 from .dataset_update import DatasetUpdateUseCase
+from .dataset_update_coalescer import AnnotationSceneEventCoalescer
 from geti_kafka_tools import BaseKafkaHandler, KafkaRawMessage, TopicSubscription
 from geti_telemetry_tools import unified_tracing
 from geti_types import ID, Singleton
@@ -29,6 +30,10 @@ class DatasetManagementMediaAndAnnotationKafkaHandler(BaseKafkaHandler, metaclas
             TopicSubscription(topic="new_annotation_scene", callback=self.on_new_annotation_scene),
         ]
 
+    def stop(self) -> None:
+        # The pending annotation scenes are applied before closing the consumer, so that their offsets are committed
+        self.event_consumer.stop(before_close=AnnotationSceneEventCoalescer().stop)
+
     @staticmethod
     @setup_session_kafka
     @unified_tracing
@@ -48,16 +53,17 @@ class DatasetManagementMediaAndAnnotationKafkaHandler(BaseKafkaHandler, metaclas
         # The datasets of other storages are instead constructed from scratch when
         # requested, so they do not need to be updated here.
         if is_training_dataset_storage:
+            # The suspension must observe the annotation scenes received before it
+            AnnotationSceneEventCoalescer().flush(project_id=project_id)
             DatasetSuspender.suspend_dataset_items(
                 workspace_id=workspace_id,
                 project_id=project_id,
                 suspended_scenes_descriptor_id=suspended_scenes_descriptor_id,
             )
 
-    @staticmethod
     @setup_session_kafka
     @unified_tracing
-    def on_new_annotation_scene(raw_message: KafkaRawMessage) -> None:
+    def on_new_annotation_scene(self, raw_message: KafkaRawMessage) -> None:
         value: dict = raw_message.value
         project_id = ID(value["project_id"])
         dataset_storage_id = ID(value["dataset_storage_id"])
@@ -67,9 +73,11 @@ class DatasetManagementMediaAndAnnotationKafkaHandler(BaseKafkaHandler, metaclas
         )
 
         if is_training_dataset_storage:
-            DatasetUpdateUseCase.update_dataset_with_new_annotation_scene(
+            # The offset of the event is committed only once the annotation scene is applied to the dataset
+            AnnotationSceneEventCoalescer().submit(
                 project_id=project_id,
                 annotation_scene_id=annotation_scene_id,
+                on_processed=self.event_consumer.defer_commit(raw_message),
             )
 
     @staticmethod
@@ -79,17 +87,21 @@ class DatasetManagementMediaAndAnnotationKafkaHandler(BaseKafkaHandler, metaclas
         value: dict = raw_message.value
         project_id = ID(value["project_id"])
         dataset_storage_id = ID(value["dataset_storage_id"])
-        media_id = ID(value["media_id"])
+        # Bulk deletions list the deleted media, single deletions describe the media at the top level
+        media_ids = [ID(media["media_id"]) for media in value.get("media", [value])]
 
         is_training_dataset_storage = ProjectService.is_training_dataset_storage_id(
             project_id=project_id, dataset_storage_id=dataset_storage_id
         )
 
         if is_training_dataset_storage:
-            DatasetUpdateUseCase.delete_media_from_datasets(
-                project_id=project_id,
-                media_id=media_id,
-            )
+            # Pending annotation scenes of the media must not be added back after the media is deleted
+            AnnotationSceneEventCoalescer().flush(project_id=project_id)
+            for media_id in media_ids:
+                DatasetUpdateUseCase.delete_media_from_datasets(
+                    project_id=project_id,
+                    media_id=media_id,
+                )
 
 
 class DatasetManagementDatasetUpdatedKafkaHandler(BaseKafkaHandler, metaclass=Singleton):
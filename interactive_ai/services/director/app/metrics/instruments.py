@@ -31,6 +31,9 @@ class MetricName:
 
     MODEL_TRAINING_DURATION = f"{MetricNameBase.MODEL_BASENAME}.training_duration"
     MODEL_TRAINING_JOB_DURATION = f"{MetricNameBase.MODEL_BASENAME}.training_job_duration"
+    DATASET_UPDATE_BASENAME = f"{MetricNameBase.APPLICATION_BASENAME}.datasets.updates"
+    DATASET_UPDATE_BATCH_SIZE = f"{DATASET_UPDATE_BASENAME}.batch_size"
+    DATASET_UPDATE_LAG = f"{DATASET_UPDATE_BASENAME}.lag"
 
 
 metric_readers: list[MetricReader] = []
@@ -73,6 +76,18 @@ training_duration_counter = meter.create_counter(
     name=MetricName.MODEL_TRAINING_DURATION, unit="seconds", description="Time used for training the model"
 )
 
+dataset_update_batch_size_histogram = meter.create_histogram(
+    name=MetricName.DATASET_UPDATE_BATCH_SIZE,
+    unit="1",
+    description="Number of annotation scenes applied to the training dataset in a single batch",
+)
+
+dataset_update_lag_histogram = meter.create_histogram(
+    name=MetricName.DATASET_UPDATE_LAG,
+    unit="seconds",
+    description="Time between receiving an annotation scene event and applying it to the training dataset",
+)
+
 
 class TrainingDurationCounterJobStatus(Enum):
     SUCCEEDED = auto()
@@ -101,3 +116,15 @@ class ModelTrainingDurationAttributes(BaseInstrumentAttributes):
     organization_id: str
     training_job_duration: float
     dataset_size: int
+
+
+@dataclass
+class DatasetUpdateBatchAttributes(BaseInstrumentAttributes):
+    """
+    Attributes for the dataset update batch size and lag histograms
+
+      - trigger: reason why the batch was applied, i.e. 'window' (coalescing window elapsed), 'size' (maximum batch
+        size reached) or 'flush' (explicit flush, e.g. before a media deletion)
+    """
+
+    trigger: str
@@ -0,0 +1,81 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""
+Benchmark of the feature loading time of an active learning round.
+
+'per-file' reads one .npy file per dataset item through the NumpyBinaryInterpreter and stacks the vectors, which is
+how the feature matrix was built before the feature matrix store was introduced; 'store' serves the same matrix from
+the memory-mapped FeatureMatrixStore, after a single cold round that fills it.
+
+Usage: PYTHONPATH=app python tests/benchmarks/bench_feature_matrix_store.py [--items 5000] [--dim 576] [--rounds 5]
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+import numpy as np
+
+from active_learning.storage.feature_matrix_store import FeatureMatrixStore
+
+from geti_types import ID, ImageIdentifier
+from iai_core.adapters.binary_interpreters import NumpyBinaryInterpreter
+
+
+def load_per_file(paths: list[str]) -> np.ndarray:
+    interpreter = NumpyBinaryInterpreter()
+    vectors = []
+    for path in paths:
+        with open(path, "rb") as vector_file:
+            vectors.append(interpreter.interpret(data=vector_file, filename=path).squeeze())
+    return np.vstack(vectors)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=5000, help="Number of dataset items")
+    parser.add_argument("--dim", type=int, default=576, help="Size of the feature vectors")
+    parser.add_argument("--rounds", type=int, default=5, help="Number of scoring rounds to time")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(seed=0)
+    features = rng.random((args.items, args.dim), dtype=np.float32)
+    keys = [(ImageIdentifier(image_id=ID(f"{i:024x}")), ID()) for i in range(args.items)]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = []
+        for i, vector in enumerate(features):
+            path = os.path.join(tmp_dir, f"representation_vector_{i}.npy")
+            np.save(path, vector[None, :, None, None])
+            paths.append(path)
+
+        per_file = []
+        for _ in range(args.rounds):
+            start = time.perf_counter()
+            load_per_file(paths)
+            per_file.append(time.perf_counter() - start)
+
+        store = FeatureMatrixStore(directory=os.path.join(tmp_dir, "store"), model_id=ID())
+        start = time.perf_counter()
+        store.append(keys=keys, vectors=load_per_file(paths))
+        cold = time.perf_counter() - start
+        warm = []
+        for _ in range(args.rounds):
+            start = time.perf_counter()
+            matrix = store.get_matrix(keys)
+            # Touch the data so that the pages of the memory map are actually read
+            float(matrix.sum())
+            warm.append(time.perf_counter() - start)
+        np.testing.assert_array_equal(matrix, features)
+
+    print(f"{args.items} items x {args.dim} features, {args.rounds} rounds")
+    print(f" per-file: mean {statistics.mean(per_file) * 1e3:9.2f} ms per round")
+    print(f"    store: cold {cold * 1e3:9.2f} ms, then mean {statistics.mean(warm) * 1e3:9.2f} ms per round")
+    print(f" Speed-up: {statistics.mean(per_file) / statistics.mean(warm):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
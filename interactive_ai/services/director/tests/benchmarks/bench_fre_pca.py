@@ -0,0 +1,111 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""
+CPU benchmark of the PCA used by the Feature Reconstruction Error algorithm.
+
+Synthetic per-label features with a decaying spectrum are scored over several active learning rounds, each of which
+adds a few new seen items. Three engines are compared:
+ - 'sklearn': full PCA(0.995) per label and round, as before the incremental engine was introduced
+ - 'cold': IncrementalRandomizedPCA fitted from scratch per label and round
+ - 'cached': FittedPCACache, which only merges the new items into the PCA of the previous round
+
+For each engine, the time per round and the agreement of the FRE scores with 'sklearn' are reported (Spearman rank
+correlation, and overlap of the top 10% of the ranking). Results are reproducible given the seed.
+
+Usage: PYTHONPATH=app python tests/benchmarks/bench_fre_pca.py [--labels 4] [--seen 2000] [--unseen 5000]
+"""
+
+import argparse
+import statistics
+import time
+from typing import TYPE_CHECKING
+
+import numpy as np
+from sklearn.decomposition import PCA
+
+from active_learning.algorithms.feature_guided.pca import FittedPCACache, IncrementalRandomizedPCA
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def generate_label_features(rng: np.random.Generator, num_samples: int, dim: int, basis: np.ndarray) -> np.ndarray:
+    spectrum = np.exp(-np.arange(len(basis)) / 12)
+    return (rng.normal(size=(num_samples, len(basis))) * spectrum) @ basis + 0.002 * rng.normal(size=(num_samples, dim))
+
+
+def sklearn_errors(seen: np.ndarray, unseen: np.ndarray) -> np.ndarray:
+    pca = PCA(0.995).fit(seen)
+    return np.sum(np.square(unseen - pca.inverse_transform(pca.transform(unseen))), axis=1)
+
+
+def spearman(a: np.ndarray, b: np.ndarray) -> float:
+    return float(np.corrcoef(np.argsort(np.argsort(a)), np.argsort(np.argsort(b)))[0, 1])
+
+
+def top_overlap(a: np.ndarray, b: np.ndarray, fraction: float = 0.1) -> float:
+    k = max(int(len(a) * fraction), 1)
+    return len(set(np.argsort(-a)[:k]) & set(np.argsort(-b)[:k])) / k
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--labels", type=int, default=4, help="Number of labels")
+    parser.add_argument("--seen", type=int, default=2000, help="Number of seen items per label in the first round")
+    parser.add_argument("--unseen", type=int, default=5000, help="Number of unseen items per label")
+    parser.add_argument("--new", type=int, default=20, help="Number of new seen items per label and round")
+    parser.add_argument("--dim", type=int, default=576, help="Size of the feature vectors")
+    parser.add_argument("--rank", type=int, default=128, help="Rank of the signal in the features")
+    parser.add_argument("--rounds", type=int, default=5, help="Number of active learning rounds")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(seed=args.seed)
+    bases = [np.linalg.qr(rng.normal(size=(args.dim, args.rank)))[0].T for _ in range(args.labels)]
+    seen = [generate_label_features(rng, args.seen + args.new * args.rounds, args.dim, basis) for basis in bases]
+    unseen = [generate_label_features(rng, args.unseen, args.dim, basis) for basis in bases]
+    cache = FittedPCACache()
+
+    engines: dict[str, Callable[[int, int, np.ndarray, np.ndarray], np.ndarray]] = {
+        "sklearn": lambda _label, _n, seen_x, unseen_x: sklearn_errors(seen_x, unseen_x),
+        "cold": lambda _label, _n, seen_x, unseen_x: IncrementalRandomizedPCA()
+        .fit(seen_x)
+        .reconstruction_error(unseen_x),
+        "cached": lambda label, n, seen_x, unseen_x: cache.get_or_fit(
+            model_id="benchmark", label=label, keys=range(n), features=seen_x
+        ).reconstruction_error(unseen_x),
+    }
+    timings: dict[str, list[float]] = {name: [] for name in engines}
+    agreement: dict[str, list[tuple[float, float]]] = {name: [] for name in engines}
+    for round_index in range(args.rounds):
+        num_seen = args.seen + args.new * round_index
+        reference = []
+        for name, engine in engines.items():
+            start = time.perf_counter()
+            errors = [engine(label, num_seen, seen[label][:num_seen], unseen[label]) for label in range(args.labels)]
+            timings[name].append(time.perf_counter() - start)
+            if name == "sklearn":
+                reference = errors
+            agreement[name].extend(
+                (spearman(reference[label], errors[label]), top_overlap(reference[label], errors[label]))
+                for label in range(args.labels)
+            )
+
+    print(
+        f"{args.labels} labels, {args.seen} seen (+{args.new}/round) and {args.unseen} unseen items per label, "
+        f"{args.dim} features, {args.rounds} rounds"
+    )
+    for name in engines:
+        # The first round of 'cached' is a cold fit, report it separately
+        warm = timings[name][1:] if name == "cached" else timings[name]
+        print(
+            f"{name:>8}: mean {statistics.mean(warm) * 1e3:9.1f} ms per round"
+            + (f" (first round {timings[name][0] * 1e3:.1f} ms)" if name == "cached" else "")
+            + f" | spearman {min(a for a, _ in agreement[name]):.4f} (min)"
+            + f" | top-10% overlap {min(b for _, b in agreement[name]):.3f} (min)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@ import pytest
 from active_learning.entities import ActiveLearningProjectConfig, ActiveLearningTaskConfig, ActiveScore, TaskActiveScore
 from active_learning.entities.active_manager import PipelineActiveManager, TaskActiveManager
 from active_learning.interactors import ActiveMapper
+from active_learning.storage.feature_matrix_store import FeatureMatrixStoreRegistry
 from active_learning.storage.repos import ActiveScoreRepo, ActiveSuggestionRepo
 
 from geti_types import ID, MediaIdentifierEntity
@@ -140,7 +141,14 @@ def fxt_pipeline_active_manager(fxt_db_project_service):
 
 
 @pytest.fixture
-def fxt_active_mapper(fxt_pipeline_active_manager):
+def fxt_feature_matrix_store_registry(tmp_path):
+    FeatureMatrixStoreRegistry._instance = None
+    yield FeatureMatrixStoreRegistry(root_dir=str(tmp_path))
+    FeatureMatrixStoreRegistry._instance = None
+
+
+@pytest.fixture
+def fxt_active_mapper(fxt_pipeline_active_manager, fxt_feature_matrix_store_registry):
     with patch.object(ActiveMapper, "_get_active_manager", return_value=fxt_pipeline_active_manager):
         yield ActiveMapper(num_workers=2)
     ActiveMapper._instances = {}
@@ -0,0 +1,115 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from sklearn.decomposition import PCA
+
+from active_learning.algorithms.feature_guided.pca import FittedPCACache, IncrementalRandomizedPCA
+
+
+def _low_rank_features(num_samples: int, dim: int = 64, rank: int = 8, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed=seed)
+    basis = rng.normal(size=(rank, dim))
+    return rng.normal(size=(num_samples, rank)) @ basis + 0.01 * rng.normal(size=(num_samples, dim))
+
+
+def _sklearn_reconstruction_error(seen: np.ndarray, unseen: np.ndarray) -> np.ndarray:
+    pca = PCA(0.995).fit(seen)
+    return np.sum(np.square(unseen - pca.inverse_transform(pca.transform(unseen))), axis=1)
+
+
+@pytest.fixture
+def fxt_pca_cache():
+    FittedPCACache._instance = None
+    yield FittedPCACache()
+    FittedPCACache._instance = None
+
+
+class TestIncrementalRandomizedPCA:
+    @pytest.mark.parametrize("exact_svd_max_size", [256, 0], ids=["exact SVD", "randomized SVD"])
+    def test_fit_matches_sklearn(self, exact_svd_max_size) -> None:
+        seen, unseen = _low_rank_features(300), _low_rank_features(50, seed=1)
+
+        with patch("active_learning.algorithms.feature_guided.pca.PCA_EXACT_SVD_MAX_SIZE", exact_svd_max_size):
+            pca = IncrementalRandomizedPCA().fit(seen)
+
+        assert pca.n_components == PCA(0.995).fit(seen).n_components_
+        np.testing.assert_allclose(
+            pca.reconstruction_error(unseen), _sklearn_reconstruction_error(seen, unseen), rtol=0.05, atol=1e-3
+        )
+
+    def test_partial_fit(self) -> None:
+        features = _low_rank_features(400)
+        pca = IncrementalRandomizedPCA().fit(features[:300])
+
+        assert pca.partial_fit(features[300:])
+
+        full_pca = IncrementalRandomizedPCA().fit(features)
+        assert pca.n_samples == 400
+        np.testing.assert_allclose(pca.mean, full_pca.mean)
+        np.testing.assert_allclose(
+            pca.reconstruction_error(features), full_pca.reconstruction_error(features), rtol=0.05, atol=1e-3
+        )
+
+    def test_drift(self) -> None:
+        pca = IncrementalRandomizedPCA().fit(_low_rank_features(300))
+
+        assert pca.drift(_low_rank_features(20, seed=0)) < 2
+        assert pca.drift(_low_rank_features(20, seed=5)) > 2
+
+
+class TestFittedPCACache:
+    def test_get_or_fit(self, fxt_pca_cache) -> None:
+        features = _low_rank_features(310)
+        features[300:] = _low_rank_features(10, seed=5)
+        keys = list(range(310))
+
+        def _get_or_fit(model_id: str, num_samples: int) -> IncrementalRandomizedPCA:
+            return fxt_pca_cache.get_or_fit(
+                model_id=model_id, label=b"label", keys=keys[:num_samples], features=features[:num_samples]
+            )
+
+        fit = IncrementalRandomizedPCA.fit
+        with patch.object(IncrementalRandomizedPCA, "fit", autospec=True, side_effect=fit) as mock_fit:
+            pca = _get_or_fit(model_id="model", num_samples=250)
+            # Same samples: the cached PCA is reused as-is
+            assert _get_or_fit(model_id="model", num_samples=250) is pca
+            # A few new samples from the same distribution: the cached PCA is updated incrementally
+            _get_or_fit(model_id="model", num_samples=300)
+            assert mock_fit.call_count == 1
+            assert pca.n_samples == 300
+
+            # New samples that drift from the fitted subspace: the PCA is fitted from scratch
+            _get_or_fit(model_id="model", num_samples=310)
+            assert mock_fit.call_count == 2
+
+            # Another model: a separate PCA is fitted
+            assert _get_or_fit(model_id="other", num_samples=300) is not pca
+            assert mock_fit.call_count == 3
+
+    def test_get_or_fit_dataset_changed(self, fxt_pca_cache) -> None:
+        features = _low_rank_features(300)
+        keys = list(range(300))
+        pca = fxt_pca_cache.get_or_fit(model_id="model", label=b"label", keys=keys, features=features)
+
+        # A fitted sample is removed from the dataset: the PCA is fitted from scratch without it
+        refitted_pca = fxt_pca_cache.get_or_fit(model_id="model", label=b"label", keys=keys[1:], features=features[1:])
+
+        assert refitted_pca is not pca
+        assert refitted_pca.n_samples == 299
+
+    def test_memory_bound(self, fxt_pca_cache) -> None:
+        features = _low_rank_features(300)
+        keys = list(range(300))
+        pca = fxt_pca_cache.get_or_fit(model_id="model", label=b"label", keys=keys, features=features)
+        # Only twice as many components as selected are kept, not the full decomposition
+        assert len(pca.components) == max(2 * pca.n_components, 32) < features.shape[1]
+
+        with patch("active_learning.algorithms.feature_guided.pca.PCA_CACHE_MAX_BYTES", 1.5 * pca.nbytes + 300 * 64):
+            fxt_pca_cache.get_or_fit(model_id="other", label=b"label", keys=keys, features=features)
+
+            # The least recently used PCA is evicted to fit in the budget
+            assert fxt_pca_cache.get_or_fit(model_id="model", label=b"label", keys=keys, features=features) is not pca
@@ -288,6 +288,7 @@ class TestTaskActiveManager:
             seen_dataset_items_with_annotations=tuple(item for item in seen_dataset_with_annotations),
             unseen_dataset_features=unseen_features,
             seen_dataset_features=seen_features,
+            model_id=model.id_,
         )
         mock_update_reduced_scores.assert_called_once_with(active_scores)
         mock_save_many.assert_called_once_with(active_scores)
@@ -10,6 +10,7 @@ import numpy as np
 from active_learning.entities.active_manager import PipelineActiveManager
 from active_learning.interactors import ActiveMapper
 
+from geti_types import DatasetStorageIdentifier
 from iai_core.entities.metadata import FloatMetadata
 from iai_core.entities.tensor import Tensor
 from iai_core.repos import MetadataRepo
@@ -132,11 +133,13 @@ class TestActiveMapper:
         mock_load_unseen_data.assert_called_once_with(
             dataset_storage_identifier=ANY,
             unannotated_dataset_with_predictions_id=unannotated_dataset_with_predictions.id_,
+            model_id=model.id_,
         )
         mock_load_seen_data.assert_called_once_with(
             dataset_storage_identifier=ANY,
             annotated_dataset_id=annotated_dataset.id_,
             train_dataset_with_predictions_id=train_dataset_with_predictions.id_,
+            model_id=model.id_,
         )
         mock_get_scores_by_media.assert_called_once_with(
             media_identifiers={item.media_identifier for item in unannotated_dataset_with_predictions}
@@ -157,6 +160,45 @@ class TestActiveMapper:
             dataset_storage_id=dataset_storage_id,
         )
 
+    def test_load_features(self, fxt_feature_matrix_store_registry, fxt_dataset, fxt_ote_id) -> None:
+        dataset_storage_identifier = DatasetStorageIdentifier(
+            workspace_id=fxt_ote_id(1), project_id=fxt_ote_id(2), dataset_storage_id=fxt_ote_id(3)
+        )
+        dataset_items = tuple(fxt_dataset)
+        features = np.random.rand(len(dataset_items), 8).astype(np.float32)
+
+        with patch.object(ActiveMapper, "_extract_features_from_dataset", return_value=features) as mock_extract:
+            first = ActiveMapper._load_features(
+                dataset_storage_identifier=dataset_storage_identifier,
+                model_id=fxt_ote_id(4),
+                dataset_items=dataset_items,
+            )
+            second = ActiveMapper._load_features(
+                dataset_storage_identifier=dataset_storage_identifier,
+                model_id=fxt_ote_id(4),
+                dataset_items=dataset_items,
+            )
+
+        # The feature vectors are extracted from the metadata only once per model
+        mock_extract.assert_called_once_with(dataset_items=dataset_items)
+        np.testing.assert_array_equal(first, features)
+        np.testing.assert_array_equal(second, features)
+
+        with patch.object(ActiveMapper, "_extract_features_from_dataset", return_value=features) as mock_extract:
+            ActiveMapper._load_features(
+                dataset_storage_identifier=dataset_storage_identifier,
+                model_id=fxt_ote_id(5),
+                dataset_items=dataset_items,
+            )
+            # Loading the features of another model keeps those of the first one, e.g. for task chains
+            ActiveMapper._load_features(
+                dataset_storage_identifier=dataset_storage_identifier,
+                model_id=fxt_ote_id(4),
+                dataset_items=dataset_items,
+            )
+
+        mock_extract.assert_called_once_with(dataset_items=dataset_items)
+
     def test_update_active_scores_async(self, fxt_active_mapper, fxt_dataset, fxt_model, fxt_ote_id) -> None:
         active_mapper: ActiveMapper = fxt_active_mapper
         workspace_id = fxt_ote_id(1)
@@ -205,6 +247,32 @@ class TestActiveMapper:
 
         mock_remove_media.assert_called_once_with(media_identifiers=media_identifiers)
 
+    def test_remove_all_media(
+        self,
+        fxt_active_mapper,
+        fxt_pipeline_active_manager,
+        fxt_feature_matrix_store_registry,
+        fxt_media_identifier_factory,
+        fxt_ote_id,
+        tmp_path,
+    ) -> None:
+        active_mapper: ActiveMapper = fxt_active_mapper
+        dataset_storage_identifier = fxt_pipeline_active_manager.dataset_storage_identifier
+        fxt_feature_matrix_store_registry.get(dataset_storage_identifier, model_id=fxt_ote_id(4)).append(
+            keys=[(fxt_media_identifier_factory(0), fxt_ote_id(5))], vectors=np.zeros((1, 2), dtype=np.float32)
+        )
+        with patch.object(PipelineActiveManager, "remove_media") as mock_remove_media:
+            active_mapper.remove_media(
+                workspace_id=dataset_storage_identifier.workspace_id,
+                project_id=dataset_storage_identifier.project_id,
+                dataset_storage_id=dataset_storage_identifier.dataset_storage_id,
+                media_identifiers=None,
+            )
+
+        mock_remove_media.assert_called_once_with(media_identifiers=None)
+        # The feature matrices of the project are deleted from disk
+        assert not any(tmp_path.iterdir())
+
     def test_remove_media_async(self, fxt_active_mapper, fxt_media_identifier_factory, fxt_ote_id) -> None:
         active_mapper: ActiveMapper = fxt_active_mapper
         workspace_id = fxt_ote_id(1)
@@ -0,0 +1,133 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from active_learning.storage.feature_matrix_store import FeatureMatrixStore
+
+from geti_types import ID, DatasetStorageIdentifier, ImageIdentifier
+
+
+@pytest.fixture
+def fxt_feature_store(tmp_path, fxt_ote_id):
+    yield FeatureMatrixStore(directory=str(tmp_path / "features"), model_id=fxt_ote_id(1))
+
+
+def _keys(fxt_ote_id, indices) -> list[tuple[ImageIdentifier, ID]]:
+    return [(ImageIdentifier(image_id=fxt_ote_id(100 + i)), ID()) for i in indices]
+
+
+class TestFeatureMatrixStore:
+    def test_append_and_get_matrix(self, fxt_feature_store, fxt_ote_id) -> None:
+        keys = _keys(fxt_ote_id, range(4))
+        vectors = np.arange(12, dtype=np.float32).reshape(4, 3)
+
+        fxt_feature_store.append(keys=keys, vectors=vectors)
+
+        matrix = fxt_feature_store.get_matrix(keys)
+        np.testing.assert_array_equal(matrix, vectors)
+        # Vectors appended together are served as a view of the memory-mapped file
+        assert np.shares_memory(matrix, fxt_feature_store.matrix)
+        reordered = fxt_feature_store.get_matrix([keys[2], keys[0]])
+        np.testing.assert_array_equal(reordered, vectors[[2, 0]])
+        assert fxt_feature_store.find_missing(_keys(fxt_ote_id, range(2, 6))) == _keys(fxt_ote_id, range(4, 6))
+
+    def test_append_grows_capacity(self, fxt_feature_store, fxt_ote_id) -> None:
+        with patch("active_learning.storage.feature_matrix_store.FEATURE_MATRIX_INITIAL_CAPACITY", 2):
+            for i in range(5):
+                fxt_feature_store.append(keys=_keys(fxt_ote_id, [i]), vectors=np.full((1, 2), i, dtype=np.float32))
+
+        np.testing.assert_array_equal(
+            fxt_feature_store.get_matrix(_keys(fxt_ote_id, range(5)))[:, 0], np.arange(5, dtype=np.float32)
+        )
+
+    def test_append_wrong_size(self, fxt_feature_store, fxt_ote_id) -> None:
+        fxt_feature_store.append(keys=_keys(fxt_ote_id, [0]), vectors=np.zeros((1, 3)))
+
+        with pytest.raises(ValueError):
+            fxt_feature_store.append(keys=_keys(fxt_ote_id, [1]), vectors=np.zeros((1, 4)))
+        with pytest.raises(ValueError):
+            fxt_feature_store.append(keys=_keys(fxt_ote_id, [1, 2]), vectors=np.zeros((1, 3)))
+
+    def test_delete_and_compact(self, fxt_feature_store, fxt_ote_id) -> None:
+        keys = _keys(fxt_ote_id, range(4))
+        vectors = np.arange(8, dtype=np.float32).reshape(4, 2)
+        fxt_feature_store.append(keys=keys, vectors=vectors)
+
+        fxt_feature_store.delete(media_identifiers=[keys[1][0]])
+
+        assert fxt_feature_store.num_vectors == 3
+        np.testing.assert_array_equal(fxt_feature_store.live_rows, [True, False, True, True])
+        with pytest.raises(KeyError):
+            fxt_feature_store.get_matrix([keys[1]])
+
+        # Deleting more than half of the rows compacts the matrix
+        fxt_feature_store.delete(media_identifiers=[keys[0][0], keys[2][0]])
+
+        assert len(fxt_feature_store.matrix) == 1
+        np.testing.assert_array_equal(fxt_feature_store.get_matrix([keys[3]]), vectors[[3]])
+
+    def test_persistence_and_clear(self, fxt_feature_store, tmp_path, fxt_ote_id) -> None:
+        keys = _keys(fxt_ote_id, range(3))
+        vectors = np.random.rand(3, 5).astype(np.float32)
+        fxt_feature_store.append(keys=keys, vectors=vectors)
+
+        reloaded_store = FeatureMatrixStore(directory=str(tmp_path / "features"), model_id=fxt_ote_id(1))
+
+        assert reloaded_store.model_id == fxt_ote_id(1)
+        np.testing.assert_array_equal(reloaded_store.get_matrix(keys), vectors)
+        # Vectors persisted for another model are discarded
+        other_model_store = FeatureMatrixStore(directory=str(tmp_path / "features"), model_id=fxt_ote_id(2))
+        assert other_model_store.find_missing(keys) == keys
+
+        reloaded_store.clear()
+
+        assert reloaded_store.find_missing(keys) == keys
+        assert not (tmp_path / "features").exists()
+
+
+class TestFeatureMatrixStoreRegistry:
+    def test_get_per_model(self, fxt_feature_matrix_store_registry, fxt_ote_id) -> None:
+        registry = fxt_feature_matrix_store_registry
+        dataset_storage_identifier = DatasetStorageIdentifier(
+            workspace_id=fxt_ote_id(1), project_id=fxt_ote_id(2), dataset_storage_id=fxt_ote_id(3)
+        )
+        keys = _keys(fxt_ote_id, range(2))
+        registry.get(dataset_storage_identifier, model_id=fxt_ote_id(4)).append(keys=keys, vectors=np.zeros((2, 3)))
+
+        with patch("active_learning.storage.feature_matrix_store.FEATURE_MATRIX_MAX_MODELS_PER_DATASET_STORAGE", 2):
+            registry.get(dataset_storage_identifier, model_id=fxt_ote_id(5)).append(keys=keys, vectors=np.ones((2, 3)))
+
+            # The stores of different models coexist
+            assert registry.get(dataset_storage_identifier, model_id=fxt_ote_id(5)).find_missing(keys) == []
+            assert registry.get(dataset_storage_identifier, model_id=fxt_ote_id(4)).find_missing(keys) == []
+
+            # The least recently used store is deleted beyond the limit
+            registry.get(dataset_storage_identifier, model_id=fxt_ote_id(6))
+
+            assert registry.get(dataset_storage_identifier, model_id=fxt_ote_id(4)).find_missing(keys) == []
+            assert registry.get(dataset_storage_identifier, model_id=fxt_ote_id(5)).find_missing(keys) == keys
+
+    def test_get_all_and_delete(self, fxt_feature_matrix_store_registry, tmp_path, fxt_ote_id) -> None:
+        registry = fxt_feature_matrix_store_registry
+        dataset_storage_identifier = DatasetStorageIdentifier(
+            workspace_id=fxt_ote_id(1), project_id=fxt_ote_id(2), dataset_storage_id=fxt_ote_id(3)
+        )
+        keys = _keys(fxt_ote_id, range(2))
+        for model_id in (fxt_ote_id(4), fxt_ote_id(5)):
+            registry.get(dataset_storage_identifier, model_id=model_id).append(keys=keys, vectors=np.zeros((2, 3)))
+        # Stores persisted by a previous process are found on disk
+        registry._stores.clear()
+
+        stores = registry.get_all(dataset_storage_identifier)
+
+        assert {store.model_id for store in stores} == {fxt_ote_id(4), fxt_ote_id(5)}
+        assert all(store.num_vectors == 2 for store in stores)
+
+        registry.delete(dataset_storage_identifier)
+
+        assert registry.get_all(dataset_storage_identifier) == []
+        assert not any(tmp_path.iterdir())
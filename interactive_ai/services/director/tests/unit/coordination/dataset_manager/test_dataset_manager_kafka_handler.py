@@ -1,13 +1,15 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 import datetime
-from unittest.mock import patch
+from unittest.mock import MagicMock, call, patch
 
 import pytest
+from tests.unit.mocked_method_helpers import return_none
 
 from coordination.dataset_manager.dataset_counter import DatasetCounterUseCase
 from coordination.dataset_manager.dataset_suspender import DatasetSuspender
 from coordination.dataset_manager.dataset_update import DatasetUpdateUseCase
+from coordination.dataset_manager.dataset_update_coalescer import AnnotationSceneEventCoalescer
 from coordination.dataset_manager.kafka_handler import (
     DatasetManagementDatasetUpdatedKafkaHandler,
     DatasetManagementMediaAndAnnotationKafkaHandler,
@@ -35,6 +37,14 @@ def fxt_consumer_record():
     return _build_consumer_record
 
 
+@pytest.fixture
+def fxt_media_and_annotation_kafka_handler():
+    with patch.object(DatasetManagementMediaAndAnnotationKafkaHandler, "__init__", new=return_none):
+        handler = DatasetManagementMediaAndAnnotationKafkaHandler()
+        handler.event_consumer = MagicMock()
+        yield handler
+
+
 class TestDatasetManagementKafkaHandler:
     def test_on_annotations_suspended(self, fxt_consumer_record, fxt_mongo_id) -> None:
         raw_message = fxt_consumer_record(
@@ -93,6 +103,7 @@ class TestDatasetManagementKafkaHandler:
         )
         with (
             patch.object(ProjectService, "is_training_dataset_storage_id", return_value=True) as mock_is_training_ds,
+            patch.object(AnnotationSceneEventCoalescer, "flush", return_value=None) as mock_flush,
             patch.object(DatasetUpdateUseCase, "delete_media_from_datasets", return_value=None) as mock_delete_media,
         ):
             DatasetManagementMediaAndAnnotationKafkaHandler.on_media_deleted(raw_message=raw_message)
@@ -101,11 +112,39 @@ class TestDatasetManagementKafkaHandler:
                 project_id=fxt_mongo_id(1),
                 dataset_storage_id=fxt_mongo_id(2),
             )
+            mock_flush.assert_called_once_with(project_id=fxt_mongo_id(1))
             mock_delete_media.assert_called_once_with(
                 project_id=fxt_mongo_id(1),
                 media_id=fxt_mongo_id(3),
             )
 
+    def test_on_media_deleted_bulk(self, fxt_consumer_record, fxt_mongo_id) -> None:
+        raw_message = fxt_consumer_record(
+            value={
+                "workspace_id": str(fxt_mongo_id(0)),
+                "project_id": str(fxt_mongo_id(1)),
+                "dataset_storage_id": str(fxt_mongo_id(2)),
+                "media": [
+                    {"media_id": str(fxt_mongo_id(3)), "media_type": "image"},
+                    {"media_id": str(fxt_mongo_id(4)), "media_type": "video"},
+                ],
+            }
+        )
+        with (
+            patch.object(ProjectService, "is_training_dataset_storage_id", return_value=True),
+            patch.object(AnnotationSceneEventCoalescer, "flush", return_value=None) as mock_flush,
+            patch.object(DatasetUpdateUseCase, "delete_media_from_datasets", return_value=None) as mock_delete_media,
+        ):
+            DatasetManagementMediaAndAnnotationKafkaHandler.on_media_deleted(raw_message=raw_message)
+
+            mock_flush.assert_called_once_with(project_id=fxt_mongo_id(1))
+            mock_delete_media.assert_has_calls(
+                [
+                    call(project_id=fxt_mongo_id(1), media_id=fxt_mongo_id(3)),
+                    call(project_id=fxt_mongo_id(1), media_id=fxt_mongo_id(4)),
+                ]
+            )
+
     def test_on_media_deleted_non_training_ds(self, fxt_consumer_record, fxt_mongo_id) -> None:
         raw_message = fxt_consumer_record(
             value={
@@ -127,7 +166,9 @@ class TestDatasetManagementKafkaHandler:
             )
             mock_delete_media.assert_not_called()
 
-    def test_on_new_annotation_scene_training_ds(self, fxt_consumer_record, fxt_mongo_id) -> None:
+    def test_on_new_annotation_scene_training_ds(
+        self, fxt_media_and_annotation_kafka_handler, fxt_consumer_record, fxt_mongo_id
+    ) -> None:
         raw_message = fxt_consumer_record(
             value={
                 "workspace_id": str(fxt_mongo_id(0)),
@@ -139,24 +180,25 @@ class TestDatasetManagementKafkaHandler:
         )
         with (
             patch.object(ProjectService, "is_training_dataset_storage_id", return_value=True) as mock_is_training_ds,
-            patch.object(
-                DatasetUpdateUseCase,
-                "update_dataset_with_new_annotation_scene",
-                return_value=None,
-            ) as mock_update_dataset,
+            patch.object(AnnotationSceneEventCoalescer, "submit", return_value=None) as mock_submit,
         ):
-            DatasetManagementMediaAndAnnotationKafkaHandler.on_new_annotation_scene(raw_message=raw_message)
+            fxt_media_and_annotation_kafka_handler.on_new_annotation_scene(raw_message=raw_message)
 
             mock_is_training_ds.assert_called_once_with(
                 project_id=fxt_mongo_id(1),
                 dataset_storage_id=fxt_mongo_id(2),
             )
-            mock_update_dataset.assert_called_once_with(
+            event_consumer = fxt_media_and_annotation_kafka_handler.event_consumer
+            event_consumer.defer_commit.assert_called_once_with(raw_message)
+            mock_submit.assert_called_once_with(
                 project_id=fxt_mongo_id(1),
                 annotation_scene_id=fxt_mongo_id(3),
+                on_processed=event_consumer.defer_commit.return_value,
             )
 
-    def test_on_new_annotation_scene_non_training_ds(self, fxt_consumer_record, fxt_mongo_id) -> None:
+    def test_on_new_annotation_scene_non_training_ds(
+        self, fxt_media_and_annotation_kafka_handler, fxt_consumer_record, fxt_mongo_id
+    ) -> None:
         raw_message = fxt_consumer_record(
             value={
                 "workspace_id": str(fxt_mongo_id(0)),
@@ -168,19 +210,16 @@ class TestDatasetManagementKafkaHandler:
         )
         with (
             patch.object(ProjectService, "is_training_dataset_storage_id", return_value=False) as mock_is_training_ds,
-            patch.object(
-                DatasetUpdateUseCase,
-                "update_dataset_with_new_annotation_scene",
-                return_value=None,
-            ) as mock_update_dataset,
+            patch.object(AnnotationSceneEventCoalescer, "submit", return_value=None) as mock_submit,
         ):
-            DatasetManagementMediaAndAnnotationKafkaHandler.on_new_annotation_scene(raw_message=raw_message)
+            fxt_media_and_annotation_kafka_handler.on_new_annotation_scene(raw_message=raw_message)
 
             mock_is_training_ds.assert_called_once_with(
                 project_id=fxt_mongo_id(1),
                 dataset_storage_id=fxt_mongo_id(2),
             )
-            mock_update_dataset.assert_not_called()
+            mock_submit.assert_not_called()
+            fxt_media_and_annotation_kafka_handler.event_consumer.defer_commit.assert_not_called()
 
     def test_on_project_created(self, fxt_consumer_record, fxt_mongo_id) -> None:
         raw_message = fxt_consumer_record(
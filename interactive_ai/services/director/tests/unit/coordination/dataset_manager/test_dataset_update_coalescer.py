@@ -0,0 +1,178 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+from threading import Event
+from unittest.mock import MagicMock, call, patch
+
+import pytest
+
+from coordination.dataset_manager.dataset_update import DatasetUpdateUseCase
+from coordination.dataset_manager.dataset_update_coalescer import AnnotationSceneEventCoalescer
+
+
+@pytest.fixture
+def fxt_coalescer():
+    def _build_coalescer(window: float = 60.0, max_batch_size: int = 500) -> AnnotationSceneEventCoalescer:
+        with patch.dict(
+            "os.environ",
+            {
+                "DATASET_UPDATE_COALESCING_WINDOW": str(window),
+                "DATASET_UPDATE_MAX_BATCH_SIZE": str(max_batch_size),
+            },
+        ):
+            # Bypass the singleton so that every test gets its own configuration
+            coalescer = object.__new__(AnnotationSceneEventCoalescer)
+            coalescer.__init__()  # type: ignore[misc]
+        coalescers.append(coalescer)
+        return coalescer
+
+    coalescers: list[AnnotationSceneEventCoalescer] = []
+    yield _build_coalescer
+    for coalescer in coalescers:
+        with patch.object(DatasetUpdateUseCase, "update_dataset_with_new_annotation_scenes"):
+            coalescer.stop()
+
+
+class TestAnnotationSceneEventCoalescer:
+    def test_submit_without_window(self, fxt_coalescer, fxt_mongo_id) -> None:
+        coalescer = fxt_coalescer(window=0)
+
+        with patch.object(DatasetUpdateUseCase, "update_dataset_with_new_annotation_scene") as mock_update:
+            coalescer.submit(project_id=fxt_mongo_id(0), annotation_scene_id=fxt_mongo_id(1))
+
+        mock_update.assert_called_once_with(project_id=fxt_mongo_id(0), annotation_scene_id=fxt_mongo_id(1))
+
+    def test_submit_without_window_failure(self, fxt_coalescer, fxt_mongo_id) -> None:
+        coalescer = fxt_coalescer(window=0)
+        on_processed = MagicMock()
+
+        with (
+            patch.object(
+                DatasetUpdateUseCase, "update_dataset_with_new_annotation_scene", side_effect=RuntimeError("Failed")
+            ),
+            pytest.raises(RuntimeError),
+        ):
+            coalescer.submit(project_id=fxt_mongo_id(0), annotation_scene_id=fxt_mongo_id(1), on_processed=on_processed)
+
+        on_processed.assert_called_once_with()
+
+    def test_flush_deduplicates_per_project(self, fxt_coalescer, fxt_mongo_id) -> None:
+        coalescer = fxt_coalescer()
+        project_1, project_2 = fxt_mongo_id(0), fxt_mongo_id(1)
+
+        with patch.object(DatasetUpdateUseCase, "update_dataset_with_new_annotation_scenes") as mock_update:
+            for scene_id in (fxt_mongo_id(10), fxt_mongo_id(11), fxt_mongo_id(10)):
+                coalescer.submit(project_id=project_1, annotation_scene_id=scene_id)
+            coalescer.submit(project_id=project_2, annotation_scene_id=fxt_mongo_id(12))
+            coalescer.flush(project_id=project_1)
+
+            mock_update.assert_called_once_with(
+                project_id=project_1, annotation_scene_ids=[fxt_mongo_id(10), fxt_mongo_id(11)]
+            )
+            mock_update.reset_mock()
+
+            coalescer.flush()
+
+            mock_update.assert_called_once_with(project_id=project_2, annotation_scene_ids=[fxt_mongo_id(12)])
+
+    def test_batch_applied_when_full(self, fxt_coalescer, fxt_mongo_id) -> None:
+        coalescer = fxt_coalescer(max_batch_size=2)
+        applied = Event()
+
+        with patch.object(
+            DatasetUpdateUseCase, "update_dataset_with_new_annotation_scenes", side_effect=lambda **_: applied.set()
+        ) as mock_update:
+            coalescer.submit(project_id=fxt_mongo_id(0), annotation_scene_id=fxt_mongo_id(10))
+            coalescer.submit(project_id=fxt_mongo_id(0), annotation_scene_id=fxt_mongo_id(11))
+
+            assert applied.wait(timeout=5)
+            mock_update.assert_called_once_with(
+                project_id=fxt_mongo_id(0), annotation_scene_ids=[fxt_mongo_id(10), fxt_mongo_id(11)]
+            )
+
+    def test_batch_applied_after_window(self, fxt_coalescer, fxt_mongo_id) -> None:
+        coalescer = fxt_coalescer(window=0.05)
+        applied = Event()
+
+        with patch.object(
+            DatasetUpdateUseCase, "update_dataset_with_new_annotation_scenes", side_effect=lambda **_: applied.set()
+        ) as mock_update:
+            coalescer.submit(project_id=fxt_mongo_id(0), annotation_scene_id=fxt_mongo_id(10))
+
+            assert applied.wait(timeout=5)
+            mock_update.assert_called_once_with(project_id=fxt_mongo_id(0), annotation_scene_ids=[fxt_mongo_id(10)])
+
+    def test_on_processed_called_after_batch_applied(self, fxt_coalescer, fxt_mongo_id) -> None:
+        coalescer = fxt_coalescer()
+        on_processed = MagicMock()
+
+        with patch.object(DatasetUpdateUseCase, "update_dataset_with_new_annotation_scenes") as mock_update:
+            coalescer.submit(
+                project_id=fxt_mongo_id(0), annotation_scene_id=fxt_mongo_id(10), on_processed=on_processed
+            )
+            coalescer.submit(
+                project_id=fxt_mongo_id(0), annotation_scene_id=fxt_mongo_id(11), on_processed=on_processed
+            )
+
+            # The events are not acknowledged while the batch is pending
+            on_processed.assert_not_called()
+            mock_update.side_effect = lambda **_: on_processed.assert_not_called()
+            coalescer.flush()
+
+        assert on_processed.call_count == 2
+
+    def test_failed_batch_applied_one_at_a_time(self, fxt_coalescer, fxt_mongo_id) -> None:
+        coalescer = fxt_coalescer()
+        on_processed = MagicMock()
+
+        def _update_one(project_id, annotation_scene_id) -> None:
+            if annotation_scene_id == fxt_mongo_id(10):
+                raise RuntimeError("Failed to update the dataset")
+
+        with (
+            patch.object(
+                DatasetUpdateUseCase,
+                "update_dataset_with_new_annotation_scenes",
+                side_effect=RuntimeError("Failed to update the dataset"),
+            ),
+            patch.object(
+                DatasetUpdateUseCase, "update_dataset_with_new_annotation_scene", side_effect=_update_one
+            ) as mock_update_one,
+        ):
+            for scene_id in (fxt_mongo_id(10), fxt_mongo_id(11)):
+                coalescer.submit(project_id=fxt_mongo_id(0), annotation_scene_id=scene_id, on_processed=on_processed)
+            coalescer.flush()
+
+        mock_update_one.assert_has_calls(
+            [
+                call(project_id=fxt_mongo_id(0), annotation_scene_id=fxt_mongo_id(10)),
+                call(project_id=fxt_mongo_id(0), annotation_scene_id=fxt_mongo_id(11)),
+            ]
+        )
+        # Failed events are acknowledged too, so that they do not block the following ones
+        assert on_processed.call_count == 2
+
+    def test_failed_batch_does_not_stop_worker(self, fxt_coalescer, fxt_mongo_id) -> None:
+        coalescer = fxt_coalescer(window=0.01)
+        applied = Event()
+
+        def _update(project_id, annotation_scene_ids) -> None:
+            if project_id == fxt_mongo_id(0):
+                raise RuntimeError("Failed to update the dataset")
+            applied.set()
+
+        with patch.object(DatasetUpdateUseCase, "update_dataset_with_new_annotation_scenes", side_effect=_update):
+            coalescer.submit(project_id=fxt_mongo_id(0), annotation_scene_id=fxt_mongo_id(10))
+            coalescer.flush()
+            coalescer.submit(project_id=fxt_mongo_id(1), annotation_scene_id=fxt_mongo_id(11))
+
+            assert applied.wait(timeout=5)
+
+    def test_stop_flushes_pending_batches(self, fxt_coalescer, fxt_mongo_id) -> None:
+        coalescer = fxt_coalescer()
+
+        with patch.object(DatasetUpdateUseCase, "update_dataset_with_new_annotation_scenes") as mock_update:
+            coalescer.submit(project_id=fxt_mongo_id(0), annotation_scene_id=fxt_mongo_id(10))
+            coalescer.stop()
+
+            mock_update.assert_called_once_with(project_id=fxt_mongo_id(0), annotation_scene_ids=[fxt_mongo_id(10)])
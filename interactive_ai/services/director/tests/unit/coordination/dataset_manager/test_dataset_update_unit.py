@@ -1,12 +1,14 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 
+import copy
 from unittest.mock import patch
 
 import pytest
 
 from coordination.dataset_manager.dataset_update import DatasetUpdateUseCase
 
+from geti_types import ImageIdentifier
 from iai_core.entities.dataset_entities import TaskDataset
 from iai_core.entities.datasets import Dataset
 from iai_core.entities.subset import Subset
@@ -61,6 +63,64 @@ class TestDatasetUpdateUseCase:
             )
             mock_generate_id.assert_called_once_with()
 
+    def test_update_dataset_with_new_annotation_scenes(
+        self,
+        fxt_db_project_service,
+        fxt_mongo_id,
+        fxt_annotation_scene,
+        fxt_dataset_item,
+    ) -> None:
+        project = fxt_db_project_service.create_empty_project()
+        dataset_storage = project.get_training_dataset_storage()
+        pipeline_dataset_entity = fxt_db_project_service.get_pipeline_dataset()
+        dataset_item = fxt_dataset_item()
+        scene_ids = [fxt_mongo_id(10), fxt_mongo_id(11), fxt_mongo_id(12)]
+        # Two scenes for the same media: only the latest one is applied
+        scenes = [copy.copy(fxt_annotation_scene) for _ in scene_ids]
+        for scene, scene_id in zip(scenes, scene_ids):
+            scene.id_ = scene_id
+        scenes[2].media_identifier = ImageIdentifier(image_id=fxt_mongo_id(20))
+        with (
+            patch.object(ProjectRepo, "get_by_id", return_value=project),
+            patch.object(AnnotationSceneRepo, "get_all", return_value=list(reversed(scenes))) as mock_get_scenes,
+            patch.object(
+                DatasetHelper,
+                "annotation_scene_to_dataset_item",
+                return_value=dataset_item,
+            ) as mock_scene_to_item,
+            patch.object(
+                DatasetUpdateUseCase,
+                "_update_dataset_with_new_items",
+                return_value=None,
+            ) as mock_update_dataset,
+            patch.object(DatasetRepo, "generate_id", return_value=fxt_mongo_id()),
+        ):
+            DatasetUpdateUseCase.update_dataset_with_new_annotation_scenes(
+                project_id=project.id_, annotation_scene_ids=scene_ids
+            )
+
+            mock_get_scenes.assert_called_once()
+            assert [call.kwargs["annotation_scene"] for call in mock_scene_to_item.call_args_list] == scenes[1:]
+            mock_update_dataset.assert_called_once_with(
+                new_items_dataset_for_task=Dataset(items=[dataset_item, dataset_item], id=fxt_mongo_id()),
+                pipeline_dataset_entity=pipeline_dataset_entity,
+                dataset_storage_identifier=dataset_storage.identifier,
+                project=project,
+            )
+
+    def test_update_dataset_with_new_annotation_scenes_not_found(self, fxt_db_project_service, fxt_mongo_id) -> None:
+        project = fxt_db_project_service.create_empty_project()
+        with (
+            patch.object(ProjectRepo, "get_by_id", return_value=project),
+            patch.object(AnnotationSceneRepo, "get_all", return_value=[]),
+            patch.object(DatasetUpdateUseCase, "_update_dataset_with_new_items") as mock_update_dataset,
+        ):
+            DatasetUpdateUseCase.update_dataset_with_new_annotation_scenes(
+                project_id=project.id_, annotation_scene_ids=[fxt_mongo_id(10)]
+            )
+
+            mock_update_dataset.assert_not_called()
+
     @pytest.mark.parametrize(
         "lazyfxt_dataset_item, lazyfxt_dataset",
         [
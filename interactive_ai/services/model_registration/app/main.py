@@ -3,13 +3,20 @@
 
 import asyncio
 import logging
+import signal
 import sys
 
 import grpc
 from aiohttp import web
 from grpc_interfaces.model_registration.pb.service_pb2_grpc import add_ModelRegistrationServicer_to_server
 
-from service.config import GRPC_SERVICE_PORT
+from service.config import (
+    GRPC_SERVICE_PORT,
+    INFERENCE_CACHE_ENABLED,
+    MODELMESH_NAMESPACE,
+    SHUTDOWN_GRACE_PERIOD_SECONDS,
+)
+from service.inference_manager import InferenceManager
 from service.model_registration import ModelRegistration
 
 logging.basicConfig(stream=sys.stdout, level=logging.INFO)
@@ -27,17 +34,32 @@ async def serve():  # noqa: ANN201
     app.router.add_get("/healthz", healthz_handler)
 
     server = grpc.aio.server()
-    add_ModelRegistrationServicer_to_server(ModelRegistration(), server)
+    model_registration = ModelRegistration()
+    add_ModelRegistrationServicer_to_server(model_registration, server)
     server.add_insecure_port(f"[::]:{GRPC_SERVICE_PORT}")
     logging.info("ModelRegistration Service started.")
     await server.start()
+    if INFERENCE_CACHE_ENABLED:
+        InferenceManager.start_cache(namespace=MODELMESH_NAMESPACE)
 
     runner = web.AppRunner(app, access_log=None)
     await runner.setup()
     site = web.TCPSite(runner, "0.0.0.0", 8080)  # noqa: S104
     await site.start()
 
-    await server.wait_for_termination()
+    # On SIGTERM/SIGINT, stop accepting RPCs and let the ongoing ones finish within the grace period
+    stop_tasks: list[asyncio.Task] = []
+    loop = asyncio.get_running_loop()
+    for stop_signal in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(
+            stop_signal, lambda: stop_tasks.append(asyncio.ensure_future(server.stop(SHUTDOWN_GRACE_PERIOD_SECONDS)))
+        )
+    try:
+        await server.wait_for_termination()
+    finally:
+        logger.info("ModelRegistration Service stopping, waiting for the running model conversions.")
+        await asyncio.to_thread(model_registration.executor.shutdown)
+        await runner.cleanup()
 
 
 if __name__ == "__main__":
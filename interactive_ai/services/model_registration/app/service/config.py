@@ -13,3 +13,16 @@ S3_BUCKETNAME = os.getenv("BUCKET_NAME_MODELMESH", "modelmesh")
 S3_STORAGE = os.getenv("S3_STORAGE", "modelmesh")  # points to a name of ConfigMap with S3 storage config
 RESOURCE_MS_SERVICE = os.getenv("RESOURCE_MS_SERVICE", "impt-resource")
 RESOURCE_MS_PORT = os.getenv("RESOURCE_MS_PORT", "5000")
+MODEL_CONVERSION_CACHE_DIR = os.getenv("MODEL_CONVERSION_CACHE_DIR", "/tmp/model_conversion_cache")  # noqa: S108
+MODEL_CONVERSION_CACHE_MAX_SIZE_MB = int(os.getenv("MODEL_CONVERSION_CACHE_MAX_SIZE_MB", "2048"))
+MODEL_PREPARATION_WORKERS = int(os.getenv("MODEL_PREPARATION_WORKERS", "4"))
+MODEL_CONVERSION_WORKERS = int(os.getenv("MODEL_CONVERSION_WORKERS", "2"))
+# Maximum number of models converted at once across all the registrations. Each ModelAPI conversion loads a whole
+# model in memory, so this bounds the memory used by the conversions and must be sized for the memory limit of the pod.
+MODEL_CONVERSION_MAX_CONCURRENT = int(os.getenv("MODEL_CONVERSION_MAX_CONCURRENT", "2"))
+S3_UPLOAD_WORKERS = int(os.getenv("S3_UPLOAD_WORKERS", "8"))
+INFERENCE_CACHE_ENABLED = os.getenv("INFERENCE_CACHE_ENABLED", "true").lower() == "true"
+INFERENCE_CACHE_PAGE_SIZE = int(os.getenv("INFERENCE_CACHE_PAGE_SIZE", "500"))
+INFERENCE_CACHE_WATCH_TIMEOUT_SECONDS = int(os.getenv("INFERENCE_CACHE_WATCH_TIMEOUT_SECONDS", "300"))
+# Time given to the ongoing RPCs to complete on SIGTERM, below the default termination grace period of the pods
+SHUTDOWN_GRACE_PERIOD_SECONDS = float(os.getenv("SHUTDOWN_GRACE_PERIOD_SECONDS", "25"))
@@ -0,0 +1,151 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from service.config import MODEL_CONVERSION_CACHE_DIR, MODEL_CONVERSION_CACHE_MAX_SIZE_MB
+
+logger = logging.getLogger(__name__)
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+class ConversionCache:
+    """
+    Local disk cache of converted models, i.e. the directories with the `model.xml` and `model.bin` files produced
+    by the ModelAPI conversion, so that a model registered again is not downloaded and converted again.
+
+    Entries are keyed by the optimized model id, the graph type and the labels of the task, which together determine
+    the result of the conversion. They are populated atomically and the least recently used entries are evicted when
+    the cache exceeds its maximum size.
+    """
+
+    def __init__(
+        self, root_dir: str = MODEL_CONVERSION_CACHE_DIR, max_size_bytes: int = MODEL_CONVERSION_CACHE_MAX_SIZE_MB << 20
+    ) -> None:
+        self.root_dir = root_dir
+        self.max_size_bytes = max_size_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._key_locks: dict[str, threading.Lock] = {}
+        # Number of threads holding or waiting for each key lock; the lock is dropped when no thread needs it anymore
+        self._key_lock_users: Counter[str] = Counter()
+        os.makedirs(root_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(
+        optimized_model_id: str, graph_type: str, labels: list[tuple[str, str, bool]], use_ellipse: bool
+    ) -> str:
+        """
+        Compute the cache key of a converted model.
+
+        :param optimized_model_id: ID of the optimized model that is converted
+        :param graph_type: Graph type the model is converted for
+        :param labels: ID, name and emptiness of each label of the task, in order
+        :param use_ellipse: Whether the model outputs ellipses
+        :return: Cache key
+        """
+        content = json.dumps([str(optimized_model_id), graph_type, labels, use_ellipse], default=str)
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    @contextmanager
+    def lock(self, key: str, blocking: bool = True) -> Iterator[bool]:
+        """
+        Lock to hold while looking up and populating an entry, so that each model is converted only once.
+
+        :param key: Cache key of the entry
+        :param blocking: If False, do not wait for the lock if it is held by another thread
+        :return: Context manager yielding whether the lock was acquired
+        """
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+            self._key_lock_users[key] += 1
+        acquired = key_lock.acquire(blocking=blocking)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                key_lock.release()
+            with self._lock:
+                self._key_lock_users[key] -= 1
+                if not self._key_lock_users[key]:
+                    del self._key_lock_users[key]
+                    del self._key_locks[key]
+
+    def get(self, key: str, target_dir: str) -> bool:
+        """
+        Copy a cached converted model to the target directory, if present.
+
+        :param key: Cache key of the converted model
+        :param target_dir: Directory to copy the converted model files to
+        :return: True on a cache hit
+        """
+        entry_dir = os.path.join(self.root_dir, key)
+        if not os.path.isdir(entry_dir):
+            with self._lock:
+                self.misses += 1
+            return False
+        # Refresh the last use time of the entry for the LRU eviction
+        os.utime(entry_dir)
+        shutil.copytree(entry_dir, target_dir, copy_function=_link_or_copy, dirs_exist_ok=True)
+        with self._lock:
+            self.hits += 1
+        logger.info(f"Conversion cache hit for {key} ({self.hits} hits, {self.misses} misses)")
+        return True
+
+    def put(self, key: str, source_dir: str) -> None:
+        """
+        Store a converted model in the cache.
+
+        :param key: Cache key of the converted model
+        :param source_dir: Directory with the converted model files
+        """
+        entry_dir = os.path.join(self.root_dir, key)
+        tmp_dir = tempfile.mkdtemp(prefix=f".{key}.", dir=self.root_dir)
+        try:
+            shutil.copytree(source_dir, tmp_dir, copy_function=_link_or_copy, dirs_exist_ok=True)
+            os.rename(tmp_dir, entry_dir)
+        except OSError:
+            # The entry was populated concurrently, or the disk is full: the cache is best effort
+            logger.warning(f"Could not store converted model {key} in the conversion cache", exc_info=True)
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return
+        self._evict(keep=key)
+
+    def _evict(self, keep: str) -> None:
+        entries = []
+        for name in os.listdir(self.root_dir):
+            entry_dir = os.path.join(self.root_dir, name)
+            if name.startswith(".") or not os.path.isdir(entry_dir):
+                continue
+            size = sum(
+                os.path.getsize(os.path.join(root, file)) for root, _, files in os.walk(entry_dir) for file in files
+            )
+            entries.append((os.path.getmtime(entry_dir), size, name))
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total_size <= self.max_size_bytes:
+                break
+            if name == keep:
+                continue
+            with self.lock(name, blocking=False) as acquired:
+                # Skip the entries being read or populated, the lock may also be held by a thread evicting concurrently
+                if not acquired:
+                    continue
+                shutil.rmtree(os.path.join(self.root_dir, name), ignore_errors=True)
+            total_size -= size
+            logger.info(f"Evicted converted model {name} ({size} bytes) from the conversion cache")
@@ -0,0 +1,98 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+import asyncio
+import functools
+import logging
+import sys
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from service.config import MODEL_CONVERSION_WORKERS
+
+logging.basicConfig(stream=sys.stdout, level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ConversionCancelled(Exception):
+    """Raised by a conversion that stopped because its request was cancelled"""
+
+
+class ConversionExecutor:
+    """
+    Runs the blocking model conversions, i.e. the downloads, the ModelAPI conversions and the S3 uploads, in a bounded
+    pool of worker threads, so that they do not stall the event loop serving the other RPCs.
+
+    Concurrent registrations of the same pipeline are deduplicated: they share a single execution and its result.
+    An execution is cancelled once all the requests waiting for it are cancelled; a conversion that is still queued is
+    dropped, and a running one is notified through the `cancel_event` passed to the blocking function.
+    """
+
+    def __init__(self, max_workers: int = MODEL_CONVERSION_WORKERS) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="model-conversion")
+        self._in_flight: dict[str, asyncio.Task] = {}
+        self._waiters: dict[str, int] = {}
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking function in the worker pool.
+
+        :param func: Function to run, which receives a `cancel_event` keyword argument set when the call is cancelled
+        :param args: Positional arguments of the function
+        :param kwargs: Keyword arguments of the function
+        :return: Result of the function
+        """
+        cancel_event = threading.Event()
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(
+            self._executor, functools.partial(func, *args, cancel_event=cancel_event, **kwargs)
+        )
+        try:
+            return await future
+        except asyncio.CancelledError:
+            cancel_event.set()
+            raise
+
+    async def run_deduplicated(self, key: str, coroutine_function: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await a coroutine, unless one with the same key is already in flight, in which case its result is awaited.
+
+        :param key: Deduplication key, e.g. the name of the registered pipeline
+        :param coroutine_function: Function returning the coroutine to run
+        :return: Result of the coroutine
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(coroutine_function())
+            self._in_flight[key] = task
+            self._waiters[key] = 0
+            task.add_done_callback(functools.partial(self._discard, key))
+        else:
+            logger.info(f"Joining the registration of {key} already in progress")
+        self._waiters[key] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if self._waiters.get(key) == 1 and not task.done():
+                logger.info(f"Cancelling the registration of {key}, no request is waiting for it anymore")
+                task.cancel()
+            raise
+        finally:
+            if self._in_flight.get(key) is task:
+                self._waiters[key] -= 1
+
+    def shutdown(self) -> None:
+        """
+        Drop the queued conversions and wait for the running ones. This method blocks and may be called from any
+        thread, e.g. with `asyncio.to_thread` once the gRPC server is stopped.
+        """
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _discard(self, key: str, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+            del self._waiters[key]
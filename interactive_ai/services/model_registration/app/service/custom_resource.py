@@ -12,7 +12,7 @@ from typing import Any, Generic, Optional, TypeVar
 
 import dpath.util
 import yaml
-from kubernetes_asyncio import client, config
+from kubernetes_asyncio import client, config, watch
 from kubernetes_asyncio.client import CoreV1Api, CustomObjectsApi
 from kubernetes_asyncio.client.rest import ApiException
 from kubernetes_asyncio.config import ConfigException
@@ -267,36 +267,71 @@ class CustomResource(abc.ABC, Generic[T]):
         Limit parameter defines chunk size of API list_namespaced_custom_object calls.
         """
         logger.debug(f"Getting list of {cls.__name__} resources.")
-        k8s_custom_object_api = await CustomResourceApiClient.get()
-
         _continue = ""
 
         while True:
-            if not _continue:
-                raw_resources = await k8s_custom_object_api.list_namespaced_custom_object(
-                    group=cls.api_group_name,
-                    namespace=namespace,
-                    plural=cls.crd_plural_name,
-                    version=cls.crd_version,
-                    label_selector=label_selector,
-                    limit=limit,
-                )
-            else:
-                raw_resources = await k8s_custom_object_api.list_namespaced_custom_object(
-                    group=cls.api_group_name,
-                    namespace=namespace,
-                    plural=cls.crd_plural_name,
-                    version=cls.crd_version,
-                    label_selector=label_selector,
-                    limit=limit,
-                    _continue=_continue,
-                )
+            raw_resources = await cls.list_page(
+                limit=limit, namespace=namespace, label_selector=label_selector, _continue=_continue
+            )
             for raw_resource in raw_resources["items"]:
                 yield cls.from_k8s_response_dict(raw_resource)
             _continue = raw_resources["metadata"].get("continue")
             if not _continue:
                 break
 
+    @classmethod
+    async def list_page(
+        cls,
+        limit: int,
+        namespace: str,
+        label_selector: str | None = None,
+        _continue: str | None = None,
+    ) -> dict:
+        """
+        Return a raw page of the list of namespace-scoped Custom Resources, as returned by the API.
+        The page metadata holds the token of the next page ("continue") and the resourceVersion of the list.
+        """
+        k8s_custom_object_api = await CustomResourceApiClient.get()
+        kwargs = {"_continue": _continue} if _continue else {}
+        return await k8s_custom_object_api.list_namespaced_custom_object(
+            group=cls.api_group_name,
+            namespace=namespace,
+            plural=cls.crd_plural_name,
+            version=cls.crd_version,
+            label_selector=label_selector,
+            limit=limit,
+            **kwargs,
+        )
+
+    @classmethod
+    async def watch(
+        cls,
+        namespace: str,
+        resource_version: str,
+        timeout_seconds: int,
+        label_selector: str | None = None,
+    ) -> AsyncIterator[dict]:
+        """
+        Return a generator of the watch events of namespace-scoped Custom Resources since the given resourceVersion,
+        including the BOOKMARK events. Each event is a dict with the event "type" and the raw resource as "object".
+        The generator ends when the server closes the watch, after at most timeout_seconds; an ApiException with
+        status 410 (Gone) is raised if the resourceVersion is too old.
+        """
+        k8s_custom_object_api = await CustomResourceApiClient.get()
+        async with watch.Watch() as resource_watch:
+            async for event in resource_watch.stream(
+                k8s_custom_object_api.list_namespaced_custom_object,
+                group=cls.api_group_name,
+                namespace=namespace,
+                plural=cls.crd_plural_name,
+                version=cls.crd_version,
+                label_selector=label_selector,
+                resource_version=resource_version,
+                allow_watch_bookmarks=True,
+                timeout_seconds=timeout_seconds,
+            ):
+                yield {"type": event["type"], "object": event["raw_object"]}
+
     @classmethod
     async def get(cls, name: str, namespace: str | None = None) -> Optional["CustomResource"]:
         """Returns defined custom resource with specified name from given namespace."""
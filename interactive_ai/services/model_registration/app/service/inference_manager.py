@@ -4,18 +4,52 @@
 import asyncio
 import logging
 import sys
+from typing import ClassVar
 
-from service.inference_service import InferenceService
+from service.config import INFERENCE_CACHE_PAGE_SIZE, INFERENCE_CACHE_WATCH_TIMEOUT_SECONDS
+from service.inference_service import PROJECT_ID_LABEL, InferenceService
+from service.resource_cache import ResourceCache
 
 logging.basicConfig(stream=sys.stdout, level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
 class InferenceManager:
-    async def create_inference(self, name: str, namespace: str, storage_name: str, path: str) -> None:
+    # Local cache of the InferenceService resources, answering the lookups once synced
+    cache: ClassVar[ResourceCache[InferenceService] | None] = None
+
+    @classmethod
+    def start_cache(cls, namespace: str) -> None:
+        """Start caching the inferenceservice resources of the namespace"""
+        if cls.cache is None:
+            cls.cache = ResourceCache(
+                resource_class=InferenceService,
+                namespace=namespace,
+                index_labels=(PROJECT_ID_LABEL,),
+                page_size=INFERENCE_CACHE_PAGE_SIZE,
+                watch_timeout_seconds=INFERENCE_CACHE_WATCH_TIMEOUT_SECONDS,
+            )
+            cls.cache.start()
+
+    @classmethod
+    async def stop_cache(cls) -> None:
+        """Stop caching the inferenceservice resources"""
+        if cls.cache is not None:
+            await cls.cache.stop()
+            cls.cache = None
+
+    def _get_synced_cache(self, namespace: str) -> ResourceCache[InferenceService] | None:
+        cache = self.cache
+        return cache if cache is not None and cache.namespace == namespace and cache.is_synced else None
+
+    async def create_inference(
+        self, name: str, namespace: str, storage_name: str, path: str, project_id: str | None = None
+    ) -> None:
         """Create inferenceservice resource"""
         logging.info(f"Creating InferenceService for {name}")
-        inference = InferenceService(name=name, namespace=namespace, storage_name=storage_name, path=path)
+        inference = InferenceService(
+            name=name, namespace=namespace, storage_name=storage_name, path=path, project_id=project_id
+        )
         await inference.create()
         create_timeout = 300
         for _ in range(create_timeout):
@@ -54,9 +88,37 @@ class InferenceManager:
 
     async def list_inference(self, namespace: str) -> list[InferenceService]:
         """List registered inferenceservice resources."""
+        if cache := self._get_synced_cache(namespace):
+            return cache.list_all()
         logging.info(f"Listing items in InferenceService within namespace `{namespace}`")
         return await InferenceService.list(namespace=namespace)  # type: ignore
 
+    async def list_project_inference(self, project_id: str, namespace: str) -> list[InferenceService]:
+        """
+        List the inferenceservice resources of a project: those labeled with the project ID, and those named after it
+        ("<project_id>-..."), which includes the resources created before they were labeled.
+        """
+        name_prefix = f"{project_id}-"
+        if cache := self._get_synced_cache(namespace):
+            project_inferences = {
+                inference.name: inference for inference in cache.list_by_label(PROJECT_ID_LABEL, project_id)
+            }
+            project_inferences.update(
+                {inference.name: inference for inference in cache.list_all() if inference.name.startswith(name_prefix)}
+            )
+            return list(project_inferences.values())
+        return [
+            inference
+            for inference in await self.list_inference(namespace=namespace)
+            if inference.labels.get(PROJECT_ID_LABEL) == project_id or inference.name.startswith(name_prefix)
+        ]
+
+    async def find_inference(self, name: str, namespace: str) -> InferenceService | None:
+        """Get specific inferenceservice resource, from the cache if synced"""
+        if cache := self._get_synced_cache(namespace):
+            return cache.get(name)
+        return await self.get_inference(name=name, namespace=namespace)
+
     async def get_inference(self, name: str, namespace: str) -> InferenceService | None:
         """Get specific inferenceservice resource."""
         logging.info(f"Getting InferenceService for {name}")
@@ -4,6 +4,8 @@
 
 from service.custom_resource import CustomResource
 
+PROJECT_ID_LABEL = "project_id"
+
 
 class InferenceService(CustomResource):
     """Helm chart repository resource class."""
@@ -20,6 +22,7 @@ class InferenceService(CustomResource):
         *,
         storage_name: str | None = None,
         path: str | None = None,
+        project_id: str | None = None,
     ) -> None:
         if not body:
             body = {
@@ -48,3 +51,5 @@ class InferenceService(CustomResource):
                 },
             }
         super().__init__(name=name, namespace=namespace, body=body)
+        if project_id:
+            self.labels = {**self.labels, PROJECT_ID_LABEL: project_id}
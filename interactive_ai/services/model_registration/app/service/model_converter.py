@@ -7,9 +7,11 @@ import os
 import shutil
 import sys
 import tempfile
+import threading
 import time
 import urllib.request
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, auto
 from pathlib import Path
 from xml.etree.ElementTree import Element
@@ -25,7 +27,15 @@ from model_api.models import (
     SegmentationModel,
 )
 
-from service.config import RESOURCE_MS_PORT, RESOURCE_MS_SERVICE, S3_BUCKETNAME
+from service.config import (
+    MODEL_CONVERSION_MAX_CONCURRENT,
+    MODEL_PREPARATION_WORKERS,
+    RESOURCE_MS_PORT,
+    RESOURCE_MS_SERVICE,
+    S3_BUCKETNAME,
+)
+from service.conversion_cache import ConversionCache
+from service.conversion_executor import ConversionCancelled
 from service.s3client import S3Client
 
 logging.basicConfig(stream=sys.stdout, level=logging.INFO)
@@ -33,6 +43,8 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_ORGANIZATION_ID = "000000000000000000000001"
 LARGE_MODEL_THRESHOLD_BYTES = 50 * 1024 * 1024
+# Shared by all the registrations, whose models are prepared by several threads each (see MODEL_PREPARATION_WORKERS)
+MODEL_CONVERSION_SEMAPHORE = threading.BoundedSemaphore(MODEL_CONVERSION_MAX_CONCURRENT)
 
 
 class GraphVariant(Enum):
@@ -50,8 +62,9 @@ class ModelConverter:
     This class is responsible for converting Geti models to Modelmesh graphs
     """
 
-    def __init__(self, s3client: S3Client) -> None:
+    def __init__(self, s3client: S3Client, conversion_cache: ConversionCache | None = None) -> None:
         self.s3 = s3client
+        self.conversion_cache = conversion_cache if conversion_cache is not None else ConversionCache()
 
     def _get_labels(self, task_id: str, project: Project, model: str) -> list[str]:
         tree = ElementTree.parse(model)
@@ -362,8 +375,71 @@ class ModelConverter:
             output_path=(export_dir_path / "LICENSE"),
         )
 
+    def _get_conversion_cache_key(self, model: Model, project: Project) -> str:
+        labels = [
+            (label.id, label.name, label.is_empty)
+            for task in project.pipeline.tasks
+            if task.id == model.task_id
+            for label in task.labels
+        ]
+        return ConversionCache.make_key(
+            optimized_model_id=model.optimized_model_id,
+            graph_type=self._get_graph_type(project=project, models=[model]),
+            labels=labels,
+            use_ellipse=model.use_ellipse,
+        )
+
+    def _prepare_model(
+        self, model: Model, project: Project, export_dir: str, cancel_event: threading.Event | None = None
+    ) -> None:
+        """
+        Provide the converted model in the export directory, from the conversion cache if available, otherwise
+        downloading and converting it.
+        """
+        if cancel_event is not None and cancel_event.is_set():
+            raise ConversionCancelled(f"Preparation of model {model.model_id} cancelled")
+        cache_key = self._get_conversion_cache_key(model=model, project=project)
+        model_url = (
+            f"http://{RESOURCE_MS_SERVICE}:{RESOURCE_MS_PORT}"
+            f"/api/v1/organizations/{model.organization_id}"
+            f"/workspaces/{model.workspace_id}/projects/{model.project_id}"
+            f"/model_groups/{model.model_group_id}/models/{model.model_id}"
+            f"/optimized_models/{model.optimized_model_id}/export"
+        )
+        model.model_id = f"{model.model_id}-{str(int(time.time() * 1000))}"
+        converted_model_dir = os.path.join(export_dir, model.model_id, "1")
+        with self.conversion_cache.lock(cache_key):
+            if self.conversion_cache.get(key=cache_key, target_dir=converted_model_dir):
+                return
+            self._download_and_convert_model(model_url=model_url, model=model, project=project, export_dir=export_dir)
+            if os.path.isdir(converted_model_dir):
+                self.conversion_cache.put(key=cache_key, source_dir=converted_model_dir)
+
+    def _download_and_convert_model(self, model_url: str, model: Model, project: Project, export_dir: str) -> None:
+        filename = tempfile.mkstemp(".zip", "model", "/tmp")[1]
+        logger.info(f"Getting model from {model_url}")
+        urllib.request.urlretrieve(model_url, filename)  # noqa: S310  # nosec
+        model_dir = os.path.splitext(filename)[0]
+        os.makedirs(model_dir, exist_ok=True)
+        try:
+            with zipfile.ZipFile(filename, "r") as zippy:
+                zippy.extractall(model_dir)
+            self._delete_file(file_path=filename)
+            # The models of all the registrations are downloaded concurrently, but only a few are converted at once
+            with MODEL_CONVERSION_SEMAPHORE:
+                self._convert_model(model_dir=model_dir, export_dir=export_dir, model=model, project=project)
+            logger.info(f"Model converted successfully {model_dir}")
+        except zipfile.BadZipFile:
+            logger.error("Invalid zip file.")
+        finally:
+            self._delete_dir(dir_path=model_dir)
+
     def prepare_graph(
-        self, project: Project, models: list[Model], graph_variant: GraphVariant = GraphVariant.INFERENCE
+        self,
+        project: Project,
+        models: list[Model],
+        graph_variant: GraphVariant = GraphVariant.INFERENCE,
+        cancel_event: threading.Event | None = None,
     ) -> str:
         """
         This function is responsible for parsing Project, download and conversion of models and
@@ -372,30 +448,20 @@ class ModelConverter:
         Caller of this function is responsible for cleaning up returned directory after it is no longer needed.
         """
         export_dir = tempfile.mkdtemp(prefix="exported", dir="/tmp")
-        for model in models:
-            filename = tempfile.mkstemp(".zip", "model", "/tmp")[1]
-            model_url = (
-                f"http://{RESOURCE_MS_SERVICE}:{RESOURCE_MS_PORT}"
-                f"/api/v1/organizations/{model.organization_id}"
-                f"/workspaces/{model.workspace_id}/projects/{model.project_id}"
-                f"/model_groups/{model.model_group_id}/models/{model.model_id}"
-                f"/optimized_models/{model.optimized_model_id}/export"
-            )
-            logger.info(f"Getting model from {model_url}")
-            urllib.request.urlretrieve(model_url, filename)  # noqa: S310  # nosec
-            model_dir = os.path.splitext(filename)[0]
-            os.makedirs(model_dir, exist_ok=True)
-            try:
-                with zipfile.ZipFile(filename, "r") as zippy:
-                    zippy.extractall(model_dir)
-                self._delete_file(file_path=filename)
-                model.model_id = f"{model.model_id}-{str(int(time.time() * 1000))}"
-                self._convert_model(model_dir=model_dir, export_dir=export_dir, model=model, project=project)
-                logger.info(f"Model converted successfully {model_dir}")
-            except zipfile.BadZipFile:
-                logger.error("Invalid zip file.")
-            finally:
-                self._delete_dir(dir_path=model_dir)
+        # Models are downloaded and converted concurrently, so that a pipeline is ready in the time of its slowest model
+        with ThreadPoolExecutor(max_workers=max(1, min(MODEL_PREPARATION_WORKERS, len(models)))) as executor:
+            futures = [
+                executor.submit(
+                    self._prepare_model, model=model, project=project, export_dir=export_dir, cancel_event=cancel_event
+                )
+                for model in models
+            ]
+        try:
+            for future in futures:
+                future.result()
+        except Exception:
+            self._delete_dir(dir_path=export_dir)
+            raise
 
         num_streams = 1 if self._check_dir_size(export_dir) > LARGE_MODEL_THRESHOLD_BYTES else 2
         self._create_subconfig(export_dir, models, num_streams=num_streams)
@@ -406,15 +472,24 @@ class ModelConverter:
 
         return export_dir
 
-    def process_model(self, name: str, project: Project, models: list[Model]):  # noqa: ANN201
+    def process_model(  # noqa: ANN201
+        self, name: str, project: Project, models: list[Model], cancel_event: threading.Event | None = None
+    ):
         """
         This function calls prepare_graph method to create Mediapipe Graphs, and then uploads .
+
+        :param cancel_event: Event set when the registration is cancelled, checked before uploading the graph
+        :raises ConversionCancelled: if the registration was cancelled
         """
-        export_dir = self.prepare_graph(project=project, models=models)
-        self.s3.upload_folder(
-            bucket_name=S3_BUCKETNAME,
-            object_key=name,
-            local_folder_path=export_dir,
-        )
-        self._delete_dir(dir_path=export_dir)
+        export_dir = self.prepare_graph(project=project, models=models, cancel_event=cancel_event)
+        try:
+            if cancel_event is not None and cancel_event.is_set():
+                raise ConversionCancelled(f"Registration of {name} cancelled")
+            self.s3.upload_folder(
+                bucket_name=S3_BUCKETNAME,
+                object_key=name,
+                local_folder_path=export_dir,
+            )
+        finally:
+            self._delete_dir(dir_path=export_dir)
         logger.info(f"Model converted successfully {export_dir}")
@@ -2,11 +2,14 @@
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 
 import asyncio
+import functools
+import hashlib
 import logging
-import os
 import pathlib
-import shutil
+import re
 import sys
+import threading
+import zipfile
 from collections.abc import AsyncGenerator
 from zipfile import BadZipFile
 
@@ -33,6 +36,7 @@ from grpc_interfaces.model_registration.pb.service_pb2_grpc import ModelRegistra
 from kubernetes_asyncio.client.rest import ApiException
 
 from service.config import MODELMESH_NAMESPACE, S3_BUCKETNAME, S3_STORAGE
+from service.conversion_executor import ConversionExecutor
 from service.inference_manager import InferenceManager
 from service.model_converter import GraphVariant, ModelConverter, UnsupportedModelType
 from service.responses import Responses
@@ -41,6 +45,20 @@ from service.s3client import S3Client
 logging.basicConfig(stream=sys.stdout, level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Pipelines are named after the ID of their project, e.g. "<project_id>-active" or "<project_id>-<task_id>"
+PIPELINE_NAME_PROJECT_ID_PATTERN = re.compile(r"^([0-9a-f]{24})[-_]")
+
+
+def get_project_id_from_pipeline_name(pipeline_name: str) -> str | None:
+    """
+    Get the ID of the project a pipeline belongs to from the name of the pipeline.
+
+    :param pipeline_name: Name of the pipeline
+    :return: ID of the project, or None if the name does not start with a project ID
+    """
+    match = PIPELINE_NAME_PROJECT_ID_PATTERN.match(pipeline_name)
+    return match.group(1) if match else None
+
 
 class ModelRegistration(ModelRegistrationServicer):
     """
@@ -50,6 +68,7 @@ class ModelRegistration(ModelRegistrationServicer):
     def __init__(self) -> None:
         self.s3 = S3Client()
         self.converter = ModelConverter(self.s3)
+        self.executor = ConversionExecutor()
         super().__init__()
 
     def make_error(self, code: ErrorCode.ValueType) -> Error:
@@ -74,14 +93,24 @@ class ModelRegistration(ModelRegistrationServicer):
     ) -> StatusResponse:
         """
         Registers new pipeline
+
+        Concurrent identical requests share a single registration and get the same response. Requests for the same
+        pipeline with other models or another override flag are registered separately.
         """
+        pipeline_name = (
+            req.name
+            if len(req.name) > 0
+            else "{}_{}".format(req.project.id, "active" if len(req.model) > 1 else req.model[0].model_id)
+        )
+        request_digest = hashlib.sha256(req.SerializeToString(deterministic=True)).hexdigest()
+        return await self.executor.run_deduplicated(
+            key=f"{pipeline_name}_{request_digest}",
+            coroutine_function=functools.partial(self._register_pipeline, req=req, pipeline_name=pipeline_name),
+        )
+
+    async def _register_pipeline(self, req: RegisterRequest, pipeline_name: str) -> StatusResponse:
         try:
             inference = InferenceManager()
-            pipeline_name = (
-                req.name
-                if len(req.name) > 0
-                else "{}_{}".format(req.project.id, "active" if len(req.model) > 1 else req.model[0].model_id)
-            )
             pipeline = await inference.get_inference(name=pipeline_name, namespace=MODELMESH_NAMESPACE)
             if pipeline:
                 if req.override:
@@ -99,12 +128,15 @@ class ModelRegistration(ModelRegistrationServicer):
                         error=self.make_error(code=ErrorCode.MODEL_ALREADY_REGISTERED),
                     )
 
-            self.converter.process_model(name=pipeline_name, models=req.model, project=req.project)
+            await self.executor.run(
+                self.converter.process_model, name=pipeline_name, models=req.model, project=req.project
+            )
             await inference.create_inference(
                 name=pipeline_name,
                 namespace=MODELMESH_NAMESPACE,
                 storage_name=S3_STORAGE,
                 path=pipeline_name,
+                project_id=req.project.id,
             )
             response = StatusResponse(status=Responses.Created)
         except ApiException as api_err:
@@ -152,30 +184,10 @@ class ModelRegistration(ModelRegistrationServicer):
         """
         Download a graph for given models
         """
-        graph_directory = None
         graph_archive_path = None
         try:
-            graph_directory = pathlib.Path(
-                self.converter.prepare_graph(
-                    models=req.models, project=req.project, graph_variant=GraphVariant.OVMS_DEPLOYMENT
-                )
-            )
-            graph_archive_path = graph_directory.parent.joinpath(f"{req.project.id}.zip")
-
-            # Create archive with prepared graph
-            # Due to shutil.make_archive intricacies, we have to change working dir manually
-            # and create zip file in another directory
-            cwd = os.getcwd()
-            try:
-                os.chdir(graph_directory)
-                shutil.make_archive(
-                    base_name=f"../{str(req.project.id)}",
-                    root_dir=None,
-                    base_dir=None,
-                    format="zip",
-                )
-            finally:
-                os.chdir(cwd)
+            # The graph is prepared and archived in the conversion workers, not to block the event loop
+            graph_archive_path = await self.executor.run(self._prepare_graph_archive, req=req)
 
             # Stream archived graph as a response
             async with aiofiles.open(graph_archive_path, "rb") as archive:
@@ -187,11 +199,36 @@ class ModelRegistration(ModelRegistrationServicer):
             logger.exception(error_message)
             await context.abort(grpc.StatusCode.INTERNAL, details=error_message)
         finally:
-            if graph_directory:
-                self.converter._delete_dir(dir_path=str(graph_directory))
             if graph_archive_path:
                 graph_archive_path.unlink(missing_ok=True)
 
+    def _prepare_graph_archive(self, req: DownloadGraphRequest, cancel_event: threading.Event) -> pathlib.Path:
+        """
+        Prepare the OVMS deployment graph of the requested models and archive it.
+
+        :return: Path of the zip archive with the graph, to be deleted by the caller
+        """
+        graph_directory = pathlib.Path(
+            self.converter.prepare_graph(
+                models=req.models,
+                project=req.project,
+                graph_variant=GraphVariant.OVMS_DEPLOYMENT,
+                cancel_event=cancel_event,
+            )
+        )
+        # The archive is named after the graph directory, which is unique, so concurrent requests do not collide
+        graph_archive_path = graph_directory.with_suffix(".zip")
+        try:
+            with zipfile.ZipFile(graph_archive_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+                for path in sorted(graph_directory.rglob("*")):
+                    archive.write(path, arcname=path.relative_to(graph_directory))
+        except OSError:
+            graph_archive_path.unlink(missing_ok=True)
+            raise
+        finally:
+            self.converter._delete_dir(dir_path=str(graph_directory))
+        return graph_archive_path
+
     async def deregister_pipeline(
         self,
         request: DeregisterRequest,
@@ -262,9 +299,8 @@ class ModelRegistration(ModelRegistrationServicer):
         be registered with ModelMesh and a success response is returned
         """
         inference = InferenceManager()
-        pipelines = await inference.list_inference(namespace=MODELMESH_NAMESPACE)
         pipeline_name = request.name
-        if pipeline_name in [p.name for p in pipelines]:
+        if await inference.find_inference(name=pipeline_name, namespace=MODELMESH_NAMESPACE):
             logger.info(f"Model `{pipeline_name}` is already registered")
             return RecoverResponse(success=True)
 
@@ -274,6 +310,8 @@ class ModelRegistration(ModelRegistrationServicer):
                 namespace=MODELMESH_NAMESPACE,
                 storage_name=S3_STORAGE,
                 path=pipeline_name,
+                # Label the recovered resource like a registered one, so that it is found and purged with its project
+                project_id=get_project_id_from_pipeline_name(pipeline_name),
             )
             logger.info(f"Model `{pipeline_name}` recovered successfully")
             return RecoverResponse(success=True)
@@ -301,8 +339,9 @@ class ModelRegistration(ModelRegistrationServicer):
         # First, remove inference services for the project and delete the
         # corresponding folders on S3
         inference = InferenceManager()
-        pipelines = await inference.list_inference(namespace=MODELMESH_NAMESPACE)
-        project_pipelines = [p for p in pipelines if p.name.startswith(project_prefix)]
+        project_pipelines = await inference.list_project_inference(
+            project_id=request.project_id, namespace=MODELMESH_NAMESPACE
+        )
         logger.info(
             f"Deleting {len(project_pipelines)} registered inference pipelines related "
             f"to project with id: {request.project_id}"
@@ -0,0 +1,183 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""Module containing an informer-style local cache of custom resources."""
+
+import asyncio
+import contextlib
+import http
+import logging
+import sys
+from collections import defaultdict
+from collections.abc import Sequence
+from typing import Generic, TypeVar
+
+from kubernetes_asyncio.client.rest import ApiException
+
+from service.custom_resource import CustomResource
+
+logging.basicConfig(stream=sys.stdout, level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=CustomResource)
+
+
+class ResourceCache(Generic[T]):
+    """
+    In-memory index of the custom resources of a namespace, kept synchronized with the API server.
+
+    The cache lists the resources once, page by page, then watches the changes since the resourceVersion of the list,
+    with bookmarks, so that the watch can be resumed from the last seen resourceVersion when the server closes it.
+    If that resourceVersion has expired (410 Gone), the resources are listed again. Resources are indexed by name and
+    by the value of each label of `index_labels`; lookups are answered locally, without calling the API.
+
+    :param resource_class: Class of the cached custom resources
+    :param namespace: Namespace of the cached custom resources
+    :param index_labels: Labels to index the resources by
+    :param page_size: Number of resources per page of the initial list
+    :param watch_timeout_seconds: Duration after which the server closes a watch, which is then resumed
+    :param retry_delay_seconds: Delay before retrying after a failed list or watch
+    """
+
+    def __init__(
+        self,
+        resource_class: type[T],
+        namespace: str,
+        index_labels: Sequence[str] = (),
+        page_size: int = 500,
+        watch_timeout_seconds: int = 300,
+        retry_delay_seconds: float = 1.0,
+    ) -> None:
+        self.resource_class = resource_class
+        self.namespace = namespace
+        self.index_labels = tuple(index_labels)
+        self.page_size = page_size
+        self.watch_timeout_seconds = watch_timeout_seconds
+        self.retry_delay_seconds = retry_delay_seconds
+        self.resource_version: str | None = None
+        self._resources: dict[str, T] = {}
+        self._label_index: dict[tuple[str, str], set[str]] = defaultdict(set)
+        self._synced = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def is_synced(self) -> bool:
+        """Whether the initial list is complete, i.e. the cache can answer lookups"""
+        return self._synced.is_set()
+
+    def start(self) -> None:
+        """Start listing and watching the resources in the background"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=f"{self.resource_class.__name__}-cache")
+
+    async def stop(self) -> None:
+        """Stop watching the resources"""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        self._synced.clear()
+
+    async def wait_until_synced(self, timeout: float | None = None) -> bool:
+        """
+        Wait for the initial list of the resources.
+
+        :param timeout: Maximum time to wait in seconds, or None to wait indefinitely
+        :return: True if the cache is synced
+        """
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._synced.wait(), timeout=timeout)
+        return self.is_synced
+
+    def get(self, name: str) -> T | None:
+        """Return the cached resource with the given name, if any"""
+        return self._resources.get(name)
+
+    def list_all(self) -> list[T]:
+        """Return all the cached resources"""
+        return list(self._resources.values())
+
+    def list_by_label(self, label: str, value: str) -> list[T]:
+        """Return the cached resources with the given label value. The label must be one of `index_labels`."""
+        if label not in self.index_labels:
+            raise ValueError(f"{self.resource_class.__name__} cache is not indexed by label {label}")
+        return [self._resources[name] for name in sorted(self._label_index.get((label, value), ()))]
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if self.resource_version is None:
+                    await self._relist()
+                await self._watch()
+            except asyncio.CancelledError:
+                raise
+            except ApiException as api_err:
+                if api_err.status == http.HTTPStatus.GONE:
+                    logger.info(f"{self.resource_class.__name__} resourceVersion {self.resource_version} expired")
+                    self.resource_version = None
+                    continue
+                logger.warning(f"Failed to watch {self.resource_class.__name__} resources: {api_err.status}")
+                await asyncio.sleep(self.retry_delay_seconds)
+            except Exception:
+                logger.exception(f"Failed to watch {self.resource_class.__name__} resources")
+                await asyncio.sleep(self.retry_delay_seconds)
+
+    async def _relist(self) -> None:
+        raw_resources: list[dict] = []
+        _continue = None
+        while True:
+            page = await self.resource_class.list_page(
+                limit=self.page_size, namespace=self.namespace, _continue=_continue
+            )
+            raw_resources.extend(page["items"])
+            _continue = page["metadata"].get("continue")
+            if not _continue:
+                break
+
+        self._resources.clear()
+        self._label_index.clear()
+        for raw_resource in raw_resources:
+            self._store(raw_resource)
+        # Continuing a list returns a consistent snapshot, at the resourceVersion of its first page
+        self.resource_version = page["metadata"]["resourceVersion"]
+        self._synced.set()
+        logger.info(
+            f"Listed {len(self._resources)} {self.resource_class.__name__} resources "
+            f"at resourceVersion {self.resource_version}"
+        )
+
+    async def _watch(self) -> None:
+        async for event in self.resource_class.watch(
+            namespace=self.namespace,
+            resource_version=self.resource_version,  # type: ignore[arg-type]
+            timeout_seconds=self.watch_timeout_seconds,
+        ):
+            raw_resource = event["object"]
+            resource_version = raw_resource["metadata"]["resourceVersion"]
+            if event["type"] == "DELETED":
+                self._remove(raw_resource["metadata"]["name"])
+            elif event["type"] in ("ADDED", "MODIFIED"):
+                self._store(raw_resource)
+            # BOOKMARK events only carry the resourceVersion to resume the watch from
+            self.resource_version = resource_version
+
+    def _store(self, raw_resource: dict) -> None:
+        name = raw_resource["metadata"]["name"]
+        self._remove(name)
+        resource: T = self.resource_class.from_k8s_response_dict(raw_resource)  # type: ignore[assignment]
+        self._resources[name] = resource
+        for label in self.index_labels:
+            if (value := resource.labels.get(label)) is not None:
+                self._label_index[(label, value)].add(name)
+
+    def _remove(self, name: str) -> None:
+        resource = self._resources.pop(name, None)
+        if resource is None:
+            return
+        for label in self.index_labels:
+            if (value := resource.labels.get(label)) is not None:
+                names = self._label_index[(label, value)]
+                names.discard(name)
+                if not names:
+                    del self._label_index[(label, value)]
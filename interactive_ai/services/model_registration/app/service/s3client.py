@@ -4,10 +4,13 @@
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import boto3
 from botocore.exceptions import ClientError
 
+from service.config import S3_UPLOAD_WORKERS
+
 logging.basicConfig(stream=sys.stdout, level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -83,14 +86,23 @@ class S3Client:
             raise err
 
     def upload_folder(self, bucket_name: str, object_key: str, local_folder_path: str):  # noqa: ANN201
-        """Uploads local folder to s3"""
+        """Uploads local folder to s3, uploading up to S3_UPLOAD_WORKERS files concurrently"""
+        uploads = []
+        for root, _dirs, files in os.walk(local_folder_path):
+            for file in files:
+                local_path = os.path.join(root, file)
+                s3_path = os.path.join(object_key, os.path.relpath(local_path, local_folder_path))
+                uploads.append((local_path, s3_path))
+
+        def upload(local_path: str, s3_path: str) -> None:
+            logger.info(f"Uploading {local_path} to s3://{bucket_name}/{s3_path}")
+            self.client.upload_file(local_path, bucket_name, s3_path)
+
         try:
-            for root, _dirs, files in os.walk(local_folder_path):
-                for file in files:
-                    local_path = os.path.join(root, file)
-                    s3_path = os.path.join(object_key, os.path.relpath(local_path, local_folder_path))
-                    logger.info(f"Uploading {local_path} to s3://{bucket_name}/{s3_path}")
-                    self.client.upload_file(local_path, bucket_name, s3_path)
+            with ThreadPoolExecutor(max_workers=max(1, min(S3_UPLOAD_WORKERS, len(uploads)))) as executor:
+                futures = [executor.submit(upload, local_path, s3_path) for local_path, s3_path in uploads]
+                for future in as_completed(futures):
+                    future.result()
         except ClientError as err:
             logger.error(err)
             raise err
@@ -0,0 +1,124 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+"""
+Benchmark of the latency of the model registration RPCs while models are being registered, against local stubs.
+
+The S3 client, the model converter and the Kubernetes API are replaced by stubs: a conversion blocks its thread for a
+fixed time, as the downloads, the ModelAPI conversion and the uploads do, and every Kubernetes call awaits a fixed
+latency. A number of registrations of distinct pipelines, plus duplicate registrations of the same pipelines, are
+started concurrently while `list_pipelines` is polled, as the health checks and the other services do.
+
+'blocking' runs the conversions on the event loop, as the service did before the conversion executor was introduced;
+'executor' runs them in the ConversionExecutor worker pool.
+
+Usage: PYTHONPATH=app python tests/benchmarks/bench_registration_latency.py [--pipelines 8] [--duplicates 2]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from unittest.mock import MagicMock, patch
+
+from grpc_interfaces.model_registration.pb.service_pb2 import ListRequest, RegisterRequest
+
+from service.model_registration import ModelRegistration
+
+
+class StubInferenceManager:
+    """Stand-in for InferenceManager keeping the registered pipelines in memory, with a fixed API latency."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.pipelines: dict[str, MagicMock] = {}
+
+    async def get_inference(self, name: str, namespace: str) -> MagicMock | None:
+        await asyncio.sleep(self.latency)
+        return self.pipelines.get(name)
+
+    async def create_inference(self, name: str, namespace: str, storage_name: str, path: str) -> None:
+        await asyncio.sleep(self.latency)
+        pipeline = MagicMock()
+        pipeline.name = name
+        self.pipelines[name] = pipeline
+
+    async def list_inference(self, namespace: str) -> list[MagicMock]:
+        await asyncio.sleep(self.latency)
+        return list(self.pipelines.values())
+
+
+async def run(mode: str, args: argparse.Namespace) -> None:
+    inference_manager = StubInferenceManager(latency=args.api_latency)
+    conversions = 0
+
+    def process_model(cancel_event=None, **_) -> None:
+        nonlocal conversions
+        conversions += 1
+        time.sleep(args.conversion_time)
+
+    with (
+        patch("service.model_registration.S3Client"),
+        patch("service.model_registration.ModelConverter"),
+        patch("service.model_registration.InferenceManager", return_value=inference_manager),
+    ):
+        registration = ModelRegistration()
+        registration.converter.process_model = process_model
+        if mode == "blocking":
+
+            async def run_inline(func, *func_args, **func_kwargs):
+                return func(*func_args, **func_kwargs)
+
+            registration.executor.run = run_inline
+
+        latencies: list[float] = []
+        done = asyncio.Event()
+
+        async def poll() -> None:
+            while not done.is_set():
+                start_time = time.perf_counter()
+                await registration.list_pipelines(ListRequest(), MagicMock())
+                latencies.append(time.perf_counter() - start_time)
+                await asyncio.sleep(args.poll_interval)
+
+        poller = asyncio.create_task(poll())
+        await asyncio.sleep(args.poll_interval)
+        start_time = time.perf_counter()
+        requests = [
+            RegisterRequest(name=f"project-{i}_active")
+            for i in range(args.pipelines)
+            for _ in range(1 + args.duplicates)
+        ]
+        responses = await asyncio.gather(
+            *(registration.register_new_pipelines(request, MagicMock()) for request in requests)
+        )
+        elapsed_time = time.perf_counter() - start_time
+        done.set()
+        await poller
+        registration.executor.shutdown()
+
+    statuses = {status: [r.status for r in responses].count(status) for status in {r.status for r in responses}}
+    latencies_ms = sorted(latency * 1000 for latency in latencies)
+    print(
+        f"{mode:>9}: {len(requests)} registrations in {elapsed_time:.2f} s, {conversions} conversions, "
+        f"responses {statuses} | list_pipelines latency over {len(latencies_ms)} calls: "
+        f"p50 {statistics.median(latencies_ms):.0f} ms, "
+        f"p95 {latencies_ms[int(0.95 * (len(latencies_ms) - 1))]:.0f} ms, max {latencies_ms[-1]:.0f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pipelines", type=int, default=8, help="Number of distinct pipelines registered")
+    parser.add_argument("--duplicates", type=int, default=2, help="Duplicate registrations per pipeline")
+    parser.add_argument("--conversion-time", type=float, default=0.5, help="Blocking time of a conversion, in s")
+    parser.add_argument("--api-latency", type=float, default=0.005, help="Latency of a Kubernetes call, in s")
+    parser.add_argument("--poll-interval", type=float, default=0.01, help="Interval between list calls, in s")
+    parser.add_argument("--mode", choices=["blocking", "executor", "both"], default="both")
+    args = parser.parse_args()
+
+    for mode in ("blocking", "executor") if args.mode == "both" else (args.mode,):
+        asyncio.run(run(mode, args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+"""
+Fake Kubernetes API server serving the list and watch endpoints of namespaced custom resources.
+
+The server keeps the resources in memory with a global resourceVersion, like etcd, and a log of the changes served
+to the watches. Lists are paginated with consistent snapshots; watches stream the changes since the requested
+resourceVersion, with BOOKMARK events, and return a 410 (Gone) error for resourceVersions older than the log, which
+can be compacted with `compact()`.
+"""
+
+import asyncio
+import copy
+import json
+
+from aiohttp import web
+
+ROUTE = "/apis/{group}/{version}/namespaces/{namespace}/{plural}"
+
+
+class FakeApiServer:
+    def __init__(self, bookmark_interval: float = 0.1) -> None:
+        self.bookmark_interval = bookmark_interval
+        self.resource_version = 1
+        self.resources: dict[str, dict] = {}
+        # Log of the (resourceVersion, event type, resource) changes, starting after compacted_version
+        self.events: list[tuple[int, str, dict]] = []
+        self.compacted_version = 1
+        self.list_requests: list[dict] = []
+        self.watch_requests: list[dict] = []
+        self._snapshots: dict[int, list[dict]] = {}
+        self._changed = asyncio.Condition()
+        self._closing = False
+        self.app = web.Application()
+        self.app.router.add_get(ROUTE, self._handle)
+
+    async def create(self, name: str, namespace: str, labels: dict[str, str] | None = None) -> dict:
+        resource = {
+            "apiVersion": "serving.kserve.io/v1beta1",
+            "kind": "InferenceService",
+            "metadata": {"name": name, "namespace": namespace, "labels": labels or {}},
+            "spec": {},
+        }
+        await self._change("ADDED", resource)
+        return resource
+
+    async def update(self, name: str, **spec) -> None:
+        resource = copy.deepcopy(self.resources[name])
+        resource["spec"].update(spec)
+        await self._change("MODIFIED", resource)
+
+    async def delete(self, name: str) -> None:
+        await self._change("DELETED", copy.deepcopy(self.resources[name]))
+
+    def compact(self) -> None:
+        """Drop the log of changes, so that watches from an older resourceVersion get 410 Gone"""
+        self.events.clear()
+        self.compacted_version = self.resource_version
+
+    async def close_watches(self) -> None:
+        """Close the ongoing watches, as the server does when their timeout expires"""
+        async with self._changed:
+            self._closing = True
+            self._changed.notify_all()
+        await asyncio.sleep(0.05)
+        self._closing = False
+
+    async def _change(self, event_type: str, resource: dict) -> None:
+        async with self._changed:
+            self.resource_version += 1
+            resource["metadata"]["resourceVersion"] = str(self.resource_version)
+            name = resource["metadata"]["name"]
+            if event_type == "DELETED":
+                del self.resources[name]
+            else:
+                self.resources[name] = resource
+            self.events.append((self.resource_version, event_type, copy.deepcopy(resource)))
+            self._changed.notify_all()
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        if request.query.get("watch", "").lower() == "true":
+            return await self._watch(request)
+        return self._list(request)
+
+    def _list(self, request: web.Request) -> web.Response:
+        self.list_requests.append(dict(request.query))
+        limit = int(request.query.get("limit", "0"))
+        if token := request.query.get("continue"):
+            snapshot_version, offset = (int(part) for part in token.split(":"))
+        else:
+            snapshot_version, offset = self.resource_version, 0
+            self._snapshots[snapshot_version] = [copy.deepcopy(self.resources[name]) for name in sorted(self.resources)]
+        snapshot = self._snapshots[snapshot_version]
+        end = offset + limit if limit else len(snapshot)
+        metadata = {"resourceVersion": str(snapshot_version)}
+        if end < len(snapshot):
+            metadata["continue"] = f"{snapshot_version}:{end}"
+        return web.json_response({"kind": "InferenceServiceList", "metadata": metadata, "items": snapshot[offset:end]})
+
+    async def _watch(self, request: web.Request) -> web.StreamResponse:
+        self.watch_requests.append(dict(request.query))
+        resource_version = int(request.query.get("resourceVersion", "0"))
+        timeout = float(request.query.get("timeoutSeconds", "300"))
+        bookmarks = request.query.get("allowWatchBookmarks", "").lower() == "true"
+        response = web.StreamResponse()
+        await response.prepare(request)
+
+        async def send(event: dict) -> None:
+            await response.write(json.dumps(event).encode() + b"\n")
+
+        if resource_version < self.compacted_version:
+            await send(
+                {
+                    "type": "ERROR",
+                    "object": {"kind": "Status", "code": 410, "reason": "Expired", "message": "too old"},
+                }
+            )
+            return response
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while loop.time() < deadline and not self._closing:
+            for version, event_type, resource in list(self.events):
+                if version > resource_version:
+                    await send({"type": event_type, "object": resource})
+                    resource_version = version
+            if bookmarks:
+                await send(
+                    {
+                        "type": "BOOKMARK",
+                        "object": {"kind": "InferenceService", "metadata": {"resourceVersion": str(resource_version)}},
+                    }
+                )
+            async with self._changed:
+                try:
+                    await asyncio.wait_for(
+                        self._changed.wait(), timeout=min(self.bookmark_interval, deadline - loop.time())
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        await response.write_eof()
+        return response
@@ -0,0 +1,75 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+import os
+
+import pytest
+
+from service.conversion_cache import ConversionCache
+
+
+@pytest.fixture
+def conversion_cache(tmp_path) -> ConversionCache:
+    return ConversionCache(root_dir=str(tmp_path / "cache"), max_size_bytes=100)
+
+
+def _converted_model(path, content: bytes) -> str:
+    path.mkdir(parents=True)
+    (path / "model.xml").write_bytes(content)
+    return str(path)
+
+
+def test_make_key():
+    key = ConversionCache.make_key("optimized", "DETECTION", [("label_1", "car", False)], use_ellipse=False)
+
+    assert key == ConversionCache.make_key("optimized", "DETECTION", [("label_1", "car", False)], use_ellipse=False)
+    assert key != ConversionCache.make_key("optimized", "DETECTION", [("label_1", "truck", False)], use_ellipse=False)
+    assert key != ConversionCache.make_key("optimized", "DETECTION", [("label_1", "car", False)], use_ellipse=True)
+
+
+def test_get_put(conversion_cache, tmp_path):
+    source_dir = _converted_model(tmp_path / "source", b"model")
+
+    assert not conversion_cache.get(key="key", target_dir=str(tmp_path / "target1"))
+    conversion_cache.put(key="key", source_dir=source_dir)
+    assert conversion_cache.get(key="key", target_dir=str(tmp_path / "target2"))
+
+    assert (tmp_path / "target2" / "model.xml").read_bytes() == b"model"
+    assert (conversion_cache.hits, conversion_cache.misses) == (1, 1)
+    # Only the populated entry is left in the cache directory
+    assert os.listdir(conversion_cache.root_dir) == ["key"]
+
+
+def test_put_existing(conversion_cache, tmp_path):
+    conversion_cache.put(key="key", source_dir=_converted_model(tmp_path / "source1", b"model1"))
+    conversion_cache.put(key="key", source_dir=_converted_model(tmp_path / "source2", b"model2"))
+
+    assert conversion_cache.get(key="key", target_dir=str(tmp_path / "target"))
+    assert (tmp_path / "target" / "model.xml").read_bytes() == b"model1"
+    assert os.listdir(conversion_cache.root_dir) == ["key"]
+
+
+def test_evict_least_recently_used(conversion_cache, tmp_path):
+    for i in range(3):
+        conversion_cache.put(key=f"key{i}", source_dir=_converted_model(tmp_path / f"source{i}", bytes([i]) * 40))
+        os.utime(os.path.join(conversion_cache.root_dir, f"key{i}"), (i, i))
+
+    assert sorted(os.listdir(conversion_cache.root_dir)) == ["key1", "key2"]
+
+
+def test_evict_skips_locked_entries(conversion_cache, tmp_path):
+    conversion_cache.put(key="key0", source_dir=_converted_model(tmp_path / "source0", b"0" * 60))
+
+    with conversion_cache.lock("key0"):
+        conversion_cache.put(key="key1", source_dir=_converted_model(tmp_path / "source1", b"1" * 60))
+
+    assert sorted(os.listdir(conversion_cache.root_dir)) == ["key0", "key1"]
+
+
+def test_lock_released_without_holders(conversion_cache, tmp_path):
+    with conversion_cache.lock("key") as acquired:
+        assert acquired
+        with conversion_cache.lock("key", blocking=False) as acquired_concurrently:
+            assert not acquired_concurrently
+
+    # The lock of an entry is forgotten once no thread holds it, so that the locks do not pile up
+    assert not conversion_cache._key_locks
@@ -0,0 +1,94 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+import asyncio
+import threading
+from unittest.mock import AsyncMock
+
+import pytest
+
+from service.conversion_executor import ConversionExecutor
+
+
+@pytest.fixture
+def conversion_executor():
+    executor = ConversionExecutor(max_workers=1)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_run(conversion_executor):
+    def convert(name: str, cancel_event: threading.Event) -> str:
+        assert not cancel_event.is_set()
+        return f"{name} converted"
+
+    assert await conversion_executor.run(convert, name="model") == "model converted"
+
+
+@pytest.mark.asyncio
+async def test_run_cancelled(conversion_executor):
+    started = threading.Event()
+    cancel_events = []
+
+    def convert(cancel_event: threading.Event) -> None:
+        cancel_events.append(cancel_event)
+        started.set()
+        cancel_event.wait(timeout=5)
+
+    task = asyncio.create_task(conversion_executor.run(convert))
+    await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # The running conversion is notified
+    assert cancel_events[0].is_set()
+
+
+@pytest.mark.asyncio
+async def test_run_deduplicated(conversion_executor):
+    release = asyncio.Event()
+
+    async def register() -> str:
+        await release.wait()
+        return "registered"
+
+    coroutine_function = AsyncMock(side_effect=register)
+    tasks = [
+        asyncio.create_task(conversion_executor.run_deduplicated("pipeline", coroutine_function)) for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*tasks) == ["registered"] * 3
+    coroutine_function.assert_awaited_once()
+
+    # Once completed, the registration runs again
+    assert await conversion_executor.run_deduplicated("pipeline", coroutine_function) == "registered"
+    assert coroutine_function.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_run_deduplicated_cancelled(conversion_executor):
+    cancelled = asyncio.Event()
+
+    async def register() -> None:
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    tasks = [asyncio.create_task(conversion_executor.run_deduplicated("pipeline", register)) for _ in range(2)]
+    await asyncio.sleep(0.01)
+
+    # The registration goes on while a request is waiting for it
+    tasks[0].cancel()
+    await asyncio.sleep(0.01)
+    assert not cancelled.is_set()
+
+    tasks[1].cancel()
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+    for task in tasks:
+        with pytest.raises(asyncio.CancelledError):
+            await task
@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from service.inference_manager import InferenceManager
+from service.inference_service import InferenceService
 
 
 @pytest.mark.asyncio
@@ -94,3 +95,50 @@ async def test_get_inference_not_found(mock_get):
     manager = InferenceManager()
     result = await manager.get_inference("test-name", "test-namespace")
     assert result is None
+
+
+def _inference_service(name: str, project_id: str | None = None) -> InferenceService:
+    return InferenceService(
+        name=name, namespace="test-namespace", storage_name="storage", path=name, project_id=project_id
+    )
+
+
+@pytest.mark.asyncio
+@patch("service.inference_manager.InferenceService.get")
+@patch("service.inference_manager.InferenceService.list")
+async def test_lookups_from_cache(mock_list, mock_get):
+    cache = MagicMock(namespace="test-namespace", is_synced=True)
+    cache.list_all.return_value = [_inference_service("project-model"), _inference_service("other", "project")]
+    cache.list_by_label.return_value = [_inference_service("other", "project")]
+    cache.get.return_value = None
+
+    with patch.object(InferenceManager, "cache", cache):
+        manager = InferenceManager()
+        assert [inference.name for inference in await manager.list_inference("test-namespace")] == [
+            "project-model",
+            "other",
+        ]
+        assert sorted(
+            inference.name for inference in await manager.list_project_inference("project", "test-namespace")
+        ) == ["other", "project-model"]
+        assert await manager.find_inference("test-name", "test-namespace") is None
+
+        # The API is used for the namespaces that are not cached
+        await manager.list_inference("other-namespace")
+
+    mock_list.assert_awaited_once_with(namespace="other-namespace")
+    mock_get.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch("service.inference_manager.InferenceService.list")
+async def test_list_project_inference(mock_list):
+    mock_list.return_value = [
+        _inference_service("project-model"),
+        _inference_service("other", "project"),
+        _inference_service("other-model", "other"),
+    ]
+
+    manager = InferenceManager()
+    result = await manager.list_project_inference("project", "test-namespace")
+    assert [inference.name for inference in result] == ["project-model", "other"]
@@ -3,10 +3,14 @@
 import json
 import os
 import tempfile
+import threading
+import time
+import zipfile
 from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 
+from service.conversion_cache import ConversionCache
 from service.model_converter import LARGE_MODEL_THRESHOLD_BYTES, GraphVariant, ModelConverter
 
 
@@ -16,8 +20,8 @@ def mock_s3client():
 
 
 @pytest.fixture
-def model_converter(mock_s3client) -> ModelConverter:
-    return ModelConverter(s3client=mock_s3client)
+def model_converter(mock_s3client, tmp_path) -> ModelConverter:
+    return ModelConverter(s3client=mock_s3client, conversion_cache=ConversionCache(root_dir=str(tmp_path / "cache")))
 
 
 @pytest.fixture
@@ -223,6 +227,84 @@ def test_prepare_graph(sample_project, sample_models, graph_variant, model_size,
     assert create_graph_mock.call_count == 1
 
 
+def _fake_convert(delay: float = 0.0):
+    def convert_model(model_dir, export_dir, model, project) -> str:
+        time.sleep(delay)
+        converted_model_dir = os.path.join(export_dir, model.model_id, "1")
+        os.makedirs(converted_model_dir, exist_ok=True)
+        for file_name in ("model.xml", "model.bin"):
+            with open(os.path.join(converted_model_dir, file_name), "w") as f:
+                f.write(f"{model.optimized_model_id}")
+        return "DETECTION"
+
+    return MagicMock(side_effect=convert_model)
+
+
+def _write_zip(model_url, filename) -> None:
+    with zipfile.ZipFile(filename, "w") as zippy:
+        zippy.writestr("model.xml", "<xml/>")
+
+
+@patch("service.model_converter.urllib.request.urlretrieve", side_effect=_write_zip)
+def test_prepare_model_conversion_cache(mock_urlretrieve, model_converter: ModelConverter, sample_project, tmp_path):
+    model_converter._convert_model = _fake_convert()  # type: ignore[method-assign]
+    export_dirs = [tmp_path / "export1", tmp_path / "export2"]
+
+    models = []
+    for export_dir in export_dirs:
+        model = MagicMock(model_id="model1", optimized_model_id="optimized1", task_id="task3", use_ellipse=False)
+        model_converter._prepare_model(model=model, project=sample_project, export_dir=str(export_dir))
+        models.append(model)
+
+    # The second registration of the same model is served from the cache
+    assert mock_urlretrieve.call_count == 1
+    assert model_converter._convert_model.call_count == 1
+    assert model_converter.conversion_cache.hits == 1
+    for export_dir, model in zip(export_dirs, models):
+        assert (export_dir / model.model_id / "1" / "model.xml").read_text() == "optimized1"
+
+    # A different label set requires a new conversion
+    sample_project.pipeline.tasks[2].labels = [MagicMock(id="label_id_5", is_empty=False)]
+    model = MagicMock(model_id="model1", optimized_model_id="optimized1", task_id="task3", use_ellipse=False)
+    model_converter._prepare_model(model=model, project=sample_project, export_dir=str(tmp_path / "export3"))
+    assert model_converter._convert_model.call_count == 2
+
+
+@patch("service.model_converter.urllib.request.urlretrieve", side_effect=_write_zip)
+def test_prepare_graph_parallel(mock_urlretrieve, model_converter: ModelConverter, sample_project, sample_models):
+    model_converter._convert_model = _fake_convert(delay=0.5)  # type: ignore[method-assign]
+    model_converter._create_subconfig = MagicMock()  # type: ignore[method-assign]
+    model_converter._create_graph = MagicMock()  # type: ignore[method-assign]
+
+    start_time = time.perf_counter()
+    export_dir = model_converter.prepare_graph(project=sample_project, models=sample_models)
+    elapsed_time = time.perf_counter() - start_time
+
+    # Both models are converted concurrently
+    assert elapsed_time < 0.9
+    assert model_converter._convert_model.call_count == 2
+    for model in sample_models:
+        assert os.path.isfile(os.path.join(export_dir, model.model_id, "1", "model.xml"))
+
+
+@patch("service.model_converter.MODEL_CONVERSION_SEMAPHORE", threading.BoundedSemaphore(1))
+@patch("service.model_converter.urllib.request.urlretrieve", side_effect=_write_zip)
+def test_prepare_graph_conversion_limit(
+    mock_urlretrieve, model_converter: ModelConverter, sample_project, sample_models
+):
+    model_converter._convert_model = _fake_convert(delay=0.5)  # type: ignore[method-assign]
+    model_converter._create_subconfig = MagicMock()  # type: ignore[method-assign]
+    model_converter._create_graph = MagicMock()  # type: ignore[method-assign]
+
+    start_time = time.perf_counter()
+    model_converter.prepare_graph(project=sample_project, models=sample_models)
+    elapsed_time = time.perf_counter() - start_time
+
+    # The models are downloaded concurrently, but converted one at a time
+    assert elapsed_time >= 1.0
+    assert mock_urlretrieve.call_count == 2
+
+
 def test_create_ovms_graph_files(
     model_converter: ModelConverter, sample_project, tmp_path, monkeypatch: pytest.MonkeyPatch
 ):
@@ -1,5 +1,9 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+import asyncio
+import threading
+import time
+import zipfile
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -8,7 +12,10 @@ from grpc.aio import ServicerContext
 from grpc_interfaces.model_registration.pb.service_pb2 import (
     ActiveRequest,
     DeregisterRequest,
+    DownloadGraphRequest,
     ListRequest,
+    Model,
+    Project,
     PurgeProjectRequest,
     RecoverRequest,
     RegisterRequest,
@@ -16,7 +23,7 @@ from grpc_interfaces.model_registration.pb.service_pb2 import (
 from kubernetes_asyncio.client.rest import ApiException
 
 from service.config import MODELMESH_NAMESPACE, S3_STORAGE
-from service.model_registration import ModelRegistration
+from service.model_registration import ModelRegistration, get_project_id_from_pipeline_name
 from service.responses import Responses
 
 
@@ -78,10 +85,65 @@ async def test_register_new_pipelines(
     if expected_response == Responses.Created:
         converter.assert_called_once()
         create_inference.assert_awaited_once_with(
-            name=name, namespace=MODELMESH_NAMESPACE, storage_name=S3_STORAGE, path=name
+            name=name, namespace=MODELMESH_NAMESPACE, storage_name=S3_STORAGE, path=name, project_id=req.project.id
         )
 
 
+@pytest.mark.asyncio
+@patch("service.model_registration.InferenceManager.create_inference")
+@patch("service.model_registration.InferenceManager.get_inference")
+@patch("service.model_registration.InferenceManager.list_inference")
+async def test_register_new_pipelines_non_blocking(
+    list_inference, get_inference, create_inference, model_registration, converter, servicer_context
+):
+    get_inference.side_effect = AsyncMock(return_value=None)
+    create_inference.side_effect = AsyncMock()
+    list_inference.side_effect = AsyncMock(return_value=[])
+    converter.return_value.process_model.side_effect = lambda **_: threading.Event().wait(0.5)
+
+    req = RegisterRequest(name="test", override=False)
+    registrations = [
+        asyncio.create_task(model_registration.register_new_pipelines(req, servicer_context)) for _ in range(2)
+    ]
+    await asyncio.sleep(0.1)
+
+    # Other requests are served while the model is converted
+    start_time = time.perf_counter()
+    await model_registration.list_pipelines(ListRequest(), servicer_context)
+    assert time.perf_counter() - start_time < 0.1
+
+    # Concurrent registrations of the same pipeline are deduplicated
+    responses = await asyncio.gather(*registrations)
+    assert [response.status for response in responses] == [Responses.Created, Responses.Created]
+    converter.return_value.process_model.assert_called_once()
+    create_inference.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@patch("service.model_registration.InferenceManager.create_inference")
+@patch("service.model_registration.InferenceManager.get_inference")
+async def test_register_new_pipelines_different_requests(
+    get_inference, create_inference, model_registration, converter, servicer_context
+):
+    get_inference.side_effect = AsyncMock(return_value=None)
+    create_inference.side_effect = AsyncMock()
+    converter.return_value.process_model.side_effect = lambda **_: threading.Event().wait(0.2)
+
+    # Both requests register the active pipeline of the project, but with other models
+    requests = [
+        RegisterRequest(project=Project(id="project"), model=[Model(model_id="a"), Model(model_id=model_id)])
+        for model_id in ("b", "c")
+    ]
+    responses = await asyncio.gather(
+        *(model_registration.register_new_pipelines(req, servicer_context) for req in requests)
+    )
+
+    assert [response.status for response in responses] == [Responses.Created, Responses.Created]
+    assert [call.kwargs["models"] for call in converter.return_value.process_model.call_args_list] == [
+        req.model for req in requests
+    ]
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "reason, expected_response",
@@ -166,92 +228,113 @@ async def test_list_pipeline_fail(list_inference, model_registration, servicer_c
 
 
 @pytest.mark.asyncio
-@patch("service.model_registration.InferenceManager.list_inference")
-async def test_recover_pipelines_registered(list_inference, model_registration, servicer_context):
+@patch("service.model_registration.InferenceManager.find_inference")
+async def test_recover_pipelines_registered(find_inference, model_registration, servicer_context):
     pipeline = MagicMock()
     pipeline.name = "test"
-    list_inference.side_effect = AsyncMock(return_value=[pipeline])
+    find_inference.side_effect = AsyncMock(return_value=pipeline)
 
     req = RecoverRequest(name="test")
     response = await model_registration.recover_pipeline(req, servicer_context)
 
     assert response.success is True
-    list_inference.assert_awaited_once()
+    find_inference.assert_awaited_once_with(name="test", namespace=MODELMESH_NAMESPACE)
 
 
 @pytest.mark.asyncio
-@patch("service.model_registration.InferenceManager.list_inference")
+@patch("service.model_registration.InferenceManager.find_inference")
 @patch("service.model_registration.InferenceManager.create_inference")
-async def test_recover_pipelines_notregistered(create_inference, list_inference, model_registration, servicer_context):
-    list_inference.side_effect = AsyncMock()
+async def test_recover_pipelines_notregistered(create_inference, find_inference, model_registration, servicer_context):
+    find_inference.side_effect = AsyncMock(return_value=None)
     create_inference.side_effect = AsyncMock()
 
-    req = RecoverRequest(name="test")
+    req = RecoverRequest(name="60d31793d5f1fb7e6e3c1a4f-active")
     response = await model_registration.recover_pipeline(req, servicer_context)
 
     assert response.success is True
-    list_inference.assert_awaited_once()
-    create_inference.assert_awaited_once()
+    find_inference.assert_awaited_once()
+    create_inference.assert_awaited_once_with(
+        name="60d31793d5f1fb7e6e3c1a4f-active",
+        namespace=MODELMESH_NAMESPACE,
+        storage_name=S3_STORAGE,
+        path="60d31793d5f1fb7e6e3c1a4f-active",
+        project_id="60d31793d5f1fb7e6e3c1a4f",
+    )
+
+
+@pytest.mark.parametrize(
+    "pipeline_name, project_id",
+    [
+        ("60d31793d5f1fb7e6e3c1a4f-active", "60d31793d5f1fb7e6e3c1a4f"),
+        ("60d31793d5f1fb7e6e3c1a4f-60d31793d5f1fb7e6e3c1a50", "60d31793d5f1fb7e6e3c1a4f"),
+        ("60d31793d5f1fb7e6e3c1a4f_active", "60d31793d5f1fb7e6e3c1a4f"),
+        ("test", None),
+    ],
+)
+def test_get_project_id_from_pipeline_name(pipeline_name, project_id):
+    assert get_project_id_from_pipeline_name(pipeline_name) == project_id
 
 
 @pytest.mark.asyncio
-@patch("service.model_registration.InferenceManager.list_inference")
-async def test_recover_pipelines_no_recover(list_inference, model_registration, servicer_context, s3_client):
-    list_inference.side_effect = AsyncMock()
+@patch("service.model_registration.InferenceManager.find_inference")
+async def test_recover_pipelines_no_recover(find_inference, model_registration, servicer_context, s3_client):
+    find_inference.side_effect = AsyncMock(return_value=None)
     s3_client.return_value.check_folder_exists.return_value = False
 
     req = RecoverRequest(name="test")
     response = await model_registration.recover_pipeline(req, servicer_context)
 
     assert response.success is False
-    list_inference.assert_awaited_once()
+    find_inference.assert_awaited_once()
 
 
 @pytest.mark.asyncio
-@patch("service.model_registration.InferenceManager.list_inference")
+@patch("service.model_registration.InferenceManager.list_project_inference")
 @patch("service.model_registration.InferenceManager.remove_inference")
 async def test_delete_project_pipelines(
-    remove_inference, list_inference, model_registration, servicer_context, s3_client
+    remove_inference, list_project_inference, model_registration, servicer_context, s3_client
 ):
     pipeline = MagicMock()
     pipeline.name = "test-test"
-    list_inference.side_effect = AsyncMock(return_value=[pipeline])
+    list_project_inference.side_effect = AsyncMock(return_value=[pipeline])
     s3_client.return_value.list_folders.return_value = ["test-"]
 
     req = PurgeProjectRequest(project_id="test")
     response = await model_registration.delete_project_pipelines(req, servicer_context)
 
     assert response.success is True
-    list_inference.assert_awaited_once()
+    list_project_inference.assert_awaited_once()
     remove_inference.assert_awaited_once()
     s3_client.return_value.list_folders.assert_called_once()
     s3_client.return_value.delete_folder.assert_called() == 2
 
 
 @pytest.mark.asyncio
-@patch("service.model_registration.InferenceManager.list_inference")
+@patch("service.model_registration.InferenceManager.list_project_inference")
 @patch("service.model_registration.InferenceManager.remove_inference")
 async def test_delete_project_pipelines_remove_fail(
-    remove_inference, list_inference, model_registration, servicer_context, s3_client
+    remove_inference, list_project_inference, model_registration, servicer_context, s3_client
 ):
     pipeline = MagicMock()
     pipeline.name = "test-test"
-    list_inference.side_effect = AsyncMock(return_value=[pipeline])
+    list_project_inference.side_effect = AsyncMock(return_value=[pipeline])
     remove_inference.side_effect = RuntimeError()
 
     req = PurgeProjectRequest(project_id="test")
     response = await model_registration.delete_project_pipelines(req, servicer_context)
 
     assert response.success is False
-    list_inference.assert_awaited_once()
+    list_project_inference.assert_awaited_once()
     remove_inference.assert_awaited_once()
     s3_client.return_value.list_folders.assert_called_once()
     s3_client.return_value.delete_folder.assert_not_called()
 
 
 @pytest.mark.asyncio
-@patch("service.model_registration.InferenceManager.list_inference")
-async def test_delete_project_pipelines_delete_failed(list_inference, model_registration, servicer_context, s3_client):
+@patch("service.model_registration.InferenceManager.list_project_inference")
+async def test_delete_project_pipelines_delete_failed(
+    list_project_inference, model_registration, servicer_context, s3_client
+):
     s3_client.return_value.list_folders.return_value = ["test-"]
     s3_client.return_value.delete_folder.side_effect = ClientError(
         {"Error": {"Code": 500, "Message": "Error"}}, "get_object"
@@ -261,6 +344,29 @@ async def test_delete_project_pipelines_delete_failed(list_inference, model_regi
     response = await model_registration.delete_project_pipelines(req, servicer_context)
 
     assert response.success is False
-    list_inference.assert_awaited_once()
+    list_project_inference.assert_awaited_once()
     s3_client.return_value.list_folders.assert_called_once()
     s3_client.return_value.delete_folder.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_download_graph(model_registration, converter, servicer_context, tmp_path):
+    def prepare_graph(**_) -> str:
+        graph_directory = tmp_path / "exported"
+        (graph_directory / "model" / "1").mkdir(parents=True)
+        (graph_directory / "config.json").write_text("{}")
+        (graph_directory / "model" / "1" / "model.xml").write_text("<xml/>")
+        return str(graph_directory)
+
+    converter.return_value.prepare_graph.side_effect = prepare_graph
+
+    req = DownloadGraphRequest()
+    chunks = [chunk async for chunk in model_registration.download_graph(req, servicer_context)]
+
+    archive_path = tmp_path / "archive.zip"
+    archive_path.write_bytes(b"".join(chunk.buffer for chunk in chunks))
+    with zipfile.ZipFile(archive_path) as archive:
+        assert sorted(archive.namelist()) == ["config.json", "model/", "model/1/", "model/1/model.xml"]
+    assert isinstance(converter.return_value.prepare_graph.call_args.kwargs["cancel_event"], threading.Event)
+    # The archive is deleted once streamed
+    assert not (tmp_path / "exported.zip").exists()
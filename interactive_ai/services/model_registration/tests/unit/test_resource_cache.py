@@ -0,0 +1,137 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+
+import pytest
+from aiohttp.test_utils import TestServer
+from kubernetes_asyncio import client
+
+from service.inference_service import PROJECT_ID_LABEL, InferenceService
+from service.resource_cache import ResourceCache
+from tests.unit.fake_api_server import FakeApiServer
+
+NAMESPACE = "test-namespace"
+
+
+@pytest.fixture
+def fake_api_server():
+    return FakeApiServer()
+
+
+@contextlib.asynccontextmanager
+async def serve(fake_api_server: FakeApiServer, mocker) -> AsyncIterator[ResourceCache]:
+    """Serve the fake API server and yield a cache of its InferenceService resources"""
+    test_server = TestServer(fake_api_server.app)
+    await test_server.start_server()
+    api_client = client.ApiClient(client.Configuration(host=str(test_server.make_url(""))))
+    mocker.patch(
+        "service.custom_resource.CustomResourceApiClient.thread_local_storage.k8s_custom_object_api",
+        client.CustomObjectsApi(api_client),
+        create=True,
+    )
+    cache = ResourceCache(
+        resource_class=InferenceService,
+        namespace=NAMESPACE,
+        index_labels=(PROJECT_ID_LABEL,),
+        page_size=2,
+        watch_timeout_seconds=1,
+        retry_delay_seconds=0.01,
+    )
+    try:
+        yield cache
+    finally:
+        await cache.stop()
+        await api_client.close()
+        await test_server.close()
+
+
+async def wait_for(condition, timeout: float = 5.0) -> None:
+    async def poll() -> None:
+        while not condition():  # noqa: ASYNC110
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(poll(), timeout=timeout)
+
+
+@pytest.mark.asyncio
+async def test_initial_list(fake_api_server, mocker):
+    async with serve(fake_api_server, mocker) as resource_cache:
+        for i in range(5):
+            await fake_api_server.create(f"pipeline-{i}", NAMESPACE, labels={PROJECT_ID_LABEL: f"project-{i % 2}"})
+
+        resource_cache.start()
+        assert await resource_cache.wait_until_synced(timeout=5)
+
+        # The resources are listed page by page
+        assert len(fake_api_server.list_requests) == 3
+        assert sorted(resource.name for resource in resource_cache.list_all()) == [f"pipeline-{i}" for i in range(5)]
+        assert resource_cache.get("pipeline-1").labels[PROJECT_ID_LABEL] == "project-1"
+        assert resource_cache.get("pipeline-5") is None
+        assert [resource.name for resource in resource_cache.list_by_label(PROJECT_ID_LABEL, "project-0")] == [
+            "pipeline-0",
+            "pipeline-2",
+            "pipeline-4",
+        ]
+        with pytest.raises(ValueError):
+            resource_cache.list_by_label("other_label", "value")
+
+
+@pytest.mark.asyncio
+async def test_watch(fake_api_server, mocker):
+    async with serve(fake_api_server, mocker) as resource_cache:
+        await fake_api_server.create("pipeline-0", NAMESPACE, labels={PROJECT_ID_LABEL: "project-0"})
+        resource_cache.start()
+        assert await resource_cache.wait_until_synced(timeout=5)
+
+        await fake_api_server.create("pipeline-1", NAMESPACE, labels={PROJECT_ID_LABEL: "project-0"})
+        await fake_api_server.update("pipeline-0", replicas=2)
+        await fake_api_server.delete("pipeline-1")
+        await fake_api_server.create("pipeline-2", NAMESPACE, labels={PROJECT_ID_LABEL: "project-1"})
+
+        await wait_for(lambda: resource_cache.resource_version == str(fake_api_server.resource_version))
+        assert sorted(resource.name for resource in resource_cache.list_all()) == ["pipeline-0", "pipeline-2"]
+        assert resource_cache.get("pipeline-0").spec == {"replicas": 2}
+        assert [resource.name for resource in resource_cache.list_by_label(PROJECT_ID_LABEL, "project-0")] == [
+            "pipeline-0"
+        ]
+        # Lookups do not call the API server
+        assert len(fake_api_server.list_requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_resume_watch(fake_api_server, mocker):
+    async with serve(fake_api_server, mocker) as resource_cache:
+        resource_cache.start()
+        assert await resource_cache.wait_until_synced(timeout=5)
+        await wait_for(lambda: len(fake_api_server.watch_requests) == 1)
+
+        # The watch is closed by the server and resumed from the last resourceVersion, without listing again
+        await fake_api_server.close_watches()
+        await fake_api_server.create("pipeline-0", NAMESPACE)
+
+        await wait_for(lambda: resource_cache.get("pipeline-0") is not None)
+        assert len(fake_api_server.watch_requests) >= 2
+        assert fake_api_server.watch_requests[1]["allowWatchBookmarks"].lower() == "true"
+        assert len(fake_api_server.list_requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_relist_on_expired_resource_version(fake_api_server, mocker):
+    async with serve(fake_api_server, mocker) as resource_cache:
+        await fake_api_server.create("pipeline-0", NAMESPACE)
+        resource_cache.start()
+        assert await resource_cache.wait_until_synced(timeout=5)
+        await wait_for(lambda: len(fake_api_server.watch_requests) == 1)
+
+        # The changes made while disconnected are compacted, so the cache must list the resources again
+        await resource_cache.stop()
+        await fake_api_server.create("pipeline-1", NAMESPACE)
+        await fake_api_server.delete("pipeline-0")
+        fake_api_server.compact()
+        resource_cache.start()
+
+        await wait_for(lambda: len(fake_api_server.list_requests) == 2)
+        await wait_for(lambda: resource_cache.resource_version == str(fake_api_server.resource_version))
+        assert [resource.name for resource in resource_cache.list_all()] == ["pipeline-1"]
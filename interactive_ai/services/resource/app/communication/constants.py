@@ -16,6 +16,9 @@ DEFAULT_N_PROJECTS_RETURNED = 10
 
 MAX_N_ANNOTATIONS_RETURNED = 500
 
+# Number of video frame annotations that are read from the database and serialized together when streaming them
+VIDEO_FRAME_ANNOTATIONS_STREAM_CHUNK_SIZE = 100
+
 MAX_UNANNOTATED_DATASET_SIZE: int = 10000
 
 # Limit object sizes to return, see: CVS-91701
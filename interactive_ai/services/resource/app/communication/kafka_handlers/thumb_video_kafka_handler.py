@@ -2,7 +2,7 @@
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 import logging
 
-from resource_management.media_manager import MediaManager
+from resource_management.thumbnail_video_worker import ThumbnailVideoWorker
 
 from geti_kafka_tools import BaseKafkaHandler, KafkaRawMessage, TopicSubscription
 from geti_types import ID, DatasetStorageIdentifier, Singleton
@@ -32,7 +32,8 @@ class ThumbVideoKafkaHandler(BaseKafkaHandler, metaclass=Singleton):
     @setup_session_kafka
     def generate_and_save_thumbnail_video(raw_message: KafkaRawMessage) -> None:
         """
-        Generates a thumbnail video for a video
+        Queues the generation of a thumbnail video for a video. The transcode runs in the ThumbnailVideoWorker, so
+        that the consumer keeps polling while the video is transcoded.
         """
         value: dict = raw_message.value
         dataset_storage_identifier = DatasetStorageIdentifier(
@@ -40,9 +41,8 @@ class ThumbVideoKafkaHandler(BaseKafkaHandler, metaclass=Singleton):
             project_id=ID(value["project_id"]),
             dataset_storage_id=ID(value["dataset_storage_id"]),
         )
-        video = MediaManager.get_video_by_id(
+        ThumbnailVideoWorker().submit(
             dataset_storage_identifier=dataset_storage_identifier,
             video_id=ID(value["video_id"]),
+            requested_at=raw_message.timestamp / 1000,  # the timestamp of the Kafka message is in milliseconds
         )
-        logger.info(f"Creating thumbnail video for video with ID {video.id_}")
-        MediaManager.create_and_save_thumbnail_video(dataset_storage_identifier=dataset_storage_identifier, video=video)
@@ -32,6 +32,7 @@ from communication.rest_endpoints import (
     workspace_router,
 )
 from metrics.instruments import initialize_metrics
+from resource_management.thumbnail_video_worker import ThumbnailVideoWorker
 
 from geti_fastapi_tools.exceptions import GetiBaseException
 from geti_fastapi_tools.responses import error_response_rest
@@ -55,6 +56,7 @@ async def lifespan(app: FastAPI):  # type: ignore # noqa: ANN201
         KafkaTelemetry.instrument()
     AnnotationKafkaHandler()
     MiscellaneousKafkaHandler()
+    ThumbnailVideoWorker()
     ThumbVideoKafkaHandler()
     MediaUploadedKafkaHandler()
     PreprocessingKafkaHandler()
@@ -63,6 +65,7 @@ async def lifespan(app: FastAPI):  # type: ignore # noqa: ANN201
     AnnotationKafkaHandler().stop()
     MiscellaneousKafkaHandler().stop()
     ThumbVideoKafkaHandler().stop()
+    ThumbnailVideoWorker().stop()
     MediaUploadedKafkaHandler().stop()
     PreprocessingKafkaHandler().stop()
     if ENABLE_TRACING:
@@ -1,8 +1,12 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
-from typing import Any, cast
+import itertools
+import json
+import logging
+from collections.abc import Iterator, Sequence
+from typing import Any
 
-from communication.constants import MAX_N_ANNOTATIONS_RETURNED
+from communication.constants import MAX_N_ANNOTATIONS_RETURNED, VIDEO_FRAME_ANNOTATIONS_STREAM_CHUNK_SIZE
 from communication.exceptions import (
     AnnotationsNotFoundException,
     CurrentlyNotImplementedException,
@@ -10,39 +14,64 @@ from communication.exceptions import (
 )
 from communication.limit_check_helpers import check_max_number_of_annotations_and_delete_extra
 from communication.rest_data_validator import AnnotationRestValidator
-from communication.rest_views.annotation_rest_views import AnnotationRESTViews
+from communication.rest_views.annotation_rest_views import ANNOTATIONS, AnnotationRESTViews
 from communication.rest_views.video_annotation_range_rest_views import VideoAnnotationRangeRESTViews
 from entities.video_annotation_properties import VideoAnnotationProperties
 from managers.annotation_manager import AnnotationManager
 from managers.project_manager import ProjectManager
+from resource_management import VideoRangeAnnotationManager
 from resource_management.media_manager import MediaManager
 from service.label_schema_service import LabelSchemaService
 from usecases.resolve_label_source_usecase import ResolveLabelSourceUseCase
 
 from geti_telemetry_tools import unified_tracing
 from geti_types import (
+    CTX_SESSION_VAR,
     ID,
     DatasetStorageIdentifier,
     ImageIdentifier,
     MediaIdentifierEntity,
+    Session,
     VideoFrameIdentifier,
     VideoIdentifier,
 )
-from iai_core.entities.annotation import Annotation, AnnotationScene, AnnotationSceneKind
+from iai_core.entities.annotation import AnnotationScene, AnnotationSceneKind
 from iai_core.entities.annotation_scene_state import AnnotationSceneState
+from iai_core.entities.dataset_storage import DatasetStorage
 from iai_core.entities.image import Image
 from iai_core.entities.label_schema import LabelSchema
 from iai_core.entities.model_template import TaskType
 from iai_core.entities.project import Project
-from iai_core.entities.scored_label import LabelSource, ScoredLabel
-from iai_core.entities.shapes import Rectangle
 from iai_core.entities.video import Video
-from iai_core.entities.video_annotation_range import VideoAnnotationRange
-from iai_core.repos import AnnotationSceneRepo, LabelSchemaRepo, VideoAnnotationRangeRepo, VideoRepo
+from iai_core.repos import LabelSchemaRepo, VideoAnnotationRangeRepo, VideoRepo
 from iai_core.utils.filesystem import check_free_space_for_operation
+from iai_core.utils.iteration import grouper
 
 LATEST = "latest"
 
+logger = logging.getLogger(__name__)
+
+
+def _json_dumps(content: Any) -> str:
+    """Encode the content to JSON with the same settings as the JSON responses of the endpoints"""
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":"))
+
+
+def _iter_in_session(iterator: Iterator[str], session: Session) -> Iterator[str]:
+    """
+    Iterate over a lazy response body with the session of the request.
+
+    The body of a streaming response is consumed after the endpoint has returned, and each item may be produced in a
+    different context (e.g. a new worker thread), so the session is set again before producing every item.
+    """
+    while True:
+        CTX_SESSION_VAR.set(session)
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        yield item
+
 
 class AnnotationRESTController:
     @staticmethod
@@ -51,6 +80,7 @@ class AnnotationRESTController:
         annotation_id: ID,
         media_identifier: MediaIdentifierEntity,
         label_only: bool = False,
+        columnar: bool = False,
     ) -> dict[str, Any]:
         """
         Get an annotation for an image or video frame.
@@ -63,6 +93,7 @@ class AnnotationRESTController:
         :param annotation_id: ID of annotation
         :param media_identifier: MediaIdentifierEntity of image or video frame
         :param label_only: if set to true, do not return the shape
+        :param columnar: if set to true, return the annotations in the columnar representation
         :return: REST View or error responses
         """
         project = ProjectManager.get_project_by_id(project_id=dataset_storage_identifier.project_id)
@@ -101,6 +132,7 @@ class AnnotationRESTController:
             tasks_to_revisit=tasks_to_revisit,
             is_rotated_detection=is_rotated_detection,
             deleted_label_ids=deleted_label_ids,
+            columnar=columnar,
         )
 
     @staticmethod
@@ -109,6 +141,8 @@ class AnnotationRESTController:
         image_id: ID,
         data: dict,
         user_id: ID,
+        columnar_data: bool = False,
+        columnar: bool = False,
     ) -> dict[str, Any]:
         """
         Create a new annotation for a given image.
@@ -117,6 +151,8 @@ class AnnotationRESTController:
         :param image_id: ID of the image to add the annotation to
         :param data: Dictionary containing the annotation data
         :param user_id: ID of the user who created or updated the annotation
+        :param columnar_data: if set to true, the annotations in data are in the columnar representation
+        :param columnar: if set to true, return the annotations in the columnar representation
         :return: REST View or error responses
         """
         check_free_space_for_operation(operation="Annotate image", exception_type=NotEnoughSpaceException)
@@ -142,6 +178,7 @@ class AnnotationRESTController:
             media_identifier=image.media_identifier,
             project=project,
             user_id=user_id,
+            columnar_data=columnar_data,
         )
 
         is_rotated_detection = AnnotationRESTController._project_is_rotated_detection_task(project)
@@ -150,6 +187,7 @@ class AnnotationRESTController:
             annotation_scene_state=annotation_scene_state,
             tasks_to_revisit=tasks_to_revisit,
             is_rotated_detection=is_rotated_detection,
+            columnar=columnar,
         )
 
     @staticmethod
@@ -161,7 +199,11 @@ class AnnotationRESTController:
         media_identifier: MediaIdentifierEntity,
         project: Project,
         user_id: ID,
+        columnar_data: bool = False,
     ) -> tuple[AnnotationScene, AnnotationSceneState, list[ID]]:
+        if columnar_data and isinstance(data.get(ANNOTATIONS), dict):
+            # Expand the columnar annotations so that they are validated and parsed like the JSON ones
+            data = {**data, ANNOTATIONS: AnnotationRESTViews.annotations_from_columnar_rest(data[ANNOTATIONS])}
         project_label_schema = LabelSchemaService.get_latest_label_schema_for_project(project.identifier)
         label_schema_by_task = {
             task_node.id_: LabelSchemaService.get_latest_label_schema_for_task(
@@ -227,12 +269,19 @@ class AnnotationRESTController:
         end_frame: int | None = None,
         frameskip: int = 1,
         limit_annotations: int = MAX_N_ANNOTATIONS_RETURNED,
-    ) -> dict[str, Any]:
+        columnar: bool = False,
+    ) -> Iterator[str]:
         """
         Get all latest annotations for all frames in a given video.
 
         This makes it possible to pull a different annotation revision over REST.
 
+        The REST view is returned as a stream of JSON text. The annotation scenes are read from the database with a
+        cursor and serialized in chunks of VIDEO_FRAME_ANNOTATIONS_STREAM_CHUNK_SIZE frames, together with their
+        states, so that the memory used by the request does not grow with the number of frames. The video annotation
+        properties, which depend on all the frames, are written after them. Errors are raised before the response
+        starts where possible; an error while streaming is logged and aborts the response.
+
         :param project_id: The project's id to get the video frame annotations for
         :param dataset_storage_id: The DS containing video frame
         :param video_id: ID of video
@@ -245,7 +294,9 @@ class AnnotationRESTController:
         :param frameskip: Stride to use for the search; only frames whose indices are multiple
             of this stride will be considered.
         :param limit_annotations: max number of annotations to return per page
-        :return: REST View or 404 response
+        :param columnar: if set to true, return the annotations of each frame in the columnar representation
+        :raises AnnotationsNotFoundException: if no annotated frame matches, before any output is produced
+        :return: Iterator over the chunks of the JSON REST view
         """
 
         if annotation_id != LATEST:
@@ -255,8 +306,15 @@ class AnnotationRESTController:
         dataset_storage = ProjectManager.get_dataset_storage_by_id(project, dataset_storage_id)
         is_rotated_detection = AnnotationRESTController._project_is_rotated_detection_task(project)
         deleted_label_ids = LabelSchemaRepo(project.identifier).get_deleted_label_ids()
+        label_schema_by_task = {
+            task_node.id_: LabelSchemaService.get_latest_label_schema_for_task(
+                project_identifier=project.identifier,
+                task_node_id=task_node.id_,
+            )
+            for task_node in project.get_trainable_task_nodes()
+        }
 
-        annotation_scenes, total_matching_annotation_scenes = AnnotationManager.get_filtered_frame_annotation_scenes(
+        annotation_scenes = AnnotationManager.iter_frame_annotation_scenes(
             dataset_storage_identifier=dataset_storage.identifier,
             video_id=video_id,
             start_frame=start_frame,
@@ -264,46 +322,116 @@ class AnnotationRESTController:
             frameskip=frameskip,
             limit=limit_annotations,
         )
-
-        actual_start_frame: int | None = None
-        actual_end_frame: int | None = None
-        if annotation_scenes:
-            start_identifier = annotation_scenes[0].media_identifier
-            end_identifier = annotation_scenes[-1].media_identifier
-            actual_start_frame = (
-                start_identifier.frame_index if isinstance(start_identifier, VideoFrameIdentifier) else None
-            )
-            actual_end_frame = end_identifier.frame_index if isinstance(end_identifier, VideoFrameIdentifier) else None
-
-        if len(annotation_scenes) == 0:
+        # Fetch the first frame now, so that a missing annotation is reported before the response starts
+        first_annotation_scene = next(annotation_scenes, None)
+        if first_annotation_scene is None:
             raise AnnotationsNotFoundException(media_identifier=VideoIdentifier(video_id=video_id))
+        total_requested_count = AnnotationManager.count_frame_annotation_scenes(
+            dataset_storage_identifier=dataset_storage.identifier,
+            video_id=video_id,
+            start_frame=start_frame,
+            end_frame=end_frame,
+            frameskip=frameskip,
+        )
 
-        (
-            annotation_scene_states,
-            tasks_to_revisit_per_scene,
-        ) = AnnotationManager.get_annotation_state_information_for_scenes(
+        chunks = AnnotationRESTController._stream_video_frame_annotations(
+            annotation_scenes=itertools.chain([first_annotation_scene], annotation_scenes),
             dataset_storage=dataset_storage,
-            annotation_scenes=annotation_scenes,
             project=project,
-        )
-
-        video_annotation_properties = VideoAnnotationProperties(
-            total_count=len(annotation_scenes),
-            start_frame=actual_start_frame,
-            end_frame=actual_end_frame,
-            total_requested_count=total_matching_annotation_scenes,
-            requested_start_frame=start_frame,
-            requested_end_frame=end_frame,
-        )
-        return AnnotationRESTViews.media_2d_annotations_to_rest(
-            annotation_scenes=annotation_scenes,
+            label_schema_by_task=label_schema_by_task,
+            video_id=video_id,
+            start_frame=start_frame,
+            end_frame=end_frame,
+            total_requested_count=total_requested_count,
             label_only=label_only,
-            annotation_scene_states=annotation_scene_states,
-            tasks_to_revisit_per_scene=tasks_to_revisit_per_scene,
             is_rotated_detection=is_rotated_detection,
             deleted_label_ids=deleted_label_ids,
-            annotation_properties=video_annotation_properties,
+            columnar=columnar,
         )
+        return _iter_in_session(chunks, session=CTX_SESSION_VAR.get())
+
+    @staticmethod
+    def _stream_video_frame_annotations(  # noqa: PLR0913
+        annotation_scenes: Iterator[AnnotationScene],
+        dataset_storage: DatasetStorage,
+        project: Project,
+        label_schema_by_task: dict[ID, LabelSchema],
+        video_id: ID,
+        start_frame: int | None,
+        end_frame: int | None,
+        total_requested_count: int,
+        label_only: bool,
+        is_rotated_detection: bool,
+        deleted_label_ids: Sequence[ID],
+        columnar: bool,
+    ) -> Iterator[str]:
+        """
+        Serialize the video frame annotations chunk by chunk, see `get_video_frame_annotations`.
+        """
+        yield '{"video_annotations":['
+        total_count = 0
+        actual_start_frame: int | None = None
+        actual_end_frame: int | None = None
+        try:
+            for annotation_scenes_chunk in grouper(
+                annotation_scenes, chunk_size=VIDEO_FRAME_ANNOTATIONS_STREAM_CHUNK_SIZE
+            ):
+                (
+                    annotation_scene_states,
+                    tasks_to_revisit_per_scene,
+                ) = AnnotationManager.get_annotation_state_information_for_scenes(
+                    dataset_storage=dataset_storage,
+                    annotation_scenes=annotation_scenes_chunk,
+                    project=project,
+                    label_schema_by_task=label_schema_by_task,
+                )
+                frames_rest = ",".join(
+                    _json_dumps(
+                        AnnotationRESTViews.media_2d_annotation_to_rest(
+                            annotation_scene,
+                            label_only=label_only,
+                            annotation_scene_state=annotation_scene_state,
+                            tasks_to_revisit=tasks_to_revisit,
+                            is_rotated_detection=is_rotated_detection,
+                            deleted_label_ids=deleted_label_ids,
+                            columnar=columnar,
+                        )
+                    )
+                    for annotation_scene, annotation_scene_state, tasks_to_revisit in zip(
+                        annotation_scenes_chunk, annotation_scene_states, tasks_to_revisit_per_scene
+                    )
+                )
+                yield f",{frames_rest}" if total_count else frames_rest
+                total_count += len(annotation_scenes_chunk)
+                if actual_start_frame is None:
+                    actual_start_frame = AnnotationRESTController._get_frame_index(annotation_scenes_chunk[0])
+                actual_end_frame = AnnotationRESTController._get_frame_index(annotation_scenes_chunk[-1])
+
+            video_annotation_properties = VideoAnnotationProperties(
+                total_count=total_count,
+                start_frame=actual_start_frame,
+                end_frame=actual_end_frame,
+                total_requested_count=total_requested_count,
+                requested_start_frame=start_frame,
+                requested_end_frame=end_frame,
+            )
+            properties_rest = AnnotationRESTViews.video_annotation_properties_to_rest(
+                video_annotation_properties=video_annotation_properties
+            )
+            yield f'],"video_annotation_properties":{_json_dumps(properties_rest)}}}'
+        except Exception:
+            # The response has already started, so the error can no longer be reported with a status code. It is
+            # raised again so that the server aborts the connection, and the client sees an incomplete transfer
+            # instead of a truncated body.
+            logger.exception(
+                "Failed to stream the annotations of video with ID `%s` after %d frames", video_id, total_count
+            )
+            raise
+
+    @staticmethod
+    def _get_frame_index(annotation_scene: AnnotationScene) -> int | None:
+        media_identifier = annotation_scene.media_identifier
+        return media_identifier.frame_index if isinstance(media_identifier, VideoFrameIdentifier) else None
 
     @staticmethod
     def get_video_range_annotation(
@@ -377,7 +505,7 @@ class AnnotationRESTController:
         video_ann_range_repo.save(new_video_ann_range)
 
         # Create AnnotationScene objects for the key frames, where necessary
-        AnnotationRESTController.create_annotations_for_video_range(
+        VideoRangeAnnotationManager.create_annotations_for_video_range(
             new_video_annotation_range=new_video_ann_range,
             old_video_annotation_range=old_video_ann_range,
             video=video,
@@ -390,102 +518,6 @@ class AnnotationRESTController:
 
         return VideoAnnotationRangeRESTViews.video_annotation_range_to_rest(video_annotation_range=new_video_ann_range)
 
-    @staticmethod
-    @unified_tracing
-    def create_annotations_for_video_range(  # noqa: PLR0913
-        new_video_annotation_range: VideoAnnotationRange,
-        old_video_annotation_range: VideoAnnotationRange,
-        video: Video,
-        project: Project,
-        dataset_storage_identifier: DatasetStorageIdentifier,
-        label_schema: LabelSchema,
-        user_id: ID,
-        skip_frame: int,
-    ) -> None:
-        """
-        Create and save AnnotationScene objects based on a VideoAnnotationRange at the desired stride.
-
-        :param new_video_annotation_range: VideoAnnotationRange object to use as a reference to create the annotations
-        :param old_video_annotation_range: Previous VideoAnnotationRange object, used to determine which annotations
-            already exist (and can be reused) and which must be created from scratch.
-        :param video: Video relative to the VideoAnnotationRange
-        :param project: Project that contains the video
-        :param dataset_storage_identifier: Identifier of the dataset storage that contains the video
-        :param label_schema: Current LabelSchema for the project
-        :param user_id: ID of the user who submitted the annotation
-        :param skip_frame: interval at which to create annotations
-        """
-
-        def create_ann_scene_for_frame(frame_index: int, label_ids: set[ID]) -> AnnotationScene:
-            media_identifier = VideoFrameIdentifier(
-                video_id=video.id_,
-                frame_index=frame_index,
-            )
-            if label_ids:
-                scored_labels = [
-                    ScoredLabel(
-                        label_id=label_id,
-                        probability=1,
-                        label_source=label_source,
-                    )
-                    for label_id in label_ids
-                ]
-                annotations = [Annotation(shape=full_box_rect, labels=scored_labels)]
-            else:
-                annotations = []
-            return AnnotationScene(
-                kind=AnnotationSceneKind.ANNOTATION,
-                media_identifier=media_identifier,
-                media_height=video.height,
-                media_width=video.width,
-                id_=AnnotationSceneRepo.generate_id(),
-                last_annotator_id=user_id,
-                annotations=annotations,
-            )
-
-        full_box_rect = Rectangle.generate_full_box()
-        label_source = LabelSource(user_id=user_id)
-        label_schema_by_task = {
-            task_node.id_: LabelSchemaService.get_latest_label_schema_for_task(
-                project_identifier=project.identifier, task_node_id=task_node.id_
-            )
-            for task_node in project.get_trainable_task_nodes()
-        }
-        ann_scene_repo = AnnotationSceneRepo(dataset_storage_identifier)
-
-        # Iterate over the key points, i.e. frames indices that are a multiple of the skip_frame
-        annotations_to_save = []
-        for key_frame_index in range(0, video.total_frames, skip_frame):
-            labels_new = new_video_annotation_range.get_labels_at_frame_index(key_frame_index)
-            labels_old = old_video_annotation_range.get_labels_at_frame_index(key_frame_index)
-            # Create/update the annotations for key frames if the new labels are different from the previous ones
-            if labels_new != labels_old:
-                annotation_scene = create_ann_scene_for_frame(frame_index=key_frame_index, label_ids=labels_new)
-                annotations_to_save.append(annotation_scene)
-            # If there are annotations for non-key frames between this key point and the next one, update them
-            non_key_annotations, _ = ann_scene_repo.get_video_frame_annotations_by_video_id(
-                video_id=video.id_,
-                start_frame=key_frame_index + 1,
-                end_frame=min(key_frame_index + skip_frame, video.total_frames) - 1,
-                annotation_kind=AnnotationSceneKind.ANNOTATION,
-            )
-
-            for non_key_ann_scene in non_key_annotations:
-                ann_scene_label_ids = non_key_ann_scene.get_label_ids(include_empty=True)
-                if ann_scene_label_ids == labels_new:
-                    continue
-                non_key_frame_index = cast("VideoFrameIdentifier", non_key_ann_scene.media_identifier).frame_index
-                annotation_scene = create_ann_scene_for_frame(frame_index=non_key_frame_index, label_ids=labels_new)
-                annotations_to_save.append(annotation_scene)
-        AnnotationManager.save_annotations(
-            annotation_scenes=annotations_to_save,
-            project=project,
-            dataset_storage_identifier=dataset_storage_identifier,
-            label_schema=label_schema,
-            label_schema_by_task=label_schema_by_task,
-            calculate_task_to_revisit=False,
-        )
-
     @staticmethod
     def make_video_frame_annotation(
         data: dict,
@@ -493,6 +525,8 @@ class AnnotationRESTController:
         video_id: ID,
         frame_index: int,
         user_id: ID,
+        columnar_data: bool = False,
+        columnar: bool = False,
     ) -> dict[str, Any]:
         """
         Create an annotation for a video frame.
@@ -502,6 +536,8 @@ class AnnotationRESTController:
         :param video_id: ID of the video to add the annotation to
         :param frame_index: index of the frame in the video
         :param user_id: ID of the user who created or updated the annotation
+        :param columnar_data: if set to true, the annotations in data are in the columnar representation
+        :param columnar: if set to true, return the annotations in the columnar representation
         :return: REST view or error response
         """
         # Get video and validate that video frame exists.
@@ -533,6 +569,7 @@ class AnnotationRESTController:
             media_identifier=media_identifier,
             project=project,
             user_id=user_id,
+            columnar_data=columnar_data,
         )
 
         # If it is a single global task project, update the VideoAnnotationRange for the
@@ -559,6 +596,7 @@ class AnnotationRESTController:
             annotation_scene_state=annotation_scene_state,
             tasks_to_revisit=tasks_to_revisit,
             is_rotated_detection=is_rotated_detection,
+            columnar=columnar,
         )
 
     @staticmethod
@@ -466,6 +466,35 @@ class MediaRESTController(metaclass=Singleton):
 
         return success_response_rest()
 
+    @staticmethod
+    def delete_media(
+        dataset_storage_identifier: DatasetStorageIdentifier,
+        media_rest: list[dict[str, str]],
+    ) -> dict[str, Any]:
+        """
+        Delete several images and videos by ID from a project.
+
+        :param dataset_storage_identifier: Identifier of the dataset storage containing
+            the media to delete
+        :param media_rest: List of the media to delete, each one in the format {"id": ..., "type": "image"|"video"}
+        :return: REST response listing the media that were deleted
+        """
+        project = ProjectManager.get_project_by_id(project_id=dataset_storage_identifier.project_id)
+        dataset_storage = ProjectManager.get_dataset_storage_by_id(
+            project=project,
+            dataset_storage_id=dataset_storage_identifier.dataset_storage_id,
+        )
+        deleted_image_ids, deleted_video_ids = MediaManager.delete_media_by_ids(
+            project=project,
+            dataset_storage=dataset_storage,
+            image_ids=[ID(media["id"]) for media in media_rest if media["type"] == MediaType.IMAGE.value],
+            video_ids=[ID(media["id"]) for media in media_rest if media["type"] == MediaType.VIDEO.value],
+        )
+        return {
+            "deleted_media": [{"id": str(image_id), "type": MediaType.IMAGE.value} for image_id in deleted_image_ids]
+            + [{"id": str(video_id), "type": MediaType.VIDEO.value} for video_id in deleted_video_ids]
+        }
+
     @staticmethod
     def get_labels_by_ids(label_ids: SequenceOrSet[ID], project_identifier: ProjectIdentifier) -> list[Label]:
         """
@@ -5,6 +5,7 @@
 
 import math
 import os
+from collections import Counter
 
 import jsonschema
 
@@ -14,6 +15,11 @@ from communication.exceptions import (
     DuplicatedAnnotationIDException,
     LabelNotFoundException,
 )
+from communication.rest_data_validator.annotation_validation_plan import (
+    AnnotationValidationPlan,
+    SceneValidationContext,
+    TaskValidationPlan,
+)
 from communication.rest_views.annotation_rest_views import AnnotationRESTViews, RestShapeType
 from service.label_schema_service import LabelSchemaService
 
@@ -22,7 +28,7 @@ from geti_fastapi_tools.validation import RestApiValidator
 from geti_telemetry_tools import unified_tracing
 from geti_types import ID, ImageIdentifier, MediaIdentifierEntity, VideoFrameIdentifier
 from iai_core.entities.label import Label
-from iai_core.entities.label_schema import LabelGroupType, LabelSchema, LabelSchemaView
+from iai_core.entities.label_schema import LabelSchema, LabelSchemaView
 from iai_core.entities.model_template import TaskType
 from iai_core.entities.project import Project
 from iai_core.entities.shapes import Ellipse, Point, Polygon, Rectangle
@@ -106,16 +112,15 @@ class AnnotationRestValidator(RestApiValidator):
             annotation_scene_rest=annotation_scene_rest,
             media_identifier=media_identifier,
         )
+        validation_plan = AnnotationValidationPlan.get(project=project, label_schema_by_task=label_schema_by_task)
         self.__validate_all_labels_exist(
             labels_to_check=self.__get_label_ids_from_annotation_scene(annotation_scene_rest=annotation_scene_rest),
-            existing_labels=[
-                label.id_ for schema in label_schema_by_task.values() for label in schema.get_labels(True)
-            ],
+            existing_labels=validation_plan.existing_label_ids,
         )
         self.__validate_all_individual_annotations(
             annotation_scene_rest=annotation_scene_rest,
             project=project,
-            label_schema_by_task=label_schema_by_task,
+            validation_plan=validation_plan,
             media_height=media_height,
             media_width=media_width,
         )
@@ -150,7 +155,7 @@ class AnnotationRestValidator(RestApiValidator):
             labels_to_check=self.__get_label_ids_from_video_annotation_range(
                 video_annotation_range_rest=video_annotation_range_rest
             ),
-            existing_labels=[label.id_ for label in label_schema.get_labels(True)],
+            existing_labels={label.id_ for label in label_schema.get_labels(True)},
         )
 
     def __validate_scene_against_schema(
@@ -409,7 +414,7 @@ class AnnotationRestValidator(RestApiValidator):
         self,
         annotation_scene_rest: dict,
         project: Project,
-        label_schema_by_task: dict[ID, LabelSchemaView],
+        validation_plan: AnnotationValidationPlan,
         media_width: int,
         media_height: int,
     ):
@@ -420,19 +425,18 @@ class AnnotationRestValidator(RestApiValidator):
           1. Validate the shape (e.g. not out of bounds)
           2. Validate labels exclusivity
           3. Validate that the annotation is suitable for the task
-          4. Validate that the annotations are unique (ID)
+          4. Validate that the annotations are unique (ID), once for the whole scene
 
         :param annotation_scene_rest: annotation json data
         :param project: project for which to validate the annotation scene
-        :param label_schema_by_task: Dictionary mapping each trainable task node ID to its label schema
+        :param validation_plan: validation plan of the project and its label schemas
         :param media_height: height of the media
         :param media_width: width of the media
         """
-        labels_by_task = {
-            task_node_id: label_schema.get_labels(include_empty=True)
-            for task_node_id, label_schema in label_schema_by_task.items()
-        }
-        for annotation_rest in annotation_scene_rest[ANNOTATIONS]:
+        scene_context = SceneValidationContext(
+            annotation_scene_rest=annotation_scene_rest, media_height=media_height, media_width=media_width
+        )
+        for index, annotation_rest in enumerate(annotation_scene_rest[ANNOTATIONS]):
             self.__validate_shape_bounds(
                 shape=annotation_rest[SHAPE],
                 media_height=media_height,
@@ -440,88 +444,66 @@ class AnnotationRestValidator(RestApiValidator):
             )
 
             self.__validate_labels_exclusivity(
-                annotation_rest=annotation_rest,
-                label_schema_by_task=label_schema_by_task,
+                annotation_label_ids=scene_context.label_ids_per_annotation[index],
+                validation_plan=validation_plan,
             )
 
             self.__validate_annotation_compatibility_with_tasks(
-                annotation_scene_rest=annotation_scene_rest,
                 annotation_rest=annotation_rest,
+                annotation_label_ids=scene_context.label_ids_per_annotation[index],
                 project=project,
+                validation_plan=validation_plan,
+                scene_context=scene_context,
                 media_width=media_width,
                 media_height=media_height,
-                labels_by_task=labels_by_task,  # type: ignore
             )
-            self.__validate_annotations_uniqueness(annotation_scene_rest=annotation_scene_rest)
+            if index == 0:
+                self.__validate_annotations_uniqueness(annotation_scene_rest=annotation_scene_rest)
 
-    def __validate_labels_exclusivity(
-        self, annotation_rest: dict, label_schema_by_task: dict[ID, LabelSchemaView]
-    ) -> None:
+    @staticmethod
+    def __validate_labels_exclusivity(annotation_label_ids: set[ID], validation_plan: AnnotationValidationPlan) -> None:
         """
         Validates that the annotation does not contain mutually exclusive labels.
 
-        :param annotation_rest: annotation json data
-        :param label_schema_by_task: Dictionary mapping each trainable task node ID to its label schema
+        :param annotation_label_ids: IDs of the labels of the annotation
+        :param validation_plan: validation plan of the project and its label schemas
         :raises ConflictingExclusiveLabelsException when groups with conflict are present
         """
-        project_groups = []
-        label_map: dict[ID, Label] = {}
-        label_schema_map: dict[ID, LabelSchemaView] = {}
-        for label_schema in label_schema_by_task.values():
-            for label in label_schema.get_all_labels():
-                label_map[label.id_] = label
-                label_schema_map[label.id_] = label_schema
-            project_groups += label_schema.get_groups(include_empty=True)
-
-        labels_ids_in_annotation: set[ID] = set()
-        for label_rest in annotation_rest[LABELS]:
-            label_id = ID(label_rest[ID_])
-            label = label_map[label_id]
-            label_schema = label_schema_map[label_id]
-            # Add the label ids including their ancestors
-            family_labels = label_schema.label_tree.get_ancestors(label)
-            labels_ids_in_annotation.update([label.id_ for label in family_labels])
-
-        found_labels_by_excl_group: dict[str, set[str]] = {
-            group.name: {
-                group_label.name for group_label in group.labels if group_label.id_ in labels_ids_in_annotation
-            }
-            for group in project_groups
-            if group.group_type == LabelGroupType.EXCLUSIVE
-        }
-        excl_groups_with_multiple_labels = dict(
-            filter(lambda item: len(item[1]) > 1, found_labels_by_excl_group.items())
-        )
+        excl_groups_with_multiple_labels = validation_plan.get_exclusivity_conflicts(label_ids=annotation_label_ids)
         if excl_groups_with_multiple_labels:
             raise ConflictingExclusiveLabelsException(groups_with_conflicts=excl_groups_with_multiple_labels)
 
     def __validate_annotation_compatibility_with_tasks(
         self,
-        annotation_scene_rest: dict,
         annotation_rest: dict,
+        annotation_label_ids: set[ID],
         project: Project,
+        validation_plan: AnnotationValidationPlan,
+        scene_context: SceneValidationContext,
         media_height: int,
         media_width: int,
-        labels_by_task: dict[ID, list[Label]],
     ):
         """
         Validate that the annotation is compatible with the task nodes.
 
-        :param annotation_scene_rest: annotation json data
         :param annotation_rest: given annotation that needs to be validated
+        :param annotation_label_ids: IDs of the labels of the annotation
         :param project: project for which to validate the annotation scene
+        :param validation_plan: validation plan of the project and its label schemas
+        :param scene_context: lookup tables of the annotation scene
         :param media_height: height of the media
         :param media_width: width of the media
-        :param labels_by_task: Dictionary mapping each trainable task node ID to its labels
         :raises NotImplementedError when a task is present that can't be annotated
         """
         previous_task: TaskNode | None = None
         previous_task_labels: list[Label] = []
         for task in project.get_trainable_task_nodes():
-            task_labels = labels_by_task[task.id_]
+            task_plan = validation_plan.task_plans[task.id_]
+            task_labels = task_plan.labels
             if task.task_properties.is_global:
                 self.__validate_global_annotation(
                     annotation_rest=annotation_rest,
+                    annotation_label_ids=annotation_label_ids,
                     task=task,
                     previous_task=previous_task,
                     task_labels=task_labels,
@@ -532,10 +514,11 @@ class AnnotationRestValidator(RestApiValidator):
             elif task.task_properties.task_type.is_local:
                 self.__validate_local_annotation(
                     annotation_rest=annotation_rest,
+                    annotation_label_ids=annotation_label_ids,
                     task=task,
+                    task_plan=task_plan,
                     previous_task=previous_task,
-                    annotation_scene_rest=annotation_scene_rest,
-                    task_labels=task_labels,
+                    scene_context=scene_context,
                     previous_task_labels=previous_task_labels,
                     media_width=media_width,
                     media_height=media_height,
@@ -561,16 +544,17 @@ class AnnotationRestValidator(RestApiValidator):
         annotation_ids = [
             annotation_rest[ID_] for annotation_rest in annotation_scene_rest[ANNOTATIONS] if ID_ in annotation_rest
         ]
-        annotation_ids_set = set(annotation_ids)
-        if not len(annotation_ids) == len(annotation_ids_set):
+        annotation_ids_count = Counter(annotation_ids)
+        if not len(annotation_ids) == len(annotation_ids_count):
             raise DuplicatedAnnotationIDException(
                 f"Using duplicate annotation IDs is not allowed - the following IDs were used "
-                f"multiple times: {[id_ for id_ in annotation_ids_set if annotation_ids.count(id_) > 1]}"
+                f"multiple times: {[id_ for id_, count in annotation_ids_count.items() if count > 1]}"
             )
 
     @staticmethod
-    def __validate_global_annotation(
+    def __validate_global_annotation(  # noqa: PLR0913
         annotation_rest: dict,
+        annotation_label_ids: set[ID],
         task: TaskNode,
         previous_task: TaskNode | None,
         task_labels: list[Label],
@@ -585,6 +569,7 @@ class AnnotationRestValidator(RestApiValidator):
         - If the task is not the first task, the annotation must also contain labels for the previous task.
 
         :param annotation_rest: REST view of the annotation
+        :param annotation_label_ids: IDs of the labels of the annotation
         :param task: TaskNode for which the annotation is checked to be valid
         :param previous_task: TaskNode that precedes the task that is being checked
         :param task_labels: Labels of the task node
@@ -595,7 +580,6 @@ class AnnotationRestValidator(RestApiValidator):
         :return: Skip making checks and return if there are no annotations in the REST view for the task
         :raises BadRequestException: if the annotation is not valid
         """
-        annotation_label_ids = {ID(label_rest[ID_]) for label_rest in annotation_rest[LABELS]}
         annotation_labels_current_task = [label for label in task_labels if label.id_ in annotation_label_ids]
         if len(annotation_labels_current_task) == 0:
             # If the annotation contains no labels for this task, return without doing validation for this task
@@ -628,12 +612,13 @@ class AnnotationRestValidator(RestApiValidator):
             raise BadRequestException("Annotation for a global task is missing a label for the preceding task.")
 
     @staticmethod
-    def __validate_local_annotation(  # noqa: C901, PLR0912, PLR0913
+    def __validate_local_annotation(  # noqa: PLR0913
         annotation_rest: dict,
+        annotation_label_ids: set[ID],
         task: TaskNode,
+        task_plan: TaskValidationPlan,
         previous_task: TaskNode | None,
-        annotation_scene_rest: dict,
-        task_labels: list[Label],
+        scene_context: SceneValidationContext,
         media_width: int,
         media_height: int,
         previous_task_labels: list[Label] | None = None,
@@ -649,43 +634,34 @@ class AnnotationRestValidator(RestApiValidator):
         - If the task is (rotated) detection, shape must be (rotated) rectangle
 
         :param annotation_rest: REST view of the annotation
+        :param annotation_label_ids: IDs of the labels of the annotation
         :param task: TaskNode for which the annotation is checked to be valid
+        :param task_plan: Validation plan of the labels of the task
         :param previous_task: TaskNode that precedes the task that is being checked
-        :param annotation_scene_rest: REST view of the entire annotation scene
-        :param task_labels: Labels of the task node
+        :param scene_context: Lookup tables of the entire annotation scene
         :param previous_task_labels: labels of the previous task node
         :raises BadRequestException: if the annotation is not valid
         """
-        annotation_label_ids = {ID(label_rest[ID_]) for label_rest in annotation_rest[LABELS]}
-        annotation_labels_current_task = [label for label in task_labels if label.id_ in annotation_label_ids]
+        annotation_labels_current_task = [label for label in task_plan.labels if label.id_ in annotation_label_ids]
         if len(annotation_labels_current_task) == 0:
             # If the annotation contains no labels for this task, return without doing validation for this task
             return
 
         # Validate that a background label is not the only label in the annotation scene
-        background_label_ids = {label.id_ for label in task_labels if label.is_background}
-        only_background_labels = True
-        for annotation in annotation_scene_rest[ANNOTATIONS]:
-            label_ids = {ID(label_rest[ID_]) for label_rest in annotation[LABELS]}
-            if background_label_ids != label_ids:
-                only_background_labels = False
-                break
-        if only_background_labels:
+        if scene_context.has_only_background_labels(task_plan):
             raise BadRequestException("It is not allowed to create an annotation with only background labels.")
 
         # Validate that if the task is a local anomaly task, it contains only one of the labels (it's not allowed to
         # have both the normal and the anomalous label).
-        if task.task_properties.is_anomaly and not task.task_properties.is_global:
-            annotation_scene_label_ids: set[ID] = set()
-            for annotation_rest in annotation_scene_rest[ANNOTATIONS]:  # noqa: PLR1704
-                for label_rest in annotation_rest[LABELS]:
-                    annotation_scene_label_ids.add(ID(label_rest[ID_]))
-            task_label_ids = {label.id_ for label in task_labels}
-            if len(annotation_scene_label_ids.intersection(task_label_ids)) > 1:
-                raise BadRequestException(
-                    "It is not allowed to have both the normal and the anomalous label in an annotation scene for "
-                    "local anomaly tasks."
-                )
+        if (
+            task.task_properties.is_anomaly
+            and not task.task_properties.is_global
+            and len(scene_context.scene_label_ids.intersection(task_plan.label_ids)) > 1
+        ):
+            raise BadRequestException(
+                "It is not allowed to have both the normal and the anomalous label in an annotation scene for "
+                "local anomaly tasks."
+            )
 
         is_empty_annotation = any(label.is_empty for label in annotation_labels_current_task)
         if is_empty_annotation:
@@ -709,18 +685,10 @@ class AnnotationRestValidator(RestApiValidator):
                 media_height=media_height,
                 media_width=media_width,
             )
-            non_empty_label_ids = {label.id_ for label in task_labels if not label.is_empty}
-            for annotation in annotation_scene_rest[ANNOTATIONS]:
-                if any(label_rest[ID_] in non_empty_label_ids for label_rest in annotation[LABELS]):
-                    shape = AnnotationRESTViews.shape_from_rest(
-                        annotation[SHAPE],
-                        media_height=media_height,
-                        media_width=media_width,
-                    )
-                    if shape.intersects(empty_shape):
-                        raise BadRequestException(
-                            "Not allowed to create annotation that overlaps with an empty box annotation."
-                        )
+            if scene_context.get_non_empty_shapes_index(task_plan).intersects_any(empty_shape):
+                raise BadRequestException(
+                    "Not allowed to create annotation that overlaps with an empty box annotation."
+                )
 
         AnnotationRestValidator._validate_shape_type(annotation_rest=annotation_rest, task=task)
 
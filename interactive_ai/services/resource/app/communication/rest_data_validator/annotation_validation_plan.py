@@ -0,0 +1,191 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""
+This module implements the lookup tables used by the AnnotationRestValidator, so that the validation of an
+annotation scene is linear in the number of annotations
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+from communication.rest_views.annotation_rest_views import AnnotationRESTViews
+
+from geti_types import ID
+from iai_core.entities.label import Label
+from iai_core.entities.label_schema import LabelGroupType, LabelSchemaView
+from iai_core.entities.project import Project
+from iai_core.utils.spatial_index import ShapeSpatialIndex
+
+ANNOTATIONS = "annotations"
+ID_ = "id"
+LABELS = "labels"
+SHAPE = "shape"
+
+ANNOTATION_VALIDATION_PLAN_CACHE_SIZE = int(os.environ.get("ANNOTATION_VALIDATION_PLAN_CACHE_SIZE", "256"))
+
+
+class TaskValidationPlan:
+    """
+    Lookup tables of the labels of a trainable task node.
+
+    :param task_node_id: ID of the trainable task node
+    :param labels: Labels of the task, including the empty label
+    """
+
+    def __init__(self, task_node_id: ID, labels: list[Label]) -> None:
+        self.task_node_id = task_node_id
+        self.labels = labels
+        self.label_ids = {label.id_ for label in labels}
+        self.non_empty_label_ids = {label.id_ for label in labels if not label.is_empty}
+        self.background_label_ids = {label.id_ for label in labels if label.is_background}
+
+
+class AnnotationValidationPlan:
+    """
+    Validation plan of the annotation scenes of a project, compiled from the label schema of each of its tasks.
+
+    The plan holds the lookup tables that only depend on the label schemas, so that they are computed once per label
+    schema revision instead of once per annotation. Plans are cached by project and label schema revisions, see
+    `AnnotationValidationPlan.get`.
+
+    :param label_schema_by_task: Dictionary mapping each trainable task node ID to its label schema
+    """
+
+    _cache: "OrderedDict[tuple, AnnotationValidationPlan]" = OrderedDict()
+    _cache_lock = threading.Lock()
+
+    def __init__(self, label_schema_by_task: dict[ID, LabelSchemaView]) -> None:
+        self.task_plans = {
+            task_node_id: TaskValidationPlan(
+                task_node_id=task_node_id, labels=label_schema.get_labels(include_empty=True)
+            )
+            for task_node_id, label_schema in label_schema_by_task.items()
+        }
+        self.existing_label_ids = {
+            label.id_ for label_schema in label_schema_by_task.values() for label in label_schema.get_labels(True)
+        }
+        self._label_by_id: dict[ID, Label] = {}
+        self._label_schema_by_label_id: dict[ID, LabelSchemaView] = {}
+        exclusive_groups_labels: dict[str, dict[ID, str]] = {}
+        for label_schema in label_schema_by_task.values():
+            for label in label_schema.get_all_labels():
+                self._label_by_id[label.id_] = label
+                self._label_schema_by_label_id[label.id_] = label_schema
+            for group in label_schema.get_groups(include_empty=True):
+                if group.group_type == LabelGroupType.EXCLUSIVE:
+                    # Groups are identified by name: a group replaces any previous group with the same name
+                    exclusive_groups_labels[group.name] = {label.id_: label.name for label in group.labels}
+        self._exclusive_groups_by_label_id: dict[ID, list[tuple[str, str]]] = {}
+        for group_name, label_names_by_id in exclusive_groups_labels.items():
+            for label_id, label_name in label_names_by_id.items():
+                self._exclusive_groups_by_label_id.setdefault(label_id, []).append((group_name, label_name))
+        self._exclusive_group_rank = {group_name: rank for rank, group_name in enumerate(exclusive_groups_labels)}
+        self._ancestor_ids_by_label_id: dict[ID, list[ID]] = {}
+
+    @classmethod
+    def get(cls, project: Project, label_schema_by_task: dict[ID, LabelSchemaView]) -> "AnnotationValidationPlan":
+        """
+        Get the validation plan for the given project and label schemas, compiling it if not cached yet.
+
+        :param project: Project whose annotation scenes are validated
+        :param label_schema_by_task: Dictionary mapping each trainable task node ID to its label schema
+        :return: AnnotationValidationPlan
+        """
+        # The labels are part of the key too, in case a label schema revision is not persisted yet
+        key = (
+            project.id_,
+            tuple(
+                (task_id, label_schema.id_, tuple(label.id_ for label in label_schema.get_all_labels()))
+                for task_id, label_schema in label_schema_by_task.items()
+            ),
+        )
+        with cls._cache_lock:
+            plan = cls._cache.get(key)
+            if plan is not None:
+                cls._cache.move_to_end(key)
+                return plan
+        plan = cls(label_schema_by_task=label_schema_by_task)
+        with cls._cache_lock:
+            cls._cache[key] = plan
+            while len(cls._cache) > ANNOTATION_VALIDATION_PLAN_CACHE_SIZE:
+                cls._cache.popitem(last=False)
+        return plan
+
+    def get_exclusivity_conflicts(self, label_ids: set[ID]) -> dict[str, set[str]]:
+        """
+        Get the exclusive groups with more than one of the given labels or of their ancestors.
+
+        :param label_ids: IDs of the labels of an annotation
+        :return: Dictionary mapping the name of each group with conflicts to the names of its conflicting labels
+        :raises KeyError: if a label is not part of the label schemas
+        """
+        labels_ids_with_ancestors: set[ID] = set()
+        for label_id in label_ids:
+            labels_ids_with_ancestors.update(self.__get_ancestor_ids(label_id))
+
+        found_labels_by_excl_group: dict[str, set[str]] = {}
+        for label_id in labels_ids_with_ancestors:
+            for group_name, label_name in self._exclusive_groups_by_label_id.get(label_id, ()):
+                found_labels_by_excl_group.setdefault(group_name, set()).add(label_name)
+        conflicting_groups = sorted(
+            (group_name for group_name, label_names in found_labels_by_excl_group.items() if len(label_names) > 1),
+            key=self._exclusive_group_rank.__getitem__,
+        )
+        return {group_name: found_labels_by_excl_group[group_name] for group_name in conflicting_groups}
+
+    def __get_ancestor_ids(self, label_id: ID) -> list[ID]:
+        ancestor_ids = self._ancestor_ids_by_label_id.get(label_id)
+        if ancestor_ids is None:
+            label = self._label_by_id[label_id]
+            label_schema = self._label_schema_by_label_id[label_id]
+            ancestor_ids = [ancestor.id_ for ancestor in label_schema.label_tree.get_ancestors(label)]
+            self._ancestor_ids_by_label_id[label_id] = ancestor_ids
+        return ancestor_ids
+
+
+class SceneValidationContext:
+    """
+    Lookup tables of an annotation scene, computed at most once per scene and shared by its annotations.
+
+    :param annotation_scene_rest: REST view of the annotation scene
+    :param media_height: height of the media
+    :param media_width: width of the media
+    """
+
+    def __init__(self, annotation_scene_rest: dict, media_height: int, media_width: int) -> None:
+        self._annotations_rest: list[dict] = annotation_scene_rest[ANNOTATIONS]
+        self._media_height = media_height
+        self._media_width = media_width
+        self.label_ids_per_annotation = [
+            {ID(label_rest[ID_]) for label_rest in annotation_rest[LABELS]}
+            for annotation_rest in self._annotations_rest
+        ]
+        self.scene_label_ids: set[ID] = set().union(*self.label_ids_per_annotation)
+        self._only_background_labels_by_task: dict[ID, bool] = {}
+        self._non_empty_shapes_index_by_task: dict[ID, ShapeSpatialIndex] = {}
+
+    def has_only_background_labels(self, task_plan: TaskValidationPlan) -> bool:
+        """Whether every annotation of the scene only has the background labels of the task."""
+        task_id = task_plan.task_node_id
+        if task_id not in self._only_background_labels_by_task:
+            self._only_background_labels_by_task[task_id] = all(
+                label_ids == task_plan.background_label_ids for label_ids in self.label_ids_per_annotation
+            )
+        return self._only_background_labels_by_task[task_id]
+
+    def get_non_empty_shapes_index(self, task_plan: TaskValidationPlan) -> ShapeSpatialIndex:
+        """Spatial index of the shapes of the annotations with a non-empty label of the task."""
+        task_id = task_plan.task_node_id
+        if task_id not in self._non_empty_shapes_index_by_task:
+            self._non_empty_shapes_index_by_task[task_id] = ShapeSpatialIndex(
+                [
+                    AnnotationRESTViews.shape_from_rest(
+                        annotation_rest[SHAPE], media_height=self._media_height, media_width=self._media_width
+                    )
+                    for annotation_rest in self._annotations_rest
+                    if any(label_rest[ID_] in task_plan.non_empty_label_ids for label_rest in annotation_rest[LABELS])
+                ]
+            )
+        return self._non_empty_shapes_index_by_task[task_id]
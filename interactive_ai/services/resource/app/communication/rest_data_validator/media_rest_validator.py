@@ -24,6 +24,7 @@ class MediaRestValidator(RestApiValidator):
     SUPPORTED_IMAGE_TYPES = [extension.value for extension in ImageExtensions]
     SUPPORTED_VIDEO_TYPES = [extension.value for extension in VideoExtensions]
     MAX_BYTES_SIZE = 4.7 * 1024**3
+    MAX_N_MEDIA_DELETED = 10000
 
     @staticmethod
     def validate_image_file(request: Request, file: UploadFile) -> UploadFile:
@@ -111,3 +112,28 @@ class MediaRestValidator(RestApiValidator):
                 raise InvalidIDException(id_name="label_id", invalid_id=label_id)
 
         return upload_info_dict
+
+    @staticmethod
+    def validate_media_deletion(request_json: dict | None) -> dict:
+        """
+        Validates the body of a request to delete several media. The body must be of the format
+        {"media": [{"id": MONGO_ID, "type": "image" | "video"}, ...]}
+
+        :param request_json: body of the request to be validated
+        :raises BadRequestException if the body does not have the correct format, or if it lists more than
+        MAX_N_MEDIA_DELETED media
+        :raises InvalidIDException if a media ID is not a well-formed MongoDB ObjectID
+        """
+        media = request_json.get("media") if isinstance(request_json, dict) else None
+        if not isinstance(media, list) or not media:
+            raise BadRequestException("The request body must contain a non-empty 'media' list.")
+        if len(media) > MediaRestValidator.MAX_N_MEDIA_DELETED:
+            raise BadRequestException(
+                f"At most {MediaRestValidator.MAX_N_MEDIA_DELETED} media can be deleted with a single request."
+            )
+        for media_info in media:
+            if not isinstance(media_info, dict) or media_info.get("type") not in ("image", "video"):
+                raise BadRequestException("Each media must be in the format {'id': MONGO_ID, 'type': 'image'|'video'}.")
+            if not ObjectId.is_valid(media_info.get("id")):
+                raise InvalidIDException(id_name="media_id", invalid_id=media_info.get("id"))
+        return request_json
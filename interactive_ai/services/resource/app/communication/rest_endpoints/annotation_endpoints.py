@@ -3,11 +3,12 @@
 import logging
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from starlette import status
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, StreamingResponse
 
 from communication.rest_controllers.annotation_controller import AnnotationRESTController
+from communication.rest_views.annotation_rest_views import COLUMNAR_ANNOTATIONS_MEDIA_TYPE
 
 from geti_fastapi_tools.dependencies import (
     get_annotation_id,
@@ -37,41 +38,61 @@ annotation_router = APIRouter(
 LabelOnly = Annotated[bool, Query(description="If set to true, only returns the label, not the shape.")]
 
 
-@annotation_router.post("/media/images/{image_id}/annotations")
+def _is_columnar(request: Request, header: str) -> bool:
+    """Whether the given 'accept' or 'content-type' header of the request selects the columnar annotations"""
+    return COLUMNAR_ANNOTATIONS_MEDIA_TYPE in request.headers.get(header, "")
+
+
+def _annotation_response(request: Request, result: dict[str, Any]) -> dict[str, Any] | JSONResponse:
+    """Return the annotation REST view with the columnar media type when the client accepts it"""
+    if _is_columnar(request, "accept"):
+        return JSONResponse(result, status_code=status.HTTP_200_OK, media_type=COLUMNAR_ANNOTATIONS_MEDIA_TYPE)
+    return result
+
+
+@annotation_router.post("/media/images/{image_id}/annotations", response_model=None)
 def post_image_annotation(
+    request: Request,
     request_json: Annotated[dict, Depends(get_request_json)],
     dataset_storage_identifier: Annotated[DatasetStorageIdentifier, Depends(get_dataset_storage_identifier)],
     image_id: Annotated[ID, Depends(get_image_id)],
     user_id: ID = Depends(get_user_id_fastapi),  # noqa: FAST002
-) -> dict[str, Any]:
+) -> dict[str, Any] | JSONResponse:
     """Post annotation for an image"""
-    return AnnotationRESTController.make_image_annotation(
+    result = AnnotationRESTController.make_image_annotation(
         dataset_storage_identifier=dataset_storage_identifier,
         image_id=image_id,
         data=request_json,
         user_id=user_id,
+        columnar_data=_is_columnar(request, "content-type"),
+        columnar=_is_columnar(request, "accept"),
     )
+    return _annotation_response(request, result)
 
 
-@annotation_router.get("/media/images/{image_id}/annotations/{annotation_id}")
+@annotation_router.get("/media/images/{image_id}/annotations/{annotation_id}", response_model=None)
 def get_image_annotation(
+    request: Request,
     dataset_storage_identifier: Annotated[DatasetStorageIdentifier, Depends(get_dataset_storage_identifier)],
     image_id: Annotated[ID, Depends(get_image_id)],
     annotation_id: Annotated[ID, Depends(get_annotation_id)],
     label_only: LabelOnly = False,
-) -> dict[str, Any]:
+) -> dict[str, Any] | JSONResponse:
     """Get annotation for an image"""
     media_identifier = ImageIdentifier(image_id=image_id)
-    return AnnotationRESTController.get_annotation(
+    result = AnnotationRESTController.get_annotation(
         dataset_storage_identifier=dataset_storage_identifier,
         annotation_id=annotation_id,
         media_identifier=media_identifier,
         label_only=label_only,
+        columnar=_is_columnar(request, "accept"),
     )
+    return _annotation_response(request, result)
 
 
 @annotation_router.get("/media/videos/{video_id}/annotations/{annotation_id}")
 def get_video_annotations(  # noqa: PLR0913
+    request: Request,
     workspace_id: Annotated[ID, Depends(get_workspace_id)],  # noqa: ARG001
     project_id: Annotated[ID, Depends(get_project_id)],
     dataset_id: Annotated[ID, Depends(get_dataset_id)],
@@ -81,9 +102,9 @@ def get_video_annotations(  # noqa: PLR0913
     start_frame: Annotated[int | None, Query()] = None,
     end_frame: Annotated[int | None, Query()] = None,
     frameskip: Annotated[int, Query(ge=1)] = 1,
-) -> JSONResponse:
+) -> StreamingResponse:
     """Get annotations for a video"""
-    result = AnnotationRESTController.get_video_frame_annotations(
+    chunks = AnnotationRESTController.get_video_frame_annotations(
         project_id=project_id,
         dataset_storage_id=dataset_id,
         video_id=video_id,
@@ -92,46 +113,53 @@ def get_video_annotations(  # noqa: PLR0913
         start_frame=int(start_frame) if start_frame is not None else start_frame,
         end_frame=int(end_frame) if end_frame is not None else end_frame,
         frameskip=int(frameskip),
+        columnar=_is_columnar(request, "accept"),
     )
-    return JSONResponse(result, status_code=status.HTTP_200_OK)
+    media_type = COLUMNAR_ANNOTATIONS_MEDIA_TYPE if _is_columnar(request, "accept") else "application/json"
+    return StreamingResponse(chunks, status_code=status.HTTP_200_OK, media_type=media_type)
 
 
-@annotation_router.post(
-    "/media/videos/{video_id}/frames/{frame_index}/annotations",
-)
+@annotation_router.post("/media/videos/{video_id}/frames/{frame_index}/annotations", response_model=None)
 def post_video_frame_annotation(
+    request: Request,
     request_json: Annotated[dict, Depends(get_request_json)],
     dataset_storage_identifier: Annotated[DatasetStorageIdentifier, Depends(get_dataset_storage_identifier)],
     video_id: Annotated[ID, Depends(get_video_id)],
     frame_index: str,
     user_id: ID = Depends(get_user_id_fastapi),  # noqa: FAST002
-) -> dict[str, Any]:
+) -> dict[str, Any] | JSONResponse:
     """Post annotations for a video frame"""
-    return AnnotationRESTController.make_video_frame_annotation(
+    result = AnnotationRESTController.make_video_frame_annotation(
         dataset_storage_identifier=dataset_storage_identifier,
         video_id=video_id,
         frame_index=int(frame_index),
         data=request_json,
         user_id=user_id,
+        columnar_data=_is_columnar(request, "content-type"),
+        columnar=_is_columnar(request, "accept"),
     )
+    return _annotation_response(request, result)
 
 
-@annotation_router.get("/media/videos/{video_id}/frames/{frame_index}/annotations/{annotation_id}")
+@annotation_router.get("/media/videos/{video_id}/frames/{frame_index}/annotations/{annotation_id}", response_model=None)
 def get_video_frame_annotation(
+    request: Request,
     dataset_storage_identifier: Annotated[DatasetStorageIdentifier, Depends(get_dataset_storage_identifier)],
     video_id: Annotated[ID, Depends(get_video_id)],
     frame_index: str,
     annotation_id: Annotated[ID, Depends(get_annotation_id)],
     label_only: LabelOnly = False,
-) -> dict[str, Any]:
+) -> dict[str, Any] | JSONResponse:
     """Get annotation for a video frame"""
     media_identifier = VideoFrameIdentifier(video_id=video_id, frame_index=int(frame_index))
-    return AnnotationRESTController.get_annotation(
+    result = AnnotationRESTController.get_annotation(
         dataset_storage_identifier=dataset_storage_identifier,
         annotation_id=annotation_id,
         media_identifier=media_identifier,
         label_only=label_only,
+        columnar=_is_columnar(request, "accept"),
     )
+    return _annotation_response(request, result)
 
 
 @annotation_router.get("/media/videos/{video_id}/range_annotation")
@@ -190,6 +190,19 @@ def delete_image(
     )
 
 
+@media_router.post("/media:delete")
+def delete_media(
+    request_json: Annotated[dict, Depends(get_request_json)],
+    dataset_storage_identifier: Annotated[DatasetStorageIdentifier, Depends(get_dataset_storage_identifier)],
+) -> dict[str, Any]:
+    """Delete several images and videos from a dataset"""
+    request_json = MediaRestValidator.validate_media_deletion(request_json)
+    return MediaRESTController.delete_media(
+        dataset_storage_identifier=dataset_storage_identifier,
+        media_rest=request_json["media"],
+    )
+
+
 @media_router.get("/media/videos/{video_id}")
 def get_video_details(
     dataset_storage_identifier: Annotated[DatasetStorageIdentifier, Depends(get_dataset_storage_identifier)],
@@ -2,6 +2,7 @@
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 from __future__ import annotations
 
+import itertools
 import logging
 import math
 import operator
@@ -10,8 +11,9 @@ from enum import IntEnum, auto
 from typing import TYPE_CHECKING, Any
 
 from communication.rest_views.media_identifier_rest_views import MediaIdentifierRESTViews
-from communication.rest_views.scored_label_rest_views import ScoredLabelRESTViews
+from communication.rest_views.scored_label_rest_views import PROBABILITY, SOURCE, ScoredLabelRESTViews
 
+from geti_fastapi_tools.exceptions import BadRequestException
 from geti_telemetry_tools import unified_tracing
 from geti_types import ID
 from iai_core.entities.annotation import Annotation, AnnotationScene, AnnotationSceneKind
@@ -48,6 +50,16 @@ X = "x"
 Y = "y"
 ANGLE = "angle"
 IS_VISIBLE = "is_visible"
+# Columnar representation of the annotations
+COLUMNAR_ANNOTATIONS_MEDIA_TYPE = "application/vnd.geti.annotations.columnar+json"
+IDS = "ids"
+LABEL_TABLE = "label_table"
+LABEL_OFFSETS = "label_offsets"
+LABEL_INDICES = "label_indices"
+LABEL_PROBABILITIES = "label_probabilities"
+SHAPE_TYPES = "shape_types"
+COORDINATE_OFFSETS = "coordinate_offsets"
+COORDINATES = "coordinates"
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +72,16 @@ class RestShapeType(IntEnum):
     KEYPOINT = auto()
 
 
+# Fields of the REST shapes stored in the coordinates of the columnar representation, in order. Polygons store their
+# points instead, as x0, y0, x1, y1, ...
+COLUMNAR_SHAPE_FIELDS: dict[str, tuple[str, ...]] = {
+    RestShapeType.ELLIPSE.name: (X, Y, WIDTH, HEIGHT),
+    RestShapeType.RECTANGLE.name: (X, Y, WIDTH, HEIGHT),
+    RestShapeType.ROTATED_RECTANGLE.name: (X, Y, WIDTH, HEIGHT, ANGLE),
+    RestShapeType.KEYPOINT.name: (X, Y, IS_VISIBLE),
+}
+
+
 class AnnotationRevisitState:
     """
     This class holds various properties related to the AnnotationSceneState which are
@@ -507,24 +529,40 @@ class AnnotationRESTViews:
                 }
             )
         if not label_only:
-            if isinstance(annotation.shape, Ellipse):
-                shape = AnnotationRESTViews.ellipse_shape_to_rest(annotation.shape, media_height, media_width)
-            elif isinstance(annotation.shape, Rectangle):
-                shape = AnnotationRESTViews.rectangle_shape_to_rest(annotation.shape, media_height, media_width)
-            elif isinstance(annotation.shape, Polygon):
-                if not is_rotated_detection:
-                    shape = AnnotationRESTViews._polygon_shape_to_rest(annotation.shape, media_height, media_width)
-                else:
-                    shape = AnnotationRESTViews.rotated_rectangle_shape_to_rest(
-                        annotation.shape, media_height, media_width
-                    )
-            elif isinstance(annotation.shape, Keypoint):
-                shape = AnnotationRESTViews.keypoint_shape_to_rest(annotation.shape, media_height, media_width)
-            else:
-                raise ValueError(f"Shape {annotation.shape.__class__.__name__} is not supported (yet)")
-            result[SHAPE] = shape
+            result[SHAPE] = AnnotationRESTViews.shape_to_rest(
+                annotation.shape, media_height, media_width, is_rotated_detection=is_rotated_detection
+            )
         return result
 
+    @staticmethod
+    def shape_to_rest(
+        shape: Shape | Keypoint,
+        media_height: int,
+        media_width: int,
+        is_rotated_detection: bool = False,
+    ) -> dict:
+        """
+        Serialize a Rectangle, Ellipse, Polygon, or Keypoint shape to its REST view.
+
+        :param shape: the shape to be represented in REST
+        :param media_height: The height in pixels of the media
+        :param media_width: The width in pixels of the media
+        :param is_rotated_detection: if set to true a polygon needs to be converted to
+        a rotated rectangle representation in the rest api
+        :return: REST view of the shape
+        """
+        if isinstance(shape, Ellipse):
+            return AnnotationRESTViews.ellipse_shape_to_rest(shape, media_height, media_width)
+        if isinstance(shape, Rectangle):
+            return AnnotationRESTViews.rectangle_shape_to_rest(shape, media_height, media_width)
+        if isinstance(shape, Polygon):
+            if not is_rotated_detection:
+                return AnnotationRESTViews._polygon_shape_to_rest(shape, media_height, media_width)
+            return AnnotationRESTViews.rotated_rectangle_shape_to_rest(shape, media_height, media_width)
+        if isinstance(shape, Keypoint):
+            return AnnotationRESTViews.keypoint_shape_to_rest(shape, media_height, media_width)
+        raise ValueError(f"Shape {shape.__class__.__name__} is not supported (yet)")
+
     @staticmethod
     def annotation_from_rest(
         data: dict, label_per_id: dict[ID, Label], media_height: int, media_width: int
@@ -587,6 +625,213 @@ class AnnotationRESTViews:
             raise ValueError(f"Shape of kind {shape_type} is not supported (yet)")
         return shape
 
+    @staticmethod
+    def annotations_to_columnar_rest(  # noqa: C901
+        annotations: Sequence[Annotation],
+        media_height: int,
+        media_width: int,
+        annotation_scene_state: AnnotationSceneState | None = None,
+        label_only: bool = False,
+        is_rotated_detection: bool = False,
+        deleted_label_ids: Sequence[ID] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Serialize a list of annotations to the columnar REST representation.
+
+        Instead of one object per annotation, label and polygon point, every field is a flat array with one entry per
+        annotation. The labels of the i-th annotation are the entries of 'label_table' at the positions
+        'label_indices[label_offsets[i]:label_offsets[i + 1]]', with the matching 'label_probabilities'. Its shape is
+        'shape_types[i]', with the values 'coordinates[coordinate_offsets[i]:coordinate_offsets[i + 1]]' laid out as
+        described by COLUMNAR_SHAPE_FIELDS.
+
+        :param annotations: the annotations to be represented in REST
+        :param media_height: The height in pixels of the media
+        :param media_width: The width in pixels of the media
+        :param annotation_scene_state: AnnotationSceneState representing the state of
+            the annotation scene from which the annotations originate. If left as
+            None, the field `labels_to_revisit` will not be added to the response
+        :param label_only: if set to true, do not return the shapes of the annotations
+        :param is_rotated_detection: if set to true a polygon needs to be converted to
+        a rotated rectangle representation in the rest api
+        :param deleted_label_ids: deleted label ids to filter out
+        :return: columnar REST representation of the annotations
+        """
+        deleted_label_ids = [] if deleted_label_ids is None else deleted_label_ids
+
+        ids: list[str] = []
+        modified: list[str] = []
+        label_table: list[dict] = []
+        label_index_by_key: dict[tuple, int] = {}
+        label_offsets = [0]
+        label_indices: list[int] = []
+        label_probabilities: list[float] = []
+        labels_to_revisit: list[list[str]] = []
+        shape_types: list[str] = []
+        coordinate_offsets = [0]
+        coordinates: list[float] = []
+        for annotation in annotations:
+            ids.append(str(annotation.id_))
+            modified.append(annotation.shape.modification_date.isoformat())  # type: ignore
+
+            labels = annotation.get_labels(include_empty=True)
+            if not labels:
+                logger.warning(f"Annotation {annotation.id_} has no labels")
+            for label in labels:
+                if label.id_ in deleted_label_ids:
+                    continue
+                rest_label = ScoredLabelRESTViews.scored_label_to_rest(label)
+                label_probabilities.append(rest_label.pop(PROBABILITY))
+                label_key = (rest_label[ID_], *rest_label[SOURCE].values())
+                if label_key not in label_index_by_key:
+                    label_index_by_key[label_key] = len(label_table)
+                    label_table.append(rest_label)
+                label_indices.append(label_index_by_key[label_key])
+            label_offsets.append(len(label_indices))
+
+            if annotation_scene_state is not None:
+                labels_to_revisit.append(
+                    [
+                        str(label_id)
+                        for label_id in annotation_scene_state.labels_to_revisit_per_annotation[annotation.id_]
+                    ]
+                )
+            if not label_only:
+                shape = annotation.shape
+                if isinstance(shape, Polygon) and not is_rotated_detection:
+                    # Flatten the points directly, this is the bulk of the payload for segmentation projects
+                    shape_types.append(RestShapeType.POLYGON.name)
+                    for point in shape.points:
+                        coordinates.append(round(point.x * media_width))
+                        coordinates.append(round(point.y * media_height))
+                else:
+                    rest_shape = AnnotationRESTViews.shape_to_rest(
+                        shape, media_height, media_width, is_rotated_detection=is_rotated_detection
+                    )
+                    shape_types.append(rest_shape[TYPE])
+                    coordinates.extend(
+                        int(rest_shape[field]) if field == IS_VISIBLE else rest_shape[field]
+                        for field in COLUMNAR_SHAPE_FIELDS[rest_shape[TYPE]]
+                    )
+                coordinate_offsets.append(len(coordinates))
+
+        result: dict[str, Any] = {
+            IDS: ids,
+            MODIFIED: modified,
+            LABEL_TABLE: label_table,
+            LABEL_OFFSETS: label_offsets,
+            LABEL_INDICES: label_indices,
+            LABEL_PROBABILITIES: label_probabilities,
+        }
+        if annotation_scene_state is not None:
+            result[LABELS_TO_REVISIT] = labels_to_revisit
+        if not label_only:
+            result[SHAPE_TYPES] = shape_types
+            result[COORDINATE_OFFSETS] = coordinate_offsets
+            result[COORDINATES] = coordinates
+        return result
+
+    @staticmethod
+    def __validate_columnar_annotations(columnar_annotations: dict) -> None:
+        """
+        Validate that the columns of the columnar REST representation of annotations are consistent with each other.
+        The content of the expanded annotations is validated afterward, like for the JSON representation.
+
+        :param columnar_annotations: columnar REST representation of the annotations
+        :raises BadRequestException: if the columns are missing or inconsistent with each other
+        """
+        required_columns = (LABEL_TABLE, LABEL_OFFSETS, LABEL_INDICES, SHAPE_TYPES, COORDINATE_OFFSETS, COORDINATES)
+        if not all(isinstance(columnar_annotations.get(column), list) for column in required_columns):
+            raise BadRequestException(
+                f"Columnar annotations require the columns {', '.join(required_columns)}, which must be lists."
+            )
+        label_table = columnar_annotations[LABEL_TABLE]
+        label_indices = columnar_annotations[LABEL_INDICES]
+        shape_types = columnar_annotations[SHAPE_TYPES]
+        if not all(isinstance(label, dict) for label in label_table):
+            raise BadRequestException("Label table of the columnar annotations must only contain objects.")
+        if not all(isinstance(shape_type, str) for shape_type in shape_types):
+            raise BadRequestException("Shape types of the columnar annotations must be strings.")
+        expected_length_per_column = {
+            IDS: len(shape_types),
+            MODIFIED: len(shape_types),
+            LABELS_TO_REVISIT: len(shape_types),
+            LABEL_OFFSETS: len(shape_types) + 1,
+            COORDINATE_OFFSETS: len(shape_types) + 1,
+            LABEL_PROBABILITIES: len(label_indices),
+        }
+        for column_name, expected_length in expected_length_per_column.items():
+            column = columnar_annotations.get(column_name)
+            if column is not None and (not isinstance(column, list) or len(column) != expected_length):
+                raise BadRequestException(
+                    f"Column '{column_name}' of the columnar annotations must be a list of {expected_length} items."
+                )
+        for offsets_column, values_column in ((LABEL_OFFSETS, LABEL_INDICES), (COORDINATE_OFFSETS, COORDINATES)):
+            offsets = columnar_annotations[offsets_column]
+            if (
+                not all(isinstance(offset, int) for offset in offsets)
+                or offsets[0] != 0
+                or offsets[-1] != len(columnar_annotations[values_column])
+                or any(start > end for start, end in itertools.pairwise(offsets))
+            ):
+                raise BadRequestException(
+                    f"Column '{offsets_column}' of the columnar annotations must contain increasing integer offsets "
+                    f"from 0 to the length of '{values_column}'."
+                )
+        if not all(isinstance(index, int) and 0 <= index < len(label_table) for index in label_indices):
+            raise BadRequestException("Label indices of the columnar annotations must refer to the label table.")
+
+    @staticmethod
+    def annotations_from_columnar_rest(columnar_annotations: dict) -> list[dict]:
+        """
+        Expand the columnar REST representation of a list of annotations to the REST representation of each
+        annotation, so that it goes through the same validation and deserialization as the JSON representation.
+
+        :param columnar_annotations: columnar REST representation of the annotations
+        :raises BadRequestException: if the columns are missing or inconsistent with each other
+        :return: list with the REST representation of each annotation
+        """
+        AnnotationRESTViews.__validate_columnar_annotations(columnar_annotations)
+        label_table = columnar_annotations[LABEL_TABLE]
+        label_offsets = columnar_annotations[LABEL_OFFSETS]
+        label_indices = columnar_annotations[LABEL_INDICES]
+        label_probabilities = columnar_annotations.get(LABEL_PROBABILITIES)
+        coordinate_offsets = columnar_annotations[COORDINATE_OFFSETS]
+        coordinates = columnar_annotations[COORDINATES]
+        optional_columns = [
+            (key, columnar_annotations[column_name])
+            for column_name, key in ((IDS, ID_), (MODIFIED, MODIFIED), (LABELS_TO_REVISIT, LABELS_TO_REVISIT))
+            if columnar_annotations.get(column_name) is not None
+        ]
+
+        annotations = []
+        for i, shape_type in enumerate(columnar_annotations[SHAPE_TYPES]):
+            shape_coordinates = coordinates[coordinate_offsets[i] : coordinate_offsets[i + 1]]
+            if shape_type == RestShapeType.POLYGON.name and len(shape_coordinates) % 2 == 0:
+                shape = {
+                    TYPE: shape_type,
+                    POINTS: [{X: x, Y: y} for x, y in zip(shape_coordinates[::2], shape_coordinates[1::2])],
+                }
+            elif len(shape_coordinates) == len(COLUMNAR_SHAPE_FIELDS.get(shape_type, ())):
+                shape = {TYPE: shape_type, **dict(zip(COLUMNAR_SHAPE_FIELDS[shape_type], shape_coordinates))}
+                if IS_VISIBLE in shape:
+                    shape[IS_VISIBLE] = bool(shape[IS_VISIBLE])
+            else:
+                raise BadRequestException(
+                    f"Shape {i} of the columnar annotations has {len(shape_coordinates)} coordinates, which does not "
+                    f"match its type '{shape_type}'."
+                )
+            labels = []
+            for j in range(label_offsets[i], label_offsets[i + 1]):
+                label = dict(label_table[label_indices[j]])
+                if label_probabilities is not None:
+                    label[PROBABILITY] = label_probabilities[j]
+                labels.append(label)
+            annotation: dict[str, Any] = {SHAPE: shape, LABELS: labels}
+            for key, column in optional_columns:
+                annotation[key] = column[i]
+            annotations.append(annotation)
+        return annotations
+
     @staticmethod
     def __per_task_annotation_states_to_rest(
         annotation_states_per_task: dict[ID, AnnotationState],
@@ -618,7 +863,7 @@ class AnnotationRESTViews:
 
     @staticmethod
     @unified_tracing
-    def media_2d_annotation_to_rest(
+    def media_2d_annotation_to_rest(  # noqa: PLR0913
         annotation_scene: AnnotationScene,
         annotation_scene_state: AnnotationSceneState | None = None,
         tasks_to_revisit: list[ID] | None = None,
@@ -626,6 +871,7 @@ class AnnotationRESTViews:
         is_rotated_detection: bool = False,
         deleted_label_ids: Sequence[ID] | None = None,
         is_ephemeral: bool = False,
+        columnar: bool = False,
     ) -> dict:
         """
         Returns the REST representation of an Annotation.
@@ -638,6 +884,7 @@ class AnnotationRESTViews:
         :param is_rotated_detection: if the task is rotated detection
         :param is_ephemeral: if set to true, skip rest mapping of media identifier
         :param deleted_label_ids: deleted labels to filter out
+        :param columnar: if set to true, return the annotations in the columnar representation
         :raises ValueError: if annotation does not belong to an Image
         :return: the REST representation of annotation.
         """
@@ -674,6 +921,18 @@ class AnnotationRESTViews:
                 tasks_to_revisit=tasks_to_revisit,
             )
 
+        if columnar:
+            result[ANNOTATIONS] = AnnotationRESTViews.annotations_to_columnar_rest(
+                annotation_scene.annotations,
+                media_height=annotation_scene.media_height,
+                media_width=annotation_scene.media_width,
+                annotation_scene_state=annotation_scene_state,
+                label_only=label_only,
+                is_rotated_detection=is_rotated_detection,
+                deleted_label_ids=deleted_label_ids,
+            )
+            return result
+
         result[ANNOTATIONS] = [
             AnnotationRESTViews.annotation_to_rest(
                 annotation,
@@ -756,7 +1015,7 @@ class AnnotationRESTViews:
 
     @staticmethod
     @unified_tracing
-    def media_2d_annotations_to_rest(
+    def media_2d_annotations_to_rest(  # noqa: PLR0913
         annotation_scenes: Sequence[AnnotationScene],
         annotation_scene_states: Sequence[AnnotationSceneState],
         tasks_to_revisit_per_scene: Sequence[list[ID]],
@@ -764,6 +1023,7 @@ class AnnotationRESTViews:
         label_only: bool = False,
         is_rotated_detection: bool = False,
         deleted_label_ids: Sequence[ID] | None = None,
+        columnar: bool = False,
     ) -> dict[str, Any]:
         """
         Returns the REST representation of a list of annotation scenes, used for video annotations.
@@ -776,6 +1036,7 @@ class AnnotationRESTViews:
         :param is_rotated_detection: if the task is rotated detection
         :param deleted_label_ids: deleted labels to filter out
         :param annotation_properties: video properties of this rest view
+        :param columnar: if set to true, return the annotations of each scene in the columnar representation
         :raises ValueError: if annotation does not belong to an Image
         :return: the REST representation of annotation.
         """
@@ -788,6 +1049,7 @@ class AnnotationRESTViews:
                     tasks_to_revisit=tasks_to_revisit,
                     is_rotated_detection=is_rotated_detection,
                     deleted_label_ids=deleted_label_ids,
+                    columnar=columnar,
                 )
                 for annotation_scene, annotation_scene_state, tasks_to_revisit in zip(
                     annotation_scenes,
@@ -1,7 +1,7 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 import logging
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterator, Mapping, Sequence
 
 from communication.exceptions import AnnotationSceneNotFoundException, AnnotationsNotFoundException
 from service.label_schema_service import LabelSchemaService
@@ -126,14 +126,18 @@ class AnnotationManager:
             labels_to_revisit_full_scene = [set() for _ in range(len(annotation_scenes))]
 
         # Complete annotations with missing labels
-        for annotation_scene in annotation_scenes:
-            for annotation in annotation_scene.annotations:
-                annotation.set_labels(
-                    LabelResolver.complete_labels(label_schema, annotation.get_labels(include_empty=True))
-                )
+        LabelResolver.complete_labels_for_annotations(
+            label_schema,
+            (annotation for annotation_scene in annotation_scenes for annotation in annotation_scene.annotations),
+        )
 
         annotation_scenes_states: list[AnnotationSceneState] = []
         tasks_to_revisit: list[list[ID]] = []
+        task_labels_ids = (
+            AnnotationManager._get_task_labels_ids(project=project, label_schema_by_task=label_schema_by_task)
+            if calculate_task_to_revisit
+            else {}
+        )
         for ann_scenes_chunk, lbl_rev_per_ann_chunk, lbl_rev_full_scene_chunk in zip(
             grouper(annotation_scenes, chunk_size=chunk_size),
             grouper(labels_to_revisit_per_annotation, chunk_size=chunk_size),
@@ -156,15 +160,12 @@ class AnnotationManager:
 
             if calculate_task_to_revisit:
                 # Compute the tasks to revisit in the chunk
-                tasks_to_revisit_chunk = [
-                    AnnotationManager._compute_tasks_to_revisit(
-                        project=project,
-                        annotation_scene_state=ann_scene_state,
-                        label_schema_by_task=label_schema_by_task,
+                tasks_to_revisit.extend(
+                    AnnotationManager._compute_tasks_to_revisit_for_scenes(
+                        annotation_scene_states=ann_scenes_states_chunk,
+                        task_labels_ids=task_labels_ids,
                     )
-                    for ann_scene_state in ann_scenes_states_chunk
-                ]
-                tasks_to_revisit.extend(tasks_to_revisit_chunk)
+                )
 
             # Save annotations and states in the chunk
             ann_scene_repo.save_many(ann_scenes_chunk)
@@ -305,28 +306,80 @@ class AnnotationManager:
             the label schema per task will be fetched from the database.
         :return: list of task id's corresponding to the tasks that need revisiting
         """
-        tasks_to_revisit: list[ID] = []
+        task_labels_ids = AnnotationManager._get_task_labels_ids(
+            project=project, label_schema_by_task=label_schema_by_task
+        )
+        return AnnotationManager._compute_tasks_to_revisit_for_scenes(
+            annotation_scene_states=[annotation_scene_state],
+            task_labels_ids=task_labels_ids,
+        )[0]
+
+    @staticmethod
+    def _get_task_labels_ids(
+        project: Project,
+        label_schema_by_task: Mapping[ID, LabelSchema] | None = None,
+        include_empty: bool = True,
+    ) -> dict[ID, frozenset[ID]]:
+        """
+        Returns the IDs of the labels of each trainable task of the project
+
+        :param project: Project where the tasks are defined
+        :param label_schema_by_task: Optional, dictionary with the label schema for each task node. If not provided,
+            the label schema per task will be fetched from the database.
+        :param include_empty: Whether to include the empty label of the tasks
+        :return: dictionary mapping the ID of each trainable task to the IDs of its labels
+        """
+        task_labels_ids: dict[ID, frozenset[ID]] = {}
         for task in project.get_trainable_task_nodes():
             if label_schema_by_task is None:
                 task_labels = LabelSchemaService.get_latest_labels_for_task(
                     project_identifier=project.identifier,
                     task_node_id=task.id_,
-                    include_empty=True,
+                    include_empty=include_empty,
                 )
-                task_labels_ids = tuple(label.id_ for label in task_labels)
             else:
-                task_labels_ids = tuple(
-                    label.id_ for label in label_schema_by_task[task.id_].get_labels(include_empty=True)
-                )
-            if annotation_scene_state.is_media_to_revisit_for_task(task_labels_ids):
-                tasks_to_revisit.append(task.id_)
-        return tasks_to_revisit
+                task_labels = label_schema_by_task[task.id_].get_labels(include_empty=include_empty)
+            task_labels_ids[task.id_] = frozenset(label.id_ for label in task_labels)
+        return task_labels_ids
+
+    @staticmethod
+    def _compute_tasks_to_revisit_for_scenes(
+        annotation_scene_states: Sequence[AnnotationSceneState],
+        task_labels_ids: Mapping[ID, frozenset[ID]],
+    ) -> list[list[ID]]:
+        """
+        Returns, for each AnnotationSceneState, the ID's of those tasks for which the Annotations in the
+        AnnotationScene described by the state need to be revisited.
+
+        The labels to revisit of each state are collected once and intersected with the labels of every task, which
+        gives the same result as `AnnotationSceneState.is_media_to_revisit_for_task` for each pair of state and task.
+
+        :param annotation_scene_states: AnnotationSceneStates describing the state of the AnnotationScenes
+        :param task_labels_ids: IDs of the labels of each trainable task, see `_get_task_labels_ids`
+        :return: list with, for each state, the task id's corresponding to the tasks that need revisiting
+        """
+        tasks_to_revisit_per_scene: list[list[ID]] = []
+        for annotation_scene_state in annotation_scene_states:
+            labels_to_revisit = set(annotation_scene_state.labels_to_revisit_full_scene)
+            for labels_to_revisit_for_annotation in annotation_scene_state.labels_to_revisit_per_annotation.values():
+                labels_to_revisit.update(labels_to_revisit_for_annotation)
+            tasks_to_revisit_per_scene.append(
+                [
+                    task_id
+                    for task_id, task_labels in task_labels_ids.items()
+                    if not labels_to_revisit.isdisjoint(task_labels)
+                ]
+                if labels_to_revisit
+                else []
+            )
+        return tasks_to_revisit_per_scene
 
     @staticmethod
     def get_annotation_state_information_for_scenes(
         dataset_storage: DatasetStorage,
         annotation_scenes: Sequence[AnnotationScene],
         project: Project,
+        label_schema_by_task: Mapping[ID, LabelSchema] | None = None,
     ) -> tuple[list[AnnotationSceneState], list[list[ID]]]:
         """
         Returns the latest AnnotationSceneState's for a list of AnnotationScene
@@ -336,6 +389,8 @@ class AnnotationManager:
         :param annotation_scenes: list of AnnotationScene instances to get the states
             for
         :param project: Project to which the annotation_scenes belong
+        :param label_schema_by_task: Optional, dictionary with the label schema for each task node. If not provided,
+            the label schema per task will be fetched from the database.
         :return: A tuple containing:
             - A list of AnnotationSceneState for the annotation_scenes. The states are
                 sorted in the same order as the input list in `annotation_scenes`
@@ -351,24 +406,13 @@ class AnnotationManager:
         annotation_scene_states = [
             annotation_scene_states_dict.get(scene.id_, NullAnnotationSceneState()) for scene in annotation_scenes
         ]
-        task_id_to_labels_map = {
-            task.id_: [
-                label.id_
-                for label in LabelSchemaService.get_latest_labels_for_task(
-                    project_identifier=project.identifier,
-                    task_node_id=task.id_,
-                    include_empty=False,
-                )
-            ]
-            for task in project.get_trainable_task_nodes()
-        }
-        tasks_to_revisit_per_scene: list[list[ID]] = []
-        for annotation_scene_state in annotation_scene_states:
-            tasks_to_revisit: list[ID] = []
-            for task_id, task_labels in task_id_to_labels_map.items():
-                if annotation_scene_state.is_media_to_revisit_for_task(task_labels):
-                    tasks_to_revisit.append(task_id)
-            tasks_to_revisit_per_scene.append(tasks_to_revisit)
+        task_labels_ids = AnnotationManager._get_task_labels_ids(
+            project=project, label_schema_by_task=label_schema_by_task, include_empty=False
+        )
+        tasks_to_revisit_per_scene = AnnotationManager._compute_tasks_to_revisit_for_scenes(
+            annotation_scene_states=annotation_scene_states,
+            task_labels_ids=task_labels_ids,
+        )
         return annotation_scene_states, tasks_to_revisit_per_scene
 
     @staticmethod
@@ -419,6 +463,69 @@ class AnnotationManager:
             limit=limit,
         )
 
+    @staticmethod
+    def iter_frame_annotation_scenes(
+        dataset_storage_identifier: DatasetStorageIdentifier,
+        video_id: ID,
+        start_frame: int | None = None,
+        end_frame: int | None = None,
+        frameskip: int = 1,
+        limit: int | None = None,
+    ) -> Iterator[AnnotationScene]:
+        """
+        Iterates over the latest frame annotation scenes of the given video, sorted by frame index.
+
+        The scenes are fetched from the database in batches while iterating, so that long videos can be served
+        without loading all their annotation scenes in memory at once.
+
+        :param dataset_storage_identifier: Identifier of the dataset storage containing the video and annotations
+        :param video_id: ID of the video
+        :param start_frame: If searching within a range of frames, first index of the range (inclusive).
+            A value of None is used to indicate the start of the video.
+        :param end_frame: If searching within a range of frames, last index of the range (inclusive).
+            A value of None is used to indicate the end of the video.
+        :param frameskip: Stride to use for the search; only frames whose indices are multiple
+            of this stride will be considered.
+        :param limit: maximum number of annotation scenes to iterate over
+        :return: Iterator over the annotation scenes
+        """
+        repo = AnnotationSceneRepo(dataset_storage_identifier)
+        return iter(
+            repo.get_video_frame_annotations_cursor_by_video_id(
+                video_id=video_id,
+                start_frame=start_frame,
+                end_frame=end_frame,
+                frame_skip=frameskip,
+                limit=limit,
+            )
+        )
+
+    @staticmethod
+    def count_frame_annotation_scenes(
+        dataset_storage_identifier: DatasetStorageIdentifier,
+        video_id: ID,
+        start_frame: int | None = None,
+        end_frame: int | None = None,
+        frameskip: int = 1,
+    ) -> int:
+        """
+        Counts the annotated frames of the given video, see `iter_frame_annotation_scenes`.
+
+        :param dataset_storage_identifier: Identifier of the dataset storage containing the video and annotations
+        :param video_id: ID of the video
+        :param start_frame: first index of the range of frames to consider (inclusive), or None for the video start
+        :param end_frame: last index of the range of frames to consider (inclusive), or None for the video end
+        :param frameskip: Stride to use for the search
+        :return: number of annotated frames
+        """
+        repo = AnnotationSceneRepo(dataset_storage_identifier)
+        return repo.count_video_frame_annotations_by_video_id(
+            video_id=video_id,
+            start_frame=start_frame,
+            end_frame=end_frame,
+            frame_skip=frameskip,
+        )
+
     @staticmethod
     def _suspend_annotations_by_labels_in_dataset_storage(
         project: Project,
@@ -20,9 +20,11 @@ from geti_telemetry_tools import DEBUG_METRICS, OTLP_METRICS_RECEIVER, TEST_METR
 from geti_telemetry_tools.metrics.instruments import BaseInstrumentAttributes
 from geti_telemetry_tools.metrics.instruments import MetricName as MetricNameBase
 from geti_telemetry_tools.metrics.utils import if_elected_publisher_for_metric
+from iai_core.repos.base.query_monitor import MongoOperation, QueryMonitor
 from iai_core.repos.leader_election_repo import LeaderElectionRepo
 from iai_core.repos.metrics_reporting_model_storage_repo import MetricsReportingModelStorageRepo
 from iai_core.repos.metrics_reporting_project_repo import MetricsReportingProjectRepo
+from media_utils import VideoDecoder
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +41,22 @@ class MetricName:
     MODELS_PER_TASK_TYPE = f"{MODEL_TOTAL_GAUGE}.task_type"
     MODELS_PER_ARCH = f"{MODEL_TOTAL_GAUGE}.architecture"
 
+    THUMBNAIL_VIDEO_BASENAME = f"{MetricNameBase.MEDIA_BASENAME}.thumbnail_video"
+    THUMBNAIL_VIDEO_QUEUE_DEPTH = f"{THUMBNAIL_VIDEO_BASENAME}.queue_depth"
+    THUMBNAIL_VIDEO_JOBS_COUNTER = f"{THUMBNAIL_VIDEO_BASENAME}.jobs_counter"
+    THUMBNAIL_VIDEO_DURATION = f"{THUMBNAIL_VIDEO_BASENAME}.duration"
+
+    VIDEO_READER_POOL_BASENAME = f"{MetricNameBase.MEDIA_BASENAME}.video_reader_pool"
+    VIDEO_READER_POOL_LOOKUPS_COUNTER = f"{VIDEO_READER_POOL_BASENAME}.lookups_counter"
+    VIDEO_READER_POOL_EVICTIONS_COUNTER = f"{VIDEO_READER_POOL_BASENAME}.evictions_counter"
+    VIDEO_READER_POOL_SEEKS_COUNTER = f"{VIDEO_READER_POOL_BASENAME}.seeks_counter"
+    VIDEO_READER_POOL_FRAMES_COUNTER = f"{VIDEO_READER_POOL_BASENAME}.frames_counter"
+
+    MONGODB_BASENAME = f"{MetricNameBase.APPLICATION_BASENAME}.mongodb"
+    MONGODB_OPERATIONS_COUNTER = f"{MONGODB_BASENAME}.operations_counter"
+    MONGODB_OPERATION_DURATION = f"{MONGODB_BASENAME}.operation_duration"
+    MONGODB_OPERATION_DOCUMENTS = f"{MONGODB_BASENAME}.operation_documents"
+
 
 metric_readers: list[MetricReader] = []
 in_memory_metric_reader: InMemoryMetricReader | None = None
@@ -173,6 +191,126 @@ models_total_per_task_type_gauge = meter.create_observable_gauge(
 )
 
 
+thumbnail_video_queue_depth_counter = meter.create_up_down_counter(
+    name=MetricName.THUMBNAIL_VIDEO_QUEUE_DEPTH,
+    description="Number of thumbnail video jobs waiting for or running a transcode",
+    unit="jobs",
+)
+
+thumbnail_video_jobs_counter = meter.create_counter(
+    name=MetricName.THUMBNAIL_VIDEO_JOBS_COUNTER,
+    description="Number of thumbnail video requests, per outcome",
+    unit="jobs",
+)
+
+thumbnail_video_duration_histogram = meter.create_histogram(
+    name=MetricName.THUMBNAIL_VIDEO_DURATION,
+    description="Time to generate a thumbnail video, from the start of the transcode",
+    unit="s",
+)
+
+
+# The video reader pool is local to each process: its statistics are reported by every replica, without election
+def video_reader_pool_lookups_callback(options: CallbackOptions) -> list[Observation]:  # noqa: ARG001
+    """
+    Report the lookups of the video reader pool, per outcome
+    """
+    statistics = VideoDecoder.get_reader_pool_statistics()
+    return [
+        Observation(value=statistics.reader_hits, attributes=VideoReaderPoolLookupAttributes(outcome="hit").to_dict()),
+        Observation(
+            value=statistics.reader_opens, attributes=VideoReaderPoolLookupAttributes(outcome="open").to_dict()
+        ),
+    ]
+
+
+def video_reader_pool_evictions_callback(options: CallbackOptions) -> list[Observation]:  # noqa: ARG001
+    """
+    Report the readers evicted from the video reader pool
+    """
+    return [Observation(value=VideoDecoder.get_reader_pool_statistics().reader_evictions)]
+
+
+def video_reader_pool_seeks_callback(options: CallbackOptions) -> list[Observation]:  # noqa: ARG001
+    """
+    Report the frame requests that required the pooled readers to seek
+    """
+    return [Observation(value=VideoDecoder.get_reader_pool_statistics().seeks)]
+
+
+def video_reader_pool_frames_callback(options: CallbackOptions) -> list[Observation]:  # noqa: ARG001
+    """
+    Report the frames served by the pooled readers, and the frames decoded to reach them
+    """
+    statistics = VideoDecoder.get_reader_pool_statistics()
+    return [
+        Observation(
+            value=statistics.frames_served, attributes=VideoReaderPoolFramesAttributes(frames="served").to_dict()
+        ),
+        Observation(
+            value=statistics.frames_decoded, attributes=VideoReaderPoolFramesAttributes(frames="decoded").to_dict()
+        ),
+    ]
+
+
+video_reader_pool_lookups_counter = meter.create_observable_counter(
+    name=MetricName.VIDEO_READER_POOL_LOOKUPS_COUNTER,
+    description="Number of video reader lookups, served by an open reader ('hit') or opening a new one ('open')",
+    unit="lookups",
+    callbacks=[video_reader_pool_lookups_callback],
+)
+
+video_reader_pool_evictions_counter = meter.create_observable_counter(
+    name=MetricName.VIDEO_READER_POOL_EVICTIONS_COUNTER,
+    description="Number of video readers closed because the pool was full or they were idle for too long",
+    unit="readers",
+    callbacks=[video_reader_pool_evictions_callback],
+)
+
+video_reader_pool_seeks_counter = meter.create_observable_counter(
+    name=MetricName.VIDEO_READER_POOL_SEEKS_COUNTER,
+    description="Number of video frame requests that required a seek in the stream",
+    unit="seeks",
+    callbacks=[video_reader_pool_seeks_callback],
+)
+
+video_reader_pool_frames_counter = meter.create_observable_counter(
+    name=MetricName.VIDEO_READER_POOL_FRAMES_COUNTER,
+    description="Number of video frames served by the pooled readers, and of frames decoded to reach them",
+    unit="frames",
+    callbacks=[video_reader_pool_frames_callback],
+)
+
+
+mongodb_operations_counter = meter.create_counter(
+    name=MetricName.MONGODB_OPERATIONS_COUNTER,
+    description="Number of operations issued to MongoDB by the repos",
+    unit="operations",
+)
+
+mongodb_operation_duration_histogram = meter.create_histogram(
+    name=MetricName.MONGODB_OPERATION_DURATION,
+    description="Time spent waiting for MongoDB per operation, over all the batches of a cursor",
+    unit="s",
+)
+
+mongodb_operation_documents_histogram = meter.create_histogram(
+    name=MetricName.MONGODB_OPERATION_DOCUMENTS,
+    description="Number of documents returned by MongoDB per operation",
+    unit="documents",
+)
+
+
+def record_mongodb_operation(operation: MongoOperation) -> None:
+    """
+    Record a MongoDB operation reported by the QueryMonitor
+    """
+    attributes = MongoDBOperationAttributes(collection=operation.collection, operation=operation.operation).to_dict()
+    mongodb_operations_counter.add(1, attributes)
+    mongodb_operation_duration_histogram.record(operation.duration, attributes)
+    mongodb_operation_documents_histogram.record(operation.documents, attributes)
+
+
 @dataclass
 class ProjectsTotalGaugeAttributes(BaseInstrumentAttributes):
     """
@@ -206,7 +344,65 @@ class ModelPerTypeTotalGaugeAttributes(BaseInstrumentAttributes):
     task_type: str
 
 
+@dataclass
+class ThumbnailVideoQueueAttributes(BaseInstrumentAttributes):
+    """
+    Attributes for the thumbnail video queue depth counter
+
+      - state: 'queued' for the jobs waiting for a transcode slot, 'running' for the jobs being transcoded
+    """
+
+    state: str
+
+
+@dataclass
+class ThumbnailVideoJobAttributes(BaseInstrumentAttributes):
+    """
+    Attributes for the thumbnail video jobs counter
+
+      - status: 'completed', 'failed' or 'deduplicated' (request for a video that already has a pending job)
+    """
+
+    status: str
+
+
+@dataclass
+class VideoReaderPoolLookupAttributes(BaseInstrumentAttributes):
+    """
+    Attributes for the video reader pool lookups counter
+
+      - outcome: 'hit' if the lookup was served by an open reader, 'open' if a new reader was opened
+    """
+
+    outcome: str
+
+
+@dataclass
+class VideoReaderPoolFramesAttributes(BaseInstrumentAttributes):
+    """
+    Attributes for the video reader pool frames counter
+
+      - frames: 'served' for the requested frames, 'decoded' for all the frames decoded to reach them
+    """
+
+    frames: str
+
+
+@dataclass
+class MongoDBOperationAttributes(BaseInstrumentAttributes):
+    """
+    Attributes for the MongoDB operation instruments
+
+      - collection: name of the MongoDB collection
+      - operation: name of the pymongo method, e.g. 'find' or 'update_one'
+    """
+
+    collection: str
+    operation: str
+
+
 def initialize_metrics() -> None:
     """
-    Ensure the metrics module is loaded and async gauges are initialized.
+    Ensure the metrics module is loaded and async gauges are initialized, and record the MongoDB operations.
     """
+    QueryMonitor.add_listener(record_mongodb_operation)
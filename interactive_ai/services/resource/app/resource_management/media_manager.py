@@ -9,6 +9,7 @@ import logging
 import os
 import subprocess
 import tempfile
+from collections.abc import Sequence
 from pathlib import Path
 from typing import BinaryIO
 
@@ -61,6 +62,7 @@ from iai_core.repos.storage.binary_repos import ImageBinaryRepo, ThumbnailBinary
 from iai_core.repos.storage.storage_client import BytesStream
 from iai_core.utils.constants import DEFAULT_THUMBNAIL_SIZE
 from iai_core.utils.deletion_helpers import DeletionHelpers
+from iai_core.utils.iteration import grouper
 from iai_core.utils.media_factory import Media2DFactory
 from media_utils import (
     VideoDecoder,
@@ -68,6 +70,7 @@ from media_utils import (
     VideoFrameOutOfRangeInternalException,
     VideoFrameReader,
     VideoFrameReadingError,
+    VideoMetadataProbeError,
     get_image_numpy,
     get_media_roi_numpy,
 )
@@ -76,6 +79,7 @@ IMAGES = "images"
 VIDEOS = "videos"
 IMAGE = "image"
 VIDEO = "video"
+MEDIA_DELETION_EVENT_CHUNK_SIZE = 20
 
 logger = logging.getLogger(__name__)
 
@@ -749,9 +753,14 @@ class MediaManager:
                     tmp_thumbnail_path,
                 ],
             )
-            # Since this method is usually called from a Kafka event, this needs to complete within 15 minutes so the
-            # Kafka consumer is not kicked out for exceeding the polling interval.
-            exit_code = process.wait(timeout=885)
+            # The transcode holds a slot of the ThumbnailVideoWorker: a stuck ffmpeg process is killed so that the slot
+            # is freed for the other videos.
+            try:
+                exit_code = process.wait(timeout=885)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+                raise
             if exit_code != 0:
                 logger.warning(f"Failed writing thumbnail video for video {video.id_} with exit code: {exit_code}")
             thumbnail_binary_repo.save(
@@ -797,8 +806,9 @@ class MediaManager:
 
         logger.debug(f"Getting video information for video with ID {video_id} with name {binary_filename}.")
         try:
-            info = VideoDecoder.get_video_information(str(video_binary_repo.get_path_or_presigned_url(binary_filename)))
-        except KeyError:
+            video_url = str(video_binary_repo.get_path_or_presigned_url(binary_filename))
+            info = VideoDecoder.get_video_information(video_url)
+        except (KeyError, VideoMetadataProbeError):
             video_binary_repo.delete_by_filename(filename=binary_filename)
             raise InvalidMediaException("Video file can not be read.")
 
@@ -810,6 +820,13 @@ class MediaManager:
                 "The server was not able to read the last frame of the video, "
                 "and it was not able to repair the video"
             )
+        # The repair may have re-encoded the video, so the metadata is fetched only after the check. It comes from the
+        # probe of the video headers done for the video information above, unless the video was repaired.
+        try:
+            metadata = VideoDecoder.get_video_metadata(video_url)
+        except VideoMetadataProbeError:
+            video_binary_repo.delete_by_filename(filename=binary_filename)
+            raise InvalidMediaException("Video file can not be read.")
 
         video = Video(
             id=video_id,
@@ -821,6 +838,7 @@ class MediaManager:
             height=info.height,
             total_frames=info.total_frames,
             size=video_binary_repo.get_object_size(binary_filename),
+            codec=metadata.codec,
             preprocessing=MediaPreprocessing(status=MediaPreprocessingStatus.SCHEDULED)
             if FeatureFlagProvider.is_enabled(FeatureFlag.FEATURE_FLAG_ASYNCHRONOUS_MEDIA_PREPROCESSING)
             else MediaPreprocessing(
@@ -973,6 +991,59 @@ class MediaManager:
             headers_getter=lambda: CTX_SESSION_VAR.get().as_list_bytes(),
         )
 
+    @staticmethod
+    @unified_tracing
+    def delete_media_by_ids(
+        project: Project,
+        dataset_storage: DatasetStorage,
+        image_ids: Sequence[ID],
+        video_ids: Sequence[ID],
+    ) -> tuple[tuple[ID, ...], tuple[ID, ...]]:
+        """
+        Delete several images and videos from a dataset storage.
+
+        The related entities are deleted with one query per collection for each chunk of media. As soon as a chunk
+        is deleted, its media are announced through 'media_deletions' events of at most
+        MEDIA_DELETION_EVENT_CHUNK_SIZE media each, so that a failure in a later chunk does not leave already deleted
+        media unannounced. Media that do not exist are ignored.
+
+        :param project: Project containing the media
+        :param dataset_storage: Dataset storage containing the media
+        :param image_ids: IDs of the images to delete
+        :param video_ids: IDs of the videos to delete
+        :return: Tuple containing the IDs of the images and the IDs of the videos that were deleted
+        :raises ProjectLockedException: if the project is locked
+        """
+        if ProjectRepo().read_lock(project_id=project.id_):
+            raise ProjectLockedException(name=project.name)
+
+        def publish_deleted_media(chunk_image_ids: tuple[ID, ...], chunk_video_ids: tuple[ID, ...]) -> None:
+            deleted_media = [
+                {"media_id": image_id, "media_type": MediaType.IMAGE.value} for image_id in chunk_image_ids
+            ] + [{"media_id": video_id, "media_type": MediaType.VIDEO.value} for video_id in chunk_video_ids]
+            # Publish media deletion events in chunks of max 20 items, to avoid hitting the Kafka message size limit
+            # and also to avoid excessive load on the consumer side.
+            for media_chunk in grouper(deleted_media, chunk_size=MEDIA_DELETION_EVENT_CHUNK_SIZE):
+                body = {
+                    "workspace_id": project.workspace_id,
+                    "project_id": project.id_,
+                    "dataset_storage_id": dataset_storage.id_,
+                    "media": media_chunk,
+                }
+                publish_event(
+                    topic="media_deletions",
+                    body=body,
+                    key=str(dataset_storage.id_).encode(),
+                    headers_getter=lambda: CTX_SESSION_VAR.get().as_list_bytes(),
+                )
+
+        return DeletionHelpers.delete_media_by_ids(
+            dataset_storage=dataset_storage,
+            image_ids=image_ids,
+            video_ids=video_ids,
+            on_chunk_deleted=publish_deleted_media,
+        )
+
     @staticmethod
     def get_first_media(
         dataset_storage_identifier: DatasetStorageIdentifier,
@@ -0,0 +1,201 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""
+This module implements the worker that generates the thumbnail videos, outside of the Kafka consumer thread
+"""
+
+import heapq
+import itertools
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from metrics.instruments import (
+    ThumbnailVideoJobAttributes,
+    ThumbnailVideoQueueAttributes,
+    thumbnail_video_duration_histogram,
+    thumbnail_video_jobs_counter,
+    thumbnail_video_queue_depth_counter,
+)
+from resource_management.media_manager import MediaManager
+
+from geti_telemetry_tools.metrics import EmptyInstrumentAttributes
+from geti_types import CTX_SESSION_VAR, ID, DatasetStorageIdentifier, Session, Singleton, session_context
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of thumbnail videos transcoded at the same time, i.e. of concurrent ffmpeg processes
+THUMBNAIL_VIDEO_MAX_WORKERS = int(os.environ.get("THUMBNAIL_VIDEO_MAX_WORKERS", "2"))
+
+QUEUED = "queued"
+RUNNING = "running"
+
+
+@dataclass(order=True)
+class ThumbnailVideoJob:
+    """
+    Request to generate the thumbnail video of a video. Jobs are ordered by request time, then by submission order.
+
+    :param requested_at: Time of the request, in seconds since the epoch
+    :param sequence: Submission number of the job, to order the jobs requested at the same time
+    :param dataset_storage_identifier: Identifier of the dataset storage containing the video
+    :param video_id: ID of the video
+    :param session: Session of the request, used to run the job
+    """
+
+    requested_at: float
+    sequence: int
+    dataset_storage_identifier: DatasetStorageIdentifier = field(compare=False)
+    video_id: ID = field(compare=False)
+    session: Session = field(compare=False, repr=False)
+
+    @property
+    def key(self) -> tuple[DatasetStorageIdentifier, ID]:
+        """Key identifying the video of the job, used to deduplicate the requests"""
+        return self.dataset_storage_identifier, self.video_id
+
+
+class ThumbnailVideoWorker(metaclass=Singleton):
+    """
+    Generates the thumbnail videos requested through `submit`, with at most `max_workers` transcodes at a time.
+
+    The pending jobs are kept in a priority queue ordered by request time. A dispatcher thread takes the oldest job
+    only when a transcode slot is free, so that a job requested later never overtakes an older one waiting in the
+    executor. A video has at most one pending job: requests for a video that is already queued or being transcoded
+    are dropped.
+
+    :param max_workers: Maximum number of thumbnail videos transcoded at the same time
+    """
+
+    def __init__(self, max_workers: int = THUMBNAIL_VIDEO_MAX_WORKERS) -> None:
+        self._queue: list[ThumbnailVideoJob] = []
+        self._pending_keys: set[tuple[DatasetStorageIdentifier, ID]] = set()
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._free_slots = threading.Semaphore(max_workers)
+        self._stopped = False
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="Thumbnail_video_worker")
+        self._dispatcher = threading.Thread(target=self._dispatch, name="Thumbnail_video_dispatcher", daemon=True)
+        self._dispatcher.start()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of jobs waiting for a transcode slot"""
+        with self._condition:
+            return len(self._queue)
+
+    @property
+    def pending_count(self) -> int:
+        """Number of jobs queued or being transcoded"""
+        with self._condition:
+            return len(self._pending_keys)
+
+    def submit(
+        self, dataset_storage_identifier: DatasetStorageIdentifier, video_id: ID, requested_at: float | None = None
+    ) -> bool:
+        """
+        Queue the generation of the thumbnail video of a video. The job runs with the session of the caller.
+
+        :param dataset_storage_identifier: Identifier of the dataset storage containing the video
+        :param video_id: ID of the video
+        :param requested_at: Time of the request in seconds since the epoch, defaults to now
+        :return: True if the job was queued, False if the video already has a pending job or the worker is stopped
+        """
+        job = ThumbnailVideoJob(
+            requested_at=time.time() if requested_at is None else requested_at,
+            sequence=next(self._sequence),
+            dataset_storage_identifier=dataset_storage_identifier,
+            video_id=video_id,
+            session=CTX_SESSION_VAR.get(),
+        )
+        with self._condition:
+            if self._stopped:
+                logger.warning(f"Thumbnail video worker is stopped, ignoring the request for video {video_id}")
+                return False
+            if job.key in self._pending_keys:
+                logger.debug(f"Thumbnail video of video {video_id} is already pending, ignoring the request")
+                thumbnail_video_jobs_counter.add(1, ThumbnailVideoJobAttributes(status="deduplicated").to_dict())
+                return False
+            heapq.heappush(self._queue, job)
+            self._pending_keys.add(job.key)
+            self._condition.notify_all()
+        thumbnail_video_queue_depth_counter.add(1, ThumbnailVideoQueueAttributes(state=QUEUED).to_dict())
+        return True
+
+    def wait_until_idle(self, timeout: float | None = None) -> bool:
+        """
+        Block until all the pending jobs are done.
+
+        :param timeout: Maximum time to wait in seconds, no limit if None
+        :return: True if the worker is idle, False if the timeout expired
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending_keys, timeout=timeout)
+
+    def stop(self) -> None:
+        """
+        Stop the worker. Queued jobs are dropped: the thumbnail video is requested again when it is found missing.
+        The transcodes in progress are not awaited.
+        """
+        with self._condition:
+            self._stopped = True
+            dropped_jobs = self._queue
+            self._queue = []
+            for job in dropped_jobs:
+                self._pending_keys.discard(job.key)
+            self._condition.notify_all()
+        if dropped_jobs:
+            logger.info(f"Dropping {len(dropped_jobs)} queued thumbnail video jobs")
+            thumbnail_video_queue_depth_counter.add(
+                -len(dropped_jobs), ThumbnailVideoQueueAttributes(state=QUEUED).to_dict()
+            )
+        self._executor.shutdown(wait=False)
+
+    def _dispatch(self) -> None:
+        while True:
+            self._free_slots.acquire()
+            with self._condition:
+                self._condition.wait_for(lambda: self._queue or self._stopped)
+                if self._stopped:
+                    return
+                job = heapq.heappop(self._queue)
+            thumbnail_video_queue_depth_counter.add(-1, ThumbnailVideoQueueAttributes(state=QUEUED).to_dict())
+            thumbnail_video_queue_depth_counter.add(1, ThumbnailVideoQueueAttributes(state=RUNNING).to_dict())
+            try:
+                self._executor.submit(self._run, job)
+            except RuntimeError:
+                # The executor was shut down by `stop` while the job was being dispatched
+                thumbnail_video_queue_depth_counter.add(-1, ThumbnailVideoQueueAttributes(state=RUNNING).to_dict())
+                with self._condition:
+                    self._pending_keys.discard(job.key)
+                return
+
+    def _run(self, job: ThumbnailVideoJob) -> None:
+        start_time = time.perf_counter()
+        status = "completed"
+        try:
+            with session_context(session=job.session):
+                video = MediaManager.get_video_by_id(
+                    dataset_storage_identifier=job.dataset_storage_identifier, video_id=job.video_id
+                )
+                logger.info(f"Creating thumbnail video for video with ID {video.id_}")
+                MediaManager.create_and_save_thumbnail_video(
+                    dataset_storage_identifier=job.dataset_storage_identifier, video=video
+                )
+        except Exception:
+            status = "failed"
+            logger.exception(f"Failed to create the thumbnail video for video with ID {job.video_id}")
+        finally:
+            thumbnail_video_duration_histogram.record(
+                time.perf_counter() - start_time, EmptyInstrumentAttributes().to_dict()
+            )
+            thumbnail_video_jobs_counter.add(1, ThumbnailVideoJobAttributes(status=status).to_dict())
+            thumbnail_video_queue_depth_counter.add(-1, ThumbnailVideoQueueAttributes(state=RUNNING).to_dict())
+            with self._condition:
+                self._pending_keys.discard(job.key)
+                self._condition.notify_all()
+            self._free_slots.release()
@@ -1,25 +1,31 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+import itertools
 import logging
+import os
 
 from managers.annotation_manager import AnnotationManager
 from service.label_schema_service import LabelSchemaService
 
 from geti_telemetry_tools import unified_tracing
-from geti_types import ID, DatasetStorageIdentifier
+from geti_types import ID, DatasetStorageIdentifier, VideoFrameIdentifier
 from iai_core.entities.annotation import Annotation, AnnotationScene, AnnotationSceneKind
 from iai_core.entities.annotation_scene_state import AnnotationSceneState, AnnotationState, NullAnnotationSceneState
 from iai_core.entities.label import Label
+from iai_core.entities.label_schema import LabelSchema
 from iai_core.entities.project import Project
 from iai_core.entities.scored_label import LabelSource, ScoredLabel
 from iai_core.entities.shapes import Rectangle
 from iai_core.entities.video import Video
-from iai_core.entities.video_annotation_range import RangeLabels, VideoAnnotationRange
+from iai_core.entities.video_annotation_range import RangeLabels, RangeLabelsBucket, VideoAnnotationRange
 from iai_core.repos import AnnotationSceneRepo, VideoAnnotationRangeRepo
 from iai_core.utils.identifier_factory import IdentifierFactory
+from iai_core.utils.iteration import grouper
 
 logger = logging.getLogger(__name__)
 
+VIDEO_RANGE_ANNOTATIONS_SAVE_BATCH_SIZE = int(os.environ.get("VIDEO_RANGE_ANNOTATIONS_SAVE_BATCH_SIZE", "1000"))
+
 
 class VideoRangeAnnotationManager:
     @staticmethod
@@ -99,3 +105,130 @@ class VideoRangeAnnotationManager:
                 calculate_task_to_revisit=False,
             )[0]
         return annotation_scene_state.state_per_task
+
+    @staticmethod
+    def get_changed_frame_ranges(
+        old_video_annotation_range: VideoAnnotationRange,
+        new_video_annotation_range: VideoAnnotationRange,
+        total_frames: int,
+    ) -> list[RangeLabelsBucket]:
+        """
+        Compare two video annotation ranges as interval sets, and get the frame ranges where their labels differ.
+
+        The frames are split at the boundaries of the range labels of both annotation ranges, so that the labels are
+        constant within each interval, and each interval is only compared once.
+
+        :param old_video_annotation_range: Previous VideoAnnotationRange of the video
+        :param new_video_annotation_range: New VideoAnnotationRange of the video
+        :param total_frames: Number of frames of the video
+        :return: Frame ranges, in frame order, whose labels differ, with their labels in the new annotation range
+        """
+        boundaries = {0, total_frames}
+        for range_labels in (*old_video_annotation_range.range_labels, *new_video_annotation_range.range_labels):
+            boundaries.update((range_labels.start_frame, range_labels.end_frame + 1))
+        changed_frame_ranges: list[RangeLabelsBucket] = []
+        for start_frame, next_start_frame in itertools.pairwise(sorted(b for b in boundaries if b <= total_frames)):
+            labels_new = new_video_annotation_range.get_labels_at_frame_index(start_frame)
+            if labels_new != old_video_annotation_range.get_labels_at_frame_index(start_frame):
+                changed_frame_ranges.append(
+                    RangeLabelsBucket(start_frame=start_frame, end_frame=next_start_frame - 1, label_ids=labels_new)
+                )
+        return changed_frame_ranges
+
+    @staticmethod
+    @unified_tracing
+    def create_annotations_for_video_range(  # noqa: PLR0913
+        new_video_annotation_range: VideoAnnotationRange,
+        old_video_annotation_range: VideoAnnotationRange,
+        video: Video,
+        project: Project,
+        dataset_storage_identifier: DatasetStorageIdentifier,
+        label_schema: LabelSchema,
+        user_id: ID,
+        skip_frame: int,
+    ) -> None:
+        """
+        Create and save AnnotationScene objects based on a VideoAnnotationRange at the desired stride.
+
+        Key frames (frames whose index is a multiple of the stride) are annotated when their labels differ between
+        the old and new annotation range. Non-key frames are only updated if they are already annotated, in which
+        case they get the labels of the preceding key frame. The existing frame annotations are fetched with a single
+        query, and only the frames that change are saved, in batches.
+
+        :param new_video_annotation_range: VideoAnnotationRange object to use as a reference to create the annotations
+        :param old_video_annotation_range: Previous VideoAnnotationRange object, used to determine which annotations
+            already exist (and can be reused) and which must be created from scratch.
+        :param video: Video relative to the VideoAnnotationRange
+        :param project: Project that contains the video
+        :param dataset_storage_identifier: Identifier of the dataset storage that contains the video
+        :param label_schema: Current LabelSchema for the project
+        :param user_id: ID of the user who submitted the annotation
+        :param skip_frame: interval at which to create annotations
+        """
+        # Key frames whose labels changed
+        label_ids_by_frame_index: dict[int, set[ID]] = {}
+        for changed_frame_range in VideoRangeAnnotationManager.get_changed_frame_ranges(
+            old_video_annotation_range=old_video_annotation_range,
+            new_video_annotation_range=new_video_annotation_range,
+            total_frames=video.total_frames,
+        ):
+            first_key_frame_index = -(-changed_frame_range.start_frame // skip_frame) * skip_frame
+            for key_frame_index in range(first_key_frame_index, changed_frame_range.end_frame + 1, skip_frame):
+                label_ids_by_frame_index[key_frame_index] = changed_frame_range.label_ids
+
+        # Annotated non-key frames whose labels differ from the ones of their key frame
+        ann_scene_repo = AnnotationSceneRepo(dataset_storage_identifier)
+        for frame_index, label_ids in ann_scene_repo.get_video_frame_label_ids_by_video_id(
+            video_id=video.id_,
+            start_frame=0,
+            end_frame=video.total_frames - 1,
+            annotation_kind=AnnotationSceneKind.ANNOTATION,
+        ):
+            if frame_index % skip_frame == 0:
+                continue
+            labels_new = new_video_annotation_range.get_labels_at_frame_index(frame_index - frame_index % skip_frame)
+            if label_ids != labels_new:
+                label_ids_by_frame_index[frame_index] = labels_new
+
+        if not label_ids_by_frame_index:
+            return
+
+        def create_ann_scene_for_frame(frame_index: int, label_ids: set[ID]) -> AnnotationScene:
+            annotations = []
+            if label_ids:
+                scored_labels = [
+                    ScoredLabel(label_id=label_id, probability=1, label_source=label_source) for label_id in label_ids
+                ]
+                annotations = [Annotation(shape=full_box_rect, labels=scored_labels)]
+            return AnnotationScene(
+                kind=AnnotationSceneKind.ANNOTATION,
+                media_identifier=VideoFrameIdentifier(video_id=video.id_, frame_index=frame_index),
+                media_height=video.height,
+                media_width=video.width,
+                id_=AnnotationSceneRepo.generate_id(),
+                last_annotator_id=user_id,
+                annotations=annotations,
+            )
+
+        full_box_rect = Rectangle.generate_full_box()
+        label_source = LabelSource(user_id=user_id)
+        label_schema_by_task = {
+            task_node.id_: LabelSchemaService.get_latest_label_schema_for_task(
+                project_identifier=project.identifier, task_node_id=task_node.id_
+            )
+            for task_node in project.get_trainable_task_nodes()
+        }
+        for frames_batch in grouper(
+            sorted(label_ids_by_frame_index.items()), chunk_size=VIDEO_RANGE_ANNOTATIONS_SAVE_BATCH_SIZE
+        ):
+            AnnotationManager.save_annotations(
+                annotation_scenes=[
+                    create_ann_scene_for_frame(frame_index=frame_index, label_ids=label_ids)
+                    for frame_index, label_ids in frames_batch
+                ],
+                project=project,
+                dataset_storage_identifier=dataset_storage_identifier,
+                label_schema=label_schema,
+                label_schema_by_task=label_schema_by_task,
+                calculate_task_to_revisit=False,
+            )
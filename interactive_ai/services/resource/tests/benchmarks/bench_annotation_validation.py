@@ -0,0 +1,158 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+"""
+Benchmark of the validation of detection annotation scenes of increasing size.
+
+Each synthetic scene contains N boxes spread over the image, each with one of a few exclusive labels. The scene is
+validated with `AnnotationRestValidator.validate_annotation_scene` as the annotation endpoint does, and the median
+duration is reported together with the duration per annotation, which should remain roughly constant as the scene
+grows.
+
+Usage: PYTHONPATH=app:. python tests/benchmarks/bench_annotation_validation.py [--annotations 10 1000 10000]
+"""
+
+import argparse
+import random
+import statistics
+import time
+from datetime import datetime, timezone
+
+from communication.rest_data_validator import AnnotationRestValidator
+
+from geti_types import ID, ImageIdentifier, RequestSource, make_session, session_context
+from iai_core.entities.dataset_storage import DatasetStorage
+from iai_core.entities.label import Domain, Label
+from iai_core.entities.label_schema import LabelGroup, LabelGroupType, LabelSchema, LabelSchemaView
+from iai_core.entities.model_template import TaskFamily, TaskType
+from iai_core.entities.project import Project
+from iai_core.entities.task_graph import TaskEdge, TaskGraph
+from iai_core.entities.task_node import TaskNode, TaskProperties
+from iai_core.repos import LabelSchemaRepo, ProjectRepo
+
+MEDIA_HEIGHT = 1080
+MEDIA_WIDTH = 1920
+
+
+def make_project() -> Project:
+    project_id = ProjectRepo.generate_id()
+    dataset_task = TaskNode(
+        title="Dataset",
+        project_id=project_id,
+        id_=ProjectRepo.generate_id(),
+        task_properties=TaskProperties(
+            task_type=TaskType.DATASET,
+            task_family=TaskFamily.DATASET,
+            is_trainable=False,
+            is_global=False,
+            is_anomaly=False,
+        ),
+    )
+    detection_task = TaskNode(
+        title="Detection",
+        project_id=project_id,
+        id_=ProjectRepo.generate_id(),
+        task_properties=TaskProperties(
+            task_type=TaskType.DETECTION,
+            task_family=TaskFamily.VISION,
+            is_trainable=True,
+            is_global=False,
+            is_anomaly=False,
+        ),
+    )
+    task_graph = TaskGraph()
+    task_graph.add_node(dataset_task)
+    task_graph.add_node(detection_task)
+    task_graph.add_task_edge(TaskEdge(from_task=dataset_task, to_task=detection_task))
+    dataset_storage = DatasetStorage(
+        name="dataset", _id=ProjectRepo.generate_id(), project_id=project_id, use_for_training=True
+    )
+    return Project(
+        id=project_id,
+        creator_id="",
+        name="Benchmark project",
+        description="",
+        user_names=[],
+        task_graph=task_graph,
+        dataset_storages=[dataset_storage],
+        creation_date=datetime.now(tz=timezone.utc),
+    )
+
+
+def make_label_schema_by_task(project: Project, labels_count: int) -> tuple[dict[ID, LabelSchemaView], list[Label]]:
+    labels = [
+        Label(id_=LabelSchemaRepo.generate_id(), name=f"object {index}", domain=Domain.DETECTION)
+        for index in range(labels_count)
+    ]
+    empty_label = Label(id_=LabelSchemaRepo.generate_id(), name="No object", domain=Domain.DETECTION, is_empty=True)
+    label_schema = LabelSchema(
+        id_=LabelSchemaRepo.generate_id(),
+        label_groups=[
+            LabelGroup(name="objects", labels=labels),
+            LabelGroup(name="No object", labels=[empty_label], group_type=LabelGroupType.EMPTY_LABEL),
+        ],
+    )
+    label_schema_view = LabelSchemaView.from_parent(
+        parent_schema=label_schema, labels=label_schema.get_labels(include_empty=True), id_=label_schema.id_
+    )
+    return {project.get_trainable_task_nodes()[0].id_: label_schema_view}, labels
+
+
+def make_annotation_scene_rest(annotations_count: int, labels: list[Label], rng: random.Random) -> dict:
+    annotations = []
+    for _ in range(annotations_count):
+        width, height = rng.randint(4, 100), rng.randint(4, 100)
+        label = rng.choice(labels)
+        annotations.append(
+            {
+                "shape": {
+                    "type": "RECTANGLE",
+                    "x": rng.randint(0, MEDIA_WIDTH - width),
+                    "y": rng.randint(0, MEDIA_HEIGHT - height),
+                    "width": width,
+                    "height": height,
+                },
+                "labels": [{"id": str(label.id_)}],
+            }
+        )
+    return {"annotations": annotations}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--annotations", type=int, nargs="+", default=[10, 1_000, 10_000])
+    parser.add_argument("--labels", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    session = make_session(
+        organization_id=ProjectRepo.generate_id(),
+        workspace_id=ProjectRepo.generate_id(),
+        source=RequestSource.INTERNAL,
+    )
+    with session_context(session=session):
+        project = make_project()
+        label_schema_by_task, labels = make_label_schema_by_task(project, args.labels)
+        media_identifier = ImageIdentifier(image_id=ProjectRepo.generate_id())
+        validator = AnnotationRestValidator()
+        print(f"{'annotations':>12} {'median (ms)':>12} {'per annotation (us)':>20}")
+        for annotations_count in args.annotations:
+            annotation_scene_rest = make_annotation_scene_rest(annotations_count, labels, rng)
+            durations = []
+            for _ in range(args.repeat):
+                start_time = time.perf_counter()
+                validator.validate_annotation_scene(
+                    annotation_scene_rest=annotation_scene_rest,
+                    project=project,
+                    media_identifier=media_identifier,
+                    media_height=MEDIA_HEIGHT,
+                    media_width=MEDIA_WIDTH,
+                    label_schema_by_task=label_schema_by_task,
+                )
+                durations.append(time.perf_counter() - start_time)
+            median = statistics.median(durations)
+            print(f"{annotations_count:>12} {median * 1000:>12.1f} {median / annotations_count * 1e6:>20.1f}")
+
+
+if __name__ == "__main__":
+    main()
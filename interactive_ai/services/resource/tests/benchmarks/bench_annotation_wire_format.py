@@ -0,0 +1,197 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+"""
+Benchmark of the JSON and columnar REST representations of the annotations.
+
+Two payloads are compared: a segmentation image with `--polygons` polygons of `--vertices` points each, and a video
+frame annotation listing of `--frames` frames with `--boxes` rectangles each. For each representation, the benchmark
+reports the size of the encoded payload, the encode time (REST view + json.dumps, as served by GET), the decode time
+of a client (json.loads) and the decode time of the server for a POST (json.loads, expansion of the columnar
+annotations, and deserialization to annotation entities).
+
+Usage: PYTHONPATH=app:. python tests/benchmarks/bench_annotation_wire_format.py [--polygons 50] [--vertices 200]
+    [--frames 500] [--boxes 10] [--repeat 5]
+"""
+
+import argparse
+import json
+import math
+import time
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import MagicMock
+
+from communication.rest_views.annotation_rest_views import ANNOTATIONS, AnnotationRESTViews
+from entities.video_annotation_properties import VideoAnnotationProperties
+
+from geti_types import ID, ImageIdentifier, VideoFrameIdentifier
+from iai_core.entities.annotation import Annotation, AnnotationScene, AnnotationSceneKind
+from iai_core.entities.annotation_scene_state import AnnotationSceneState
+from iai_core.entities.scored_label import ScoredLabel
+from iai_core.entities.shapes import Point, Polygon, Rectangle
+from iai_core.repos import AnnotationSceneRepo
+
+_MEDIA_HEIGHT = 1080
+_MEDIA_WIDTH = 1920
+_LABEL_IDS = [ID(f"60d31793d5f1fb7e6e3c1a{index:02x}") for index in range(4)]
+
+
+def make_annotation_scene(media_identifier: Any, shapes: list) -> tuple[AnnotationScene, AnnotationSceneState]:
+    annotation_scene = AnnotationScene(
+        kind=AnnotationSceneKind.ANNOTATION,
+        media_identifier=media_identifier,
+        media_height=_MEDIA_HEIGHT,
+        media_width=_MEDIA_WIDTH,
+        id_=AnnotationSceneRepo.generate_id(),
+        annotations=[
+            Annotation(
+                shape=shape,
+                labels=[ScoredLabel(label_id=_LABEL_IDS[index % len(_LABEL_IDS)], probability=0.9)],
+                id_=AnnotationSceneRepo.generate_id(),
+            )
+            for index, shape in enumerate(shapes)
+        ],
+    )
+    annotation_scene_state = AnnotationSceneState(
+        media_identifier=media_identifier,
+        annotation_scene_id=annotation_scene.id_,
+        annotation_state_per_task={},
+        unannotated_rois={},
+        id_=AnnotationSceneRepo.generate_id(),
+    )
+    return annotation_scene, annotation_scene_state
+
+
+def make_polygon(index: int, vertices: int) -> Polygon:
+    center_x, center_y, radius = 0.1 + 0.8 * ((index * 37) % 100) / 100, 0.1 + 0.8 * ((index * 61) % 100) / 100, 0.05
+    return Polygon(
+        points=[
+            Point(
+                x=center_x + radius * math.cos(2 * math.pi * vertex / vertices),
+                y=center_y + radius * math.sin(2 * math.pi * vertex / vertices),
+            )
+            for vertex in range(vertices)
+        ]
+    )
+
+
+def time_best(function: Callable[[], Any], repeat: int) -> tuple[float, Any]:
+    """Returns the best duration of `repeat` calls of the function, with its last result."""
+    best_duration = math.inf
+    result = None
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        result = function()
+        best_duration = min(best_duration, time.perf_counter() - start_time)
+    return best_duration, result
+
+
+def parse_annotation_scene(payload: str, columnar: bool, label_per_id: dict) -> AnnotationScene:
+    """Parses a POST body to an annotation scene, as the annotation controller does."""
+    data = json.loads(payload)
+    if columnar:
+        data = {**data, ANNOTATIONS: AnnotationRESTViews.annotations_from_columnar_rest(data[ANNOTATIONS])}
+    annotation_scene, _ = AnnotationRESTViews.media_2d_annotation_from_rest(
+        annotation_dict=data,
+        label_per_id=label_per_id,
+        kind=AnnotationSceneKind.ANNOTATION,
+        last_annotator_id="benchmark",
+        media_identifier=ImageIdentifier(image_id=ID("benchmark")),
+        media_height=_MEDIA_HEIGHT,
+        media_width=_MEDIA_WIDTH,
+    )
+    return annotation_scene
+
+
+def benchmark_segmentation_image(polygons: int, vertices: int, repeat: int) -> dict:
+    annotation_scene, annotation_scene_state = make_annotation_scene(
+        ImageIdentifier(image_id=AnnotationSceneRepo.generate_id()),
+        [make_polygon(index, vertices) for index in range(polygons)],
+    )
+    label_per_id = {label_id: MagicMock(id_=label_id, is_empty=False, is_background=False) for label_id in _LABEL_IDS}
+    result: dict[str, Any] = {"payload": "segmentation_image", "polygons": polygons, "vertices": vertices}
+    for representation in ("json", "columnar"):
+        columnar = representation == "columnar"
+        encode_seconds, payload = time_best(
+            lambda: json.dumps(
+                AnnotationRESTViews.media_2d_annotation_to_rest(
+                    annotation_scene,
+                    annotation_scene_state=annotation_scene_state,
+                    tasks_to_revisit=[],
+                    columnar=columnar,
+                )
+            ),
+            repeat,
+        )
+        decode_seconds, _ = time_best(lambda: json.loads(payload), repeat)
+        post_decode_seconds, parsed_scene = time_best(
+            lambda: parse_annotation_scene(payload, columnar, label_per_id), repeat
+        )
+        if len(parsed_scene.annotations) != polygons:
+            raise RuntimeError(f"The {representation} payload was not decoded correctly")
+        result[f"{representation}_bytes"] = len(payload.encode())
+        result[f"{representation}_encode_ms"] = round(encode_seconds * 1000, 2)
+        result[f"{representation}_decode_ms"] = round(decode_seconds * 1000, 2)
+        result[f"{representation}_post_decode_ms"] = round(post_decode_seconds * 1000, 2)
+    return result
+
+
+def benchmark_video_listing(frames: int, boxes: int, repeat: int) -> dict:
+    video_id = AnnotationSceneRepo.generate_id()
+    scenes_and_states = [
+        make_annotation_scene(
+            VideoFrameIdentifier(video_id=video_id, frame_index=frame_index),
+            [Rectangle(x1=0.01 * box, y1=0.02 * box, x2=0.01 * box + 0.1, y2=0.02 * box + 0.1) for box in range(boxes)],
+        )
+        for frame_index in range(frames)
+    ]
+    annotation_properties = VideoAnnotationProperties(
+        total_count=frames,
+        start_frame=0,
+        end_frame=frames - 1,
+        total_requested_count=frames,
+        requested_start_frame=None,
+        requested_end_frame=None,
+    )
+    result: dict[str, Any] = {"payload": "video_listing", "frames": frames, "boxes": boxes}
+    for representation in ("json", "columnar"):
+        encode_seconds, payload = time_best(
+            lambda: json.dumps(
+                AnnotationRESTViews.media_2d_annotations_to_rest(
+                    annotation_scenes=[scene for scene, _ in scenes_and_states],
+                    annotation_scene_states=[state for _, state in scenes_and_states],
+                    tasks_to_revisit_per_scene=[[] for _ in scenes_and_states],
+                    annotation_properties=annotation_properties,
+                    columnar=representation == "columnar",
+                )
+            ),
+            repeat,
+        )
+        decode_seconds, _ = time_best(lambda: json.loads(payload), repeat)
+        result[f"{representation}_bytes"] = len(payload.encode())
+        result[f"{representation}_encode_ms"] = round(encode_seconds * 1000, 2)
+        result[f"{representation}_decode_ms"] = round(decode_seconds * 1000, 2)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--polygons", type=int, default=50)
+    parser.add_argument("--vertices", type=int, default=200)
+    parser.add_argument("--frames", type=int, default=500)
+    parser.add_argument("--boxes", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs, the best one is reported")
+    args = parser.parse_args()
+
+    for result in (
+        benchmark_segmentation_image(args.polygons, args.vertices, args.repeat),
+        benchmark_video_listing(args.frames, args.boxes, args.repeat),
+    ):
+        result["size_ratio"] = round(result["json_bytes"] / result["columnar_bytes"], 2)
+        result["encode_speedup"] = round(result["json_encode_ms"] / result["columnar_encode_ms"], 2)
+        result["decode_speedup"] = round(result["json_decode_ms"] / result["columnar_decode_ms"], 2)
+        print(json.dumps(result), flush=True)
+
+
+if __name__ == "__main__":
+    main()
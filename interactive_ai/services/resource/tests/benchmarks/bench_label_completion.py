@@ -0,0 +1,181 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+"""
+Benchmark of the label completion and tasks-to-revisit computation of `AnnotationManager.save_annotations`.
+
+Each synthetic batch holds `--scenes` scenes of `--annotations` annotations of a detection -> classification project,
+with one scene out of ten having labels to revisit. 'per_annotation' calls `LabelResolver.complete_labels` for every
+annotation and `AnnotationSceneState.is_media_to_revisit_for_task` for every pair of scene and task, as the manager did
+before; 'batch' runs `LabelResolver.complete_labels_for_annotations` and `_compute_tasks_to_revisit_for_scenes` on the
+whole batch. Both must produce the same labels and tasks to revisit.
+
+Usage: PYTHONPATH=app:. python tests/benchmarks/bench_label_completion.py [--scenes 100 1000 10000] [--annotations 10]
+    [--repeat 5]
+"""
+
+import argparse
+import json
+import math
+import random
+import time
+from unittest.mock import MagicMock
+
+from managers.annotation_manager import AnnotationManager
+
+from geti_types import ID, ImageIdentifier
+from iai_core.entities.annotation import Annotation, AnnotationScene, AnnotationSceneKind
+from iai_core.entities.annotation_scene_state import AnnotationSceneState
+from iai_core.entities.label import Domain, Label
+from iai_core.entities.label_schema import LabelGroup, LabelSchema
+from iai_core.entities.scored_label import LabelSource, ScoredLabel
+from iai_core.entities.shapes import Rectangle
+from iai_core.repos import AnnotationSceneRepo, LabelSchemaRepo
+from iai_core.utils.label_resolver import LabelResolver
+
+
+def make_label_schema(name: str, domain: Domain, labels: int) -> LabelSchema:
+    return LabelSchema(
+        id_=LabelSchemaRepo.generate_id(),
+        label_groups=[
+            LabelGroup(
+                name=name,
+                labels=[
+                    Label(id_=LabelSchemaRepo.generate_id(), name=f"{name} {index}", domain=domain)
+                    for index in range(labels)
+                ],
+            )
+        ],
+    )
+
+
+def make_batch(
+    scenes: int, annotations: int, label_ids: list[ID], rng: random.Random
+) -> tuple[list[AnnotationScene], list[AnnotationSceneState]]:
+    """Returns the annotation scenes of the batch, with a state for each scene."""
+    annotation_scenes = []
+    annotation_scene_states = []
+    for _ in range(scenes):
+        annotation_scene = AnnotationScene(
+            kind=AnnotationSceneKind.ANNOTATION,
+            media_identifier=ImageIdentifier(image_id=AnnotationSceneRepo.generate_id()),
+            media_height=480,
+            media_width=640,
+            id_=AnnotationSceneRepo.generate_id(),
+            annotations=[
+                Annotation(
+                    shape=Rectangle(x1=0.1, y1=0.1, x2=0.2, y2=0.2),
+                    labels=[
+                        ScoredLabel(label_id=label_id, probability=1.0, label_source=LabelSource(user_id="user"))
+                        for label_id in rng.sample(label_ids, k=2)
+                    ],
+                    id_=AnnotationSceneRepo.generate_id(),
+                )
+                for _ in range(annotations)
+            ],
+        )
+        to_revisit = rng.random() < 0.1
+        annotation_scenes.append(annotation_scene)
+        annotation_scene_states.append(
+            AnnotationSceneState(
+                media_identifier=annotation_scene.media_identifier,
+                annotation_scene_id=annotation_scene.id_,
+                annotation_state_per_task={},
+                unannotated_rois={},
+                labels_to_revisit_per_annotation={
+                    annotation.id_: annotation.get_label_ids() if to_revisit else set()
+                    for annotation in annotation_scene.annotations
+                },
+                id_=AnnotationSceneRepo.generate_id(),
+            )
+        )
+    return annotation_scenes, annotation_scene_states
+
+
+def run_per_annotation(
+    annotation_scenes: list[AnnotationScene],
+    annotation_scene_states: list[AnnotationSceneState],
+    label_schema: LabelSchema,
+    label_schema_by_task: dict[ID, LabelSchema],
+) -> list[list[ID]]:
+    for annotation_scene in annotation_scenes:
+        for annotation in annotation_scene.annotations:
+            annotation.set_labels(
+                LabelResolver.complete_labels(label_schema, annotation.get_labels(include_empty=True))
+            )
+    tasks_to_revisit_per_scene = []
+    for annotation_scene_state in annotation_scene_states:
+        tasks_to_revisit = []
+        for task_id, task_label_schema in label_schema_by_task.items():
+            task_labels_ids = tuple(label.id_ for label in task_label_schema.get_labels(include_empty=True))
+            if annotation_scene_state.is_media_to_revisit_for_task(task_labels_ids):
+                tasks_to_revisit.append(task_id)
+        tasks_to_revisit_per_scene.append(tasks_to_revisit)
+    return tasks_to_revisit_per_scene
+
+
+def run_batch(
+    annotation_scenes: list[AnnotationScene],
+    annotation_scene_states: list[AnnotationSceneState],
+    label_schema: LabelSchema,
+    label_schema_by_task: dict[ID, LabelSchema],
+) -> list[list[ID]]:
+    LabelResolver.complete_labels_for_annotations(
+        label_schema,
+        (annotation for annotation_scene in annotation_scenes for annotation in annotation_scene.annotations),
+    )
+    project = MagicMock()
+    project.get_trainable_task_nodes.return_value = [MagicMock(id_=task_id) for task_id in label_schema_by_task]
+    task_labels_ids = AnnotationManager._get_task_labels_ids(project=project, label_schema_by_task=label_schema_by_task)
+    return AnnotationManager._compute_tasks_to_revisit_for_scenes(
+        annotation_scene_states=annotation_scene_states, task_labels_ids=task_labels_ids
+    )
+
+
+def benchmark(scenes: int, annotations: int, repeat: int) -> dict:
+    label_schema_by_task = {
+        ID("detection"): make_label_schema("detection", Domain.DETECTION, labels=3),
+        ID("classification"): make_label_schema("classification", Domain.CLASSIFICATION, labels=5),
+    }
+    label_schema = LabelSchema(
+        id_=LabelSchemaRepo.generate_id(),
+        label_groups=[group for schema in label_schema_by_task.values() for group in schema.get_groups()],
+    )
+    label_ids = [label.id_ for label in label_schema.get_labels(include_empty=False)]
+    result: dict[str, float | int] = {"scenes": scenes, "annotations_per_scene": annotations}
+    outputs = {}
+    for mode, function in (("per_annotation", run_per_annotation), ("batch", run_batch)):
+        best_duration = math.inf
+        for _ in range(repeat):
+            # Completion modifies the annotations: each run gets the same batch, generated from the same seed
+            annotation_scenes, annotation_scene_states = make_batch(scenes, annotations, label_ids, random.Random(0))
+            start_time = time.perf_counter()
+            tasks_to_revisit = function(annotation_scenes, annotation_scene_states, label_schema, label_schema_by_task)
+            best_duration = min(best_duration, time.perf_counter() - start_time)
+        outputs[mode] = (
+            [
+                [annotation.get_labels(include_empty=True) for annotation in scene.annotations]
+                for scene in annotation_scenes
+            ],
+            tasks_to_revisit,
+        )
+        result[f"{mode}_ms"] = round(best_duration * 1000, 2)
+        result[f"{mode}_annotations_per_second"] = round(scenes * annotations / best_duration)
+    if outputs["per_annotation"] != outputs["batch"]:
+        raise RuntimeError(f"The completed labels or tasks to revisit differ for {scenes} scenes")
+    result["speedup"] = round(result["per_annotation_ms"] / result["batch_ms"], 2)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenes", type=int, nargs="+", default=[100, 1_000, 10_000])
+    parser.add_argument("--annotations", type=int, default=10, help="Number of annotations per scene")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs, the best one is reported")
+    args = parser.parse_args()
+
+    for scenes in args.scenes:
+        print(json.dumps(benchmark(scenes, args.annotations, args.repeat)), flush=True)
+
+
+if __name__ == "__main__":
+    main()
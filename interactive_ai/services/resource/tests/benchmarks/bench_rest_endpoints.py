@@ -0,0 +1,375 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+"""
+Regression benchmark of the number of MongoDB operations and the latency of the main REST endpoints.
+
+`--projects` synthetic detection projects are seeded in an in-memory mongomock DB, each with `--images` annotated
+images of `--shapes` boxes. The benchmark then calls, through the FastAPI test client, the media listing, the
+annotation GET and POST (the API saves the annotations with a POST), the dataset statistics and the project listing
+endpoints `--repeats` times after a warm-up call. For each endpoint, it reports the number of MongoDB operations
+counted by `query_budget` and the median latency, and compares them with the baseline file: the benchmark fails if an
+endpoint issues more operations than in the baseline. Since mongomock has no network round-trips, the latency is also
+reported with one round-trip of `--round-trip-ms` added per operation.
+
+The latency depends on the machine, so it is only checked with `--max-latency-ratio`: the latencies are then divided
+by the duration of a fixed CPU-bound calibration workload, measured in the same run, and the benchmark fails if a
+normalized latency grows by more than the given ratio compared with the baseline. The baseline must be recorded with
+the same seeding arguments, with `--update-baseline`.
+
+Usage: PYTHONPATH=app:. python tests/benchmarks/bench_rest_endpoints.py [--projects 3] [--images 100] [--shapes 5]
+    [--repeats 5] [--round-trip-ms 1.0] [--max-latency-ratio 0] [--baseline path] [--update-baseline]
+Run with `make bench-rest-endpoints` from the resource directory.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import statistics
+import time
+from collections import Counter
+from collections.abc import Callable, Generator
+from dataclasses import dataclass
+from unittest.mock import patch
+
+import mongomock
+import mongomock.collection
+from geti_spicedb_tools import SpiceDB
+from mongomock import aggregate
+from starlette.testclient import TestClient
+
+from communication.main import app as resource_app
+
+from geti_fastapi_tools.dependencies import get_source_fastapi, get_user_id_fastapi
+from geti_types import ID, RequestSource, make_session, session_context
+from iai_core.algorithms import ModelTemplateList
+from iai_core.entities.annotation import Annotation, AnnotationScene, AnnotationSceneKind
+from iai_core.entities.annotation_scene_state import AnnotationState
+from iai_core.entities.dataset_storage_filter_data import DatasetStorageFilterData
+from iai_core.entities.image import Image
+from iai_core.entities.label import Label
+from iai_core.entities.media import ImageExtensions, MediaPreprocessing, MediaPreprocessingStatus
+from iai_core.entities.model_template import HyperParameterData, InstantiationType, ModelTemplate, TaskFamily, TaskType
+from iai_core.entities.scored_label import ScoredLabel
+from iai_core.entities.shapes import Rectangle
+from iai_core.repos import AnnotationSceneRepo, AnnotationSceneStateRepo, ImageRepo, LabelSchemaRepo
+from iai_core.repos.base.mongo_connector import MongoConnector
+from iai_core.repos.base.query_monitor import query_budget
+from iai_core.repos.dataset_storage_filter_repo import DatasetStorageFilterRepo
+from iai_core.utils.annotation_scene_state_helper import AnnotationSceneStateHelper
+from iai_core.utils.project_factory import ProjectFactory
+
+_ORGANIZATION_ID = ID("6682a33b-3d18-4dab-abee-f797090480e0")
+_WORKSPACE_ID = ID("60d31793d5f1fb7e6e3c1a01")
+_USER_ID = ID("benchmark_user")
+_DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "bench_rest_endpoints_baseline.json")
+
+
+class InMemoryMongoClient(mongomock.MongoClient):
+    """mongomock client whose sessions do nothing, since mongomock does not support them"""
+
+    def start_session(self, *args, **kwargs) -> contextlib.nullcontext:
+        return contextlib.nullcontext()
+
+
+def first_n(values: list[dict]) -> list:
+    """Accumulator of the '$firstN' group operator, which mongomock does not implement"""
+    return [value["input"] for value in values[: values[0]["n"]]] if values else []
+
+
+@contextlib.contextmanager
+def in_memory_mongodb() -> Generator[None, None, None]:
+    """
+    Redirect the repos to an in-memory mongomock DB. The BSON validation of mongomock is disabled because it does not
+    know the 'standard' UUID representation configured by the MongoConnector, used to store the organization IDs.
+    """
+    with (
+        patch.object(MongoConnector, "get_mongo_client", return_value=InMemoryMongoClient()),
+        patch.object(mongomock.collection, "BSON", None),
+        patch.dict(aggregate._GROUPING_OPERATOR_MAP, {"$firstN": first_n}),
+    ):
+        yield
+
+
+def register_detection_model_template() -> None:
+    ModelTemplateList().register_model_template(
+        ModelTemplate(
+            model_template_id="detection",
+            model_template_path="",
+            name="mock_detection",
+            task_type=TaskType.DETECTION,
+            task_family=TaskFamily.VISION,
+            instantiation=InstantiationType.NONE,
+            hyper_parameters=HyperParameterData(base_path=""),
+            is_default_for_task=True,
+        )
+    )
+
+
+@dataclass
+class SeededProject:
+    project_id: ID
+    dataset_id: ID
+    image_ids: list[ID]
+    labels: list[Label]
+
+
+def make_annotations(labels: list[Label], image_index: int, shapes: int) -> list[Annotation]:
+    annotations = []
+    for shape_index in range(shapes):
+        offset = (image_index + shape_index) % 10 / 20
+        annotations.append(
+            Annotation(
+                shape=Rectangle(x1=offset, y1=offset, x2=offset + 0.4, y2=offset + 0.3),
+                labels=[ScoredLabel(label_id=labels[shape_index % len(labels)].id_, probability=1.0)],
+            )
+        )
+    return annotations
+
+
+def seed_project(index: int, images: int, shapes: int) -> SeededProject:
+    """Creates a detection project whose training dataset contains annotated images, without their binaries"""
+    project = ProjectFactory.create_project_single_task(
+        name=f"Benchmark project {index}",
+        description="",
+        creator_id=_USER_ID,
+        labels=[{"name": "car", "color": "#ff0000ff"}, {"name": "person", "color": "#00ff00ff"}],
+        model_template_id="detection",
+    )
+    dataset_storage = project.get_training_dataset_storage()
+    dataset_storage_identifier = dataset_storage.identifier
+    labels = LabelSchemaRepo(project.identifier).get_latest().get_labels(include_empty=False)
+    image_repo = ImageRepo(dataset_storage_identifier)
+    annotation_scene_repo = AnnotationSceneRepo(dataset_storage_identifier)
+    annotation_scene_state_repo = AnnotationSceneStateRepo(dataset_storage_identifier)
+    dataset_storage_filter_repo = DatasetStorageFilterRepo(dataset_storage_identifier)
+    image_ids = []
+    for image_index in range(images):
+        image = Image(
+            name=f"image {image_index}",
+            uploader_id=_USER_ID,
+            id=ImageRepo.generate_id(),
+            width=640,
+            height=480,
+            size=100_000,
+            extension=ImageExtensions.JPG,
+            preprocessing=MediaPreprocessing(status=MediaPreprocessingStatus.FINISHED),
+        )
+        image_repo.save(image)
+        annotation_scene = AnnotationScene(
+            kind=AnnotationSceneKind.ANNOTATION,
+            media_identifier=image.media_identifier,
+            media_height=image.height,
+            media_width=image.width,
+            id_=AnnotationSceneRepo.generate_id(),
+            annotations=make_annotations(labels=labels, image_index=image_index, shapes=shapes),
+        )
+        annotation_scene_repo.save(annotation_scene)
+        annotation_scene_state_repo.save(
+            AnnotationSceneStateHelper.compute_annotation_scene_state(
+                annotation_scene=annotation_scene, project=project
+            )
+        )
+        dataset_storage_filter_repo.upsert_dataset_storage_filter_data(
+            DatasetStorageFilterData.create_dataset_storage_filter_data(
+                media_identifier=image.media_identifier,
+                media=image,
+                annotation_scene=annotation_scene,
+                media_annotation_state=AnnotationState.ANNOTATED,
+                preprocessing=MediaPreprocessingStatus.FINISHED,
+            )
+        )
+        image_ids.append(image.id_)
+    return SeededProject(project_id=project.id_, dataset_id=dataset_storage.id_, image_ids=image_ids, labels=labels)
+
+
+# Each endpoint is a function returning the method, the URL and the JSON body of the n-th request
+Endpoint = Callable[[int], tuple[str, str, dict | None]]
+
+
+def make_endpoints(project: SeededProject) -> dict[str, Endpoint]:
+    workspace_url = f"/api/v1/organizations/{_ORGANIZATION_ID}/workspaces/{_WORKSPACE_ID}"
+    dataset_url = f"{workspace_url}/projects/{project.project_id}/datasets/{project.dataset_id}"
+
+    def image_url(image_index: int) -> str:
+        return f"{dataset_url}/media/images/{project.image_ids[image_index % len(project.image_ids)]}"
+
+    def annotation_body(request_index: int) -> dict:
+        return {
+            "annotations": [
+                {
+                    "labels": [{"id": str(project.labels[request_index % len(project.labels)].id_)}],
+                    "shape": {"type": "RECTANGLE", "x": 10, "y": 20, "width": 100, "height": 50},
+                }
+            ]
+        }
+
+    return {
+        "media_listing": lambda _: ("post", f"{dataset_url}/media:query?limit=100", {}),
+        "annotation_get": lambda request_index: ("get", f"{image_url(request_index)}/annotations/latest", None),
+        # Each request saves the annotations of another image, starting from the last one
+        "annotation_post": lambda request_index: (
+            "post",
+            f"{image_url(-1 - request_index)}/annotations",
+            annotation_body(request_index),
+        ),
+        "dataset_statistics": lambda _: ("get", f"{dataset_url}/statistics", None),
+        "project_listing": lambda _: ("get", f"{workspace_url}/projects?limit=100", None),
+    }
+
+
+def calibrate(repeats: int) -> float:
+    """
+    Measure the median duration in milliseconds of a fixed CPU-bound workload, similar to the work done by the
+    endpoints on mongomock: building, serializing and parsing documents in pure Python.
+    """
+    documents = [
+        {"_id": str(index), "shape": {"x": index / 7, "y": index / 11}, "labels": [str(index % 3)] * 3}
+        for index in range(2000)
+    ]
+    durations_ms = []
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        parsed = json.loads(json.dumps(documents))
+        sorted(parsed, key=lambda document: document["shape"]["x"] * document["shape"]["y"])
+        durations_ms.append(1000 * (time.perf_counter() - start_time))
+    return statistics.median(durations_ms)
+
+
+def measure(client: TestClient, endpoint: Endpoint, repeats: int, round_trip_ms: float) -> dict:
+    latencies_ms = []
+    counts = []
+    operations: Counter[str] = Counter()
+    # The first request warms up the caches of the process, e.g. of the label schemas, and is not measured
+    for request_index in range(repeats + 1):
+        method, url, body = endpoint(request_index)
+        with query_budget(max_operations=1_000_000) as budget:
+            start_time = time.perf_counter()
+            response = client.request(method, url, json=body)
+            latency_ms = 1000 * (time.perf_counter() - start_time)
+        if response.status_code != 200:
+            raise RuntimeError(f"{method.upper()} {url} returned {response.status_code}: {response.text}")
+        if request_index == 0:
+            continue
+        latencies_ms.append(latency_ms)
+        counts.append(budget.count)
+        # The operations of the last request are reported, to find which collections a regression comes from
+        operations = Counter(f"{collection}.{operation}" for collection, operation in budget.operations)
+    latency_ms = statistics.median(latencies_ms)
+    return {
+        "operations": max(counts),
+        "latency_ms": round(latency_ms, 2),
+        "latency_with_round_trips_ms": round(latency_ms + max(counts) * round_trip_ms, 2),
+        "operations_by_collection": dict(sorted(operations.items())),
+    }
+
+
+def find_regressions(
+    results: dict[str, dict],
+    baseline: dict[str, dict],
+    max_latency_ratio: float,
+    calibration_ms: float,
+    baseline_calibration_ms: float,
+) -> list[str]:
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            regressions.append(f"{name}: missing from the baseline")
+            continue
+        if result["operations"] > baseline[name]["operations"]:
+            regressions.append(
+                f"{name}: {result['operations']} MongoDB operations, {baseline[name]['operations']} in the baseline "
+                f"({result['operations_by_collection']})"
+            )
+        if max_latency_ratio <= 0:
+            continue
+        # Latencies are compared relative to the calibration workload, to factor out the speed of the machine
+        latency_ratio = (result["latency_ms"] / calibration_ms) / (
+            baseline[name]["latency_ms"] / baseline_calibration_ms
+        )
+        if latency_ratio > max_latency_ratio:
+            regressions.append(
+                f"{name}: latency of {result['latency_ms']} ms, {baseline[name]['latency_ms']} ms in the baseline "
+                f"(x{latency_ratio:.2f} after calibration, "
+                f"{calibration_ms:.2f} ms against {baseline_calibration_ms} ms)"
+            )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--projects", type=int, default=3, help="Number of seeded projects")
+    parser.add_argument("--images", type=int, default=100, help="Number of annotated images per project")
+    parser.add_argument("--shapes", type=int, default=5, help="Number of boxes per annotation")
+    parser.add_argument("--repeats", type=int, default=5, help="Number of measured requests per endpoint")
+    parser.add_argument("--round-trip-ms", type=float, default=1.0)
+    parser.add_argument(
+        "--max-latency-ratio",
+        type=float,
+        default=0.0,
+        help="Maximum ratio between the calibrated latency and the baseline one; by default (0), only the number of "
+        "operations is checked",
+    )
+    parser.add_argument("--baseline", default=_DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true", help="Record the results as the new baseline")
+    args = parser.parse_args()
+    seeding = {"projects": args.projects, "images": args.images, "shapes": args.shapes}
+
+    register_detection_model_template()
+    resource_app.dependency_overrides[get_user_id_fastapi] = lambda: _USER_ID
+    resource_app.dependency_overrides[get_source_fastapi] = lambda: RequestSource.UNKNOWN
+    session = make_session(organization_id=_ORGANIZATION_ID, workspace_id=_WORKSPACE_ID, source=RequestSource.INTERNAL)
+    calibration_ms = calibrate(repeats=args.repeats)
+    print(json.dumps({"calibration_ms": round(calibration_ms, 2)}), flush=True)
+    with in_memory_mongodb(), session_context(session=session):
+        start_time = time.perf_counter()
+        projects = [seed_project(index=index, images=args.images, shapes=args.shapes) for index in range(args.projects)]
+        print(json.dumps({**seeding, "seeding_s": round(time.perf_counter() - start_time, 2)}), flush=True)
+        client = TestClient(resource_app)
+        results = {}
+        with (
+            patch.object(
+                SpiceDB, "get_user_projects", return_value=tuple(str(project.project_id) for project in projects)
+            ),
+            # Kafka is not part of the benchmark
+            patch("managers.annotation_manager.publish_event"),
+        ):
+            for name, endpoint in make_endpoints(projects[-1]).items():
+                results[name] = measure(client, endpoint, repeats=args.repeats, round_trip_ms=args.round_trip_ms)
+                print(json.dumps({"endpoint": name, **results[name]}), flush=True)
+
+    if args.update_baseline:
+        baseline_results = {
+            name: {"operations": result["operations"], "latency_ms": result["latency_ms"]}
+            for name, result in results.items()
+        }
+        with open(args.baseline, "w") as baseline_file:
+            json.dump(
+                {"seeding": seeding, "calibration_ms": round(calibration_ms, 2), "endpoints": baseline_results},
+                baseline_file,
+                indent=4,
+            )
+            baseline_file.write("\n")
+        print(f"Baseline written to {args.baseline}", flush=True)
+        return
+
+    with open(args.baseline) as baseline_file:
+        baseline = json.load(baseline_file)
+    if baseline["seeding"] != seeding:
+        raise RuntimeError(
+            f"The baseline was recorded with {baseline['seeding']}, run the benchmark with the same seeding arguments"
+        )
+    regressions = find_regressions(
+        results,
+        baseline["endpoints"],
+        max_latency_ratio=args.max_latency_ratio,
+        calibration_ms=calibration_ms,
+        baseline_calibration_ms=baseline["calibration_ms"],
+    )
+    if regressions:
+        raise RuntimeError("Regressions found against the baseline:\n" + "\n".join(regressions))
+    print("No regression found against the baseline", flush=True)
+
+
+if __name__ == "__main__":
+    main()
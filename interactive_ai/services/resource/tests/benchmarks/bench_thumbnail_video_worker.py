@@ -0,0 +1,184 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+"""
+Benchmark of the generation of the thumbnail videos requested through the 'thumbnail_video_missing' Kafka topic.
+
+`--videos` videos of `--seconds` seconds are generated locally with OpenCV, and each of them is requested twice, as
+happens when the thumbnail is found missing by several requests. 'inline' handles the events one by one on the
+consumer thread, as `ThumbVideoKafkaHandler` did before; 'worker' submits them to a `ThumbnailVideoWorker` with
+`--workers` transcode slots. The benchmark reports the time the consumer thread is blocked per event, the total time
+until all the thumbnail videos are saved and the number of transcodes. ffmpeg must be on the PATH.
+
+Usage: PYTHONPATH=app:. python tests/benchmarks/bench_thumbnail_video_worker.py [--videos 8] [--seconds 20]
+    [--workers 1 2 4]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+from collections.abc import Callable
+from unittest.mock import MagicMock, patch
+
+import cv2
+import numpy as np
+
+from resource_management.media_manager import MediaManager
+from resource_management.thumbnail_video_worker import ThumbnailVideoWorker
+
+from geti_types import ID, DatasetStorageIdentifier, RequestSource, make_session, session_context
+from iai_core.repos.storage.binary_repos import ThumbnailBinaryRepo, VideoBinaryRepo
+
+_DATASET_STORAGE_IDENTIFIER = DatasetStorageIdentifier(
+    workspace_id=ID("60d31793d5f1fb7e6e3c1a01"),
+    project_id=ID("60d31793d5f1fb7e6e3c1a02"),
+    dataset_storage_id=ID("60d31793d5f1fb7e6e3c1a03"),
+)
+
+
+def generate_video(path: str, seconds: int, fps: int = 30, width: int = 1280, height: int = 720) -> None:
+    """Writes a video of a moving gradient, so that the encoder cannot skip the frames"""
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), fps, (width, height))
+    gradient = np.tile(np.linspace(0, 255, width, dtype=np.uint8), (height, 1))
+    for frame_index in range(seconds * fps):
+        frame = np.roll(gradient, shift=frame_index * 8, axis=1)
+        writer.write(cv2.merge([frame, np.flipud(frame), np.full_like(frame, frame_index % 256)]))
+    writer.release()
+
+
+class LocalStorage:
+    """Stores the videos and thumbnail videos in a local directory, in place of the binary repos"""
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        self.transcodes = 0
+
+    def reset(self) -> None:
+        for filename in os.listdir(self.directory):
+            if filename.startswith("thumbnail_"):
+                os.remove(os.path.join(self.directory, filename))
+        self.transcodes = 0
+
+    def exists(self, repo: ThumbnailBinaryRepo, filename: str) -> bool:
+        return os.path.exists(os.path.join(self.directory, filename))
+
+    def create_path_for_temporary_file(self, repo: ThumbnailBinaryRepo, filename: str, make_unique: bool) -> str:
+        self.transcodes += 1
+        return os.path.join(self.directory, f"tmp_{filename}")
+
+    def get_path_or_presigned_url(self, repo: VideoBinaryRepo, filename: str) -> str:
+        return os.path.join(self.directory, filename)
+
+    def save(self, repo: ThumbnailBinaryRepo, data_source: str, remove_source: bool, dst_file_name: str) -> str:
+        os.replace(data_source, os.path.join(self.directory, dst_file_name))
+        return dst_file_name
+
+
+def make_video(video_id: ID, filename: str) -> MagicMock:
+    video = MagicMock(id_=video_id, width=1280, height=720, data_binary_filename=filename)
+    video.thumbnail_video_filename = f"thumbnail_{video_id}.mp4"
+    return video
+
+
+def run_inline(video_ids: list[ID], workers: int) -> tuple[list[float], Callable[[], None]]:
+    """Handles each event on the consumer thread, as the Kafka handler did before"""
+    event_seconds = []
+    for video_id in video_ids:
+        start_time = time.perf_counter()
+        video = MediaManager.get_video_by_id(dataset_storage_identifier=_DATASET_STORAGE_IDENTIFIER, video_id=video_id)
+        MediaManager.create_and_save_thumbnail_video(
+            dataset_storage_identifier=_DATASET_STORAGE_IDENTIFIER, video=video
+        )
+        event_seconds.append(time.perf_counter() - start_time)
+    return event_seconds, lambda: None
+
+
+def run_worker(video_ids: list[ID], workers: int) -> tuple[list[float], Callable[[], None]]:
+    """Submits each event to the worker, then returns a function that waits until all the jobs are done"""
+    worker = ThumbnailVideoWorker(max_workers=workers)
+    event_seconds = []
+    for video_id in video_ids:
+        start_time = time.perf_counter()
+        worker.submit(dataset_storage_identifier=_DATASET_STORAGE_IDENTIFIER, video_id=video_id)
+        event_seconds.append(time.perf_counter() - start_time)
+
+    def wait() -> None:
+        worker.wait_until_idle()
+        worker.stop()
+        ThumbnailVideoWorker._instance = None
+
+    return event_seconds, wait
+
+
+def benchmark(storage: LocalStorage, video_ids: list[ID], mode: str, workers: int) -> dict:
+    storage.reset()
+    # Each video is requested twice in a row
+    requested_video_ids = [video_id for video_id in video_ids for _ in range(2)]
+    run_function = run_worker if mode == "worker" else run_inline
+    start_time = time.perf_counter()
+    event_seconds, wait = run_function(requested_video_ids, workers)
+    wait()
+    total_seconds = time.perf_counter() - start_time
+    missing = [video_id for video_id in video_ids if not storage.exists(None, f"thumbnail_{video_id}.mp4")]
+    if missing:
+        raise RuntimeError(f"The thumbnail videos of {len(missing)} videos were not generated in mode {mode}")
+    return {
+        "mode": mode,
+        "workers": workers if mode == "worker" else 1,
+        "events": len(requested_video_ids),
+        "transcodes": storage.transcodes,
+        "consumer_mean_ms_per_event": round(1000 * sum(event_seconds) / len(event_seconds), 2),
+        "consumer_max_ms_per_event": round(1000 * max(event_seconds), 2),
+        "total_s": round(total_seconds, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--videos", type=int, default=8)
+    parser.add_argument("--seconds", type=int, default=20, help="Duration of each video")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Transcode slots of the worker")
+    args = parser.parse_args()
+    if shutil.which("ffmpeg") is None:
+        raise RuntimeError("ffmpeg is required to run this benchmark")
+
+    with tempfile.TemporaryDirectory() as directory:
+        generate_video(os.path.join(directory, "video.mp4"), seconds=args.seconds)
+        video_ids = [ID(f"{index:024x}") for index in range(args.videos)]
+        storage = LocalStorage(directory)
+        session = make_session(
+            organization_id=ID("60d31793d5f1fb7e6e3c1a04"),
+            workspace_id=_DATASET_STORAGE_IDENTIFIER.workspace_id,
+            source=RequestSource.INTERNAL,
+        )
+        with (
+            session_context(session=session),
+            patch.object(
+                MediaManager,
+                "get_video_by_id",
+                side_effect=lambda dataset_storage_identifier, video_id: make_video(video_id, "video.mp4"),
+            ),
+            patch.object(ThumbnailBinaryRepo, "exists", autospec=True, side_effect=storage.exists),
+            patch.object(
+                ThumbnailBinaryRepo,
+                "create_path_for_temporary_file",
+                autospec=True,
+                side_effect=storage.create_path_for_temporary_file,
+            ),
+            patch.object(ThumbnailBinaryRepo, "save", autospec=True, side_effect=storage.save),
+            patch.object(
+                VideoBinaryRepo,
+                "get_path_or_presigned_url",
+                autospec=True,
+                side_effect=storage.get_path_or_presigned_url,
+            ),
+        ):
+            print(json.dumps(benchmark(storage, video_ids, "inline", workers=1)), flush=True)
+            for workers in args.workers:
+                print(json.dumps(benchmark(storage, video_ids, "worker", workers=workers)), flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+"""
+Benchmark of the video frame annotation listing (GET .../videos/{video_id}/annotations/latest) on long videos.
+
+Each synthetic video has every frame annotated with `--boxes` rectangles. 'buffered' builds the list of annotation
+scenes with their states and the whole REST view before encoding it, as the annotation controller did before;
+'streamed' consumes `AnnotationRESTController.get_video_frame_annotations`, which reads the scenes with a cursor and
+serializes them in chunks. Both must produce the same JSON document. The time to the first byte of the body, the total
+time and the peak Python memory (tracemalloc, in a separate run) are reported.
+
+The database is emulated at the repos: the documents are stored BSON-encoded and decoded when the aggregation result
+is read, in full for the `$facet` query of the buffered mode and in batches of `--batch-size` documents for a cursor,
+like pymongo does. mongomock is not used because its aggregations on 100k documents take minutes. The listing of the
+REST endpoint is limited to 500 frames per page; the benchmark lists the whole video to show how each mode scales.
+
+Usage: PYTHONPATH=app:. python tests/benchmarks/bench_video_frame_annotations_stream.py
+    [--frames 1000 10000 100000] [--boxes 5]
+"""
+
+import argparse
+import datetime
+import json
+import time
+import tracemalloc
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+import bson
+import mongomock
+
+from communication.rest_controllers.annotation_controller import LATEST, AnnotationRESTController
+from communication.rest_views.annotation_rest_views import AnnotationRESTViews
+from entities.video_annotation_properties import VideoAnnotationProperties
+from managers.annotation_manager import AnnotationManager
+from managers.project_manager import ProjectManager
+from service.label_schema_service import LabelSchemaService
+
+from geti_types import ID, RequestSource, VideoFrameIdentifier, make_session, session_context
+from iai_core.entities.annotation import Annotation, AnnotationScene, AnnotationSceneKind
+from iai_core.entities.annotation_scene_state import AnnotationSceneState, AnnotationState
+from iai_core.entities.dataset_storage import DatasetStorage
+from iai_core.entities.label import Domain, Label
+from iai_core.entities.label_schema import LabelGroup, LabelSchema
+from iai_core.entities.scored_label import ScoredLabel
+from iai_core.entities.shapes import Rectangle
+from iai_core.repos import AnnotationSceneRepo, AnnotationSceneStateRepo, LabelSchemaRepo
+from iai_core.repos.base.mongo_connector import MongoConnector
+from iai_core.repos.mappers import IDToMongo
+
+_TASK_ID = ID("60d31793d5f1fb7e6e3c1a01")
+_LABEL_ID = ID("60d31793d5f1fb7e6e3c1a02")
+_PROJECT_ID = ID("60d31793d5f1fb7e6e3c1a03")
+_DATASET_STORAGE_ID = ID("60d31793d5f1fb7e6e3c1a04")
+_VIDEO_ID = ID("60d31793d5f1fb7e6e3c1a05")
+_CREATION_DATE = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def make_id(kind: int, frame_index: int, box: int = 0) -> ID:
+    """Deterministic ObjectId, so that both modes list the same documents"""
+    return ID(f"{kind:08x}{frame_index:08x}{box:08x}")
+
+
+class EmulatedCursor:
+    """Minimal pymongo CommandCursor over the decoded documents"""
+
+    def __init__(self, documents: Iterator[dict]) -> None:
+        self._documents = documents
+        self.alive = True
+
+    def __iter__(self) -> "EmulatedCursor":
+        return self
+
+    def __next__(self) -> dict:
+        try:
+            return next(self._documents)
+        except StopIteration:
+            self.alive = False
+            raise
+
+    next = __next__
+
+
+class EmulatedDatabase:
+    """Stores the BSON documents of the scenes and states, and answers the aggregations of the listing"""
+
+    def __init__(self, batch_size: int) -> None:
+        self.batch_size = batch_size
+        self.scene_documents: list[bytes] = []
+        self.state_documents: dict[object, bytes] = {}
+
+    def _decode_in_batches(self, documents: list[bytes]) -> Iterator[dict]:
+        for start in range(0, len(documents), self.batch_size):
+            yield from [bson.decode(document) for document in documents[start : start + self.batch_size]]
+
+    def aggregate_scenes(self, repo: AnnotationSceneRepo, pipeline: list[dict], collation=None) -> EmulatedCursor:
+        last_stage = pipeline[-1]
+        if "$count" in last_stage:
+            return EmulatedCursor(iter([{"count": len(self.scene_documents)}]))
+        if "$facet" in last_stage:
+            limit_stages = [stage for stage in last_stage["$facet"]["annotation_scenes"] if "$limit" in stage]
+            limit = limit_stages[0]["$limit"] if limit_stages else None
+            annotation_scenes = [{"annotation": bson.decode(document)} for document in self.scene_documents[:limit]]
+            return EmulatedCursor(
+                iter([{"annotation_scenes": annotation_scenes, "count": [{"count": len(self.scene_documents)}]}])
+            )
+        limit_stages = [stage for stage in pipeline if "$limit" in stage]
+        limit = limit_stages[0]["$limit"] if limit_stages else None
+        return EmulatedCursor(self._decode_in_batches(self.scene_documents[:limit]))
+
+    def aggregate_states(self, repo: AnnotationSceneStateRepo, pipeline: list[dict], collation=None) -> EmulatedCursor:
+        scene_ids = pipeline[0]["$match"]["annotation_scene_id"]["$in"]
+        documents = [self.state_documents[scene_id] for scene_id in scene_ids]
+        return EmulatedCursor({"annotation_scene_state": document} for document in self._decode_in_batches(documents))
+
+
+def seed(database: EmulatedDatabase, dataset_storage: DatasetStorage, video_id: ID, frames: int, boxes: int) -> None:
+    scene_repo = AnnotationSceneRepo(dataset_storage.identifier)
+    state_repo = AnnotationSceneStateRepo(dataset_storage.identifier)
+    for frame_index in range(frames):
+        annotation_scene = AnnotationScene(
+            kind=AnnotationSceneKind.ANNOTATION,
+            media_identifier=VideoFrameIdentifier(video_id=video_id, frame_index=frame_index),
+            media_height=1080,
+            media_width=1920,
+            id_=make_id(1, frame_index),
+            creation_date=_CREATION_DATE,
+            annotations=[
+                Annotation(
+                    shape=Rectangle(
+                        x1=0.1 * box, y1=0.05, x2=0.1 * box + 0.08, y2=0.3, modification_date=_CREATION_DATE
+                    ),
+                    labels=[ScoredLabel(label_id=_LABEL_ID, probability=1.0)],
+                    id_=make_id(2, frame_index, box),
+                )
+                for box in range(boxes)
+            ],
+        )
+        annotation_scene_state = AnnotationSceneState(
+            media_identifier=annotation_scene.media_identifier,
+            annotation_scene_id=annotation_scene.id_,
+            annotation_state_per_task={_TASK_ID: AnnotationState.ANNOTATED},
+            unannotated_rois={},
+            id_=make_id(3, frame_index),
+        )
+        database.scene_documents.append(bson.encode(scene_repo.forward_map(annotation_scene)))
+        database.state_documents[IDToMongo.forward(annotation_scene.id_)] = bson.encode(
+            state_repo.forward_map(annotation_scene_state)
+        )
+
+
+def list_buffered(project: MagicMock, dataset_storage: DatasetStorage, video_id: ID, limit: int) -> Iterator[str]:
+    """Builds the whole REST view, then encodes it, as the annotation controller did before"""
+    annotation_scenes, total_matching_annotation_scenes = AnnotationManager.get_filtered_frame_annotation_scenes(
+        dataset_storage_identifier=dataset_storage.identifier, video_id=video_id, frameskip=1, limit=limit
+    )
+    annotation_scene_states, tasks_to_revisit_per_scene = AnnotationManager.get_annotation_state_information_for_scenes(
+        dataset_storage=dataset_storage, annotation_scenes=annotation_scenes, project=project
+    )
+    result = AnnotationRESTViews.media_2d_annotations_to_rest(
+        annotation_scenes=annotation_scenes,
+        annotation_scene_states=annotation_scene_states,
+        tasks_to_revisit_per_scene=tasks_to_revisit_per_scene,
+        annotation_properties=VideoAnnotationProperties(
+            total_count=len(annotation_scenes),
+            start_frame=annotation_scenes[0].media_identifier.frame_index,  # type: ignore[attr-defined]
+            end_frame=annotation_scenes[-1].media_identifier.frame_index,  # type: ignore[attr-defined]
+            total_requested_count=total_matching_annotation_scenes,
+            requested_start_frame=None,
+            requested_end_frame=None,
+        ),
+    )
+    # Same encoding as the JSONResponse that served the view
+    yield json.dumps(result, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":"))
+
+
+def list_streamed(project: MagicMock, dataset_storage: DatasetStorage, video_id: ID, limit: int) -> Iterator[str]:
+    return AnnotationRESTController.get_video_frame_annotations(
+        project_id=project.id_,
+        dataset_storage_id=dataset_storage.id_,
+        video_id=video_id,
+        annotation_id=ID(LATEST),
+        label_only=False,
+        frameskip=1,
+        limit_annotations=limit,
+    )
+
+
+def run(
+    frames: int, boxes: int, batch_size: int, streamed: bool, measure_memory: bool
+) -> tuple[float, float, float, str]:
+    """
+    Seeds the emulated database, then consumes the response body of the listing like a server writing it to a socket.
+
+    :return: time to the first byte, total time, peak memory in MB (0 if not measured) and the body
+    """
+    database = EmulatedDatabase(batch_size=batch_size)
+    label = Label(name="task label", domain=Domain.DETECTION, id_=_LABEL_ID)
+    task_label_schema = LabelSchema(id_=LabelSchemaRepo.generate_id(), label_groups=[LabelGroup("group", [label])])
+    project = MagicMock()
+    project.id_ = _PROJECT_ID
+    project.get_trainable_task_nodes.return_value = [MagicMock(id_=_TASK_ID)]
+    dataset_storage = DatasetStorage(
+        name="dataset", _id=_DATASET_STORAGE_ID, project_id=project.id_, use_for_training=True
+    )
+    video_id = _VIDEO_ID
+    list_function = list_streamed if streamed else list_buffered
+    with (
+        patch.object(MongoConnector, "get_mongo_client", return_value=mongomock.MongoClient()),
+        patch.object(AnnotationSceneRepo, "aggregate_read", autospec=True, side_effect=database.aggregate_scenes),
+        patch.object(AnnotationSceneStateRepo, "aggregate_read", autospec=True, side_effect=database.aggregate_states),
+        patch.object(ProjectManager, "get_project_by_id", return_value=project),
+        patch.object(ProjectManager, "get_dataset_storage_by_id", return_value=dataset_storage),
+        patch.object(LabelSchemaRepo, "get_deleted_label_ids", return_value=[]),
+        patch.object(LabelSchemaService, "get_latest_label_schema_for_task", return_value=task_label_schema),
+    ):
+        seed(database, dataset_storage, video_id, frames, boxes)
+        if measure_memory:
+            tracemalloc.start()
+        start_time = time.perf_counter()
+        first_byte_seconds = 0.0
+        chunks = []
+        for index, chunk in enumerate(list_function(project, dataset_storage, video_id, frames)):
+            if index == 0:
+                first_byte_seconds = time.perf_counter() - start_time
+            encoded_chunk = chunk.encode()
+            # A server sends and releases each chunk: the body is only kept for the parity check, outside of the
+            # memory measurement
+            if not measure_memory:
+                chunks.append(encoded_chunk)
+        duration = time.perf_counter() - start_time
+        peak_mb = 0.0
+        if measure_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            peak_mb = peak / 2**20
+    return first_byte_seconds, duration, peak_mb, b"".join(chunks).decode()
+
+
+def benchmark(frames: int, boxes: int, batch_size: int) -> dict:
+    result: dict[str, float | int] = {"frames": frames, "boxes": boxes}
+    bodies = {}
+    for mode in ("buffered", "streamed"):
+        first_byte, duration, _, bodies[mode] = run(frames, boxes, batch_size, mode == "streamed", measure_memory=False)
+        result[f"{mode}_first_byte_ms"] = round(first_byte * 1000, 1)
+        result[f"{mode}_total_ms"] = round(duration * 1000, 1)
+    if json.loads(bodies["buffered"]) != json.loads(bodies["streamed"]):
+        raise RuntimeError(f"The listings of the video with {frames} frames differ")
+    result["body_mb"] = round(len(bodies["streamed"].encode()) / 2**20, 1)
+    del bodies
+    for mode in ("buffered", "streamed"):
+        _, _, peak_mb, _ = run(frames, boxes, batch_size, mode == "streamed", measure_memory=True)
+        result[f"{mode}_peak_mb"] = round(peak_mb, 1)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--boxes", type=int, default=5, help="Number of rectangles per frame")
+    parser.add_argument("--batch-size", type=int, default=101, help="Number of documents per batch of the cursors")
+    args = parser.parse_args()
+
+    session = make_session(
+        organization_id=LabelSchemaRepo.generate_id(),
+        workspace_id=LabelSchemaRepo.generate_id(),
+        source=RequestSource.INTERNAL,
+    )
+    with session_context(session=session):
+        for frames in args.frames:
+            print(json.dumps(benchmark(frames, args.boxes, args.batch_size)), flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+"""
+Benchmark of the propagation of a video annotation range to the frame annotations, on videos of 1k to 100k frames.
+
+Each synthetic video has its key frames annotated by a previous annotation range covering the whole video, plus a
+fraction of annotated non-key frames. The new annotation range changes the label of the second half of the video.
+'per_key_frame' queries the non-key frame annotations after each key frame, as the annotation controller did before;
+'streamed' runs `VideoRangeAnnotationManager.create_annotations_for_video_range`, which diffs the annotation ranges
+and fetches the frame annotations with a single query. Saving the annotations is left out, and both modes must select
+the same frames. Each mode runs on a fresh in-memory mongomock DB, which has no network round-trips: the time is also
+reported with one round-trip of `--round-trip-ms` added per query.
+
+Usage: PYTHONPATH=app:. python tests/benchmarks/bench_video_range_propagation.py [--frames 1000 10000 100000]
+    [--skip-frame 30] [--round-trip-ms 1.0]
+"""
+
+import argparse
+import json
+import random
+import time
+from typing import cast
+from unittest.mock import MagicMock, patch
+
+import mongomock
+
+from managers.annotation_manager import AnnotationManager
+from resource_management import VideoRangeAnnotationManager
+from service.label_schema_service import LabelSchemaService
+
+from geti_types import (
+    CTX_SESSION_VAR,
+    ID,
+    DatasetStorageIdentifier,
+    RequestSource,
+    VideoFrameIdentifier,
+    make_session,
+    session_context,
+)
+from iai_core.entities.annotation import Annotation, AnnotationScene, AnnotationSceneKind
+from iai_core.entities.scored_label import ScoredLabel
+from iai_core.entities.shapes import Rectangle
+from iai_core.entities.video import Video
+from iai_core.entities.video_annotation_range import RangeLabels, VideoAnnotationRange
+from iai_core.repos import AnnotationSceneRepo
+from iai_core.repos.base.mongo_connector import MongoConnector
+
+_LABEL_A = ID("60d31793d5f1fb7e6e3c1a4f")
+_LABEL_B = ID("60d31793d5f1fb7e6e3c1a50")
+
+
+def make_frame_annotation_scene(video_id: ID, frame_index: int, label_id: ID) -> AnnotationScene:
+    return AnnotationScene(
+        kind=AnnotationSceneKind.ANNOTATION,
+        media_identifier=VideoFrameIdentifier(video_id=video_id, frame_index=frame_index),
+        media_height=480,
+        media_width=640,
+        id_=AnnotationSceneRepo.generate_id(),
+        annotations=[
+            Annotation(shape=Rectangle.generate_full_box(), labels=[ScoredLabel(label_id=label_id, probability=1)])
+        ],
+    )
+
+
+def propagate_per_key_frame(
+    repo: AnnotationSceneRepo,
+    new_video_ann_range: VideoAnnotationRange,
+    old_video_ann_range: VideoAnnotationRange,
+    video: Video,
+    skip_frame: int,
+) -> list[int]:
+    """Selects the frames to annotate with one query per key frame, as the annotation controller did before."""
+    frame_indices = []
+    for key_frame_index in range(0, video.total_frames, skip_frame):
+        labels_new = new_video_ann_range.get_labels_at_frame_index(key_frame_index)
+        if labels_new != old_video_ann_range.get_labels_at_frame_index(key_frame_index):
+            frame_indices.append(key_frame_index)
+        non_key_annotations, _ = repo.get_video_frame_annotations_by_video_id(
+            video_id=video.id_,
+            start_frame=key_frame_index + 1,
+            end_frame=min(key_frame_index + skip_frame, video.total_frames) - 1,
+            annotation_kind=AnnotationSceneKind.ANNOTATION,
+        )
+        for non_key_ann_scene in non_key_annotations:
+            if non_key_ann_scene.get_label_ids(include_empty=True) != labels_new:
+                frame_indices.append(cast("VideoFrameIdentifier", non_key_ann_scene.media_identifier).frame_index)
+    return frame_indices
+
+
+def run(frames: int, skip_frame: int, non_key_fraction: float, streamed: bool) -> tuple[float, int, list[int]]:
+    """Seeds a fresh in-memory DB, then times the selection of the frames to annotate."""
+    rng = random.Random(frames)
+    with patch.object(MongoConnector, "get_mongo_client", return_value=mongomock.MongoClient()):
+        dataset_storage_identifier = DatasetStorageIdentifier(
+            workspace_id=CTX_SESSION_VAR.get().workspace_id,
+            project_id=AnnotationSceneRepo.generate_id(),
+            dataset_storage_id=AnnotationSceneRepo.generate_id(),
+        )
+        repo = AnnotationSceneRepo(dataset_storage_identifier)
+        video = MagicMock(spec=Video)
+        video.id_ = AnnotationSceneRepo.generate_id()
+        video.total_frames = frames
+        non_key_frames = [index for index in range(frames) if index % skip_frame != 0]
+        annotated_frames = sorted(
+            [*range(0, frames, skip_frame), *rng.sample(non_key_frames, k=int(len(non_key_frames) * non_key_fraction))]
+        )
+        repo.save_many([make_frame_annotation_scene(video.id_, index, _LABEL_A) for index in annotated_frames])
+        old_video_ann_range = VideoAnnotationRange(
+            video_id=video.id_,
+            range_labels=[RangeLabels(start_frame=0, end_frame=frames - 1, label_ids=[_LABEL_A])],
+            id_=AnnotationSceneRepo.generate_id(),
+        )
+        new_video_ann_range = VideoAnnotationRange(
+            video_id=video.id_,
+            range_labels=[
+                RangeLabels(start_frame=0, end_frame=frames // 2 - 1, label_ids=[_LABEL_A]),
+                RangeLabels(start_frame=frames // 2, end_frame=frames - 1, label_ids=[_LABEL_B]),
+            ],
+            id_=AnnotationSceneRepo.generate_id(),
+        )
+
+        with (
+            patch.object(
+                AnnotationSceneRepo, "aggregate_read", autospec=True, side_effect=AnnotationSceneRepo.aggregate_read
+            ) as mock_aggregate_read,
+            patch.object(AnnotationManager, "save_annotations") as mock_save_annotations,
+            patch.object(LabelSchemaService, "get_latest_label_schema_for_task"),
+        ):
+            start_time = time.perf_counter()
+            if streamed:
+                VideoRangeAnnotationManager.create_annotations_for_video_range(
+                    new_video_annotation_range=new_video_ann_range,
+                    old_video_annotation_range=old_video_ann_range,
+                    video=video,
+                    project=MagicMock(),
+                    dataset_storage_identifier=dataset_storage_identifier,
+                    label_schema=MagicMock(),
+                    user_id=ID("benchmark"),
+                    skip_frame=skip_frame,
+                )
+                frame_indices = [
+                    cast("VideoFrameIdentifier", ann_scene.media_identifier).frame_index
+                    for save_call in mock_save_annotations.mock_calls
+                    for ann_scene in save_call.kwargs["annotation_scenes"]
+                ]
+            else:
+                frame_indices = propagate_per_key_frame(
+                    repo, new_video_ann_range, old_video_ann_range, video, skip_frame
+                )
+            duration = time.perf_counter() - start_time
+    return duration, mock_aggregate_read.call_count, sorted(frame_indices)
+
+
+def benchmark(frames: int, skip_frame: int, non_key_fraction: float, round_trip_ms: float) -> dict:
+    result: dict[str, float | int] = {"frames": frames, "skip_frame": skip_frame}
+    selected_frames = {}
+    for mode in ("per_key_frame", "streamed"):
+        duration, queries, selected_frames[mode] = run(frames, skip_frame, non_key_fraction, mode == "streamed")
+        result[f"{mode}_seconds"] = round(duration, 3)
+        result[f"{mode}_queries"] = queries
+        result[f"{mode}_seconds_with_round_trips"] = round(duration + queries * round_trip_ms / 1000, 3)
+    if selected_frames["per_key_frame"] != selected_frames["streamed"]:
+        raise RuntimeError(f"The frames to annotate differ for a video of {frames} frames")
+    result["frames_to_annotate"] = len(selected_frames["streamed"])
+    result["speedup"] = round(
+        result["per_key_frame_seconds_with_round_trips"] / result["streamed_seconds_with_round_trips"], 2
+    )
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--skip-frame", type=int, default=30)
+    parser.add_argument("--non-key-fraction", type=float, default=0.01, help="Fraction of annotated non-key frames")
+    parser.add_argument("--round-trip-ms", type=float, default=1.0, help="Latency of a request to the DB server")
+    args = parser.parse_args()
+
+    session = make_session(
+        organization_id=AnnotationSceneRepo.generate_id(),
+        workspace_id=AnnotationSceneRepo.generate_id(),
+        source=RequestSource.INTERNAL,
+    )
+    with session_context(session=session):
+        for frames in args.frames:
+            print(json.dumps(benchmark(frames, args.skip_frame, args.non_key_fraction, args.round_trip_ms)), flush=True)
+
+
+if __name__ == "__main__":
+    main()
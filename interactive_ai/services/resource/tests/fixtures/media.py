@@ -22,7 +22,7 @@ from iai_core.entities.media import MediaPreprocessing, MediaPreprocessingStatus
 from iai_core.entities.project import Project
 from iai_core.entities.video import Video, VideoFrame
 from iai_core.repos import VideoRepo
-from media_utils import VideoInformation
+from media_utils import VideoInformation, VideoMetadata
 
 
 @pytest.fixture
@@ -197,6 +197,11 @@ def fxt_video_information():
     yield VideoInformation(fps=10, height=10, width=10, total_frames=100)
 
 
+@pytest.fixture
+def fxt_video_metadata():
+    yield VideoMetadata(fps=10, total_frames=100, duration=10.0, codec="h264")
+
+
 @pytest.fixture
 def fxt_dataset_identifier(fxt_dataset_storage, fxt_dataset):
     yield DatasetIdentifier.from_ds_identifier(
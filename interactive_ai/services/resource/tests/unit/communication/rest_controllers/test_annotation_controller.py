@@ -1,7 +1,7 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
-from typing import cast
-from unittest.mock import ANY, MagicMock, call, patch
+import json
+from unittest.mock import MagicMock, patch
 
 import pytest
 from testfixtures import compare
@@ -12,14 +12,14 @@ from communication.rest_data_validator import AnnotationRestValidator
 from communication.rest_views.video_annotation_range_rest_views import VideoAnnotationRangeRESTViews
 from managers.annotation_manager import AnnotationManager
 from managers.project_manager import ProjectManager
+from resource_management import VideoRangeAnnotationManager
 from service.label_schema_service import LabelSchemaService
 
-from geti_types import ID, DatasetStorageIdentifier, ImageIdentifier, VideoFrameIdentifier
-from iai_core.entities.annotation import AnnotationScene, AnnotationSceneKind
+from geti_types import ID, DatasetStorageIdentifier, ImageIdentifier
 from iai_core.entities.label_schema import LabelSchema, NullLabelSchema
 from iai_core.entities.video import Video
 from iai_core.entities.video_annotation_range import NullVideoAnnotationRange, VideoAnnotationRange
-from iai_core.repos import AnnotationSceneRepo, LabelSchemaRepo, VideoAnnotationRangeRepo, VideoRepo
+from iai_core.repos import LabelSchemaRepo, VideoAnnotationRangeRepo, VideoRepo
 
 
 class TestAnnotationRESTController:
@@ -135,6 +135,7 @@ class TestAnnotationRESTController:
         self,
         fxt_mongo_id,
         fxt_project,
+        fxt_label_schema,
         lazyfxt_ann_scenes_list,
         lazyfxt_ann_scenes_list_rest,
         lazyfxt_ann_scene_states_list,
@@ -154,21 +155,27 @@ class TestAnnotationRESTController:
             patch.object(ProjectManager, "get_project_by_id", return_value=fxt_project) as mock_get_project,
             patch.object(
                 AnnotationManager,
-                "get_filtered_frame_annotation_scenes",
-                return_value=(annotation_scenes_list, len(annotation_scenes_list)),
+                "iter_frame_annotation_scenes",
+                return_value=iter(annotation_scenes_list),
             ) as mock_get_frames,
+            patch.object(
+                AnnotationManager,
+                "count_frame_annotation_scenes",
+                return_value=len(annotation_scenes_list),
+            ) as mock_count_frames,
             patch.object(
                 AnnotationManager,
                 "get_annotation_state_information_for_scenes",
                 return_value=(annotation_scene_states_list, [[], []]),
             ) as mock_get_anno_states,
+            patch.object(LabelSchemaService, "get_latest_label_schema_for_task", return_value=fxt_label_schema),
             patch.object(
                 LabelSchemaRepo,
                 "get_latest",
                 return_value=LabelSchema(id_=fxt_mongo_id(4)),
             ),
         ):
-            result = AnnotationRESTController.get_video_frame_annotations(
+            chunks = AnnotationRESTController.get_video_frame_annotations(
                 project_id=dataset_storage.project_id,
                 dataset_storage_id=dataset_storage.id_,
                 video_id=ID(video_id),
@@ -178,6 +185,15 @@ class TestAnnotationRESTController:
                 end_frame=end_frame,
                 frameskip=frameskip,
             )
+            # The frames are counted before the response starts
+            mock_count_frames.assert_called_once_with(
+                dataset_storage_identifier=dataset_storage.identifier,
+                video_id=video_id,
+                start_frame=start_frame,
+                end_frame=end_frame,
+                frameskip=frameskip,
+            )
+            result = json.loads("".join(chunks))
 
             mock_get_project.assert_called_once_with(project_id=dataset_storage.project_id)
             mock_get_frames.assert_called_once_with(
@@ -192,6 +208,9 @@ class TestAnnotationRESTController:
                 dataset_storage=fxt_project.get_training_dataset_storage(),
                 annotation_scenes=annotation_scenes_list,
                 project=fxt_project,
+                label_schema_by_task={
+                    task_node.id_: fxt_label_schema for task_node in fxt_project.get_trainable_task_nodes()
+                },
             )
             compare(
                 result["video_annotations"],
@@ -227,9 +246,10 @@ class TestAnnotationRESTController:
             patch.object(ProjectManager, "get_project_by_id", return_value=fxt_project) as mock_get_project,
             patch.object(
                 AnnotationManager,
-                "get_filtered_frame_annotation_scenes",
-                return_value=([], 0),
+                "iter_frame_annotation_scenes",
+                return_value=iter([]),
             ) as mock_get_anno,
+            patch.object(LabelSchemaService, "get_latest_label_schema_for_task"),
             patch.object(
                 LabelSchemaRepo,
                 "get_latest",
@@ -258,6 +278,36 @@ class TestAnnotationRESTController:
                 limit=500,
             )
 
+    def test_get_video_frame_annotations_stream_error(
+        self, fxt_mongo_id, fxt_project, fxt_label_schema, fxt_annotation_scene, caplog
+    ) -> None:
+        dataset_storage = fxt_project.get_training_dataset_storage()
+
+        with (
+            patch.object(ProjectManager, "get_project_by_id", return_value=fxt_project),
+            patch.object(AnnotationManager, "iter_frame_annotation_scenes", return_value=iter([fxt_annotation_scene])),
+            patch.object(AnnotationManager, "count_frame_annotation_scenes", return_value=1),
+            patch.object(
+                AnnotationManager,
+                "get_annotation_state_information_for_scenes",
+                side_effect=RuntimeError("Connection lost"),
+            ),
+            patch.object(LabelSchemaService, "get_latest_label_schema_for_task", return_value=fxt_label_schema),
+            patch.object(LabelSchemaRepo, "get_latest", return_value=LabelSchema(id_=fxt_mongo_id(4))),
+        ):
+            chunks = AnnotationRESTController.get_video_frame_annotations(
+                project_id=dataset_storage.project_id,
+                dataset_storage_id=dataset_storage.id_,
+                video_id=fxt_mongo_id(3),
+                annotation_id=ID(LATEST),
+            )
+            assert next(chunks) == '{"video_annotations":['
+            # The error is raised from the stream, so that the server aborts the response
+            with pytest.raises(RuntimeError, match="Connection lost"):
+                next(chunks)
+
+        assert "Failed to stream the annotations" in caplog.text
+
     def test_get_video_range_annotation(self, fxt_dataset_storage_identifier, fxt_mongo_id) -> None:
         dummy_var_rest = {"key": "value"}
         video_id = fxt_mongo_id(11)
@@ -305,7 +355,7 @@ class TestAnnotationRESTController:
             patch.object(
                 VideoAnnotationRangeRESTViews, "video_annotation_range_to_rest", return_value=dummy_video_ann_range_rest
             ) as mock_var_to_rest,
-            patch.object(AnnotationRESTController, "create_annotations_for_video_range") as mock_create_annotations,
+            patch.object(VideoRangeAnnotationManager, "create_annotations_for_video_range") as mock_create_annotations,
         ):
             out_var_rest = AnnotationRESTController.make_video_range_annotation(
                 video_annotation_range_data=dummy_video_ann_range_rest,
@@ -337,76 +387,3 @@ class TestAnnotationRESTController:
         )
         mock_var_to_rest.assert_called_once_with(video_annotation_range=dummy_video_ann_range)
         assert out_var_rest == dummy_video_ann_range_rest
-
-    def test_create_annotations_for_video_range(
-        self,
-        fxt_project,
-        fxt_classification_label_schema,
-        fxt_dataset_storage_identifier,
-        fxt_mongo_id,
-    ) -> None:
-        label_0, label_1 = fxt_classification_label_schema.get_labels(include_empty=True)[:2]
-        new_video_ann_range = MagicMock(spec=VideoAnnotationRange)
-        old_video_ann_range = MagicMock(spec=VideoAnnotationRange)
-        video = MagicMock(spec=Video)
-        video.id_ = fxt_mongo_id(11)
-        video.total_frames = 10
-        with (
-            patch.object(new_video_ann_range, "get_labels_at_frame_index", return_value={label_0.id_}),
-            patch.object(old_video_ann_range, "get_labels_at_frame_index", return_value={label_1.id_}),
-            patch.object(AnnotationManager, "save_annotations") as mock_save_annotations,
-            patch.object(
-                AnnotationSceneRepo, "get_video_frame_annotations_by_video_id", return_value=([], 0)
-            ) as mock_get_frame_anns,
-            patch.object(
-                LabelSchemaService, "get_latest_label_schema_for_task", return_value=fxt_classification_label_schema
-            ),
-        ):
-            AnnotationRESTController.create_annotations_for_video_range(
-                new_video_annotation_range=new_video_ann_range,
-                old_video_annotation_range=old_video_ann_range,
-                video=video,
-                project=fxt_project,
-                dataset_storage_identifier=fxt_dataset_storage_identifier,
-                label_schema=fxt_classification_label_schema,
-                user_id=ID("dummy_user"),
-                skip_frame=4,
-            )
-
-        mock_get_frame_anns.assert_has_calls(
-            [
-                call(
-                    video_id=video.id_,
-                    start_frame=1,
-                    end_frame=3,
-                    annotation_kind=AnnotationSceneKind.ANNOTATION,
-                ),
-                call(
-                    video_id=video.id_,
-                    start_frame=5,
-                    end_frame=7,
-                    annotation_kind=AnnotationSceneKind.ANNOTATION,
-                ),
-                call(
-                    video_id=video.id_,
-                    start_frame=9,
-                    end_frame=9,
-                    annotation_kind=AnnotationSceneKind.ANNOTATION,
-                ),
-            ]
-        )
-        mock_save_annotations.assert_called_once_with(
-            annotation_scenes=ANY,
-            project=fxt_project,
-            dataset_storage_identifier=fxt_dataset_storage_identifier,
-            label_schema=fxt_classification_label_schema,
-            label_schema_by_task=ANY,
-            calculate_task_to_revisit=False,
-        )
-        saved_scenes: list[AnnotationScene] = mock_save_annotations.mock_calls[0].kwargs["annotation_scenes"]
-        assert len(saved_scenes) == 3  # annotations should be created for frames [0, 4, 8]
-        assert all(ann_scene.media_identifier.media_id == video.id_ for ann_scene in saved_scenes)
-        saved_frame_indices = {
-            cast("VideoFrameIdentifier", ann_scene.media_identifier).frame_index for ann_scene in saved_scenes
-        }
-        assert saved_frame_indices == {0, 4, 8}
@@ -527,6 +527,34 @@ class TestMediaRESTController:
             )
             compare(result, success_response_rest(), ignore_eq=True)
 
+    def test_delete_media(self, fxt_project, fxt_mongo_id) -> None:
+        dataset_storage = fxt_project.get_training_dataset_storage()
+        image_id, missing_image_id, video_id = fxt_mongo_id(0), fxt_mongo_id(1), fxt_mongo_id(2)
+        with (
+            patch.object(ProjectManager, "get_project_by_id", return_value=fxt_project),
+            patch.object(
+                MediaManager, "delete_media_by_ids", return_value=((image_id,), (video_id,))
+            ) as mock_delete_media_by_ids,
+        ):
+            result = MediaRESTController.delete_media(
+                dataset_storage_identifier=dataset_storage.identifier,
+                media_rest=[
+                    {"id": str(image_id), "type": "image"},
+                    {"id": str(missing_image_id), "type": "image"},
+                    {"id": str(video_id), "type": "video"},
+                ],
+            )
+
+            mock_delete_media_by_ids.assert_called_once_with(
+                project=fxt_project,
+                dataset_storage=dataset_storage,
+                image_ids=[image_id, missing_image_id],
+                video_ids=[video_id],
+            )
+            assert result == {
+                "deleted_media": [{"id": str(image_id), "type": "image"}, {"id": str(video_id), "type": "video"}]
+            }
+
     def test_get_image_thumbnail(self, request) -> None:
         """
         This test creates an image without a thumbnail, requests the thumbnail and then checks that the thumbnail is
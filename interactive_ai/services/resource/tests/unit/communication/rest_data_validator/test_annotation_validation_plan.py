@@ -0,0 +1,85 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+from communication.rest_data_validator.annotation_validation_plan import (
+    AnnotationValidationPlan,
+    SceneValidationContext,
+)
+from tests.fixtures.values import DummyValues
+
+from geti_types import ID
+from iai_core.entities.label_schema import LabelSchemaView
+from iai_core.entities.shapes import Rectangle
+
+
+def _label_schema_by_task(project, label_schema) -> dict[ID, LabelSchemaView]:
+    label_schema_view = LabelSchemaView.from_parent(
+        parent_schema=label_schema, labels=label_schema.get_labels(True), id_=label_schema.id_
+    )
+    return {project.get_trainable_task_nodes()[0].id_: label_schema_view}
+
+
+def _rectangle_rest(x: float, y: float, size: float) -> dict:
+    return {
+        "type": "RECTANGLE",
+        "x": x * DummyValues.MEDIA_WIDTH,
+        "y": y * DummyValues.MEDIA_HEIGHT,
+        "width": size * DummyValues.MEDIA_WIDTH,
+        "height": size * DummyValues.MEDIA_HEIGHT,
+    }
+
+
+class TestAnnotationValidationPlan:
+    def test_get_cached(self, fxt_project, fxt_segmentation_label_schema_factory) -> None:
+        label_schema = fxt_segmentation_label_schema_factory(num_labels=2)
+        label_schema_by_task = _label_schema_by_task(fxt_project, label_schema)
+
+        plan = AnnotationValidationPlan.get(project=fxt_project, label_schema_by_task=label_schema_by_task)
+        cached_plan = AnnotationValidationPlan.get(
+            project=fxt_project, label_schema_by_task=_label_schema_by_task(fxt_project, label_schema)
+        )
+        other_plan = AnnotationValidationPlan.get(
+            project=fxt_project,
+            label_schema_by_task=_label_schema_by_task(fxt_project, fxt_segmentation_label_schema_factory(3)),
+        )
+
+        assert cached_plan is plan
+        assert other_plan is not plan
+        assert plan.existing_label_ids == set(label_schema.get_label_ids(include_empty=True))
+
+    def test_get_exclusivity_conflicts(self, fxt_project, fxt_segmentation_label_schema_factory) -> None:
+        label_schema = fxt_segmentation_label_schema_factory(num_labels=2)
+        label_1, label_2 = label_schema.get_labels(include_empty=False)
+        plan = AnnotationValidationPlan(label_schema_by_task=_label_schema_by_task(fxt_project, label_schema))
+
+        assert plan.get_exclusivity_conflicts({label_1.id_}) == {}
+        assert plan.get_exclusivity_conflicts({label_1.id_, label_2.id_}) == {
+            "from_label_list": {label_1.name, label_2.name}
+        }
+
+
+class TestSceneValidationContext:
+    def test_scene_lookups(self, fxt_project, fxt_segmentation_label_schema_factory) -> None:
+        label_schema = fxt_segmentation_label_schema_factory(num_labels=2)
+        label_1, label_2 = label_schema.get_labels(include_empty=False)
+        plan = AnnotationValidationPlan(label_schema_by_task=_label_schema_by_task(fxt_project, label_schema))
+        task_plan = next(iter(plan.task_plans.values()))
+        annotation_scene_rest = {
+            "annotations": [
+                {"shape": _rectangle_rest(0.1, 0.1, 0.1), "labels": [{"id": str(label_1.id_)}]},
+                {"shape": _rectangle_rest(0.6, 0.6, 0.1), "labels": [{"id": str(label_2.id_)}]},
+            ]
+        }
+
+        context = SceneValidationContext(
+            annotation_scene_rest=annotation_scene_rest,
+            media_height=DummyValues.MEDIA_HEIGHT,
+            media_width=DummyValues.MEDIA_WIDTH,
+        )
+
+        assert context.label_ids_per_annotation == [{label_1.id_}, {label_2.id_}]
+        assert context.scene_label_ids == {label_1.id_, label_2.id_}
+        assert not context.has_only_background_labels(task_plan)
+        shapes_index = context.get_non_empty_shapes_index(task_plan)
+        assert len(shapes_index) == 2
+        assert shapes_index.intersects_any(Rectangle(x1=0.15, y1=0.15, x2=0.3, y2=0.3))
+        assert not shapes_index.intersects_any(Rectangle(x1=0.3, y1=0.3, x2=0.5, y2=0.5))
@@ -1,12 +1,14 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 
+import json
 from http import HTTPStatus
 from unittest.mock import patch
 
 from testfixtures import compare
 
 from communication.rest_controllers.annotation_controller import LATEST, AnnotationRESTController
+from communication.rest_views.annotation_rest_views import COLUMNAR_ANNOTATIONS_MEDIA_TYPE
 
 from geti_types import ID, DatasetStorageIdentifier, ImageIdentifier, VideoFrameIdentifier
 
@@ -59,6 +61,8 @@ class TestAnnotationRESTEndpoint:
             dataset_storage_identifier=DUMMY_DATASET_STORAGE_IDENTIFIER,
             image_id=ID(DUMMY_IMAGE_ID),
             user_id=DUMMY_USER,
+            columnar_data=False,
+            columnar=False,
         )
         assert result.status_code == HTTPStatus.OK
         compare(result.json(), DUMMY_DATA, ignore_eq=True)
@@ -82,10 +86,29 @@ class TestAnnotationRESTEndpoint:
             annotation_id=ID(DUMMY_ANNOTATION_ID),
             media_identifier=media_identifier,
             label_only=False,
+            columnar=False,
         )
         assert result.status_code == HTTPStatus.OK
         compare(result.json(), DUMMY_DATA, ignore_eq=True)
 
+    def test_media_image_annotation_endpoint_get_columnar(self, fxt_resource_rest) -> None:
+        # Arrange
+        endpoint = f"{API_IMAGE_PATTERN}/{DUMMY_IMAGE_ID}/annotations/{DUMMY_ANNOTATION_ID}"
+
+        # Act
+        with patch.object(
+            AnnotationRESTController,
+            "get_annotation",
+            return_value=DUMMY_DATA,
+        ) as mock_get_anno:
+            result = fxt_resource_rest.get(endpoint, headers={"Accept": COLUMNAR_ANNOTATIONS_MEDIA_TYPE})
+
+        # Assert
+        assert mock_get_anno.call_args.kwargs["columnar"]
+        assert result.status_code == HTTPStatus.OK
+        assert result.headers["content-type"] == COLUMNAR_ANNOTATIONS_MEDIA_TYPE
+        compare(result.json(), DUMMY_DATA, ignore_eq=True)
+
     def test_media_image_annotation_endpoint_invalid_parameter(self, fxt_resource_rest) -> None:
         # Arrange
         endpoint = (
@@ -115,19 +138,45 @@ class TestAnnotationRESTEndpoint:
             video_id=DUMMY_VIDEO_ID,
             frame_index=int(DUMMY_FRAME_INDEX),
             user_id=DUMMY_USER,
+            columnar_data=False,
+            columnar=False,
         )
         assert result.status_code == HTTPStatus.OK
         compare(result.json(), DUMMY_DATA, ignore_eq=True)
 
+    def test_media_video_annotations_endpoint_post_columnar(self, fxt_resource_rest):
+        # Arrange
+        endpoint = f"{API_VIDEO_PATTERN}/{DUMMY_VIDEO_ID}/frames/{DUMMY_FRAME_INDEX}/annotations"
+
+        # Act
+        with patch.object(
+            AnnotationRESTController,
+            "make_video_frame_annotation",
+            return_value=DUMMY_DATA,
+        ) as mock_make_anno:
+            result = fxt_resource_rest.post(
+                endpoint,
+                content=json.dumps(DUMMY_DATA),
+                headers={"Content-Type": COLUMNAR_ANNOTATIONS_MEDIA_TYPE},
+            )
+
+        # Assert
+        assert mock_make_anno.call_args.kwargs["data"] == DUMMY_DATA
+        assert mock_make_anno.call_args.kwargs["columnar_data"]
+        assert not mock_make_anno.call_args.kwargs["columnar"]
+        assert result.status_code == HTTPStatus.OK
+        assert result.headers["content-type"] == "application/json"
+
     def test_media_video_annotation_endpoint_get(self, fxt_resource_rest) -> None:
         # Arrange
         endpoint = f"{API_VIDEO_PATTERN}/{DUMMY_VIDEO_ID}/annotations/latest"
+        dummy_data_json = json.dumps(DUMMY_DATA)
 
         # Act
         with patch.object(
             AnnotationRESTController,
             "get_video_frame_annotations",
-            return_value=DUMMY_DATA,
+            return_value=iter([dummy_data_json[:5], dummy_data_json[5:]]),
         ) as mock_get_annos:
             result = fxt_resource_rest.get(endpoint)
 
@@ -141,6 +190,7 @@ class TestAnnotationRESTEndpoint:
             start_frame=None,
             end_frame=None,
             frameskip=1,
+            columnar=False,
         )
         assert result.status_code == HTTPStatus.OK
         compare(result.json(), DUMMY_DATA, ignore_eq=True)
@@ -219,6 +269,7 @@ class TestAnnotationRESTEndpoint:
             annotation_id=ID(DUMMY_ANNOTATION_ID),
             media_identifier=dummy_video_frame_identifier,
             label_only=False,
+            columnar=False,
         )
         assert result.status_code == HTTPStatus.OK
         compare(result.json(), DUMMY_DATA, ignore_eq=True)
@@ -301,6 +301,40 @@ class TestMediaRESTEndpoint:
         )
         compare(result.json(), DUMMY_DATA, ignore_eq=True)
 
+    def test_media_delete_endpoint(self, fxt_resource_rest) -> None:
+        # Arrange
+        endpoint = f"{API_BASE_PATTERN}/media:delete"
+        media_rest = [{"id": DUMMY_IMAGE_ID, "type": IMAGE}, {"id": DUMMY_VIDEO_ID, "type": VIDEO}]
+
+        # Act
+        with patch.object(MediaRESTController, "delete_media", return_value=DUMMY_DATA) as mock_delete_media:
+            result = fxt_resource_rest.post(endpoint, json={"media": media_rest})
+
+        # Assert
+        assert result.status_code == HTTPStatus.OK
+        mock_delete_media.assert_called_once_with(
+            dataset_storage_identifier=DUMMY_DATASET_STORAGE_IDENTIFIER,
+            media_rest=media_rest,
+        )
+        compare(result.json(), DUMMY_DATA, ignore_eq=True)
+
+    @pytest.mark.parametrize(
+        "request_json",
+        [{}, {"media": []}, {"media": [{"id": DUMMY_IMAGE_ID, "type": "video_frame"}]}, {"media": [{"id": "bad"}]}],
+        ids=["no media", "empty media", "invalid type", "invalid id"],
+    )
+    def test_media_delete_endpoint_invalid(self, fxt_resource_rest, request_json) -> None:
+        # Arrange
+        endpoint = f"{API_BASE_PATTERN}/media:delete"
+
+        # Act
+        with patch.object(MediaRESTController, "delete_media") as mock_delete_media:
+            result = fxt_resource_rest.post(endpoint, json=request_json)
+
+        # Assert
+        assert result.status_code == HTTPStatus.BAD_REQUEST
+        mock_delete_media.assert_not_called()
+
     def test_media_video_detail_endpoint_get(self, fxt_resource_rest) -> None:
         # Arrange
         endpoint = f"{API_VIDEO_PATTERN}/{DUMMY_VIDEO_ID}"
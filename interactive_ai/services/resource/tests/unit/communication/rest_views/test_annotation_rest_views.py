@@ -1,6 +1,7 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 
+import json
 from typing import Any
 from unittest.mock import patch
 
@@ -12,6 +13,7 @@ from communication.rest_views.scored_label_rest_views import ScoredLabelRESTView
 from entities.video_annotation_properties import VideoAnnotationProperties
 from tests.fixtures.values import DummyValues
 
+from geti_fastapi_tools.exceptions import BadRequestException
 from geti_types import ID
 from iai_core.entities.shapes import Point, Polygon
 from iai_core.utils import time_utils
@@ -202,6 +204,69 @@ class TestAnnotationRESTViews:
         assert result.shapes[0].modification_date >= date_begin
         assert result.shapes[0].modification_date <= date_end
 
+    @pytest.mark.parametrize("lazyfxt_annotation_scene", ["fxt_annotation_scene", "fxt_annotation_scene_keypoint"])
+    def test_media_2d_annotation_to_columnar_rest(
+        self, request, lazyfxt_annotation_scene, fxt_annotation_scene_state
+    ) -> None:
+        annotation_scene = request.getfixturevalue(lazyfxt_annotation_scene)
+
+        json_rest = AnnotationRESTViews.media_2d_annotation_to_rest(
+            annotation_scene=annotation_scene,
+            annotation_scene_state=fxt_annotation_scene_state,
+            tasks_to_revisit=[],
+        )
+        columnar_rest = AnnotationRESTViews.media_2d_annotation_to_rest(
+            annotation_scene=annotation_scene,
+            annotation_scene_state=fxt_annotation_scene_state,
+            tasks_to_revisit=[],
+            columnar=True,
+        )
+        expanded_annotations = AnnotationRESTViews.annotations_from_columnar_rest(
+            json.loads(json.dumps(columnar_rest["annotations"]))
+        )
+
+        assert {key: value for key, value in columnar_rest.items() if key != "annotations"} == {
+            key: value for key, value in json_rest.items() if key != "annotations"
+        }
+        assert len(columnar_rest["annotations"]["label_table"]) == 1
+        assert all(isinstance(value, int | float) for value in columnar_rest["annotations"]["coordinates"])
+        compare(expanded_annotations, json_rest["annotations"])
+
+    @pytest.mark.parametrize(
+        "columnar_annotations",
+        [
+            {"shape_types": ["RECTANGLE"], "coordinates": [0, 0, 1, 1]},
+            {
+                "label_table": [{"id": "label"}],
+                "label_offsets": [0, 1],
+                "label_indices": [0],
+                "shape_types": ["RECTANGLE"],
+                "coordinate_offsets": [0, 3],
+                "coordinates": [0, 0, 1, 1],
+            },
+            {
+                "label_table": [{"id": "label"}],
+                "label_offsets": [0, 1],
+                "label_indices": [1],
+                "shape_types": ["RECTANGLE"],
+                "coordinate_offsets": [0, 4],
+                "coordinates": [0, 0, 1, 1],
+            },
+            {
+                "label_table": [{"id": "label"}],
+                "label_offsets": [0, 1],
+                "label_indices": [0],
+                "shape_types": ["POLYGON"],
+                "coordinate_offsets": [0, 5],
+                "coordinates": [0, 0, 1, 1, 2],
+            },
+        ],
+        ids=["missing_columns", "inconsistent_offsets", "unknown_label_index", "odd_polygon_coordinates"],
+    )
+    def test_annotations_from_columnar_rest_invalid(self, columnar_annotations) -> None:
+        with pytest.raises(BadRequestException):
+            AnnotationRESTViews.annotations_from_columnar_rest(columnar_annotations)
+
     def test_rotated_rectangle_rest_mapper(self):
         """
         Tests mapping of a rotated rectangle
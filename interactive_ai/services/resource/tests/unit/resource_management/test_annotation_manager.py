@@ -177,7 +177,7 @@ class TestAnnotationManager:
     ) -> None:
         task_id = fxt_project.get_trainable_task_nodes()[0].id_
         with (
-            patch.object(LabelResolver, "complete_labels"),
+            patch.object(LabelResolver, "complete_labels_for_annotations") as mock_complete_labels,
             patch.object(
                 AnnotationSceneStateHelper,
                 "compute_annotation_scene_state",
@@ -186,7 +186,12 @@ class TestAnnotationManager:
                     fxt_annotation_scene_state_2,
                 ),
             ),
-            patch.object(AnnotationManager, "_compute_tasks_to_revisit", return_value=[task_id]),
+            patch.object(
+                AnnotationManager, "_get_task_labels_ids", return_value={task_id: frozenset()}
+            ) as mock_get_task_labels_ids,
+            patch.object(
+                AnnotationManager, "_compute_tasks_to_revisit_for_scenes", side_effect=([[task_id]], [[task_id]])
+            ) as mock_compute_tasks_to_revisit,
             patch.object(AnnotationSceneRepo, "save_many") as mock_ann_repo_save_many,
             patch.object(AnnotationSceneStateRepo, "save_many") as mock_ann_state_repo_save_many,
             patch.object(AnnotationManager, "publish_annotation_scene") as mock_publish,
@@ -212,6 +217,14 @@ class TestAnnotationManager:
             ]
         )
         assert mock_publish.call_count == 2
+        mock_complete_labels.assert_called_once()
+        mock_get_task_labels_ids.assert_called_once_with(project=fxt_project, label_schema_by_task=None)
+        mock_compute_tasks_to_revisit.assert_has_calls(
+            [
+                call(annotation_scene_states=[fxt_annotation_scene_state_1], task_labels_ids={task_id: frozenset()}),
+                call(annotation_scene_states=[fxt_annotation_scene_state_2], task_labels_ids={task_id: frozenset()}),
+            ]
+        )
         expected_output = (
             (fxt_annotation_scene_1, fxt_annotation_scene_state_1, [task_id]),
             (fxt_annotation_scene_2, fxt_annotation_scene_state_2, [task_id]),
@@ -35,7 +35,13 @@ from iai_core.repos.storage.storage_client import BytesStream
 from iai_core.utils.annotation_scene_state_helper import AnnotationSceneStateHelper
 from iai_core.utils.deletion_helpers import DeletionHelpers
 from iai_core.utils.media_factory import Media2DFactory
-from media_utils import VideoFileRepair, VideoFrameOutOfRangeInternalException, VideoFrameReader, VideoFrameReadingError
+from media_utils import (
+    VideoFileRepair,
+    VideoFrameOutOfRangeInternalException,
+    VideoFrameReader,
+    VideoFrameReadingError,
+    VideoMetadataProbeError,
+)
 from media_utils.video_decoder import _VideoDecoderOpenCV
 
 
@@ -546,12 +552,36 @@ class TestMediaManager:
 
             mock_save.assert_called()
 
+    def test_upload_video_metadata_probe_error(self, fxt_project, fxt_video_information) -> None:
+        dataset_storage = fxt_project.get_training_dataset_storage()
+        video_decoder = _VideoDecoderOpenCV()  # type: ignore
+        with (
+            patch.object(VideoBinaryRepo, "save", return_value="file.mp4"),
+            patch.object(VideoBinaryRepo, "get_path_or_presigned_url", return_value="/tmp/file.mp4"),
+            patch.object(VideoBinaryRepo, "delete_by_filename") as mock_delete,
+            patch.object(video_decoder, "get_video_information", return_value=fxt_video_information),
+            patch.object(video_decoder, "get_video_metadata", side_effect=VideoMetadataProbeError("probe failed")),
+            patch.object(VideoFileRepair, "check_and_repair_video", return_value=True),
+            pytest.raises(InvalidMediaException, match="Video file can not be read"),
+        ):
+            MediaManager.upload_video(
+                dataset_storage_identifier=dataset_storage.identifier,
+                basename="file",
+                extension=VideoExtensions.MP4,
+                data_stream=BytesStream(data=io.BytesIO(b"video"), length=5),
+                user_id=ID("dummy_user"),
+            )
+
+        # The binary of the rejected video is not left behind
+        mock_delete.assert_called_once_with(filename="file.mp4")
+
     def test_upload_video_too_long_error(
         self,
         fxt_project,
         fxt_unannotated_video_factory,
         request,
         fxt_video_information,
+        fxt_video_metadata,
     ) -> None:
         dataset_storage = fxt_project.get_training_dataset_storage()
         video = fxt_unannotated_video_factory(
@@ -582,6 +612,7 @@ class TestMediaManager:
                 "get_video_information",
                 return_value=fxt_video_information,
             ),
+            patch.object(_video_decoder, "get_video_metadata", return_value=fxt_video_metadata),
             patch.object(VideoFileRepair, "check_and_repair_video", return_value=True),
             patch.object(Video, "duration", 1000000),
             pytest.raises(
@@ -1152,6 +1183,77 @@ class TestMediaManager:
             )
             mock_delete_video.assert_called_once_with(dataset_storage=dataset_storage, video=fxt_video_entity)
 
+    def test_delete_media_by_ids(self, fxt_empty_project_persisted, fxt_mongo_id) -> None:
+        dataset_storage = fxt_empty_project_persisted.get_training_dataset_storage()
+        image_ids = [fxt_mongo_id(i) for i in range(25)]
+        video_ids = [fxt_mongo_id(100)]
+
+        def delete_media_by_ids(dataset_storage, image_ids, video_ids, on_chunk_deleted):
+            # Simulate two deletion chunks: the first one with 21 images, the second one with the rest
+            on_chunk_deleted(tuple(image_ids[:21]), ())
+            on_chunk_deleted(tuple(image_ids[21:]), tuple(video_ids))
+            return tuple(image_ids), tuple(video_ids)
+
+        with (
+            patch.object(DeletionHelpers, "delete_media_by_ids", side_effect=delete_media_by_ids) as mock_delete_media,
+            patch("resource_management.media_manager.publish_event") as mock_publish_event,
+        ):
+            deleted_media_ids = MediaManager.delete_media_by_ids(
+                project=fxt_empty_project_persisted,
+                dataset_storage=dataset_storage,
+                image_ids=image_ids,
+                video_ids=video_ids,
+            )
+
+        mock_delete_media.assert_called_once_with(
+            dataset_storage=dataset_storage, image_ids=image_ids, video_ids=video_ids, on_chunk_deleted=ANY
+        )
+        # Each deleted chunk is published right away, split into events of at most 20 media
+        published_media = [publish_call.kwargs["body"]["media"] for publish_call in mock_publish_event.call_args_list]
+        assert published_media == [
+            [{"media_id": image_id, "media_type": "image"} for image_id in image_ids[:20]],
+            [{"media_id": image_ids[20], "media_type": "image"}],
+            [{"media_id": image_id, "media_type": "image"} for image_id in image_ids[21:]]
+            + [{"media_id": video_ids[0], "media_type": "video"}],
+        ]
+        mock_publish_event.assert_called_with(
+            topic="media_deletions",
+            body={
+                "workspace_id": fxt_empty_project_persisted.workspace_id,
+                "project_id": fxt_empty_project_persisted.id_,
+                "dataset_storage_id": dataset_storage.id_,
+                "media": ANY,
+            },
+            key=str(dataset_storage.id_).encode(),
+            headers_getter=ANY,
+        )
+        assert deleted_media_ids == (tuple(image_ids), tuple(video_ids))
+
+    def test_delete_media_by_ids_failure_after_first_chunk(self, fxt_empty_project_persisted, fxt_mongo_id) -> None:
+        dataset_storage = fxt_empty_project_persisted.get_training_dataset_storage()
+
+        def delete_media_by_ids(dataset_storage, image_ids, video_ids, on_chunk_deleted):
+            on_chunk_deleted((image_ids[0],), ())
+            raise RuntimeError("Database unavailable")
+
+        with (
+            patch.object(DeletionHelpers, "delete_media_by_ids", side_effect=delete_media_by_ids),
+            patch("resource_management.media_manager.publish_event") as mock_publish_event,
+            pytest.raises(RuntimeError),
+        ):
+            MediaManager.delete_media_by_ids(
+                project=fxt_empty_project_persisted,
+                dataset_storage=dataset_storage,
+                image_ids=[fxt_mongo_id(1), fxt_mongo_id(2)],
+                video_ids=[],
+            )
+
+        # The media deleted before the failure are still announced
+        mock_publish_event.assert_called_once()
+        assert mock_publish_event.call_args.kwargs["body"]["media"] == [
+            {"media_id": fxt_mongo_id(1), "media_type": "image"}
+        ]
+
     def test_delete_media_project_locked(self, fxt_empty_project_persisted, fxt_image_entity, fxt_video_entity) -> None:
         dataset_storage = fxt_empty_project_persisted.get_training_dataset_storage()
         ProjectRepo().mark_locked(
@@ -1173,6 +1275,14 @@ class TestMediaManager:
                 video_id=fxt_video_entity.id_,
             )
 
+        with pytest.raises(ProjectLockedException):
+            MediaManager.delete_media_by_ids(
+                project=fxt_empty_project_persisted,
+                dataset_storage=dataset_storage,
+                image_ids=[fxt_image_entity.id_],
+                video_ids=[fxt_video_entity.id_],
+            )
+
     def test_get_video_frame_thumbnail_numpy(
         self, fxt_dataset_storage_identifier, fxt_mongo_id, fxt_media_numpy
     ) -> None:
@@ -0,0 +1,95 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from resource_management.media_manager import MediaManager
+from resource_management.thumbnail_video_worker import ThumbnailVideoWorker
+
+from geti_types import CTX_SESSION_VAR, ID
+
+
+@pytest.fixture
+def fxt_thumbnail_video_worker():
+    worker = ThumbnailVideoWorker(max_workers=1)
+    yield worker
+    worker.stop()
+    ThumbnailVideoWorker._instance = None
+
+
+class TestThumbnailVideoWorker:
+    def test_submit(self, fxt_thumbnail_video_worker, fxt_dataset_storage_identifier, fxt_session_ctx) -> None:
+        # Arrange
+        first_job_started = threading.Event()
+        release_first_job = threading.Event()
+        generated_video_ids = []
+        sessions = []
+
+        def create_and_save_thumbnail_video(dataset_storage_identifier, video) -> None:
+            generated_video_ids.append(video.id_)
+            sessions.append(CTX_SESSION_VAR.get())
+            if video.id_ == ID("first"):
+                first_job_started.set()
+                release_first_job.wait(timeout=10)
+
+        # Act
+        with (
+            patch.object(
+                MediaManager,
+                "get_video_by_id",
+                side_effect=lambda dataset_storage_identifier, video_id: MagicMock(id_=video_id),
+            ),
+            patch.object(
+                MediaManager, "create_and_save_thumbnail_video", side_effect=create_and_save_thumbnail_video
+            ) as mock_create_and_save_thumbnail_video,
+        ):
+            submitted = [fxt_thumbnail_video_worker.submit(fxt_dataset_storage_identifier, ID("first"), 10.0)]
+            assert first_job_started.wait(timeout=10)
+            submitted += [
+                fxt_thumbnail_video_worker.submit(fxt_dataset_storage_identifier, ID("late"), 30.0),
+                fxt_thumbnail_video_worker.submit(fxt_dataset_storage_identifier, ID("early"), 20.0),
+                fxt_thumbnail_video_worker.submit(fxt_dataset_storage_identifier, ID("late"), 40.0),
+                fxt_thumbnail_video_worker.submit(fxt_dataset_storage_identifier, ID("first"), 50.0),
+            ]
+            queue_depth = fxt_thumbnail_video_worker.queue_depth
+            release_first_job.set()
+            idle = fxt_thumbnail_video_worker.wait_until_idle(timeout=10)
+
+        # Assert
+        assert idle
+        assert submitted == [True, True, True, False, False]
+        assert queue_depth == 2
+        assert generated_video_ids == [ID("first"), ID("early"), ID("late")]
+        assert mock_create_and_save_thumbnail_video.call_count == 3
+        assert sessions == [fxt_session_ctx] * 3
+        assert fxt_thumbnail_video_worker.pending_count == 0
+
+    def test_submit_failure(self, fxt_thumbnail_video_worker, fxt_dataset_storage_identifier, fxt_video_entity) -> None:
+        # Act
+        with (
+            patch.object(MediaManager, "get_video_by_id", return_value=fxt_video_entity),
+            patch.object(
+                MediaManager, "create_and_save_thumbnail_video", side_effect=[RuntimeError("ffmpeg failed"), None]
+            ) as mock_create_and_save_thumbnail_video,
+        ):
+            fxt_thumbnail_video_worker.submit(fxt_dataset_storage_identifier, fxt_video_entity.id_)
+            assert fxt_thumbnail_video_worker.wait_until_idle(timeout=10)
+            # A video can be requested again once its previous job is done
+            resubmitted = fxt_thumbnail_video_worker.submit(fxt_dataset_storage_identifier, fxt_video_entity.id_)
+            idle = fxt_thumbnail_video_worker.wait_until_idle(timeout=10)
+
+        # Assert
+        assert resubmitted
+        assert idle
+        assert mock_create_and_save_thumbnail_video.call_count == 2
+
+    def test_stop(self, fxt_thumbnail_video_worker, fxt_dataset_storage_identifier) -> None:
+        # Act
+        fxt_thumbnail_video_worker.stop()
+        submitted = fxt_thumbnail_video_worker.submit(fxt_dataset_storage_identifier, ID("video"))
+
+        # Assert
+        assert not submitted
+        assert fxt_thumbnail_video_worker.pending_count == 0
@@ -1,18 +1,20 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
-from typing import TYPE_CHECKING
-from unittest.mock import patch
+from typing import TYPE_CHECKING, cast
+from unittest.mock import MagicMock, patch
 
 from managers.annotation_manager import AnnotationManager
 from resource_management import VideoRangeAnnotationManager
 from service.label_schema_service import LabelSchemaService
 
-from geti_types import ID, DatasetStorageIdentifier
+from geti_types import ID, DatasetStorageIdentifier, VideoFrameIdentifier
 from iai_core.entities.annotation import AnnotationSceneKind
 from iai_core.entities.label_schema import LabelSchema
 from iai_core.entities.scored_label import LabelSource, ScoredLabel
 from iai_core.entities.shapes import Rectangle
-from iai_core.repos import LabelSchemaRepo, VideoAnnotationRangeRepo
+from iai_core.entities.video import Video
+from iai_core.entities.video_annotation_range import NullVideoAnnotationRange, RangeLabels, VideoAnnotationRange
+from iai_core.repos import AnnotationSceneRepo, LabelSchemaRepo, VideoAnnotationRangeRepo
 from iai_core.utils.identifier_factory import IdentifierFactory
 
 if TYPE_CHECKING:
@@ -99,3 +101,86 @@ class TestVideoRangeAnnotationManager:
                 label_schema_by_task={fxt_project.task_ids[1]: dummy_label_schema},
                 calculate_task_to_revisit=False,
             )
+
+    def test_get_changed_frame_ranges(self, mock_ann_scene_repo_init, fxt_mongo_id) -> None:
+        label_a, label_b = fxt_mongo_id(1), fxt_mongo_id(2)
+        old_video_ann_range = VideoAnnotationRange(
+            video_id=fxt_mongo_id(3),
+            range_labels=[RangeLabels(start_frame=0, end_frame=9, label_ids=[label_a])],
+            id_=fxt_mongo_id(4),
+        )
+        new_video_ann_range = VideoAnnotationRange(
+            video_id=fxt_mongo_id(3),
+            range_labels=[
+                RangeLabels(start_frame=0, end_frame=4, label_ids=[label_a]),
+                RangeLabels(start_frame=5, end_frame=14, label_ids=[label_b]),
+            ],
+            id_=fxt_mongo_id(5),
+        )
+
+        changed_frame_ranges = VideoRangeAnnotationManager.get_changed_frame_ranges(
+            old_video_annotation_range=old_video_ann_range,
+            new_video_annotation_range=new_video_ann_range,
+            total_frames=20,
+        )
+
+        assert [(r.start_frame, r.end_frame, r.label_ids) for r in changed_frame_ranges] == [
+            (5, 9, {label_b}),
+            (10, 14, {label_b}),
+        ]
+
+    def test_create_annotations_for_video_range(
+        self,
+        mock_ann_scene_repo_init,
+        fxt_project,
+        fxt_classification_label_schema,
+        fxt_dataset_storage_identifier,
+        fxt_mongo_id,
+    ) -> None:
+        label_0, label_1 = fxt_classification_label_schema.get_labels(include_empty=True)[:2]
+        video = MagicMock(spec=Video)
+        video.id_ = fxt_mongo_id(11)
+        video.total_frames = 10
+        new_video_ann_range = VideoAnnotationRange(
+            video_id=video.id_,
+            range_labels=[RangeLabels(start_frame=0, end_frame=9, label_ids=[label_0.id_])],
+            id_=fxt_mongo_id(12),
+        )
+        # Non-key frame 2 has other labels than its key frame, non-key frame 5 already has the same labels
+        frame_label_ids = [(2, {label_1.id_}), (4, {label_1.id_}), (5, {label_0.id_})]
+        with (
+            patch("resource_management.video_range_annotation_manager.VIDEO_RANGE_ANNOTATIONS_SAVE_BATCH_SIZE", 2),
+            patch.object(AnnotationManager, "save_annotations") as mock_save_annotations,
+            patch.object(
+                AnnotationSceneRepo, "get_video_frame_label_ids_by_video_id", return_value=iter(frame_label_ids)
+            ) as mock_get_frame_label_ids,
+            patch.object(
+                LabelSchemaService, "get_latest_label_schema_for_task", return_value=fxt_classification_label_schema
+            ),
+        ):
+            VideoRangeAnnotationManager.create_annotations_for_video_range(
+                new_video_annotation_range=new_video_ann_range,
+                old_video_annotation_range=NullVideoAnnotationRange(),
+                video=video,
+                project=fxt_project,
+                dataset_storage_identifier=fxt_dataset_storage_identifier,
+                label_schema=fxt_classification_label_schema,
+                user_id=ID("dummy_user"),
+                skip_frame=4,
+            )
+
+        mock_get_frame_label_ids.assert_called_once_with(
+            video_id=video.id_, start_frame=0, end_frame=9, annotation_kind=AnnotationSceneKind.ANNOTATION
+        )
+        # Key frames [0, 4, 8] and non-key frame 2 are saved, in batches of 2 scenes
+        assert mock_save_annotations.call_count == 2
+        saved_scenes: list[AnnotationScene] = [
+            ann_scene
+            for save_call in mock_save_annotations.mock_calls
+            for ann_scene in save_call.kwargs["annotation_scenes"]
+        ]
+        saved_frame_indices = [
+            cast("VideoFrameIdentifier", ann_scene.media_identifier).frame_index for ann_scene in saved_scenes
+        ]
+        assert saved_frame_indices == [0, 2, 4, 8]
+        assert all(ann_scene.get_label_ids(include_empty=True) == {label_0.id_} for ann_scene in saved_scenes)
@@ -16,6 +16,7 @@ from kubernetes.client.models import (
     V1EnvFromSource,
     V1EnvVar,
     V1EnvVarSource,
+    V1HostPathVolumeSource,
     V1LocalObjectReference,
     V1ResourceRequirements,
     V1SecretKeySelector,
@@ -35,6 +36,8 @@ logger = logging.getLogger(__name__)
 
 
 CONTAINER_NAME = "trainer"
+TRAINER_USER_ID = 10001
+PRETRAINED_WEIGHTS_CACHE_MOUNT_PATH = "/pretrained_weights_cache"
 
 
 def _create_sidecar_env(
@@ -187,11 +190,34 @@ def create_flyte_container_task(  # noqa: PLR0913
             allow_privilege_escalation=False,
             read_only_root_filesystem=False,
             run_as_non_root=True,
-            run_as_user=10001,
+            run_as_user=TRAINER_USER_ID,
             capabilities=V1Capabilities(drop=["ALL"]),
         )
     role = "flyte_workflows"
 
+    # Node-local cache of the pretrained weights, shared by the training jobs running on the same node. Opt-in: the
+    # directory must be provisioned on the nodes beforehand, owned by the trainer user
+    cache_env: list[V1EnvVar] = []
+    cache_volume_mounts: list[V1VolumeMount] = []
+    cache_volumes: list[V1Volume] = []
+    if weights_cache_host_path := os.environ.get("PRETRAINED_WEIGHTS_CACHE_HOST_PATH"):
+        cache_env = [
+            V1EnvVar(name="PRETRAINED_WEIGHTS_CACHE_DIR", value=PRETRAINED_WEIGHTS_CACHE_MOUNT_PATH),
+            V1EnvVar(
+                name="PRETRAINED_WEIGHTS_CACHE_MAX_SIZE_GB",
+                value=os.environ.get("PRETRAINED_WEIGHTS_CACHE_MAX_SIZE_GB", "20"),
+            ),
+        ]
+        cache_volume_mounts = [
+            V1VolumeMount(mount_path=PRETRAINED_WEIGHTS_CACHE_MOUNT_PATH, name="pretrained-weights-cache")
+        ]
+        cache_volumes = [
+            V1Volume(
+                name="pretrained-weights-cache",
+                host_path=V1HostPathVolumeSource(path=weights_cache_host_path, type="Directory"),
+            )
+        ]
+
     pod_spec = V1PodSpec(
         containers=[
             V1Container(
@@ -300,12 +326,14 @@ def create_flyte_container_task(  # noqa: PLR0913
                         name="S3_CREDENTIALS_PROVIDER",
                         value=os.environ.get("S3_CREDENTIALS_PROVIDER", ""),
                     ),
+                    *cache_env,
                 ],
                 resources=resources,
                 env_from=env_from,
                 volume_mounts=[
                     V1VolumeMount(mount_path="/dev/shm", name="shared-memory"),  # noqa : S108 # nosec: B108
                     V1VolumeMount(mount_path="/shard_files", name="shard-files-dir"),
+                    *cache_volume_mounts,
                 ],
                 security_context=security_context,
             )
@@ -321,6 +349,7 @@ def create_flyte_container_task(  # noqa: PLR0913
                 name="shard-files-dir",
                 empty_dir=V1EmptyDirVolumeSource(size_limit=str(ephemeral_storage_resources.work_dir_size_limit)),
             ),
+            *cache_volumes,
         ],
     )
     logger.info(f"Create pod_spec={pod_spec}")
@@ -3,6 +3,7 @@
 """This module defines helpers used to construct datasets"""
 
 import copy
+import logging
 import os
 
 from geti_configuration_tools.training_configuration import TrainingConfiguration
@@ -30,6 +31,8 @@ from jobs_common.tasks.utils.progress import report_progress
 from jobs_common.utils.annotation_filter import AnnotationFilter
 from jobs_common.utils.subset_management.subset_manager import TaskSubsetManager
 
+logger = logging.getLogger(__name__)
+
 # Maximum recommended size for unannotated datasets
 MAX_UNANNOTATED_DATASET_SIZE: int = 10000
 
@@ -224,6 +227,9 @@ class DatasetHelpers:
         3. Save the new subsets to the repo by calling update_subsets and publish that the subsets were updated
         4. Makes a copy of the dataset and passes it to the training operator
 
+        The annotation scenes of the items are loaded from the DB with the task dataset, so only the ones modified by
+        the annotation filters are saved again with the training dataset.
+
         :param task_dataset_entity: TaskDataset that holds the current dataset for the task
         :param project_id: ID of the project
         :param task_node: Task node for which the dataset is fetched
@@ -312,6 +318,10 @@ class DatasetHelpers:
             if filtering_params.max_annotation_objects and filtering_params.max_annotation_objects.enable
             else None
         )
+        annotation_ids_before_filters = {
+            item.annotation_scene.id_: tuple(annotation.id_ for annotation in item.annotation_scene.annotations)
+            for item in training_dataset_items
+        }
         AnnotationFilter.apply_annotation_filters(
             dataset=new_training_dataset,
             min_number_of_annotations=min_annotation_objects,
@@ -320,8 +330,23 @@ class DatasetHelpers:
             max_annotation_size=max_annotation_size,
         )
 
-        dataset_repo = DatasetRepo(dataset_storage.identifier)
-        dataset_repo.save_deep(new_training_dataset)
+        # The annotation filters edit the annotation scenes in place, which must then be saved again
+        persisted_annotation_scene_ids = {
+            item.annotation_scene.id_
+            for item in new_training_dataset
+            if not item.annotation_scene.ephemeral
+            and tuple(annotation.id_ for annotation in item.annotation_scene.annotations)
+            == annotation_ids_before_filters[item.annotation_scene.id_]
+        }
+        logger.info(
+            "Saving training dataset for task `%s` with %d items, of which %d have unchanged annotation scenes",
+            task_node.title,
+            len(new_training_dataset),
+            sum(item.annotation_scene.id_ in persisted_annotation_scene_ids for item in new_training_dataset),
+        )
+        DatasetRepo(dataset_storage.identifier).save_deep(
+            new_training_dataset, persisted_annotation_scene_ids=persisted_annotation_scene_ids
+        )
         return new_training_dataset
 
     @staticmethod
@@ -25,7 +25,7 @@ from iai_core.entities.scored_label import LabelSource, ScoredLabel
 from iai_core.entities.shapes import Ellipse, Keypoint, Point, Polygon, Rectangle
 from iai_core.entities.video import Video
 from iai_core.repos import AnnotationSceneRepo, BinaryRepo, VideoRepo
-from media_utils import VideoDecoder
+from media_utils import VideoDecoder, VideoMetadataProbeError
 
 from jobs_common_extras.datumaro_conversion.definitions import SUPPORTED_DOMAIN_TO_ANNOTATION_TYPES, GetiProjectType
 from jobs_common_extras.datumaro_conversion.import_utils import ImportUtils
@@ -314,8 +314,9 @@ class ConvertUtils:
         try:
             logger.debug(f"Getting video information for video with ID {video_id} with name {binary_filename}.")
             info = VideoDecoder.get_video_information(str(video_path))
+            metadata = VideoDecoder.get_video_metadata(str(video_path))
             logger.debug(f"Successfully fetched video information for video with ID {video_id}.")
-        except RuntimeError:
+        except (RuntimeError, VideoMetadataProbeError):
             video_binary_repo.delete_by_filename(filename=binary_filename)
             raise
 
@@ -330,6 +331,7 @@ class ConvertUtils:
             size=video_binary_repo.get_object_size(binary_filename),
             extension=video_extension,
             preprocessing=MediaPreprocessing(status=MediaPreprocessingStatus.SCHEDULED),
+            codec=metadata.codec,
         )
 
     @classmethod
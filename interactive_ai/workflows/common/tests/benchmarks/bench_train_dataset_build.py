@@ -0,0 +1,179 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+"""
+Benchmark of the persistence of a training dataset, on synthetic projects of 1k, 10k and 100k annotated images.
+
+A first training dataset is saved, then the annotations of a fraction of the media are edited and a new training
+dataset is built from the same media. 'full' saves the new training dataset and all its annotation scenes, as every
+training round did before; 'incremental' skips the annotation scenes that were loaded from the DB and only saves the
+new ones. For each mode the time and the number of annotation scenes written are reported. Each mode runs on a fresh
+in-memory mongomock DB, which has no network round-trips: the time is also reported with one round-trip of
+`--round-trip-ms` added per annotation scene request.
+
+Usage: PYTHONPATH=. python tests/benchmarks/bench_train_dataset_build.py [--items 1000 10000] [--changed-fraction 0.01]
+    [--round-trip-ms 1.0]
+"""
+
+import argparse
+import json
+import random
+import time
+from unittest.mock import patch
+
+import mongomock
+from geti_types import (
+    CTX_SESSION_VAR,
+    ID,
+    DatasetStorageIdentifier,
+    MediaIdentifierEntity,
+    RequestSource,
+    make_session,
+    session_context,
+)
+from iai_core.entities.annotation import Annotation, AnnotationScene, AnnotationSceneKind
+from iai_core.entities.dataset_item import DatasetItem
+from iai_core.entities.datasets import Dataset, DatasetPurpose
+from iai_core.entities.image import Image
+from iai_core.entities.media import MediaPreprocessing, MediaPreprocessingStatus
+from iai_core.entities.scored_label import ScoredLabel
+from iai_core.entities.shapes import Rectangle
+from iai_core.repos import AnnotationSceneRepo, DatasetRepo
+from iai_core.repos.base.mongo_connector import MongoConnector
+
+_LABEL_ID = ID("60d31793d5f1fb7e6e3c1a4f")
+_LABEL_SCHEMA_ID = ID("60d31793d5f1fb7e6e3c1a50")
+
+
+def make_annotation_scene(media_identifier: MediaIdentifierEntity, rng: random.Random) -> AnnotationScene:
+    annotations = []
+    for _ in range(3):
+        x1, y1 = rng.random() * 0.5, rng.random() * 0.5
+        annotations.append(
+            Annotation(
+                shape=Rectangle(x1=x1, y1=y1, x2=x1 + 0.25, y2=y1 + 0.25),
+                labels=[ScoredLabel(label_id=_LABEL_ID, is_empty=False)],
+            )
+        )
+    return AnnotationScene(
+        kind=AnnotationSceneKind.ANNOTATION,
+        media_identifier=media_identifier,
+        media_height=480,
+        media_width=640,
+        id_=AnnotationSceneRepo.generate_id(),
+        annotations=annotations,
+    )
+
+
+def make_items(count: int, rng: random.Random) -> list[DatasetItem]:
+    items = []
+    for i in range(count):
+        image = Image(
+            name=f"image_{i}",
+            uploader_id="",
+            id=DatasetRepo.generate_id(),
+            height=480,
+            width=640,
+            size=100_000,
+            preprocessing=MediaPreprocessing(status=MediaPreprocessingStatus.FINISHED),
+        )
+        items.append(
+            DatasetItem(
+                id_=DatasetRepo.generate_id(),
+                media=image,
+                annotation_scene=make_annotation_scene(image.media_identifier, rng),
+            )
+        )
+    return items
+
+
+def next_round_items(items: list[DatasetItem], changed_fraction: float, rng: random.Random) -> list[DatasetItem]:
+    """Copies the items for a new training round, with new annotation scenes for a fraction of the media."""
+    changed_indices = set(rng.sample(range(len(items)), k=int(len(items) * changed_fraction)))
+    new_items = []
+    for i, item in enumerate(items):
+        annotation_scene = item.annotation_scene
+        if i in changed_indices:
+            annotation_scene = make_annotation_scene(item.media_identifier, rng)
+        new_items.append(
+            DatasetItem(
+                id_=DatasetRepo.generate_id(), media=item.media, annotation_scene=annotation_scene, roi=item.roi
+            )
+        )
+    return new_items
+
+
+def make_dataset(items: list[DatasetItem]) -> Dataset:
+    return Dataset(
+        items=items, purpose=DatasetPurpose.TRAINING, label_schema_id=_LABEL_SCHEMA_ID, id=DatasetRepo.generate_id()
+    )
+
+
+def count_scene_writes(function, *args, **kwargs) -> tuple[float, int]:  # noqa: ANN001
+    """Runs the function, returns its duration and the number of annotation scenes it saved."""
+    with patch.object(AnnotationSceneRepo, "save", autospec=True, side_effect=AnnotationSceneRepo.save) as mock_save:
+        start_time = time.perf_counter()
+        function(*args, **kwargs)
+        duration = time.perf_counter() - start_time
+    return duration, mock_save.call_count
+
+
+def run_round(items_count: int, changed_fraction: float, incremental: bool) -> tuple[float, int]:
+    """Saves a first training dataset, then times the save of the next one, on a fresh in-memory DB."""
+    rng = random.Random(items_count)  # noqa: S311
+    with patch.object(MongoConnector, "get_mongo_client", return_value=mongomock.MongoClient()):
+        dataset_storage_identifier = DatasetStorageIdentifier(
+            workspace_id=CTX_SESSION_VAR.get().workspace_id,
+            project_id=DatasetRepo.generate_id(),
+            dataset_storage_id=DatasetRepo.generate_id(),
+        )
+        dataset_repo = DatasetRepo(dataset_storage_identifier)
+        previous_items = make_items(items_count, rng)
+        previous_dataset = make_dataset(previous_items)
+        dataset_repo.save_deep(previous_dataset)
+        new_dataset = make_dataset(next_round_items(previous_items, changed_fraction, rng))
+
+        if not incremental:
+            return count_scene_writes(dataset_repo.save_deep, new_dataset)
+
+        def save_incremental() -> None:
+            persisted_annotation_scene_ids = {
+                item.annotation_scene.id_ for item in new_dataset if not item.annotation_scene.ephemeral
+            }
+            dataset_repo.save_deep(new_dataset, persisted_annotation_scene_ids=persisted_annotation_scene_ids)
+
+        return count_scene_writes(save_incremental)
+
+
+def benchmark(items_count: int, changed_fraction: float, round_trip_ms: float) -> dict:
+    result: dict[str, float | int] = {"items": items_count, "changed_fraction": changed_fraction}
+    for mode in ("full", "incremental"):
+        duration, scene_writes = run_round(items_count, changed_fraction, incremental=mode == "incremental")
+        result[f"{mode}_seconds"] = round(duration, 3)
+        result[f"{mode}_scene_writes"] = scene_writes
+        # Every annotation scene is saved with its own request, which costs a round-trip to a real server
+        result[f"{mode}_seconds_with_round_trips"] = round(duration + scene_writes * round_trip_ms / 1000, 3)
+    result["speedup"] = round(
+        result["full_seconds_with_round_trips"] / result["incremental_seconds_with_round_trips"], 2
+    )
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--changed-fraction", type=float, default=0.01)
+    parser.add_argument("--round-trip-ms", type=float, default=1.0, help="Latency of a request to the DB server")
+    args = parser.parse_args()
+
+    session = make_session(
+        organization_id=DatasetRepo.generate_id(),
+        workspace_id=DatasetRepo.generate_id(),
+        source=RequestSource.INTERNAL,
+    )
+    with session_context(session=session):
+        for items_count in args.items:
+            print(json.dumps(benchmark(items_count, args.changed_fraction, args.round_trip_ms)), flush=True)
+
+
+if __name__ == "__main__":
+    main()
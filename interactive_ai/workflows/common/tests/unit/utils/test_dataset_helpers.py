@@ -92,6 +92,63 @@ class TestDatasetHelpers:
                 ),
             ]
         )
-        mock_save_deep.assert_called_once_with(train_dataset)
+        mock_save_deep.assert_called_once_with(train_dataset, persisted_annotation_scene_ids=set())
         assert train_dataset.purpose == DatasetPurpose.TRAINING
         assert len(train_dataset) == len(input_dataset)
+
+    def test_construct_and_save_train_dataset_for_task_persisted_annotation_scenes(
+        self,
+        fxt_session_ctx,
+        fxt_detection_project,
+        fxt_image_entity_factory,
+        fxt_annotation_scene_factory,
+        fxt_training_configuration,
+    ) -> None:
+        project: Project = fxt_detection_project
+        task_node = project.get_trainable_task_nodes()[0]
+        dataset_storage = project.get_training_dataset_storage()
+        input_dataset_items = [
+            DatasetItem(
+                id_=DatasetRepo.generate_id(),
+                media=fxt_image_entity_factory(index=i),
+                annotation_scene=fxt_annotation_scene_factory(index=i),
+            )
+            for i in range(1, 11)
+        ]
+        # The annotation scenes of the first 8 items were loaded from the DB
+        for item in input_dataset_items[:8]:
+            item.annotation_scene.mark_as_persisted()
+        input_dataset = Dataset(items=input_dataset_items, id=DatasetRepo.generate_id())
+
+        def filter_first_item(dataset: Dataset, **kwargs) -> Dataset:
+            dataset[0].annotation_scene.annotations = []
+            return dataset
+
+        with (
+            patch.object(LabelSchemaRepo, "get_latest_view_by_task"),
+            patch.object(TaskDataset, "get_dataset", return_value=input_dataset),
+            patch.object(TaskSubsetManager, "split"),
+            patch.object(TaskDataset, "save_subsets"),
+            patch("jobs_common.utils.dataset_helpers.publish_event"),
+            patch.object(DatasetRepo, "save_deep") as mock_save_deep,
+            patch.object(AnnotationFilter, "apply_annotation_filters", side_effect=filter_first_item),
+        ):
+            train_dataset = DatasetHelpers.construct_and_save_train_dataset_for_task(
+                task_dataset_entity=TaskDataset(
+                    task_node_id=task_node.id_,
+                    dataset_storage_id=project.training_dataset_storage_id,
+                    dataset_id=input_dataset.id_,
+                ),
+                project_id=project.id_,
+                task_node=task_node,
+                dataset_storage=dataset_storage,
+                training_configuration=fxt_training_configuration,
+                max_training_dataset_size=1000,
+            )
+
+        # Only the persisted annotation scenes left unchanged by the annotation filters are not saved again
+        mock_save_deep.assert_called_once_with(
+            train_dataset,
+            persisted_annotation_scene_ids={item.annotation_scene.id_ for item in input_dataset_items[1:8]},
+        )
+        assert len(train_dataset) == len(input_dataset)
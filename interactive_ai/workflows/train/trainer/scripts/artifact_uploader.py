@@ -0,0 +1,214 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+"""Background uploader for the model artifacts produced by the training job."""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from concurrent.futures import Future, wait
+from dataclasses import dataclass
+from queue import Queue
+from threading import Lock, Thread
+from typing import TYPE_CHECKING, ClassVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+ARTIFACT_UPLOAD_WORKERS = int(os.environ.get("ARTIFACT_UPLOAD_WORKERS", "4"))
+ARTIFACT_UPLOAD_QUEUE_SIZE = int(os.environ.get("ARTIFACT_UPLOAD_QUEUE_SIZE", "8"))
+
+logger = logging.getLogger(__name__)
+
+
+class ArtifactUploadError(RuntimeError):
+    """Raised by the flush barrier when some artifacts could not be uploaded."""
+
+
+@dataclass
+class ArtifactUploadStats:
+    uploaded_files: int = 0
+    uploaded_bytes: int = 0
+    failed_files: int = 0
+    # Sum of the durations of the individual uploads
+    upload_seconds: float = 0.0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+
+    @property
+    def throughput(self) -> float:
+        """Mean upload throughput of a worker, in bytes per second."""
+        return self.uploaded_bytes / self.upload_seconds if self.upload_seconds > 0 else 0.0
+
+
+@dataclass
+class _UploadTask:
+    future: Future[None]
+    src_filepath: Path
+    dst_filepath: Path
+    cleanup: Callable[[], None] | None
+
+
+class ArtifactUploader:
+    """Helper class to upload model artifacts in the background.
+
+    Artifacts are uploaded by a pool of worker threads. The queue of pending uploads is bounded: when it is full,
+    submitting another artifact blocks until a worker is available, so that the artifacts waiting for upload do not
+    pile up on disk. Each submitted artifact gets a future completed when its upload is done, and `flush()` waits
+    for all the submitted artifacts, e.g. before the job reports its completion.
+    """
+
+    STOP_SIGN: ClassVar[None] = None
+    instance: ClassVar[ArtifactUploader | None] = None
+
+    def __new__(cls):
+        if cls.instance is None:
+            cls.instance = super().__new__(cls)
+            cls.instance.threads = []
+            cls.instance.stats = ArtifactUploadStats()
+
+        return cls.instance
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self.threads)
+
+    def start(
+        self,
+        upload_file: Callable[[Path, Path], None],
+        num_workers: int = ARTIFACT_UPLOAD_WORKERS,
+        max_queue_size: int = ARTIFACT_UPLOAD_QUEUE_SIZE,
+    ) -> None:
+        """Start the upload workers.
+
+        :param upload_file: Function uploading a local file (first argument) to an object path (second argument)
+        :param num_workers: Number of concurrent uploads
+        :param max_queue_size: Maximum number of artifacts waiting for a worker
+        """
+        if self.is_running:
+            raise RuntimeError("ArtifactUploader is already started.")
+        self.upload_file = upload_file
+        self.stats = ArtifactUploadStats()
+        self.lock = Lock()
+        self.pending: set[Future[None]] = set()
+        self.errors: list[Exception] = []
+        self.queue: Queue[_UploadTask | None] = Queue(maxsize=max(1, max_queue_size))
+        self.threads = [
+            Thread(target=self.loop, name=f"artifact-upload-{i}", daemon=True) for i in range(max(1, num_workers))
+        ]
+        for thread in self.threads:
+            thread.start()
+
+    def submit(
+        self,
+        src_filepath: Path,
+        dst_filepath: Path,
+        cleanup: Callable[[], None] | None = None,
+    ) -> Future[None]:
+        """Upload an artifact in the background.
+
+        :param src_filepath: Local file to upload, which must not be modified until the upload is completed
+        :param dst_filepath: Path of the uploaded object
+        :param cleanup: Function to call once the upload is completed or failed, e.g. to delete the local file
+        :return: Future completed when the artifact is uploaded
+        """
+        if not self.is_running:
+            raise RuntimeError("You should call ArtifactUploader().start() first.")
+
+        task = _UploadTask(future=Future(), src_filepath=src_filepath, dst_filepath=dst_filepath, cleanup=cleanup)
+        with self.lock:
+            self.pending.add(task.future)
+        task.future.add_done_callback(self._discard_pending)
+        self.queue.put(task)
+        with self.lock:
+            self.stats.queue_depth = self.queue.qsize()
+            self.stats.max_queue_depth = max(self.stats.max_queue_depth, self.stats.queue_depth)
+        return task.future
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Block until all the submitted artifacts are uploaded.
+
+        Failures of the uploads completed since the previous flush are reported as well.
+
+        :param timeout: Maximum time to wait in seconds, or None to wait indefinitely
+        :raises ArtifactUploadError: If any upload failed or did not complete in time
+        """
+        if not self.is_running:
+            return
+        with self.lock:
+            pending = list(self.pending)
+        _, not_done = wait(pending, timeout=timeout)
+        with self.lock:
+            errors, self.errors = self.errors, []
+        self.log_stats()
+        if not_done or errors:
+            raise ArtifactUploadError(
+                f"{len(errors)} artifact uploads failed and {len(not_done)} did not complete in time."
+            ) from (errors[0] if errors else None)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Wait for the pending uploads and stop the workers."""
+        if not self.is_running:
+            return
+        try:
+            self.flush(timeout=timeout)
+        finally:
+            for _ in self.threads:
+                self.queue.put(self.STOP_SIGN)
+            for thread in self.threads:
+                thread.join(timeout=timeout)
+            self.threads = []
+
+    def loop(self) -> None:
+        while (task := self.queue.get()) is not self.STOP_SIGN:
+            self.run(task)
+
+    def run(self, task: _UploadTask) -> None:
+        if not task.future.set_running_or_notify_cancel():
+            return
+        start_time = time.perf_counter()
+        error: Exception | None = None
+        try:
+            size = task.src_filepath.stat().st_size
+            self.upload_file(task.src_filepath, task.dst_filepath)
+        except Exception as e:
+            logger.exception("Failed to upload artifact %s to %s", task.src_filepath, task.dst_filepath)
+            error = e
+        elapsed_time = time.perf_counter() - start_time
+        if task.cleanup is not None:
+            try:
+                task.cleanup()
+            except Exception:
+                logger.exception("Failed to clean up after the upload of artifact %s", task.src_filepath)
+
+        with self.lock:
+            if error is not None:
+                self.stats.failed_files += 1
+                self.errors.append(error)
+            else:
+                self.stats.uploaded_files += 1
+                self.stats.uploaded_bytes += size
+                self.stats.upload_seconds += elapsed_time
+        if error is not None:
+            task.future.set_exception(error)
+        else:
+            logger.info("Uploaded artifact %s (%d bytes) in %.1f s", task.dst_filepath, size, elapsed_time)
+            task.future.set_result(None)
+
+    def log_stats(self) -> None:
+        stats = self.stats
+        logger.info(
+            "Artifact uploads: %d files, %.1f MB, %.1f MB/s per worker, %d failed, max queue depth %d",
+            stats.uploaded_files,
+            stats.uploaded_bytes / 1e6,
+            stats.throughput / 1e6,
+            stats.failed_files,
+            stats.max_queue_depth,
+        )
+
+    def _discard_pending(self, future: Future[None]) -> None:
+        with self.lock:
+            self.pending.discard(future)
+            self.stats.queue_depth = self.queue.qsize()
@@ -7,16 +7,21 @@ import json
 import logging
 import os
 import re
+import shutil
 import traceback
+import uuid
+from concurrent.futures import Future
 from functools import partial, wraps
 from pathlib import Path
 from queue import Queue
-from tempfile import TemporaryDirectory
+from tempfile import NamedTemporaryFile
 from threading import Thread
 from typing import TYPE_CHECKING, ClassVar
 
 import requests
+from artifact_uploader import ArtifactUploader
 from s3_client import S3ClientSingleton
+from shard_downloader import ShardDownloader, ShardObject
 from tqdm import tqdm
 from utils import BASE_MODEL_FILENAME, ExportFormat, ExportParameter, PrecisionType, logging_elapsed_time
 
@@ -25,6 +30,8 @@ if TYPE_CHECKING:
     from collections.abc import Callable
 
 TIMEOUT = 300.0
+ARTIFACT_UPLOAD_PART_SIZE = int(os.environ.get("ARTIFACT_UPLOAD_PART_SIZE_MB", "16")) * 1024 * 1024
+ARTIFACT_UPLOAD_PART_PARALLELISM = int(os.environ.get("ARTIFACT_UPLOAD_PART_PARALLELISM", "4"))
 
 logger = logging.getLogger(__name__)
 
@@ -102,25 +109,46 @@ class AsyncCaller:
         return wrapper
 
 
-@logging_elapsed_time(logger=logger, log_level=logging.INFO)
-def download_shard_files() -> Path:
-    """Download shard files."""
-    pattern = re.compile("datum-(\d+)-of-(\d+).arrow")
+def start_shard_files_download() -> ShardDownloader:
+    """Start downloading the shard files in the background.
+
+    The returned downloader yields the shards as they complete (`as_completed()`) or blocks until all of them are
+    downloaded and verified (`wait()`), so that other preparation steps can run while the download is in progress.
+    """
+    pattern = re.compile(r"datum-(\d+)-of-(\d+).arrow")
 
     client = S3ClientSingleton.instance()
-    shard_file_names = []
+    shards = []
     for obj in client.list_files(
         bucket_name=_get_bucket_name(), relative_path=_get_object_name_base() / "inputs", recursive=True
     ):
         if not obj.is_dir and pattern.findall(obj.object_name):
-            shard_file_names += [os.path.basename(obj.object_name)]
+            shards.append(
+                ShardObject(
+                    relative_path=_get_object_name_base() / "inputs" / os.path.basename(obj.object_name),
+                    size=obj.size,
+                    etag=obj.etag,
+                )
+            )
 
-    for shard_file_name in tqdm(shard_file_names, desc="Downloading shard files"):
-        client.download_file(
-            bucket_name=_get_bucket_name(),
-            relative_path=_get_object_name_base() / "inputs" / shard_file_name,
-            file_path=_get_shard_files_dir() / shard_file_name,
-        )
+    return ShardDownloader(
+        client=client, bucket_name=_get_bucket_name(), shards=shards, dst_dir=_get_shard_files_dir()
+    ).start()
+
+
+@logging_elapsed_time(logger=logger, log_level=logging.INFO)
+def download_shard_files(downloader: ShardDownloader | None = None) -> Path:
+    """Download shard files.
+
+    :param downloader: Downloader returned by `start_shard_files_download()`, if the download was already started
+    :return: Directory containing the downloaded shard files
+    """
+    if downloader is None:
+        downloader = start_shard_files_download()
+
+    with tqdm(total=len(downloader.shards), desc="Downloading shard files") as progress_bar:
+        for _ in downloader.as_completed():
+            progress_bar.update()
 
     return _get_shard_files_dir()
 
@@ -151,21 +179,21 @@ def save_checkpoint(
 def save_checkpoint_sync(
     model_weights_reader: io.BufferedReader,
     force_non_xai: bool = False,
-) -> None:
-    """Save the trained base model weight binary file (BASE_FRAMEWORK)."""
-    filename = BASE_MODEL_FILENAME if not force_non_xai else BASE_MODEL_FILENAME.replace("xai", "non-xai")
-    with TemporaryDirectory() as tmpdir:
-        local_dir_path = Path(tmpdir)
-        local_file_path = local_dir_path / filename
+) -> Future[None]:
+    """Save the trained base model weight binary file (BASE_FRAMEWORK).
 
-        with local_file_path.open("wb") as fp:
-            fp.write(model_weights_reader.read())
+    The file is uploaded in the background if the `ArtifactUploader` is running; the returned future is completed
+    once it is uploaded.
+    """
+    filename = BASE_MODEL_FILENAME if not force_non_xai else BASE_MODEL_FILENAME.replace("xai", "non-xai")
+    with NamedTemporaryFile(prefix="checkpoint-", delete=False) as fp:
+        fp.write(model_weights_reader.read())
 
-        S3ClientSingleton.instance().upload_file_from_local_disk(
-            bucket_name=_get_bucket_name(),
-            relative_path=_get_object_name_base() / "outputs/models" / filename,
-            local_file_path=local_file_path,
-        )
+    return upload_model_artifact_async(
+        src_filepath=Path(fp.name),
+        dst_filepath=Path("outputs/models") / filename,
+        keep_src=False,
+    )
 
 
 def upload_error_log(exception: Exception) -> None:
@@ -203,6 +231,44 @@ def upload_model_artifact(
         bucket_name=_get_bucket_name(),
         relative_path=_get_object_name_base() / dst_filepath,
         local_file_path=src_filepath,
+        part_size=ARTIFACT_UPLOAD_PART_SIZE,
+        num_parallel_uploads=ARTIFACT_UPLOAD_PART_PARALLELISM,
+    )
+
+
+def upload_model_artifact_async(
+    src_filepath: Path,
+    dst_filepath: Path,
+    keep_src: bool = True,
+) -> Future[None]:
+    """Upload model artifact without blocking, if the `ArtifactUploader` is running, otherwise synchronously.
+
+    The file is snapshotted before returning, so that it can be overwritten or deleted right away, e.g. by the next
+    export to the same directory.
+
+    :param src_filepath: Local file to upload
+    :param dst_filepath: Path of the artifact, relative to the job directory
+    :param keep_src: If False, the local file is deleted; moving it to the snapshot saves a copy
+    :return: Future completed when the artifact is uploaded
+    """
+    uploader = ArtifactUploader()
+    if not uploader.is_running:
+        upload_model_artifact(src_filepath=src_filepath, dst_filepath=dst_filepath)
+        if not keep_src:
+            os.remove(src_filepath)
+        future: Future[None] = Future()
+        future.set_result(None)
+        return future
+
+    snapshot_path = src_filepath.with_name(f".{src_filepath.name}.{uuid.uuid4().hex}.upload")
+    if keep_src:
+        shutil.copyfile(src_filepath, snapshot_path)
+    else:
+        os.replace(src_filepath, snapshot_path)
+    return uploader.submit(
+        src_filepath=snapshot_path,
+        dst_filepath=dst_filepath,
+        cleanup=partial(os.remove, snapshot_path),
     )
 
 
@@ -247,7 +313,7 @@ def save_trained_model_weights(
     """Save model trained weights (PyTorch checkpoint)."""
     filename = BASE_MODEL_FILENAME if not force_non_xai else BASE_MODEL_FILENAME.replace("xai", "non-xai")
 
-    upload_model_artifact(
+    upload_model_artifact_async(
         src_filepath=best_checkpoint,
         dst_filepath=Path("outputs/models") / filename,
     )
@@ -266,12 +332,11 @@ def save_exported_model(export_dir: Path, export_param: ExportParameter) -> None
             target_names,
             export_param.to_artifact_fnames(),
         ):
-            src_filepath = export_dir / src_filename
-            upload_model_artifact(
-                src_filepath=src_filepath,
+            upload_model_artifact_async(
+                src_filepath=export_dir / src_filename,
                 dst_filepath=Path("outputs/models") / dst_filename,
+                keep_src=False,
             )
-            os.remove(src_filepath)
 
         return
 
@@ -280,7 +345,7 @@ def save_exported_model(export_dir: Path, export_param: ExportParameter) -> None
             ["exported_model.onnx"],
             export_param.to_artifact_fnames(),
         ):
-            upload_model_artifact(
+            upload_model_artifact_async(
                 src_filepath=export_dir / src_filename,
                 dst_filepath=Path("outputs/models") / dst_filename,
             )
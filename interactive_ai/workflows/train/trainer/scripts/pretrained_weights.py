@@ -11,11 +11,13 @@ from pathlib import Path
 import requests
 from minio.error import S3Error
 from s3_client import S3ClientSingleton
+from weights_cache import WeightsCache
 
 logger = logging.getLogger("otx_job")
 
 BUCKET_NAME_PRETRAINEDWEIGHTS = os.environ.get("BUCKET_NAME_PRETRAINEDWEIGHTS")
 logger.info(f"PRETRAINEDWEIGHTS bucket name: {BUCKET_NAME_PRETRAINEDWEIGHTS}")
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 
 
 def download_file_from_url(object_name: str, file_path: str) -> None:
@@ -25,10 +27,10 @@ def download_file_from_url(object_name: str, file_path: str) -> None:
     try:
         # Try to download the file from the Internet
         url = f"{os.environ.get('WEIGHTS_URL')}/{object_name}"
-        resp = requests.get(url, timeout=600)
+        resp = requests.get(url, timeout=600, stream=True)
         if resp.status_code == 200:
             with open(file_path, "wb") as f:
-                for chunk in resp.iter_content(chunk_size=512):
+                for chunk in resp.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                     if chunk:
                         f.write(chunk)
             logger.info(f"File '{object_name}' downloaded successfully from {url} to '{file_path}'")
@@ -62,10 +64,10 @@ def download_file(object_name, file_path):  # noqa: ANN001, ANN201, D103
             logger.warning("Trying to get object using presigned URL")
             url = client.get_presigned_url(bucket_name=BUCKET_NAME_PRETRAINEDWEIGHTS, relative_path=object_name)
             try:
-                resp = requests.get(url, timeout=600)
+                resp = requests.get(url, timeout=600, stream=True)
                 if resp.status_code == 200:
                     with open(file_path, "wb") as f:
-                        for chunk in resp.iter_content(chunk_size=512):
+                        for chunk in resp.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                             if chunk:
                                 f.write(chunk)
                     logger.info(f"File '{object_name}' downloaded successfully to '{file_path}' using presigned URL")
@@ -75,6 +77,28 @@ def download_file(object_name, file_path):  # noqa: ANN001, ANN201, D103
                 raise
 
 
+def fetch_file(object_name: str, file_path: str, sha_sum: str | None, weights_cache: WeightsCache | None) -> None:
+    """
+    Download a file through the node-local pretrained weights cache, if enabled and the file digest is known
+    """
+    if weights_cache is None or not sha_sum:
+        download_file(object_name, file_path)
+        return
+    try:
+        weights_cache.fetch(
+            object_name=object_name,
+            digest=sha_sum,
+            dst_path=Path(file_path),
+            download=lambda path: download_file(object_name, str(path)),
+        )
+    except requests.RequestException:
+        # Download failures are subclasses of OSError but are not caused by the cache
+        raise
+    except OSError:
+        logger.warning(f"Pretrained weights cache failed for '{object_name}', downloading it directly", exc_info=True)
+        download_file(object_name, file_path)
+
+
 def download_pretrained_weights(work_dir: Path, template_id: str) -> None:
     """Download pretrained weights from MinIO and save them to the given directory."""
 
@@ -91,12 +115,14 @@ def download_pretrained_weights(work_dir: Path, template_id: str) -> None:
         metadata = json.load(f)
     # Determine obj_name depending on the config
     obj_names = []
+    sha_sums = {}
     for model in metadata:
         template_ids = model.get("template_ids")
         if template_ids is not None and isinstance(template_ids, list):
             for id in template_ids:
                 if id == template_id:
                     obj_names.append(os.path.basename(model["target"]))
+                    sha_sums[obj_names[-1]] = model.get("sha_sum")
                     logger.info(
                         f"Found pretrained weights for template_id: {template_id},"
                         "target: {os.path.basename(model['target'])}"
@@ -107,11 +133,19 @@ def download_pretrained_weights(work_dir: Path, template_id: str) -> None:
         raise RuntimeError(f"Cannot find matched weights from model metadata for {template_id}")
 
     model_cache_dir = os.environ.get("MODEL_CACHE_DIR", "/home/non-root/.cache/torch/hub/checkpoints")
+    weights_cache = WeightsCache.from_env()
     for obj_name in obj_names:
         file_path = os.path.join(model_cache_dir, obj_name)
-        download_file(obj_name, file_path)
+        fetch_file(obj_name, file_path, sha_sum=sha_sums[obj_name], weights_cache=weights_cache)
         if file_path.endswith(".zip"):
             with zipfile.ZipFile(file_path) as zip_ref:
                 zip_ref.extractall(os.path.dirname(file_path))
             os.remove(file_path)
         logger.info(f"Downloaded pretrained weights: {obj_name} to {file_path}")
+
+    if weights_cache is not None:
+        stats = weights_cache.stats
+        logger.info(
+            f"Pretrained weights cache: {stats.hits} hits, {stats.misses} misses, "
+            f"{stats.downloaded_bytes} bytes downloaded, {stats.evicted_bytes} bytes evicted"
+        )
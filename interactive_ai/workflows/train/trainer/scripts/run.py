@@ -8,8 +8,17 @@ import os
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+from artifact_uploader import ArtifactUploader, ArtifactUploadError
 from optimize import optimize
-from otx_io import AsyncCaller, download_config_file, download_shard_files, upload_error_log, upload_full_log
+from otx_io import (
+    AsyncCaller,
+    download_config_file,
+    download_shard_files,
+    start_shard_files_download,
+    upload_error_log,
+    upload_full_log,
+    upload_model_artifact,
+)
 from pretrained_weights import download_pretrained_weights
 from train import train
 from utils import JobType, OTXConfig, logging_elapsed_time
@@ -22,12 +31,19 @@ def execute(work_dir: Path) -> None:
     """Execute an OTX job by dispatching according to the given job type."""
 
     config_file_path = download_config_file()
-    shard_files_dir = download_shard_files()
+    # Shards are fetched in the background while the pretrained weights are downloaded
+    shard_downloader = start_shard_files_download()
 
-    config = OTXConfig.from_yaml_file(config_file_path=config_file_path)
+    try:
+        config = OTXConfig.from_yaml_file(config_file_path=config_file_path)
+
+        job_type = config.job_type
+        download_pretrained_weights(work_dir=work_dir, template_id=config.model_manifest_id)
+    except Exception:
+        shard_downloader.cancel()
+        raise
 
-    job_type = config.job_type
-    download_pretrained_weights(work_dir=work_dir, template_id=config.model_manifest_id)
+    shard_files_dir = download_shard_files(downloader=shard_downloader)
 
     if job_type == JobType.TRAIN:
         logger.debug("Starting training job.")
@@ -48,6 +64,9 @@ def execute(work_dir: Path) -> None:
     else:
         raise ValueError
 
+    # Barrier for the model artifacts uploaded in the background: the job is complete only once all are uploaded
+    ArtifactUploader().flush()
+
 
 if __name__ == "__main__":
     client = None
@@ -66,8 +85,11 @@ if __name__ == "__main__":
         fp.write(str(pid))
         logger.info(f"Primary PID: {pid}")
 
+    job_exception: BaseException | None = None
+    upload_exception: ArtifactUploadError | None = None
     try:
         AsyncCaller().start()
+        ArtifactUploader().start(upload_file=upload_model_artifact)
 
         with TemporaryDirectory() as tmpdir:
             work_dir = Path(tmpdir)
@@ -76,9 +98,18 @@ if __name__ == "__main__":
 
         Path("/tmp/training_completed").touch()  # noqa: S108
     except Exception as exception:
+        job_exception = exception
         upload_error_log(exception=exception)
         raise  # Reraise
     finally:
+        root_logger.debug("Start ArtifactUploader().close() process.")
+        try:
+            ArtifactUploader().close()
+        except ArtifactUploadError as exception:
+            # The logs must still be uploaded, so the error is only raised once the cleanup is complete
+            logger.exception("Failed to upload some model artifacts")
+            upload_exception = exception
+
         root_logger.debug("Start AsyncCaller().close() process.")
         AsyncCaller().close()
 
@@ -87,3 +118,7 @@ if __name__ == "__main__":
             full_log_text = Path(log_file).read_text()
             upload_full_log(full_log_text=full_log_text)
         root_logger.debug("Finished upload_full_log() process.")
+
+        # Do not mask the exception of a failed job, which already reports its own error
+        if upload_exception is not None and job_exception is None:
+            raise upload_exception
@@ -184,8 +184,21 @@ class S3Client:
 
     @retry_on_rate_limit()
     def upload_file_from_local_disk(
-        self, bucket_name: str, relative_path: Path, local_file_path: Path, overwrite: bool = False
+        self,
+        bucket_name: str,
+        relative_path: Path,
+        local_file_path: Path,
+        overwrite: bool = False,
+        part_size: int = 0,
+        num_parallel_uploads: int = 3,
     ) -> None:
+        """
+        Upload a local file. Files larger than the part size are sent as a multipart upload.
+
+        :param part_size: Size in bytes of the parts of a multipart upload (at least 5 MiB), or 0 to let the client
+            pick the smallest size allowed for the file
+        :param num_parallel_uploads: Number of parts uploaded concurrently
+        """
         if not overwrite and self.check_file_exists(bucket_name=bucket_name, object_name=relative_path):
             raise FileExistsError(f"Cannot save file, because a file already exists at {relative_path}.")
 
@@ -193,6 +206,8 @@ class S3Client:
             bucket_name=bucket_name,
             object_name=str(relative_path),
             file_path=local_file_path,
+            part_size=part_size,
+            num_parallel_uploads=num_parallel_uploads,
         )
 
     @retry_on_rate_limit()
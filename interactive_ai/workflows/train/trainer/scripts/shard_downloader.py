@@ -0,0 +1,217 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+"""Parallel download of the dataset shard files, with retries and integrity verification."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import random
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from threading import Event
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+    from pathlib import Path
+
+    from s3_client import S3Client
+
+SHARD_DOWNLOAD_MAX_WORKERS = int(os.environ.get("SHARD_DOWNLOAD_MAX_WORKERS", "8"))
+SHARD_DOWNLOAD_MAX_ATTEMPTS = int(os.environ.get("SHARD_DOWNLOAD_MAX_ATTEMPTS", "5"))
+SHARD_DOWNLOAD_INITIAL_BACKOFF = float(os.environ.get("SHARD_DOWNLOAD_INITIAL_BACKOFF", "1.0"))
+SHARD_DOWNLOAD_MAX_BACKOFF = float(os.environ.get("SHARD_DOWNLOAD_MAX_BACKOFF", "20.0"))
+CHECKSUM_CHUNK_SIZE = 8 * 1024 * 1024
+
+logger = logging.getLogger(__name__)
+
+
+class ShardDownloadError(RuntimeError):
+    """Raised when a shard file could not be downloaded."""
+
+
+class ShardVerificationError(RuntimeError):
+    """Raised when a downloaded shard file does not match the size or checksum of the S3 object."""
+
+
+@dataclass(frozen=True)
+class ShardObject:
+    """
+    Shard file stored in S3.
+
+    :param relative_path: Object name of the shard file in the bucket
+    :param size: Size in bytes of the object, as listed by S3, or None if unknown
+    :param etag: ETag of the object, as listed by S3, or None if unknown
+    """
+
+    relative_path: Path
+    size: int | None = None
+    etag: str | None = None
+
+    @property
+    def name(self) -> str:
+        return self.relative_path.name
+
+    @property
+    def md5(self) -> str | None:
+        """MD5 checksum of the object, if available: the ETag of objects uploaded in a single part is their MD5."""
+        if not self.etag:
+            return None
+        etag = self.etag.strip('"')
+        # The ETag of multipart uploads is not the checksum of the content, e.g. "<md5 of the part md5s>-<n_parts>"
+        if "-" in etag or len(etag) != 32:
+            return None
+        return etag.lower()
+
+
+class ShardDownloader:
+    """
+    Download engine for the shard files of a training job.
+
+    The shards are fetched in parallel by a bounded pool of workers. Each download is verified against the size and,
+    when available, the MD5 checksum of the S3 object, and is retried with exponential back-off and jitter on failure.
+    Shards already present locally and passing the verification are not downloaded again.
+
+    The downloads start in the background with `start()`; consumers can pick up completed shards with `as_completed()`
+    while the others are still downloading, or block until all of them are available with `wait()`.
+
+    :param client: S3 client to download the shards with
+    :param bucket_name: Name of the bucket storing the shards
+    :param shards: Shard files to download
+    :param dst_dir: Local directory to download the shards to
+    :param max_workers: Maximum number of concurrent downloads
+    :param max_attempts: Maximum number of attempts per shard before giving up
+    :param initial_backoff: Delay in seconds before the first retry, doubled after every failed attempt
+    """
+
+    def __init__(
+        self,
+        client: S3Client,
+        bucket_name: str,
+        shards: Sequence[ShardObject],
+        dst_dir: Path,
+        max_workers: int = SHARD_DOWNLOAD_MAX_WORKERS,
+        max_attempts: int = SHARD_DOWNLOAD_MAX_ATTEMPTS,
+        initial_backoff: float = SHARD_DOWNLOAD_INITIAL_BACKOFF,
+    ) -> None:
+        self.client = client
+        self.bucket_name = bucket_name
+        self.shards = list(shards)
+        self.dst_dir = dst_dir
+        self.max_workers = max(1, max_workers)
+        self.max_attempts = max(1, max_attempts)
+        self.initial_backoff = initial_backoff
+        self._cancelled = Event()
+        self._executor: ThreadPoolExecutor | None = None
+        self._futures: list[Future[Path]] = []
+
+    def start(self) -> ShardDownloader:
+        """Start downloading the shards in the background."""
+        if self._executor is not None:
+            raise RuntimeError("The shard download has already been started.")
+        self.dst_dir.mkdir(parents=True, exist_ok=True)
+        self._executor = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, max(len(self.shards), 1)), thread_name_prefix="shard-download"
+        )
+        self._futures = [self._executor.submit(self._download, shard) for shard in self.shards]
+        return self
+
+    def as_completed(self) -> Iterator[Path]:
+        """
+        Iterate over the local paths of the shards as soon as their download is completed and verified.
+
+        :raises ShardDownloadError: If any shard cannot be downloaded; the remaining downloads are cancelled
+        """
+        if self._executor is None:
+            self.start()
+        try:
+            for future in as_completed(self._futures):
+                yield future.result()
+        except Exception:
+            self.cancel()
+            raise
+        self._executor.shutdown(wait=True)  # type: ignore[union-attr]
+
+    def wait(self) -> list[Path]:
+        """
+        Block until all the shards are downloaded.
+
+        :return: Local paths of the shards, in the order they were given
+        :raises ShardDownloadError: If any shard cannot be downloaded; the remaining downloads are cancelled
+        """
+        for _ in self.as_completed():
+            pass
+        return [future.result() for future in self._futures]
+
+    def cancel(self) -> None:
+        """Cancel the pending downloads and wait for the running ones to stop."""
+        self._cancelled.set()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _is_downloaded(self, file_path: Path, shard: ShardObject) -> bool:
+        """Check whether a shard was fully downloaded already, e.g. by a previous run of the job."""
+        if not file_path.exists():
+            return False
+        try:
+            self._verify(file_path=file_path, shard=shard)
+        except (ShardVerificationError, OSError):
+            file_path.unlink(missing_ok=True)
+            return False
+        return True
+
+    def _download(self, shard: ShardObject) -> Path:
+        file_path = self.dst_dir / shard.name
+        if self._is_downloaded(file_path=file_path, shard=shard):
+            logger.info("Shard file %s is already downloaded, skipping.", shard.name)
+            return file_path
+
+        last_error: Exception | None = None
+        for attempt in range(self.max_attempts):
+            if attempt > 0:
+                # ruff: noqa: S311
+                jitter = random.uniform(0.5, 1.0)  # nosec
+                backoff_time = min(jitter * (2 ** (attempt - 1)) * self.initial_backoff, SHARD_DOWNLOAD_MAX_BACKOFF)
+                if self._cancelled.wait(backoff_time):
+                    break
+            if self._cancelled.is_set():
+                break
+            try:
+                self.client.download_file(
+                    bucket_name=self.bucket_name, relative_path=shard.relative_path, file_path=file_path
+                )
+                self._verify(file_path=file_path, shard=shard)
+            except Exception as e:
+                last_error = e
+                file_path.unlink(missing_ok=True)
+                logger.warning(
+                    "Attempt %d/%d to download shard file %s failed: %s", attempt + 1, self.max_attempts, shard.name, e
+                )
+            else:
+                return file_path
+
+        if self._cancelled.is_set():
+            raise ShardDownloadError(f"Download of shard file {shard.name} was cancelled.") from last_error
+        raise ShardDownloadError(
+            f"Failed to download shard file {shard.name} after {self.max_attempts} attempts."
+        ) from last_error
+
+    @staticmethod
+    def _verify(file_path: Path, shard: ShardObject) -> None:
+        """
+        Check that a downloaded file matches the size and checksum of the S3 object.
+
+        :raises ShardVerificationError: If the file does not match
+        """
+        if shard.size is not None and (size := file_path.stat().st_size) != shard.size:
+            raise ShardVerificationError(f"{file_path.name} has size {size}, expected {shard.size}.")
+        if (expected_md5 := shard.md5) is None:
+            return
+        md5 = hashlib.md5(usedforsecurity=False)
+        with file_path.open("rb") as fp:
+            while chunk := fp.read(CHECKSUM_CHUNK_SIZE):
+                md5.update(chunk)
+        if md5.hexdigest() != expected_md5:
+            raise ShardVerificationError(f"{file_path.name} has MD5 {md5.hexdigest()}, expected {expected_md5}.")
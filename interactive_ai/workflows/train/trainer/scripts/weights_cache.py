@@ -0,0 +1,217 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+"""Node-local content-addressed cache for the pretrained weights, shared by the training jobs running on a node."""
+
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import logging
+import os
+import shutil
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+CHECKSUM_CHUNK_SIZE = 8 * 1024 * 1024
+
+logger = logging.getLogger("otx_job")
+
+
+@dataclass
+class WeightsCacheStats:
+    hits: int = 0
+    misses: int = 0
+    downloaded_bytes: int = 0
+    evicted_bytes: int = 0
+
+
+class WeightsCache:
+    """
+    Cache of the pretrained weight files, keyed by object name and SHA-256 digest.
+
+    The cache lives in a directory shared by all the jobs on the node, laid out as follows:
+     - `entries/<digest>/<object name>`: cached files
+     - `locks/<digest>.lock`: lock files, held shared while an entry is read and exclusive while it is populated or
+       evicted, so that concurrent jobs download each file at most once and never read a partially written entry;
+       they are removed together with their entry, or as soon as they are unused if the entry was never cached
+     - `tmp/`: files being downloaded, moved atomically into `entries/` once complete and verified
+
+    The modification time of the cached files records their last use; when the total size exceeds `max_size`, the
+    least recently used entries that are not being read are evicted.
+
+    :param root_dir: Directory of the cache
+    :param max_size: Maximum total size in bytes of the cached files
+    """
+
+    def __init__(self, root_dir: Path, max_size: int) -> None:
+        self.root_dir = root_dir
+        self.max_size = max_size
+        self.stats = WeightsCacheStats()
+        for sub_dir in ("entries", "locks", "tmp"):
+            (root_dir / sub_dir).mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def from_env(cls) -> WeightsCache | None:
+        """
+        Create the cache configured by the environment variables, or None if caching is disabled or the cache
+        directory is not usable, in which case the weights are downloaded without caching.
+        """
+        root_dir = os.environ.get("PRETRAINED_WEIGHTS_CACHE_DIR")
+        if not root_dir:
+            return None
+        max_size_gb = float(os.environ.get("PRETRAINED_WEIGHTS_CACHE_MAX_SIZE_GB", "20"))
+        try:
+            return cls(root_dir=Path(root_dir), max_size=int(max_size_gb * 1024**3))
+        except OSError:
+            logger.warning("Pretrained weights cache disabled: cannot set up %s", root_dir, exc_info=True)
+            return None
+
+    def fetch(self, object_name: str, digest: str, dst_path: Path, download: Callable[[Path], None]) -> Path:
+        """
+        Provide a weight file at the given path, from the cache if available, otherwise downloading it first.
+
+        :param object_name: Name of the object storing the file
+        :param digest: Expected SHA-256 hex digest of the file
+        :param dst_path: Path where the file should be provided
+        :param download: Function downloading the file to the path passed as argument, called on a cache miss
+        :return: dst_path
+        """
+        digest = digest.lower()
+        entry_path = self.root_dir / "entries" / digest / os.path.basename(object_name)
+        with self._lock(digest, exclusive=False):
+            if entry_path.is_file():
+                self.stats.hits += 1
+                logger.info("Pretrained weights cache hit: %s", object_name)
+                self._materialize(entry_path=entry_path, dst_path=dst_path)
+                return dst_path
+
+        with self._lock(digest, exclusive=True):
+            # Another job may have populated the entry while waiting for the lock
+            if entry_path.is_file():
+                self.stats.hits += 1
+                logger.info("Pretrained weights cache hit: %s", object_name)
+            else:
+                self.stats.misses += 1
+                logger.info("Pretrained weights cache miss: %s", object_name)
+                if not self._populate(entry_path=entry_path, digest=digest, download=download, dst_path=dst_path):
+                    return dst_path
+            self._materialize(entry_path=entry_path, dst_path=dst_path)
+
+        self._evict(keep=digest)
+        return dst_path
+
+    def _populate(self, entry_path: Path, digest: str, download: Callable[[Path], None], dst_path: Path) -> bool:
+        """
+        Download a file into the cache. Must be called holding the exclusive lock of the entry.
+
+        :return: False if the downloaded file does not match the digest, in which case it is not cached and is moved
+            to dst_path as is
+        """
+        tmp_path = self.root_dir / "tmp" / f"{digest}.{uuid.uuid4().hex}"
+        try:
+            download(tmp_path)
+            self.stats.downloaded_bytes += tmp_path.stat().st_size
+            if (actual_digest := self._sha256(tmp_path)) != digest:
+                logger.warning(
+                    "Not caching %s: SHA-256 %s does not match the expected %s", entry_path.name, actual_digest, digest
+                )
+                dst_path.parent.mkdir(parents=True, exist_ok=True)
+                shutil.move(tmp_path, dst_path)
+                return False
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp_path, entry_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return True
+
+    @staticmethod
+    def _materialize(entry_path: Path, dst_path: Path) -> None:
+        """Provide a cached file at dst_path, hard-linked if on the same filesystem, copied otherwise."""
+        # Refresh the last use time of the entry for the LRU eviction
+        os.utime(entry_path)
+        dst_path.parent.mkdir(parents=True, exist_ok=True)
+        dst_path.unlink(missing_ok=True)
+        try:
+            os.link(entry_path, dst_path)
+        except OSError:
+            shutil.copyfile(entry_path, dst_path)
+
+    def _evict(self, keep: str) -> None:
+        """Evict the least recently used entries until the cache fits its maximum size."""
+        entries = []
+        for entry_dir in (self.root_dir / "entries").iterdir():
+            try:
+                files = [(path.stat().st_size, path.stat().st_mtime) for path in entry_dir.iterdir()]
+            except FileNotFoundError:
+                continue
+            entries.append((max((mtime for _, mtime in files), default=0.0), sum(size for size, _ in files), entry_dir))
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry_dir in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            if entry_dir.name == keep:
+                continue
+            try:
+                with self._lock(entry_dir.name, exclusive=True, blocking=False):
+                    shutil.rmtree(entry_dir, ignore_errors=True)
+                    self._lock_path(entry_dir.name).unlink(missing_ok=True)
+            except BlockingIOError:
+                # The entry is being read or populated by another job
+                continue
+            total_size -= size
+            self.stats.evicted_bytes += size
+            logger.info("Evicted %s (%d bytes) from the pretrained weights cache", entry_dir.name, size)
+        self._remove_orphan_locks()
+
+    def _remove_orphan_locks(self) -> None:
+        """Remove the unused lock files of the entries that are not cached, e.g. after a digest mismatch."""
+        for lock_path in (self.root_dir / "locks").glob("*.lock"):
+            digest = lock_path.stem
+            if (self.root_dir / "entries" / digest).exists():
+                continue
+            try:
+                with self._lock(digest, exclusive=True, blocking=False):
+                    if not (self.root_dir / "entries" / digest).exists():
+                        lock_path.unlink(missing_ok=True)
+            except BlockingIOError:
+                continue
+
+    def _lock_path(self, digest: str) -> Path:
+        return self.root_dir / "locks" / f"{digest}.lock"
+
+    @contextmanager
+    def _lock(self, digest: str, exclusive: bool, blocking: bool = True) -> Iterator[None]:
+        lock_path = self._lock_path(digest)
+        operation = fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+        while True:
+            with open(lock_path, "a") as lock_file:
+                fcntl.flock(lock_file, operation if blocking else operation | fcntl.LOCK_NB)
+                try:
+                    # The lock file may have been removed by another job while waiting for the lock, in which case
+                    # the lock is held on a stale file and must be acquired again on the current one
+                    if self._is_current_lock_file(lock_file.fileno(), lock_path):
+                        yield
+                        return
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _is_current_lock_file(fd: int, lock_path: Path) -> bool:
+        try:
+            return os.path.samestat(os.fstat(fd), os.stat(lock_path))
+        except FileNotFoundError:
+            return False
+
+    @staticmethod
+    def _sha256(file_path: Path) -> str:
+        sha256 = hashlib.sha256()
+        with file_path.open("rb") as fp:
+            while chunk := fp.read(CHECKSUM_CHUNK_SIZE):
+                sha256.update(chunk)
+        return sha256.hexdigest()
@@ -0,0 +1,164 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+"""
+Benchmark of the shard file download stage of the trainer, against a local filesystem stand-in for S3.
+
+The stand-in serves files from a local directory, adding a fixed latency per request and throttling each transfer to
+a per-connection bandwidth, which is what bounds the throughput of a single download from S3. It can also inject
+transient failures (errors and corrupted transfers) to exercise the retries.
+
+'sequential' downloads one shard at a time, as the trainer did before the download engine was introduced;
+'parallel' uses the ShardDownloader, which also verifies the size and MD5 checksum of every shard. The time to the
+first completed shard, when the data loader could start consuming, is reported as well.
+
+Usage: PYTHONPATH=scripts python tests/benchmarks/bench_shard_download.py [--shards 16] [--shard-size 32] [--workers 8]
+"""
+
+import argparse
+import hashlib
+import random
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+
+from shard_downloader import ShardDownloader, ShardObject
+
+
+@dataclass
+class LocalObject:
+    object_name: str
+    size: int
+    etag: str
+    is_dir: bool = False
+
+
+class LocalFileSystemS3:
+    """Stand-in for S3Client serving the files of a local directory, with simulated latency and bandwidth."""
+
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, root: Path, latency: float, bandwidth: float, failure_rate: float, seed: int) -> None:
+        self.root = root
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.failure_rate = failure_rate
+        self.failures = 0
+        self._rng = random.Random(seed)
+        self._lock = Lock()
+
+    def list_files(self, bucket_name: str, relative_path: Path, recursive: bool = False) -> list[LocalObject]:
+        time.sleep(self.latency)
+        return [
+            LocalObject(
+                object_name=str(path.relative_to(self.root / bucket_name)),
+                size=path.stat().st_size,
+                etag=hashlib.md5(path.read_bytes(), usedforsecurity=False).hexdigest(),
+            )
+            for path in sorted((self.root / bucket_name / relative_path).glob("**/*" if recursive else "*"))
+        ]
+
+    def download_file(self, bucket_name: str, relative_path: Path, file_path: Path) -> None:
+        time.sleep(self.latency)
+        with self._lock:
+            failure = self._rng.random() < self.failure_rate
+            self.failures += failure
+        with (self.root / bucket_name / relative_path).open("rb") as src, file_path.open("wb") as dst:
+            while chunk := src.read(self.CHUNK_SIZE):
+                time.sleep(len(chunk) / self.bandwidth)
+                if failure and self._rng.random() < 0.5:
+                    raise ConnectionError("Connection reset by peer")
+                dst.write(b"\0" * len(chunk) if failure else chunk)
+
+
+def download_sequential(client: LocalFileSystemS3, shards: list[ShardObject], dst_dir: Path) -> float:
+    """Download the shards one at a time, as before the download engine was introduced."""
+    start = time.perf_counter()
+    for shard in shards:
+        client.download_file(bucket_name="bucket", relative_path=shard.relative_path, file_path=dst_dir / shard.name)
+    return time.perf_counter() - start
+
+
+def download_parallel(
+    client: LocalFileSystemS3, shards: list[ShardObject], dst_dir: Path, workers: int
+) -> tuple[float, float]:
+    start = time.perf_counter()
+    downloader = ShardDownloader(
+        client=client,  # type: ignore[arg-type]
+        bucket_name="bucket",
+        shards=shards,
+        dst_dir=dst_dir,
+        max_workers=workers,
+        initial_backoff=0.05,
+    ).start()
+    first_shard = None
+    for _ in downloader.as_completed():
+        if first_shard is None:
+            first_shard = time.perf_counter() - start
+    return time.perf_counter() - start, first_shard or 0.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--shards", type=int, default=16, help="Number of shard files")
+    parser.add_argument("--shard-size", type=float, default=32, help="Size of each shard file in MB")
+    parser.add_argument("--workers", type=int, default=8, help="Number of concurrent downloads")
+    parser.add_argument("--latency", type=float, default=50, help="Latency of each request in ms")
+    parser.add_argument("--bandwidth", type=float, default=100, help="Bandwidth of each connection in MB/s")
+    parser.add_argument("--failure-rate", type=float, default=0.1, help="Fraction of the transfers that fail")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir)
+        inputs_dir = root / "s3" / "bucket" / "inputs"
+        inputs_dir.mkdir(parents=True)
+        rng = random.Random(args.seed)
+        for i in range(args.shards):
+            (inputs_dir / f"datum-{i}-of-{args.shards}.arrow").write_bytes(rng.randbytes(int(args.shard_size * 1e6)))
+
+        def make_client(failure_rate: float) -> LocalFileSystemS3:
+            return LocalFileSystemS3(
+                root=root / "s3",
+                latency=args.latency / 1e3,
+                bandwidth=args.bandwidth * 1e6,
+                failure_rate=failure_rate,
+                seed=args.seed,
+            )
+
+        shards = [
+            ShardObject(relative_path=Path(obj.object_name), size=obj.size, etag=obj.etag)
+            for obj in make_client(0).list_files(bucket_name="bucket", relative_path=Path("inputs"))
+        ]
+
+        dst_dir = root / "sequential"
+        dst_dir.mkdir()
+        sequential = download_sequential(make_client(0), shards, dst_dir)
+        shutil.rmtree(dst_dir)
+
+        results = {}
+        for failure_rate in sorted({0.0, args.failure_rate}):
+            client = make_client(failure_rate)
+            dst_dir = root / f"parallel-{failure_rate}"
+            results[failure_rate] = (*download_parallel(client, shards, dst_dir, args.workers), client.failures)
+            for shard in shards:
+                assert (dst_dir / shard.name).read_bytes() == (inputs_dir / shard.name).read_bytes()
+            shutil.rmtree(dst_dir)
+
+    total_size = args.shards * args.shard_size
+    print(
+        f"{args.shards} shards x {args.shard_size} MB, {args.latency} ms latency, {args.bandwidth} MB/s per connection"
+    )
+    print(f"sequential: {sequential:7.2f} s ({total_size / sequential:7.1f} MB/s), no verification, no retries")
+    for failure_rate, (elapsed, first_shard, failures) in results.items():
+        print(
+            f"  parallel: {elapsed:7.2f} s ({total_size / elapsed:7.1f} MB/s), first shard after {first_shard:.2f} s, "
+            f"{args.workers} workers, {failures} failed transfers retried (failure rate {failure_rate})"
+        )
+    print(f"  speed-up: {sequential / results[0.0][0]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+from pathlib import Path
+from threading import Event, Thread
+from unittest.mock import MagicMock
+
+import pytest
+from artifact_uploader import ArtifactUploader, ArtifactUploadError
+
+
+@pytest.fixture
+def fxt_artifact_uploader():
+    ArtifactUploader.instance = None
+    uploader = ArtifactUploader()
+    yield uploader
+    uploader.close(timeout=10)
+    ArtifactUploader.instance = None
+
+
+@pytest.fixture
+def fxt_artifacts(tmp_path):
+    paths = []
+    for i in range(4):
+        path = tmp_path / f"artifact_{i}.bin"
+        path.write_bytes(b"x" * (i + 1))
+        paths.append(path)
+    return paths
+
+
+class TestArtifactUploader:
+    def test_submit_and_flush(self, fxt_artifact_uploader, fxt_artifacts) -> None:
+        upload_file = MagicMock()
+        cleanup = MagicMock()
+        fxt_artifact_uploader.start(upload_file=upload_file, num_workers=2)
+
+        futures = [
+            fxt_artifact_uploader.submit(src_filepath=path, dst_filepath=Path("outputs") / path.name, cleanup=cleanup)
+            for path in fxt_artifacts
+        ]
+        fxt_artifact_uploader.flush(timeout=10)
+
+        assert all(future.done() and future.exception() is None for future in futures)
+        assert sorted(call.args for call in upload_file.call_args_list) == sorted(
+            (path, Path("outputs") / path.name) for path in fxt_artifacts
+        )
+        assert cleanup.call_count == len(fxt_artifacts)
+        stats = fxt_artifact_uploader.stats
+        assert (stats.uploaded_files, stats.uploaded_bytes, stats.failed_files) == (4, 10, 0)
+
+    def test_flush_failure(self, fxt_artifact_uploader, fxt_artifacts) -> None:
+        def upload_file(src_filepath, dst_filepath) -> None:
+            if src_filepath == fxt_artifacts[1]:
+                raise ConnectionError("connection reset")
+
+        cleanup = MagicMock()
+        fxt_artifact_uploader.start(upload_file=upload_file, num_workers=2)
+
+        futures = [
+            fxt_artifact_uploader.submit(src_filepath=path, dst_filepath=Path(path.name), cleanup=cleanup)
+            for path in fxt_artifacts
+        ]
+        futures[1].exception(timeout=10)
+
+        with pytest.raises(ArtifactUploadError):
+            fxt_artifact_uploader.flush(timeout=10)
+
+        assert isinstance(futures[1].exception(), ConnectionError)
+        # The failed upload is cleaned up too, and reported only once
+        assert cleanup.call_count == len(fxt_artifacts)
+        fxt_artifact_uploader.flush(timeout=10)
+
+    def test_bounded_queue(self, fxt_artifact_uploader, fxt_artifacts) -> None:
+        release = Event()
+        fxt_artifact_uploader.start(upload_file=lambda *_: release.wait(), num_workers=1, max_queue_size=1)
+        submitted = []
+
+        def submit_all() -> None:
+            for path in fxt_artifacts:
+                submitted.append(fxt_artifact_uploader.submit(src_filepath=path, dst_filepath=Path(path.name)))
+
+        thread = Thread(target=submit_all)
+        thread.start()
+        thread.join(timeout=0.5)
+
+        # One artifact is being uploaded and one is queued: submitting the others blocks
+        assert thread.is_alive()
+        assert len(submitted) <= 3
+        release.set()
+        thread.join(timeout=10)
+        fxt_artifact_uploader.flush(timeout=10)
+        assert len(submitted) == len(fxt_artifacts)
+        assert fxt_artifact_uploader.stats.max_queue_depth == 1
+
+    def test_submit_not_started(self, fxt_artifact_uploader, fxt_artifacts) -> None:
+        with pytest.raises(RuntimeError):
+            fxt_artifact_uploader.submit(src_filepath=fxt_artifacts[0], dst_filepath=Path("artifact"))
@@ -1,10 +1,15 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+import hashlib
 from pathlib import Path
 from unittest.mock import MagicMock, call, patch
 
+import otx_io
 import pytest
+from artifact_uploader import ArtifactUploader
 from otx_io import (
+    ARTIFACT_UPLOAD_PART_PARALLELISM,
+    ARTIFACT_UPLOAD_PART_SIZE,
     download_config_file,
     download_model_artifact,
     download_shard_files,
@@ -15,6 +20,7 @@ from otx_io import (
     upload_error_log,
     upload_full_log,
     upload_model_artifact,
+    upload_model_artifact_async,
 )
 from s3_client import S3ClientSingleton
 from utils import ExportFormat, ExportParameter, PrecisionType
@@ -27,7 +33,7 @@ def mock_client(self, *args, **kwargs) -> None:
 
 
 @patch.object(S3ClientSingleton, "instance")
-@patch("otx_io._get_shard_files_dir", return_value=Path("shard_files"))
+@patch("otx_io._get_shard_files_dir")
 @patch("otx_io._get_object_name_base", return_value=Path("object_name_base"))
 @patch("otx_io._get_bucket_name", return_value="bucket")
 def test_download_shard_files(
@@ -35,17 +41,22 @@ def test_download_shard_files(
     mock_get_object_name_base,
     mock_get_shard_files_dir,
     mock_s3_client,
+    tmp_path,
 ) -> None:
     # Arrange
     client = MagicMock()
     mock_s3_client.return_value = client
+    mock_get_shard_files_dir.return_value = tmp_path / "shard_files"
 
+    content = b"shard content"
     file = MagicMock()
     file.is_dir = False
     file.object_name = "datum-1-of-1.arrow"
-    client.list_files.return_value = [file]
-
-    client.get_presigned_url.return_value = "presigned_url"
+    file.size = len(content)
+    file.etag = hashlib.md5(content).hexdigest()
+    other_file = MagicMock(is_dir=False, object_name="config.yaml")
+    client.list_files.return_value = [file, other_file]
+    client.download_file.side_effect = lambda bucket_name, relative_path, file_path: file_path.write_bytes(content)
 
     # Act
     result = download_shard_files()
@@ -60,9 +71,10 @@ def test_download_shard_files(
     client.download_file.assert_called_once_with(
         bucket_name="bucket",
         relative_path=Path("object_name_base/inputs/datum-1-of-1.arrow"),
-        file_path=Path("shard_files/datum-1-of-1.arrow"),
+        file_path=tmp_path / "shard_files/datum-1-of-1.arrow",
     )
-    assert result == Path("shard_files")
+    assert result == tmp_path / "shard_files"
+    assert (result / "datum-1-of-1.arrow").read_bytes() == content
 
 
 @patch.object(S3ClientSingleton, "instance")
@@ -92,15 +104,15 @@ def test_download_config_file(
 
 @pytest.mark.parametrize("force_non_xai", [True, False])
 @patch.object(S3ClientSingleton, "instance")
-@patch.object(Path, "open")
-@patch("otx_io.TemporaryDirectory")
+@patch("os.remove")
+@patch("otx_io.NamedTemporaryFile")
 @patch("otx_io._get_object_name_base", return_value=Path("object_name_base"))
 @patch("otx_io._get_bucket_name", return_value="bucket")
 def test_save_checkpoint_sync(
     mock_get_bucket_name,
     mock_get_object_name_base,
-    mock_temp_dir,
-    mock_open,
+    mock_temp_file,
+    mock_remove,
     mock_s3_client,
     force_non_xai,
 ) -> None:
@@ -108,24 +120,26 @@ def test_save_checkpoint_sync(
     client = MagicMock()
     mock_s3_client.return_value = client
 
-    dir = MagicMock()
-    dir.__enter__.return_value = "temp"
-    mock_temp_dir.return_value = dir
-
-    mock_open.return_value = MagicMock()
+    temp_file = MagicMock()
+    temp_file.__enter__.return_value.name = "temp/checkpoint"
+    mock_temp_file.return_value = temp_file
 
     # Act
-    save_checkpoint_sync(model_weights_reader=MagicMock(), force_non_xai=force_non_xai)
+    future = save_checkpoint_sync(model_weights_reader=MagicMock(), force_non_xai=force_non_xai)
 
     # Assert
+    assert future.done()
     mock_get_bucket_name.assert_called()
     mock_get_object_name_base.assert_called()
     filename = "model_fp32_non-xai.pth" if force_non_xai else "model_fp32_xai.pth"
     client.upload_file_from_local_disk.assert_called_once_with(
         bucket_name="bucket",
         relative_path=Path("object_name_base/outputs/models") / filename,
-        local_file_path=Path("temp") / filename,
+        local_file_path=Path("temp/checkpoint"),
+        part_size=ARTIFACT_UPLOAD_PART_SIZE,
+        num_parallel_uploads=ARTIFACT_UPLOAD_PART_PARALLELISM,
     )
+    mock_remove.assert_called_once_with(Path("temp/checkpoint"))
 
 
 @patch.object(S3ClientSingleton, "instance")
@@ -202,9 +216,42 @@ def test_upload_model_artifact(
         bucket_name="bucket",
         relative_path=Path("object_name_base/dst_filepath"),
         local_file_path=Path("src_filepath"),
+        part_size=ARTIFACT_UPLOAD_PART_SIZE,
+        num_parallel_uploads=ARTIFACT_UPLOAD_PART_PARALLELISM,
     )
 
 
+@pytest.mark.parametrize("keep_src", [True, False])
+@patch("otx_io.upload_model_artifact")
+def test_upload_model_artifact_async(mock_upload_model_artifact, keep_src, tmp_path) -> None:
+    # Arrange
+    uploaded = {}
+    mock_upload_model_artifact.side_effect = lambda src, dst: uploaded.update({dst: src.read_bytes()})
+    src_filepath = tmp_path / "exported_model.bin"
+    src_filepath.write_bytes(b"model")
+    uploader = ArtifactUploader()
+    uploader.start(upload_file=otx_io.upload_model_artifact)
+
+    try:
+        # Act
+        future = upload_model_artifact_async(
+            src_filepath=src_filepath, dst_filepath=Path("outputs/models/model.bin"), keep_src=keep_src
+        )
+        # The source can be overwritten right away, e.g. by the next export
+        if keep_src:
+            src_filepath.write_bytes(b"next model")
+        future.result(timeout=10)
+        uploader.flush()
+    finally:
+        uploader.close()
+
+    # Assert
+    assert uploaded == {Path("outputs/models/model.bin"): b"model"}
+    assert src_filepath.exists() == keep_src
+    # The snapshot of the source is removed once uploaded
+    assert [path.name for path in tmp_path.iterdir()] == (["exported_model.bin"] if keep_src else [])
+
+
 @patch.object(S3ClientSingleton, "instance")
 @patch("otx_io._get_object_name_base", return_value=Path("object_name_base"))
 @patch("otx_io._get_bucket_name", return_value="bucket")
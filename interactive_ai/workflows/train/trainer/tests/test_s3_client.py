@@ -83,7 +83,11 @@ def test_upload_file_from_local_disk_not_exists(overwrite) -> None:
     if not overwrite:
         client.check_file_exists.assert_called_once_with(bucket_name="bucket_name", object_name=Path("relative_path"))
     client.client.fput_object.assert_called_once_with(
-        bucket_name="bucket_name", object_name="relative_path", file_path=Path("local_file_path")
+        bucket_name="bucket_name",
+        object_name="relative_path",
+        file_path=Path("local_file_path"),
+        part_size=0,
+        num_parallel_uploads=3,
     )
 
 
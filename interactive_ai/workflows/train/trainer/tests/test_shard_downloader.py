@@ -0,0 +1,140 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+import hashlib
+import time
+from pathlib import Path
+from threading import Lock
+from unittest.mock import MagicMock
+
+import pytest
+from shard_downloader import ShardDownloader, ShardDownloadError, ShardObject
+
+SHARD_CONTENTS = {f"datum-{i}-of-4.arrow": f"shard {i}".encode() * (i + 1) for i in range(4)}
+
+
+def _shard(name: str, etag: str | None = None) -> ShardObject:
+    content = SHARD_CONTENTS[name]
+    return ShardObject(
+        relative_path=Path("inputs") / name,
+        size=len(content),
+        etag=hashlib.md5(content).hexdigest() if etag is None else etag,
+    )
+
+
+class FakeS3Client:
+    """Serves SHARD_CONTENTS, failing the first `failures[name]` downloads of each shard with `failure_mode`."""
+
+    def __init__(self, failures: dict[str, int] | None = None, failure_mode: str = "error") -> None:
+        self.failures = dict(failures or {})
+        self.failure_mode = failure_mode
+        self.calls: list[str] = []
+        self._lock = Lock()
+
+    def download_file(self, bucket_name: str, relative_path: Path, file_path: Path) -> None:
+        with self._lock:
+            self.calls.append(relative_path.name)
+            failing = self.failures.get(relative_path.name, 0) > 0
+            if failing:
+                self.failures[relative_path.name] -= 1
+        content = SHARD_CONTENTS[relative_path.name]
+        if failing and self.failure_mode == "error":
+            raise ConnectionError("connection reset")
+        if failing and self.failure_mode == "truncated":
+            content = content[:-1]
+        elif failing and self.failure_mode == "corrupted":
+            content = b"x" * len(content)
+        file_path.write_bytes(content)
+
+
+class TestShardDownloader:
+    def test_wait(self, tmp_path) -> None:
+        client = FakeS3Client()
+        shards = [_shard(name) for name in SHARD_CONTENTS]
+
+        paths = ShardDownloader(
+            client=client, bucket_name="bucket", shards=shards, dst_dir=tmp_path, max_workers=3
+        ).wait()
+
+        assert paths == [tmp_path / name for name in SHARD_CONTENTS]
+        for path in paths:
+            assert path.read_bytes() == SHARD_CONTENTS[path.name]
+        assert sorted(client.calls) == sorted(SHARD_CONTENTS)
+
+    def test_as_completed(self, tmp_path) -> None:
+        shards = [_shard(name) for name in SHARD_CONTENTS]
+        downloader = ShardDownloader(client=FakeS3Client(), bucket_name="bucket", shards=shards, dst_dir=tmp_path)
+
+        completed = list(downloader.start().as_completed())
+
+        assert sorted(completed) == sorted(tmp_path / name for name in SHARD_CONTENTS)
+
+    @pytest.mark.parametrize("failure_mode", ["error", "truncated", "corrupted"])
+    def test_retry(self, tmp_path, failure_mode) -> None:
+        name = "datum-2-of-4.arrow"
+        client = FakeS3Client(failures={name: 2}, failure_mode=failure_mode)
+
+        paths = ShardDownloader(
+            client=client, bucket_name="bucket", shards=[_shard(name)], dst_dir=tmp_path, initial_backoff=0
+        ).wait()
+
+        assert paths[0].read_bytes() == SHARD_CONTENTS[name]
+        assert client.calls == [name] * 3
+
+    def test_retry_exhausted(self, tmp_path) -> None:
+        name = "datum-1-of-4.arrow"
+        client = FakeS3Client(failures={name: 3}, failure_mode="corrupted")
+        downloader = ShardDownloader(
+            client=client,
+            bucket_name="bucket",
+            shards=[_shard(name)],
+            dst_dir=tmp_path,
+            max_attempts=3,
+            initial_backoff=0,
+        )
+
+        with pytest.raises(ShardDownloadError):
+            downloader.wait()
+
+        assert client.calls == [name] * 3
+        assert not (tmp_path / name).exists()
+
+    def test_skip_downloaded(self, tmp_path) -> None:
+        downloaded, stale = "datum-0-of-4.arrow", "datum-1-of-4.arrow"
+        (tmp_path / downloaded).write_bytes(SHARD_CONTENTS[downloaded])
+        (tmp_path / stale).write_bytes(b"stale")
+        client = FakeS3Client()
+
+        ShardDownloader(
+            client=client, bucket_name="bucket", shards=[_shard(downloaded), _shard(stale)], dst_dir=tmp_path
+        ).wait()
+
+        assert client.calls == [stale]
+        assert (tmp_path / stale).read_bytes() == SHARD_CONTENTS[stale]
+
+    def test_multipart_etag(self, tmp_path) -> None:
+        # The ETag of a multipart upload is not a checksum of the content: only the size is verified
+        name = "datum-3-of-4.arrow"
+        shard = _shard(name, etag='"0123456789abcdef0123456789abcdef-2"')
+        assert shard.md5 is None
+
+        paths = ShardDownloader(client=FakeS3Client(), bucket_name="bucket", shards=[shard], dst_dir=tmp_path).wait()
+
+        assert paths[0].read_bytes() == SHARD_CONTENTS[name]
+
+    def test_cancel_on_failure(self, tmp_path) -> None:
+        def download_file(**_kwargs) -> None:
+            time.sleep(0.05)
+            raise ConnectionError("connection reset")
+
+        client = MagicMock()
+        client.download_file.side_effect = download_file
+        shards = [_shard(name) for name in SHARD_CONTENTS]
+        downloader = ShardDownloader(
+            client=client, bucket_name="bucket", shards=shards, dst_dir=tmp_path, max_workers=1, max_attempts=1
+        )
+
+        with pytest.raises(ShardDownloadError):
+            downloader.wait()
+
+        # The first failure cancels the downloads that were not started yet
+        assert client.download_file.call_count < len(shards)
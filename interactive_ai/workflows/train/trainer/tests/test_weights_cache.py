@@ -0,0 +1,139 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+from weights_cache import WeightsCache
+
+
+def _writer(content: bytes, delay: float = 0.0) -> MagicMock:
+    def download(path) -> None:
+        time.sleep(delay)
+        path.write_bytes(content)
+
+    return MagicMock(side_effect=download)
+
+
+@pytest.fixture
+def fxt_weights_cache(tmp_path):
+    yield WeightsCache(root_dir=tmp_path / "cache", max_size=100)
+
+
+class TestWeightsCache:
+    def test_fetch(self, fxt_weights_cache, tmp_path) -> None:
+        content = b"weights"
+        digest = hashlib.sha256(content).hexdigest()
+        download = _writer(content)
+
+        first = fxt_weights_cache.fetch("model.pth", digest, tmp_path / "job_1" / "model.pth", download)
+        second = fxt_weights_cache.fetch("model.pth", digest, tmp_path / "job_2" / "model.pth", download)
+
+        download.assert_called_once()
+        assert first.read_bytes() == second.read_bytes() == content
+        assert (fxt_weights_cache.stats.hits, fxt_weights_cache.stats.misses) == (1, 1)
+        assert fxt_weights_cache.stats.downloaded_bytes == len(content)
+        # The tmp directory is left empty once the entry is populated
+        assert not list((tmp_path / "cache" / "tmp").iterdir())
+
+    def test_fetch_concurrent(self, fxt_weights_cache, tmp_path) -> None:
+        content = b"weights"
+        digest = hashlib.sha256(content).hexdigest()
+        download = _writer(content, delay=0.1)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            paths = list(
+                executor.map(
+                    lambda i: fxt_weights_cache.fetch(
+                        "model.pth", digest, tmp_path / f"job_{i}" / "model.pth", download
+                    ),
+                    range(4),
+                )
+            )
+
+        download.assert_called_once()
+        assert all(path.read_bytes() == content for path in paths)
+
+    def test_fetch_digest_mismatch(self, fxt_weights_cache, tmp_path) -> None:
+        content = b"weights"
+        download = _writer(content)
+
+        path = fxt_weights_cache.fetch("model.pth", "0" * 64, tmp_path / "job" / "model.pth", download)
+        fxt_weights_cache.fetch("model.pth", "0" * 64, tmp_path / "job" / "model.pth", download)
+
+        # The file is provided as downloaded, but it is not cached
+        assert path.read_bytes() == content
+        assert download.call_count == 2
+        assert not list((tmp_path / "cache" / "entries").iterdir())
+
+    def test_evict_least_recently_used(self, fxt_weights_cache, tmp_path) -> None:
+        contents = [bytes([i]) * 40 for i in range(3)]
+        digests = [hashlib.sha256(content).hexdigest() for content in contents]
+        for i, (content, digest) in enumerate(zip(contents, digests)):
+            fxt_weights_cache.fetch(f"model_{i}.pth", digest, tmp_path / "job" / f"model_{i}.pth", _writer(content))
+            # Make sure that the entries have distinct last use times
+            entry_path = tmp_path / "cache" / "entries" / digest / f"model_{i}.pth"
+            os.utime(entry_path, (i, i))
+
+        fxt_weights_cache.fetch("model_3.pth", hashlib.sha256(b"x").hexdigest(), tmp_path / "m.pth", _writer(b"x"))
+
+        cached = {entry.name for entry in (tmp_path / "cache" / "entries").iterdir()}
+        assert digests[0] not in cached
+        assert {digests[1], digests[2]} <= cached
+        assert fxt_weights_cache.stats.evicted_bytes == 40
+        # Files provided to the jobs remain valid after eviction
+        assert (tmp_path / "job" / "model_0.pth").read_bytes() == contents[0]
+
+    def test_evict_skips_entries_in_use(self, fxt_weights_cache, tmp_path) -> None:
+        contents = [bytes([i]) * 60 for i in range(2)]
+        digests = [hashlib.sha256(content).hexdigest() for content in contents]
+        fxt_weights_cache.fetch("model_0.pth", digests[0], tmp_path / "model_0.pth", _writer(contents[0]))
+
+        with fxt_weights_cache._lock(digests[0], exclusive=False):
+            fxt_weights_cache.fetch("model_1.pth", digests[1], tmp_path / "model_1.pth", _writer(contents[1]))
+
+        cached = {entry.name for entry in (tmp_path / "cache" / "entries").iterdir()}
+        assert cached == set(digests)
+
+    def test_evict_removes_locks(self, fxt_weights_cache, tmp_path) -> None:
+        contents = [bytes([i]) * 60 for i in range(2)]
+        digests = [hashlib.sha256(content).hexdigest() for content in contents]
+        fxt_weights_cache.fetch("model_0.pth", digests[0], tmp_path / "model_0.pth", _writer(contents[0]))
+        fxt_weights_cache.fetch("model_1.pth", "0" * 64, tmp_path / "model_1.pth", _writer(b"mismatch"))
+
+        fxt_weights_cache.fetch("model_2.pth", digests[1], tmp_path / "model_2.pth", _writer(contents[1]))
+
+        # The lock files of the evicted entry and of the entry never cached are removed
+        locks = {lock.stem for lock in (tmp_path / "cache" / "locks").iterdir()}
+        assert locks == {digests[1]}
+
+    def test_lock_reacquired_after_removal(self, fxt_weights_cache) -> None:
+        acquired = threading.Event()
+
+        def wait_for_lock() -> None:
+            with fxt_weights_cache._lock("digest", exclusive=True):
+                acquired.set()
+                time.sleep(0.2)
+
+        with fxt_weights_cache._lock("digest", exclusive=True):
+            waiter = threading.Thread(target=wait_for_lock)
+            waiter.start()
+            # Let the waiter open the lock file before it is removed, as done on eviction
+            time.sleep(0.1)
+            fxt_weights_cache._lock_path("digest").unlink()
+
+        assert acquired.wait(timeout=5)
+        # The waiter holds the lock on the current lock file, not on the removed one
+        with pytest.raises(BlockingIOError), fxt_weights_cache._lock("digest", exclusive=True, blocking=False):
+            pass
+        waiter.join()
+
+    def test_from_env_unusable_dir(self, tmp_path, monkeypatch) -> None:
+        (tmp_path / "file").write_text("not a directory")
+        monkeypatch.setenv("PRETRAINED_WEIGHTS_CACHE_DIR", str(tmp_path / "file" / "cache"))
+
+        assert WeightsCache.from_env() is None
@@ -11,7 +11,7 @@ from typing import Any, NamedTuple
 
 # Consumer shouldn't be imported here, because ConfluentKafkaInstrumentor replaces it with its implementation in runtime
 import confluent_kafka
-from confluent_kafka import Message
+from confluent_kafka import Message, TopicPartition
 
 from .exceptions import TopicAlreadySubscribedException, TopicNotSubscribedException
 from .utils import (
@@ -80,6 +80,10 @@ class KafkaEventConsumer:
         self._topic_to_callback: dict[str, CallbackT] = {}
         self._topic_to_deserializer: dict[str, Deserializer] = {}
         self._should_stop = False
+        # Offsets of the messages whose processing was deferred by their callback, per (topic, partition)
+        self._deferred_offsets: dict[tuple[str, int], set[int]] = {}
+        self._deferred_offsets_released = False
+        self._deferred_offsets_lock = threading.Lock()
 
         logger.info(f"Creating Kafka consumer ({group_id}).")
         self._consumer = self._create_consumer(group_id=group_id)
@@ -220,7 +224,9 @@ class KafkaEventConsumer:
         try:
             message: Message = self._consumer.poll(timeout=1.0)
             if not isinstance(message, Message):
-                # Timeout condition
+                # Timeout condition: commit the deferred messages completed in the meantime
+                if self._deferred_offsets_released:
+                    self._commit()
                 return
 
             if message.error():
@@ -228,11 +234,61 @@ class KafkaEventConsumer:
                 return
 
             self._consume_message(message)
-            self._consumer.commit()
+            self._commit()
 
         except Exception:
             logger.exception("Failed to consume an event (group_id `%s`)", self.group_id)
 
+    def defer_commit(self, raw_message: KafkaRawMessage) -> Callable[[], None]:
+        """
+        Defer the commit of a message whose processing continues after its callback returns, e.g. in a background
+        batch. Until the returned function is called, the offsets of this message and of the following messages of
+        the same partition are not committed, so that they are delivered again if the process stops in the meantime.
+
+        Must be called from the callback of the message.
+
+        :param raw_message: Message received by the callback
+        :return: Function to call, from any thread, once the message has been processed
+        """
+        topic_partition = (raw_message.topic, raw_message.partition)
+        with self._deferred_offsets_lock:
+            self._deferred_offsets.setdefault(topic_partition, set()).add(raw_message.offset)
+
+        def release() -> None:
+            with self._deferred_offsets_lock:
+                offsets = self._deferred_offsets.get(topic_partition, set())
+                offsets.discard(raw_message.offset)
+                if not offsets:
+                    self._deferred_offsets.pop(topic_partition, None)
+                self._deferred_offsets_released = True
+
+        return release
+
+    def _commit(self) -> None:
+        """
+        Commit the offsets of the consumed messages, except for the messages deferred by their callback: in the
+        partitions with deferred messages, the committed offset is the one of the oldest deferred message.
+        """
+        with self._deferred_offsets_lock:
+            first_deferred_offsets = {
+                topic_partition: min(offsets) for topic_partition, offsets in self._deferred_offsets.items()
+            }
+            self._deferred_offsets_released = False
+        if not first_deferred_offsets:
+            self._consumer.commit()
+            return
+        offsets = [
+            TopicPartition(
+                position.topic,
+                position.partition,
+                first_deferred_offsets.get((position.topic, position.partition), position.offset),
+            )
+            for position in self._consumer.position(self._consumer.assignment())
+            if position.offset >= 0
+        ]
+        if offsets:
+            self._consumer.commit(offsets=offsets)
+
     def _deserialize_message_value(self, topic: str, value: str | bytes | None) -> Any | None:
         """
         Deserializes event value.
@@ -287,14 +343,21 @@ class KafkaEventConsumer:
             message.offset(),
         )
 
-    def stop(self) -> None:
+    def stop(self, before_close: Callable[[], None] | None = None) -> None:
         """
         Stop the event consumer.
+
+        :param before_close: Optional function called once the consumer stopped polling and before it is closed,
+            e.g. to complete the deferred messages so that their offsets are committed
         """
         logger.info("Stopping Kafka event consumer with group_id `%s`", self.group_id)
 
         self._should_stop = True
         self._consumer_thread.join()
+        if before_close is not None:
+            before_close()
+        if self._deferred_offsets_released:
+            self._commit()
         self._consumer.close()
 
     def __signal(self, signum: int, frame: FrameType) -> None:  # noqa: ARG002
@@ -1,11 +1,11 @@
 import datetime
 import os
 from json import JSONDecodeError
-from unittest.mock import ANY, MagicMock, patch
+from unittest.mock import ANY, MagicMock, call, patch
 
 import confluent_kafka
 import pytest
-from confluent_kafka import Message
+from confluent_kafka import Message, TopicPartition
 
 from geti_kafka_tools import (
     KafkaEventConsumer,
@@ -434,6 +434,93 @@ class TestKafkaEventConsumer:
         mock_consume_message.assert_called_once_with(message)
         kafka_event_consumer._consumer.commit.assert_called_once_with()
 
+    @patch.object(KafkaEventConsumer, "_start_consume_thread")
+    def test_kafka_event_consumer_defer_commit(self, mock_start_consume_thread, fxt_consumer) -> None:
+        # Arrange
+        kafka_event_consumer = KafkaEventConsumer("integration-test")
+        consumer = kafka_event_consumer._consumer
+        consumer.assignment.return_value = [TopicPartition("topic1", 0), TopicPartition("topic2", 0)]
+        consumer.position.return_value = [TopicPartition("topic1", 0, 8), TopicPartition("topic2", 0, 3)]
+        raw_messages = [
+            KafkaRawMessage(
+                topic="topic1",
+                partition=0,
+                offset=offset,
+                timestamp=0,
+                timestamp_type=0,
+                key=None,
+                value=None,
+                headers=[],
+            )
+            for offset in (5, 6)
+        ]
+
+        # Act
+        releases = [kafka_event_consumer.defer_commit(raw_message) for raw_message in raw_messages]
+        kafka_event_consumer._commit()
+        committed_while_deferred = consumer.commit.call_args
+        releases[1]()
+        kafka_event_consumer._commit()
+        committed_after_newest_release = consumer.commit.call_args
+        releases[0]()
+        kafka_event_consumer._commit()
+
+        # Assert
+        fxt_consumer.assert_called_once()
+        mock_start_consume_thread.assert_called_once()
+        # The partition with deferred messages is committed up to the oldest one, the others up to their position
+        assert committed_while_deferred.kwargs["offsets"] == [
+            TopicPartition("topic1", 0, 5),
+            TopicPartition("topic2", 0, 3),
+        ]
+        assert committed_after_newest_release.kwargs["offsets"] == [
+            TopicPartition("topic1", 0, 5),
+            TopicPartition("topic2", 0, 3),
+        ]
+        assert consumer.commit.call_args == call()
+
+    @patch.object(KafkaEventConsumer, "_start_consume_thread")
+    def test_kafka_event_consumer_poll_timeout_commits_released(self, mock_start_consume_thread, fxt_consumer) -> None:
+        # Arrange
+        kafka_event_consumer = KafkaEventConsumer("integration-test")
+        kafka_event_consumer._consumer.poll.return_value = None
+        raw_message = KafkaRawMessage(
+            topic="topic1", partition=0, offset=5, timestamp=0, timestamp_type=0, key=None, value=None, headers=[]
+        )
+        release = kafka_event_consumer.defer_commit(raw_message)
+
+        # Act
+        kafka_event_consumer._poll_and_consume_message()
+        commit_calls_before_release = kafka_event_consumer._consumer.commit.call_count
+        release()
+        kafka_event_consumer._poll_and_consume_message()
+
+        # Assert
+        fxt_consumer.assert_called_once()
+        mock_start_consume_thread.assert_called_once()
+        assert commit_calls_before_release == 0
+        kafka_event_consumer._consumer.commit.assert_called_once_with()
+
+    @patch.object(KafkaEventConsumer, "_start_consume_thread")
+    def test_kafka_event_consumer_stop_before_close(self, mock_start_consume_thread, fxt_consumer) -> None:
+        # Arrange
+        kafka_event_consumer = KafkaEventConsumer("integration-test")
+        kafka_event_consumer._consumer_thread = MagicMock()
+        raw_message = KafkaRawMessage(
+            topic="topic1", partition=0, offset=5, timestamp=0, timestamp_type=0, key=None, value=None, headers=[]
+        )
+        release = kafka_event_consumer.defer_commit(raw_message)
+
+        # Act
+        kafka_event_consumer.stop(before_close=release)
+
+        # Assert
+        fxt_consumer.assert_called_once()
+        mock_start_consume_thread.assert_called_once()
+        # The messages completed before closing are committed
+        kafka_event_consumer._consumer.commit.assert_called_once_with()
+        kafka_event_consumer._consumer.close.assert_called_once_with()
+
     @patch.object(KafkaEventConsumer, "_start_consume_thread")
     def test_kafka_event_consumer_stop(self, mock_start_consume_thread, fxt_consumer) -> None:
         # Arrange
@@ -26,6 +26,19 @@ else:
 
 VERIFY_HTTPS = os.getenv("INSECURE_SKIP_HTTPS_VALIDATION", "false").lower() != "true"
 
+# Delivery engine: persistent SMTP sessions, each serving one email at a time
+SMTP_POOL_SIZE = int(os.getenv("SMTP_POOL_SIZE", "4"))
+SMTP_TIMEOUT_SECONDS = float(os.getenv("SMTP_TIMEOUT_SECONDS", "60"))
+# Sessions idle for longer are reopened before use, as servers close idle connections
+SMTP_SESSION_MAX_IDLE_SECONDS = float(os.getenv("SMTP_SESSION_MAX_IDLE_SECONDS", "60"))
+SMTP_DELIVERY_QUEUE_SIZE = int(os.getenv("SMTP_DELIVERY_QUEUE_SIZE", "100"))
+SMTP_MAX_RETRIES = int(os.getenv("SMTP_MAX_RETRIES", "3"))
+SMTP_RETRY_BACKOFF_SECONDS = float(os.getenv("SMTP_RETRY_BACKOFF_SECONDS", "1"))
+SMTP_MAX_RETRY_BACKOFF_SECONDS = float(os.getenv("SMTP_MAX_RETRY_BACKOFF_SECONDS", "30"))
+# Emails per second, and burst, sent to each recipient domain
+SMTP_DOMAIN_RATE_LIMIT = float(os.getenv("SMTP_DOMAIN_RATE_LIMIT", "5"))
+SMTP_DOMAIN_BURST = int(os.getenv("SMTP_DOMAIN_BURST", "10"))
+
 logger = logging.getLogger(__name__)
 
 
@@ -7,10 +7,11 @@ Topic related functions
 
 import asyncio
 import logging
+import threading
 
 from geti_kafka_tools import BaseKafkaHandler, KafkaRawMessage, TopicSubscription
 from message import Message
-from sender import send_message
+from sender import close_delivery_engine, submit_message
 
 from config import GETI_NOTIFICATION_TOPIC
 
@@ -19,8 +20,13 @@ logger = logging.getLogger(__name__)
 
 class NotificationsHandler(BaseKafkaHandler):
     def __init__(self) -> None:
-        super().__init__(group_id="notifier-consumer-group")
+        # The emails are sent by the delivery engine on a dedicated event loop, holding its SMTP sessions
         self._event_loop = asyncio.new_event_loop()
+        self._delivery_thread = threading.Thread(
+            target=self._event_loop.run_forever, name="SMTP delivery thread", daemon=True
+        )
+        self._delivery_thread.start()
+        super().__init__(group_id="notifier-consumer-group")
 
     @property
     def topics_subscriptions(self) -> list[TopicSubscription]:
@@ -33,4 +39,22 @@ class NotificationsHandler(BaseKafkaHandler):
         message = Message(raw_message.value)
 
         logger.debug("Message received from kafka")
-        self._event_loop.run_until_complete(send_message(message))
+        # The emails are sent concurrently over the SMTP sessions: the offset of the message is only committed once
+        # its email is sent or has failed permanently, so that it is consumed again if the notifier stops before.
+        release = self.event_consumer.defer_commit(raw_message)
+        try:
+            # Returns once the email is queued, so that the consumption pauses while the delivery queue is full
+            asyncio.run_coroutine_threadsafe(submit_message(message, on_done=release), self._event_loop).result()
+        except Exception:
+            release()
+            raise
+
+    def stop(self) -> None:
+        """Stop consuming the notifications, then send the queued emails and close the SMTP sessions"""
+        # The queued emails are sent before the consumer is closed, so that the offsets of their messages are committed
+        self.event_consumer.stop(before_close=self._close_delivery_engine)
+        self._event_loop.call_soon_threadsafe(self._event_loop.stop)
+        self._delivery_thread.join()
+
+    def _close_delivery_engine(self) -> None:
+        asyncio.run_coroutine_threadsafe(close_delivery_engine(), self._event_loop).result()
@@ -0,0 +1,258 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""
+Email delivery engine, sending the emails over a pool of persistent SMTP sessions
+"""
+
+import asyncio
+import contextlib
+import logging
+import random
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from email.message import Message as EmailMessage
+from email.utils import parseaddr
+from typing import Any
+
+from aiosmtplib import SMTP, SMTPException, SMTPRecipientsRefused, SMTPResponseException
+
+from metrics import (
+    emails_delivered_counter,
+    emails_delivery_time_histogram,
+    emails_queue_time_histogram,
+    emails_queued_counter,
+    emails_retries_counter,
+    smtp_sessions_opened_counter,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def is_transient_error(error: Exception) -> bool:
+    """
+    Whether a delivery error may not persist, i.e. a connection error, a timeout or a 4xx reply of the server.
+
+    :param error: Error raised while sending an email
+    :return: True if the delivery should be retried
+    """
+    if isinstance(error, SMTPRecipientsRefused):
+        return all(400 <= recipient.code < 500 for recipient in error.recipients)
+    if isinstance(error, SMTPResponseException):
+        return 400 <= error.code < 500
+    return isinstance(error, ConnectionError | TimeoutError)
+
+
+class SMTPSessionPool:
+    """
+    Pool of persistent SMTP sessions, connected and authenticated on first use.
+
+    A session is closed after any error, since the server may have dropped the connection or left the transaction in
+    an unknown state, and is reopened when it is used again, as are the sessions idle for more than `max_idle_seconds`.
+
+    :param size: Number of sessions
+    :param max_idle_seconds: Idle time after which a session is reopened before use
+    :param smtp_kwargs: Connection and login parameters of `aiosmtplib.SMTP`
+    """
+
+    def __init__(self, size: int, max_idle_seconds: float = 60, **smtp_kwargs: Any) -> None:
+        self.size = size
+        self.max_idle_seconds = max_idle_seconds
+        self._clients = [SMTP(**smtp_kwargs) for _ in range(size)]
+        # Most recently used sessions first, so that the least used ones expire when the load decreases
+        self._idle: asyncio.LifoQueue[SMTP] = asyncio.LifoQueue()
+        for client in self._clients:
+            self._idle.put_nowait(client)
+        self._last_used: dict[int, float] = {}
+
+    @contextlib.asynccontextmanager
+    async def session(self) -> AsyncIterator[SMTP]:
+        """Borrow a connected and authenticated session, waiting for one to be available"""
+        client = await self._idle.get()
+        try:
+            idle_time = time.monotonic() - self._last_used.get(id(client), 0)
+            if client.is_connected and idle_time > self.max_idle_seconds:
+                client.close()
+            if not client.is_connected:
+                smtp_sessions_opened_counter.add(1)
+                await client.connect()
+            yield client
+            self._last_used[id(client)] = time.monotonic()
+        except BaseException:
+            client.close()
+            raise
+        finally:
+            self._idle.put_nowait(client)
+
+    async def close(self) -> None:
+        """Quit the open sessions"""
+        for client in self._clients:
+            if client.is_connected:
+                try:
+                    await client.quit()
+                except SMTPException:
+                    client.close()
+
+
+class DomainRateLimiter:
+    """
+    Token bucket per recipient domain, so that a burst of emails does not get throttled or blocked by a provider.
+
+    :param rate: Number of emails per second sent to a domain
+    :param burst: Number of emails that can be sent at once to a domain
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        # domain -> (tokens, time of the last update)
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def acquire(self, domain: str) -> None:
+        """Wait until an email can be sent to the domain"""
+        lock = self._locks.setdefault(domain, asyncio.Lock())
+        async with lock:
+            now = time.monotonic()
+            tokens, last_update = self._buckets.get(domain, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - last_update) * self.rate)
+            if tokens < 1:
+                await asyncio.sleep((1 - tokens) / self.rate)
+                now = time.monotonic()
+                tokens = 1
+            self._buckets[domain] = (tokens - 1, now)
+
+
+@dataclass
+class _Delivery:
+    message: EmailMessage
+    domain: str
+    result: asyncio.Future
+    enqueue_time: float = field(default_factory=time.monotonic)
+
+
+class SMTPDeliveryEngine:
+    """
+    Sends emails over a pool of persistent SMTP sessions.
+
+    Emails are queued and sent by one worker per session, which bounds the number of concurrent deliveries. Transient
+    errors are retried with an exponential backoff, and the emails sent to each recipient domain are rate limited.
+
+    :param session_pool: Pool of SMTP sessions
+    :param rate_limiter: Rate limiter of the recipient domains
+    :param queue_size: Number of emails that can be queued, before `submit` waits for room in the queue
+    :param max_retries: Number of times a delivery is retried after a transient error
+    :param retry_backoff_seconds: Delay before the first retry, doubled at each retry
+    :param max_retry_backoff_seconds: Maximum delay between two retries
+    """
+
+    def __init__(
+        self,
+        session_pool: SMTPSessionPool,
+        rate_limiter: DomainRateLimiter,
+        queue_size: int = 100,
+        max_retries: int = 3,
+        retry_backoff_seconds: float = 1,
+        max_retry_backoff_seconds: float = 30,
+    ) -> None:
+        self.session_pool = session_pool
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.max_retry_backoff_seconds = max_retry_backoff_seconds
+        self._queue: asyncio.Queue[_Delivery] = asyncio.Queue(maxsize=queue_size)
+        self._workers: list[asyncio.Task] = []
+
+    async def submit(self, message: EmailMessage) -> asyncio.Future:
+        """
+        Queue an email to be sent in the background, waiting if the queue is full.
+
+        :param message: Email to send
+        :return: Future completed once the email is sent, or set with the SMTPException if it could not be sent
+        """
+        delivery = _Delivery(
+            message=message,
+            domain=self._recipient_domain(message),
+            result=asyncio.get_running_loop().create_future(),
+        )
+        await self._enqueue(delivery)
+        return delivery.result
+
+    async def deliver(self, message: EmailMessage) -> None:
+        """
+        Send an email and wait for its delivery.
+
+        :param message: Email to send
+        :raises SMTPException: if the email could not be sent
+        """
+        result = await self.submit(message)
+        await result
+
+    async def close(self) -> None:
+        """Send the queued emails, then stop the workers and close the SMTP sessions"""
+        await self._queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+        await self.session_pool.close()
+
+    async def _enqueue(self, delivery: _Delivery) -> None:
+        if not self._workers:
+            self._workers = [
+                asyncio.create_task(self._work(), name=f"smtp-delivery-{i}") for i in range(self.session_pool.size)
+            ]
+        await self._queue.put(delivery)
+        emails_queued_counter.add(1)
+
+    async def _work(self) -> None:
+        while True:
+            delivery = await self._queue.get()
+            emails_queued_counter.add(-1)
+            emails_queue_time_histogram.record(time.monotonic() - delivery.enqueue_time)
+            try:
+                await self._send(delivery)
+            finally:
+                self._queue.task_done()
+
+    async def _send(self, delivery: _Delivery) -> None:
+        start_time = time.monotonic()
+        error = await self._send_with_retries(delivery)
+        status = "sent" if error is None else "failed"
+        emails_delivered_counter.add(1, {"status": status})
+        emails_delivery_time_histogram.record(time.monotonic() - start_time, {"status": status})
+        if delivery.result.done():
+            return
+        if error is None:
+            delivery.result.set_result(None)
+        else:
+            delivery.result.set_exception(error)
+
+    async def _send_with_retries(self, delivery: _Delivery) -> Exception | None:
+        attempt = 0
+        while True:
+            try:
+                await self.rate_limiter.acquire(delivery.domain)
+                async with self.session_pool.session() as client:
+                    await client.send_message(delivery.message)
+            except Exception as error:
+                if attempt >= self.max_retries or not is_transient_error(error):
+                    logger.exception(f"Error during sending email: {error}")
+                    return error
+                backoff = min(self.max_retry_backoff_seconds, self.retry_backoff_seconds * 2**attempt)
+                attempt += 1
+                logger.warning(
+                    f"Transient error during sending email, retry {attempt} in up to {backoff:.1f}s: {error}"
+                )
+                emails_retries_counter.add(1)
+                # Full jitter, so that the retries of concurrent deliveries are spread out
+                await asyncio.sleep(random.uniform(0, backoff))  # noqa: S311
+            else:
+                logger.info("Email sent successfully")
+                return None
+
+    @staticmethod
+    def _recipient_domain(message: EmailMessage) -> str:
+        _, address = parseaddr(str(message["To"]))
+        return address.rsplit("@", maxsplit=1)[-1].lower()
@@ -0,0 +1,60 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""Instruments to collect the metrics of the email delivery using OpenTelemetry"""
+
+from geti_telemetry_tools.metrics.instruments import MetricName as MetricNameBase
+from geti_telemetry_tools.metrics.instruments import meter_provider
+
+
+class MetricName:
+    """Names of the instruments used to collect the notifier metrics"""
+
+    EMAILS_BASENAME = f"{MetricNameBase.PLATFORM_BASENAME}.notifier.emails"
+
+    EMAILS_QUEUED = f"{EMAILS_BASENAME}.queued"
+    EMAILS_QUEUE_TIME = f"{EMAILS_BASENAME}.queue_time"
+    EMAILS_DELIVERY_TIME = f"{EMAILS_BASENAME}.delivery_time"
+    EMAILS_DELIVERED = f"{EMAILS_BASENAME}.delivered"
+    EMAILS_RETRIES = f"{EMAILS_BASENAME}.retries"
+    SMTP_SESSIONS_OPENED = f"{MetricNameBase.PLATFORM_BASENAME}.notifier.smtp.sessions_opened"
+
+
+meter = meter_provider.get_meter("geti.notifier.metrics")
+
+emails_queued_counter = meter.create_up_down_counter(
+    name=MetricName.EMAILS_QUEUED,
+    description="Number of emails waiting for an SMTP session",
+    unit="1",
+)
+
+emails_queue_time_histogram = meter.create_histogram(
+    name=MetricName.EMAILS_QUEUE_TIME,
+    description="Time spent by the emails in the delivery queue",
+    unit="s",
+)
+
+emails_delivery_time_histogram = meter.create_histogram(
+    name=MetricName.EMAILS_DELIVERY_TIME,
+    description="Time to deliver the emails to the SMTP server, including the retries",
+    unit="s",
+)
+
+# Attribute 'status': 'sent' or 'failed'
+emails_delivered_counter = meter.create_counter(
+    name=MetricName.EMAILS_DELIVERED,
+    description="Number of emails handed over to the SMTP server, or given up on",
+    unit="1",
+)
+
+emails_retries_counter = meter.create_counter(
+    name=MetricName.EMAILS_RETRIES,
+    description="Number of delivery attempts retried after a transient error",
+    unit="1",
+)
+
+smtp_sessions_opened_counter = meter.create_counter(
+    name=MetricName.SMTP_SESSIONS_OPENED,
+    description="Number of SMTP sessions opened, i.e. connections, TLS handshakes and logins",
+    unit="1",
+)
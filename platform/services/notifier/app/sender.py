@@ -1,20 +1,39 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 
+import asyncio
 import logging
 import re
+from collections.abc import Callable
 from email.headerregistry import Address
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
-from aiosmtplib import SMTPException, send
-
+from delivery import DomainRateLimiter, SMTPDeliveryEngine, SMTPSessionPool
 from message import Message
 
-from config import SMTP_HOST, SMTP_LOGIN, SMTP_PASSWORD, SMTP_PORT, USE_START_TLS, VERIFY_HTTPS
+from config import (
+    SMTP_DELIVERY_QUEUE_SIZE,
+    SMTP_DOMAIN_BURST,
+    SMTP_DOMAIN_RATE_LIMIT,
+    SMTP_HOST,
+    SMTP_LOGIN,
+    SMTP_MAX_RETRIES,
+    SMTP_MAX_RETRY_BACKOFF_SECONDS,
+    SMTP_PASSWORD,
+    SMTP_POOL_SIZE,
+    SMTP_PORT,
+    SMTP_RETRY_BACKOFF_SECONDS,
+    SMTP_SESSION_MAX_IDLE_SECONDS,
+    SMTP_TIMEOUT_SECONDS,
+    USE_START_TLS,
+    VERIFY_HTTPS,
+)
 
 logger = logging.getLogger(__name__)
 
+_delivery_engine: SMTPDeliveryEngine | None = None
+
 
 def is_valid_email(mail: str) -> bool:
     """Validates email address format"""
@@ -47,27 +66,63 @@ def create_email_message(message: Message) -> MIMEMultipart:
     return msg
 
 
-async def send_message(message: Message) -> None:
+def get_delivery_engine() -> SMTPDeliveryEngine:
     """
-    Send the message in a background task.
+    Get the delivery engine sending the emails with the configured SMTP server, creating it on first use.
+    The engine must always be used from the same event loop, which holds its SMTP sessions.
     """
-    logger.info("Sending email")
-
-    msg = create_email_message(message=message)
-
-    validate_certs = VERIFY_HTTPS
-
-    try:
-        await send(
-            message=msg,
+    global _delivery_engine  # noqa: PLW0603
+    if _delivery_engine is None:
+        session_pool = SMTPSessionPool(
+            size=SMTP_POOL_SIZE,
+            max_idle_seconds=SMTP_SESSION_MAX_IDLE_SECONDS,
             hostname=SMTP_HOST,
             port=SMTP_PORT,
-            username=SMTP_LOGIN,
-            password=SMTP_PASSWORD,
+            username=SMTP_LOGIN or None,
+            password=SMTP_PASSWORD or None,
             start_tls=USE_START_TLS,
             use_tls=not USE_START_TLS,
-            validate_certs=validate_certs,
+            validate_certs=VERIFY_HTTPS,
+            timeout=SMTP_TIMEOUT_SECONDS,
+        )
+        _delivery_engine = SMTPDeliveryEngine(
+            session_pool=session_pool,
+            rate_limiter=DomainRateLimiter(rate=SMTP_DOMAIN_RATE_LIMIT, burst=SMTP_DOMAIN_BURST),
+            queue_size=SMTP_DELIVERY_QUEUE_SIZE,
+            max_retries=SMTP_MAX_RETRIES,
+            retry_backoff_seconds=SMTP_RETRY_BACKOFF_SECONDS,
+            max_retry_backoff_seconds=SMTP_MAX_RETRY_BACKOFF_SECONDS,
         )
-        logger.info("Email sent successfully")
-    except SMTPException as e:
-        logger.exception(f"Error during sending email: {e}")
+    return _delivery_engine
+
+
+async def close_delivery_engine() -> None:
+    """
+    Send the queued emails and close the SMTP sessions
+    """
+    global _delivery_engine  # noqa: PLW0603
+    if _delivery_engine is not None:
+        await _delivery_engine.close()
+        _delivery_engine = None
+
+
+async def submit_message(message: Message, on_done: Callable[[], None]) -> None:
+    """
+    Queue the message to be sent over the SMTP session pool, waiting if the delivery queue is full.
+
+    :param message: Message to send
+    :param on_done: Function called once the email is sent or has failed permanently, e.g. to commit the Kafka message
+    :raises ValueError: if the message does not have valid email addresses
+    """
+    logger.info("Sending email")
+
+    msg = create_email_message(message=message)
+    result = await get_delivery_engine().submit(msg)
+
+    def on_delivered(future: asyncio.Future) -> None:
+        # The error is logged by the delivery engine, the message is not retried
+        if not future.cancelled():
+            future.exception()
+        on_done()
+
+    result.add_done_callback(on_delivered)
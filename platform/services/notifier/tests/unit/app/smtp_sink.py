@@ -0,0 +1,102 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+"""
+Local SMTP sink accepting the emails over plain connections, with AUTH PLAIN.
+
+The sink records the sessions, logins and received emails; the replies to RCPT TO can be scripted to simulate
+transient or permanent errors, and the open connections can be dropped to simulate a server closing idle sessions.
+"""
+
+import asyncio
+import base64
+from collections import deque
+
+
+class SMTPSink:
+    def __init__(self, data_delay: float = 0) -> None:
+        self.data_delay = data_delay
+        self.host = "127.0.0.1"
+        self.port = 0
+        self.connections = 0
+        self.logins: list[str] = []
+        self.quits = 0
+        self.rcpt_commands = 0
+        self.messages: list[bytes] = []
+        self.max_concurrent_transactions = 0
+        # Replies to the next RCPT TO commands, before accepting them
+        self.rcpt_replies: deque[str] = deque()
+        self._transactions = 0
+        self._writers: set[asyncio.StreamWriter] = set()
+        self._server: asyncio.AbstractServer | None = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        self.drop_connections()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    def drop_connections(self) -> None:
+        for writer in list(self._writers):
+            writer.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:  # noqa: C901
+        self.connections += 1
+        self._writers.add(writer)
+        in_transaction = False
+
+        def end_transaction() -> None:
+            nonlocal in_transaction
+            if in_transaction:
+                self._transactions -= 1
+                in_transaction = False
+
+        async def reply(line: str) -> None:
+            writer.write(line.encode() + b"\r\n")
+            await writer.drain()
+
+        try:
+            await reply("220 localhost SMTP sink")
+            while line := await reader.readline():
+                command, _, argument = line.decode().rstrip("\r\n").partition(" ")
+                match command.upper():
+                    case "EHLO":
+                        await reply("250-localhost")
+                        await reply("250 AUTH PLAIN")
+                    case "AUTH":
+                        credentials = base64.b64decode(argument.split()[1]).decode()
+                        self.logins.append(credentials.split("\0")[1])
+                        await reply("235 Authentication successful")
+                    case "MAIL":
+                        in_transaction = True
+                        self._transactions += 1
+                        self.max_concurrent_transactions = max(self.max_concurrent_transactions, self._transactions)
+                        await reply("250 OK")
+                    case "RCPT":
+                        self.rcpt_commands += 1
+                        await reply(self.rcpt_replies.popleft() if self.rcpt_replies else "250 OK")
+                    case "DATA":
+                        await reply("354 End data with <CR><LF>.<CR><LF>")
+                        data = await reader.readuntil(b"\r\n.\r\n")
+                        await asyncio.sleep(self.data_delay)
+                        self.messages.append(data)
+                        end_transaction()
+                        await reply("250 OK")
+                    case "RSET":
+                        end_transaction()
+                        await reply("250 OK")
+                    case "QUIT":
+                        self.quits += 1
+                        await reply("221 Bye")
+                        break
+                    case _:
+                        await reply("250 OK")
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            end_transaction()
+            self._writers.discard(writer)
+            writer.close()
@@ -0,0 +1,76 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+from unittest.mock import MagicMock
+
+import pytest
+from app.consumer import NotificationsHandler
+
+from geti_kafka_tools import KafkaRawMessage
+
+RAW_MESSAGE = KafkaRawMessage(
+    topic="notifications",
+    partition=0,
+    offset=42,
+    timestamp_type=0,
+    timestamp=0,
+    key=None,
+    value={
+        "subject": "Hello World!",
+        "to": "recipient@example.com",
+        "from_address": "sender@example.com",
+        "from_name": "John Doe",
+        "content": "Welcome to the real world.",
+    },
+    headers=None,
+)
+
+
+@pytest.fixture
+def fxt_handler(mocker):
+    mocker.patch("geti_kafka_tools.event_consuming.KafkaEventConsumer")
+    handler = NotificationsHandler()
+    yield handler
+    handler._event_loop.call_soon_threadsafe(handler._event_loop.stop)
+    handler._delivery_thread.join()
+
+
+def test_consume_notification_commits_after_delivery(fxt_handler, mocker):
+    submitted: list[tuple] = []
+
+    async def submit_message(message, on_done):
+        submitted.append((message, on_done))
+
+    mocker.patch("app.consumer.submit_message", submit_message)
+    release = MagicMock()
+    fxt_handler.event_consumer.defer_commit.return_value = release
+
+    fxt_handler.consume_notification(RAW_MESSAGE)
+
+    # The callback returns once the email is queued, the message is committed once the email is sent
+    fxt_handler.event_consumer.defer_commit.assert_called_once_with(RAW_MESSAGE)
+    assert len(submitted) == 1
+    assert submitted[0][1] is release
+    release.assert_not_called()
+
+
+def test_consume_invalid_notification(fxt_handler, mocker):
+    mocker.patch("app.consumer.submit_message", side_effect=ValueError('Invalid "To" email address'))
+    release = MagicMock()
+    fxt_handler.event_consumer.defer_commit.return_value = release
+
+    with pytest.raises(ValueError):
+        fxt_handler.consume_notification(RAW_MESSAGE)
+
+    # The invalid message is committed without being sent
+    release.assert_called_once()
+
+
+def test_stop_sends_queued_emails_before_closing_consumer(fxt_handler, mocker):
+    close_delivery_engine = mocker.patch("app.consumer.close_delivery_engine")
+    fxt_handler.event_consumer.stop.side_effect = lambda before_close: before_close()
+
+    fxt_handler.stop()
+
+    # The queued emails are sent before the consumer commits the offsets of their messages and closes
+    close_delivery_engine.assert_awaited_once()
@@ -0,0 +1,196 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+import asyncio
+import contextlib
+import time
+from collections.abc import AsyncIterator
+
+import pytest
+from aiosmtplib import (
+    SMTPDataError,
+    SMTPRecipientRefused,
+    SMTPRecipientsRefused,
+    SMTPSenderRefused,
+    SMTPServerDisconnected,
+)
+from app.delivery import DomainRateLimiter, SMTPDeliveryEngine, SMTPSessionPool, is_transient_error
+from app.message import Message
+from app.sender import create_email_message
+
+from tests.unit.app.smtp_sink import SMTPSink
+
+LOGIN = "notifier"
+
+
+def email(to: str = "recipient@example.com"):
+    return create_email_message(
+        Message(
+            {
+                "subject": "Hello World!",
+                "to": to,
+                "from_address": "sender@example.com",
+                "from_name": "John Doe",
+                "content": "Welcome to the real world.",
+            }
+        )
+    )
+
+
+@contextlib.asynccontextmanager
+async def serve(sink: SMTPSink, pool_size: int = 2, max_retries: int = 3) -> AsyncIterator[SMTPDeliveryEngine]:
+    """Start the SMTP sink and yield a delivery engine sending to it"""
+    await sink.start()
+    engine = SMTPDeliveryEngine(
+        session_pool=SMTPSessionPool(
+            size=pool_size,
+            hostname=sink.host,
+            port=sink.port,
+            username=LOGIN,
+            password="password",
+            start_tls=False,
+            use_tls=False,
+            timeout=5,
+        ),
+        rate_limiter=DomainRateLimiter(rate=1000, burst=1000),
+        max_retries=max_retries,
+        retry_backoff_seconds=0.01,
+    )
+    try:
+        yield engine
+    finally:
+        await engine.close()
+        await sink.stop()
+
+
+async def test_sessions_are_reused():
+    sink = SMTPSink(data_delay=0.02)
+    async with serve(sink, pool_size=2) as engine:
+        await asyncio.gather(*(engine.deliver(email()) for _ in range(10)))
+
+    assert len(sink.messages) == 10
+    # Each session is opened and authenticated once, and sends one email at a time
+    assert sink.connections == 2
+    assert sink.logins == [LOGIN, LOGIN]
+    assert sink.max_concurrent_transactions == 2
+    assert sink.quits == 2
+
+
+async def test_submit_sends_queued_emails_on_close():
+    sink = SMTPSink()
+    async with serve(sink) as engine:
+        for i in range(5):
+            await engine.submit(email(to=f"recipient-{i}@example.com"))
+
+    assert len(sink.messages) == 5
+
+
+async def test_submit_sends_concurrently():
+    sink = SMTPSink(data_delay=0.02)
+    async with serve(sink, pool_size=2) as engine:
+        # Returns once the emails are queued, their results complete once they are sent
+        results = [await engine.submit(email()) for _ in range(6)]
+        assert not any(result.done() for result in results)
+        await asyncio.gather(*results)
+
+    assert len(sink.messages) == 6
+    assert sink.max_concurrent_transactions == 2
+
+
+async def test_retry_transient_error():
+    sink = SMTPSink()
+    sink.rcpt_replies.extend(["451 Try again later", "421 Too many connections"])
+    async with serve(sink) as engine:
+        await engine.deliver(email())
+
+    assert sink.rcpt_commands == 3
+    assert len(sink.messages) == 1
+
+
+async def test_permanent_error_is_not_retried():
+    sink = SMTPSink()
+    sink.rcpt_replies.append("550 No such user")
+    async with serve(sink) as engine:
+        with pytest.raises(SMTPRecipientsRefused):
+            await engine.deliver(email())
+        # The engine keeps delivering the other emails
+        await engine.deliver(email())
+
+    assert sink.rcpt_commands == 2
+    assert len(sink.messages) == 1
+
+
+async def test_give_up_after_max_retries():
+    sink = SMTPSink()
+    sink.rcpt_replies.extend(["451 Try again later"] * 5)
+    async with serve(sink, max_retries=2) as engine:
+        with pytest.raises(SMTPRecipientsRefused):
+            await engine.deliver(email())
+
+    assert sink.rcpt_commands == 3
+    assert sink.messages == []
+
+
+async def test_reconnect_dropped_session():
+    sink = SMTPSink()
+    async with serve(sink, pool_size=1) as engine:
+        await engine.deliver(email())
+        sink.drop_connections()
+        await asyncio.sleep(0.05)
+        await engine.deliver(email())
+
+    assert len(sink.messages) == 2
+    assert sink.connections == 2
+
+
+async def test_domain_rate_limit():
+    rate_limiter = DomainRateLimiter(rate=20, burst=2)
+
+    start_time = time.monotonic()
+    for _ in range(2):
+        await rate_limiter.acquire("example.com")
+    await rate_limiter.acquire("example.org")
+    # The burst is sent at once, to any domain
+    assert time.monotonic() - start_time < 0.04
+
+    for _ in range(3):
+        await rate_limiter.acquire("example.com")
+    assert time.monotonic() - start_time >= 0.14
+
+
+@pytest.mark.parametrize(
+    "error, is_transient",
+    (
+        pytest.param(SMTPServerDisconnected("Connection lost"), True, id="disconnected"),
+        pytest.param(TimeoutError(), True, id="timeout"),
+        pytest.param(SMTPDataError(451, "Local error"), True, id="4xx reply"),
+        pytest.param(SMTPSenderRefused(550, "Rejected", "sender@example.com"), False, id="5xx reply"),
+        pytest.param(
+            SMTPRecipientsRefused([SMTPRecipientRefused(452, "Mailbox full", "recipient@example.com")]),
+            True,
+            id="recipient temporarily refused",
+        ),
+        pytest.param(
+            SMTPRecipientsRefused([SMTPRecipientRefused(550, "No such user", "recipient@example.com")]),
+            False,
+            id="recipient refused",
+        ),
+        pytest.param(ValueError(), False, id="other error"),
+    ),
+)
+def test_is_transient_error(error, is_transient):
+    assert is_transient_error(error) is is_transient
+
+
+@pytest.mark.parametrize(
+    "to, domain",
+    (
+        pytest.param("recipient@Example.com", "example.com", id="address"),
+        pytest.param("John Doe <recipient@example.org>", "example.org", id="address with display name"),
+    ),
+)
+def test_recipient_domain(to, domain):
+    message = email()
+    message.replace_header("To", to)
+
+    assert SMTPDeliveryEngine._recipient_domain(message) == domain
@@ -1,13 +1,15 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 
+import asyncio
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from aiosmtplib import SMTPResponseException
 from app.message import Message
-from app.sender import create_email_message, is_valid_email, send_message
+from app.sender import create_email_message, is_valid_email, submit_message
 
 MESSAGE = Message(
     {
@@ -25,52 +27,103 @@ LOGIN = "mocked smtp login"
 PASSWORD = "mocked smtp password"
 
 
-@patch("app.sender.send")
-async def test_send_message_start_tls(send_mock: MagicMock, mocker):
+@pytest.fixture
+def engine_mocks(mocker):
+    mocker.patch("app.sender._delivery_engine", None)
     mocker.patch("app.sender.SMTP_HOST", HOST)
     mocker.patch("app.sender.SMTP_PORT", PORT)
     mocker.patch("app.sender.SMTP_LOGIN", LOGIN)
     mocker.patch("app.sender.SMTP_PASSWORD", PASSWORD)
+    session_pool_mock = mocker.patch("app.sender.SMTPSessionPool")
+    engine_mock = mocker.patch("app.sender.SMTPDeliveryEngine")
+    engine_mock.return_value.submit = AsyncMock(side_effect=lambda _: asyncio.get_running_loop().create_future())
+    return session_pool_mock, engine_mock
+
+
+async def test_submit_message_start_tls(engine_mocks, mocker):
+    session_pool_mock, engine_mock = engine_mocks
     mocker.patch("app.sender.USE_START_TLS", True)
     mocker.patch("app.sender.VERIFY_HTTPS", True)
 
-    await send_message(MESSAGE)
-
-    send_mock.assert_called_once()
-    assert_send_args(send_mock=send_mock, start_tls=True, use_tls=False, validate_certs=True)
+    await submit_message(MESSAGE, on_done=MagicMock())
+    await submit_message(MESSAGE, on_done=MagicMock())
+
+    # The engine and its SMTP sessions are reused by the next messages
+    session_pool_mock.assert_called_once()
+    assert engine_mock.return_value.submit.await_count == 2
+    assert_send_args(
+        session_pool_mock=session_pool_mock,
+        submit_mock=engine_mock.return_value.submit,
+        start_tls=True,
+        use_tls=False,
+        validate_certs=True,
+    )
 
 
-@patch("app.sender.send")
-async def test_send_message_tls(send_mock: MagicMock, mocker):
-    mocker.patch("app.sender.SMTP_HOST", HOST)
-    mocker.patch("app.sender.SMTP_PORT", PORT)
-    mocker.patch("app.sender.SMTP_LOGIN", LOGIN)
-    mocker.patch("app.sender.SMTP_PASSWORD", PASSWORD)
+async def test_submit_message_tls(engine_mocks, mocker):
+    session_pool_mock, engine_mock = engine_mocks
     mocker.patch("app.sender.USE_START_TLS", False)
     mocker.patch("app.sender.VERIFY_HTTPS", False)
 
-    await send_message(MESSAGE)
+    await submit_message(MESSAGE, on_done=MagicMock())
+
+    engine_mock.return_value.submit.assert_awaited_once()
+    assert_send_args(
+        session_pool_mock=session_pool_mock,
+        submit_mock=engine_mock.return_value.submit,
+        start_tls=False,
+        use_tls=True,
+        validate_certs=False,
+    )
+
+
+async def test_submit_message_done_after_delivery(engine_mocks):
+    _, engine_mock = engine_mocks
+    result = asyncio.get_running_loop().create_future()
+    engine_mock.return_value.submit = AsyncMock(return_value=result)
+    on_done = MagicMock()
+
+    await submit_message(MESSAGE, on_done=on_done)
+    # The message is done once its email is sent, not when it is queued
+    await asyncio.sleep(0)
+    on_done.assert_not_called()
+    result.set_result(None)
+    await asyncio.sleep(0)
+
+    on_done.assert_called_once()
+
+
+async def test_submit_message_failed(engine_mocks):
+    _, engine_mock = engine_mocks
+    result = asyncio.get_running_loop().create_future()
+    engine_mock.return_value.submit = AsyncMock(return_value=result)
+    on_done = MagicMock()
 
-    send_mock.assert_called_once()
-    assert_send_args(send_mock=send_mock, start_tls=False, use_tls=True, validate_certs=False)
+    await submit_message(MESSAGE, on_done=on_done)
+    # The failed email is not retried by Kafka
+    result.set_exception(SMTPResponseException(550, "Mailbox unavailable"))
+    await asyncio.sleep(0)
 
+    on_done.assert_called_once()
 
-def assert_send_args(send_mock: MagicMock, start_tls: bool, use_tls: bool, validate_certs: bool):
-    send_kwargs = send_mock.call_args[1]
 
-    sent_message = send_kwargs.get("message")
+def assert_send_args(
+    session_pool_mock: MagicMock, submit_mock: AsyncMock, start_tls: bool, use_tls: bool, validate_certs: bool
+):
+    sent_message = submit_mock.call_args[0][0]
     assert isinstance(sent_message, MIMEMultipart)
     assert sent_message.get("to") == "recipient@example.com"
     assert sent_message.get("from") == "John Doe <sender@example.com>"
     assert sent_message.get("subject") == "Hello World!"
 
-    assert send_kwargs.get("hostname") is HOST
-    assert send_kwargs.get("port") is PORT
-    assert send_kwargs.get("username") is LOGIN
-    assert send_kwargs.get("password") is PASSWORD
-    assert send_kwargs.get("start_tls") is start_tls
-    assert send_kwargs.get("use_tls") is use_tls
-    assert send_kwargs.get("validate_certs") is validate_certs
+    session_pool_kwargs = session_pool_mock.call_args[1]
+    assert session_pool_kwargs.get("hostname") is HOST
+    assert session_pool_kwargs.get("port") is PORT
+    assert session_pool_kwargs.get("username") is LOGIN
+    assert session_pool_kwargs.get("password") is PASSWORD
+    assert session_pool_kwargs.get("start_tls") is start_tls
+    assert session_pool_kwargs.get("use_tls") is use_tls
+    assert session_pool_kwargs.get("validate_certs") is validate_certs
 
 
 @pytest.mark.parametrize(
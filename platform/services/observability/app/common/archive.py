@@ -0,0 +1,148 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""
+Streaming tar.gz archive generation.
+"""
+
+import logging
+import queue
+import tarfile
+import threading
+import zlib
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_GZIP_WBITS = 31  # zlib window size with a gzip header and trailer
+_PUT_TIMEOUT_SECONDS = 0.1
+
+
+class _BlockWriter:
+    """Write-only file object splitting the written bytes into blocks of a fixed size."""
+
+    def __init__(self, block_size: int, on_block: Callable[[bytes], None]) -> None:
+        self._block_size = block_size
+        self._on_block = on_block
+        self._buffer = bytearray()
+
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        while len(self._buffer) >= self._block_size:
+            self._on_block(bytes(self._buffer[: self._block_size]))
+            del self._buffer[: self._block_size]
+        return len(data)
+
+    def flush(self) -> None:
+        if self._buffer:
+            self._on_block(bytes(self._buffer))
+            self._buffer.clear()
+
+
+class _StreamCancelled(Exception):
+    """Raised in the archiving thread when the consumer of the stream is gone."""
+
+
+def _compress_block(block: bytes, compresslevel: int) -> bytes:
+    """Compresses a block of the tar stream into a standalone gzip member."""
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, _GZIP_WBITS)
+    return compressor.compress(block) + compressor.flush()
+
+
+class _TarWriterThread(threading.Thread):
+    """Thread writing the tar stream and submitting its blocks for compression, in order.
+
+    The futures of the compressed blocks are put in the `pending` queue, followed by None once the archive is complete.
+    """
+
+    def __init__(
+        self,
+        path_src_to_arc: Mapping[Path, Path],
+        block_size: int,
+        compress: Callable[[bytes], Future],
+        pending: queue.Queue[Future | None],
+    ) -> None:
+        super().__init__(name="tar-gz-writer", daemon=True)
+        self._path_src_to_arc = path_src_to_arc
+        self._block_size = block_size
+        self._compress = compress
+        self._pending = pending
+        self.cancelled = threading.Event()
+        self.error: BaseException | None = None
+
+    def run(self) -> None:
+        writer = _BlockWriter(block_size=self._block_size, on_block=self._submit_block)
+        try:
+            with tarfile.open(fileobj=writer, mode="w|", format=tarfile.PAX_FORMAT) as tar:  # type: ignore[call-overload]
+                for path_fs, path_rel in self._path_src_to_arc.items():
+                    logger.debug(f"Adding {repr(str(path_fs))} to the archive as {repr(str(path_rel))}")
+                    try:
+                        tar.add(name=path_fs, arcname=path_rel, recursive=True)
+                    except FileNotFoundError:
+                        logger.warning(f"Skipping {repr(str(path_fs))}, removed before it could be archived")
+            writer.flush()
+        except _StreamCancelled:
+            logger.info("Archive stream cancelled by its consumer")
+        except BaseException as err:
+            self.error = err
+        finally:
+            if not self.cancelled.is_set():
+                self._pending.put(None)
+
+    def _submit_block(self, block: bytes) -> None:
+        future = self._compress(block)
+        while not self.cancelled.is_set():
+            try:
+                self._pending.put(future, timeout=_PUT_TIMEOUT_SECONDS)
+                return
+            except queue.Full:
+                continue
+        raise _StreamCancelled
+
+
+def stream_tar_gz(
+    path_src_to_arc: Mapping[Path, Path],
+    block_size: int = 1024 * 1024,
+    compression_workers: int = 1,
+    max_pending_blocks: int = 8,
+    compresslevel: int = 1,
+) -> Iterator[bytes]:
+    """Generates a tar.gz archive incrementally, as a sequence of compressed chunks.
+
+    The tar stream is written by a background thread and split into blocks, which are compressed by a pool of
+    `compression_workers` threads into independent gzip members; a concatenation of gzip members is a valid gzip
+    stream. At most `max_pending_blocks` blocks are queued or being compressed, which bounds the memory footprint
+    to about `(max_pending_blocks + 1) * block_size` bytes, whatever the size of the archived files. Nothing is written
+    to disk. Source files removed before they are archived, e.g. by the log rotation, are skipped.
+
+    Closing the generator before its end, e.g. when the client disconnects, stops the archiving.
+
+    :param path_src_to_arc: Map of filesystem source paths to their corresponding in-archive relative paths (1:1).
+    :param block_size: Size of the uncompressed blocks, in bytes.
+    :param compression_workers: Number of threads compressing the blocks in parallel.
+    :param max_pending_blocks: Maximum number of blocks compressed ahead of the consumer.
+    :param compresslevel: Compression level, from 0 (none) to 9 (best).
+    :returns Iterator[bytes]: The compressed chunks of the archive.
+    """
+    pending: queue.Queue[Future | None] = queue.Queue(maxsize=max_pending_blocks)
+    with ThreadPoolExecutor(max_workers=compression_workers, thread_name_prefix="tar-gz-compression") as executor:
+        tar_writer = _TarWriterThread(
+            path_src_to_arc=path_src_to_arc,
+            block_size=block_size,
+            compress=lambda block: executor.submit(_compress_block, block, compresslevel),
+            pending=pending,
+        )
+        tar_writer.start()
+        try:
+            while (future := pending.get()) is not None:
+                yield future.result()
+            if tar_writer.error is not None:
+                raise tar_writer.error
+        finally:
+            tar_writer.cancelled.set()
+            # Unblock the archiving thread if it is waiting for room in the queue
+            while not pending.empty():
+                pending.get_nowait()
+            tar_writer.join()
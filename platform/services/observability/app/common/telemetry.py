@@ -8,8 +8,8 @@ Platform telemetry handling utilities.
 import logging
 import re
 import secrets
-import tarfile
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
@@ -18,6 +18,7 @@ from opentelemetry import trace  # type: ignore[attr-defined]
 from service_connection.k8s_client.cluster_info import create_cluster_info_dump
 
 import config as cfg
+from common.archive import stream_tar_gz
 from common.platform import get_installation_datetime
 from common.utils import make_tarfile
 
@@ -55,15 +56,35 @@ _LOG_TYPE_TO_SOURCE_DIR: Mapping[LogType, Path] = {
 }
 
 
+_FILE_CHUNK_SIZE = 1024 * 1024
+
+
 class DateError(ValueError):
     """Raised for invalid date ranges."""
 
 
-def get_archive(log_type: LogType | None, start: datetime | None, end: datetime | None) -> Path:
-    """Returns path to generated archive for the provided log type."""
+@dataclass(frozen=True)
+class Archive:
+    """A tar.gz archive generated while it is being read.
+
+    :param name: File name of the archive.
+    :param chunks: Content of the archive, generated chunk by chunk.
+    """
+
+    name: str
+    chunks: Iterator[bytes]
+
+
+def get_archive(log_type: LogType | None, start: datetime | None, end: datetime | None) -> Archive:
+    """Returns the archive for the provided log type.
+
+    The date range is validated and the files to archive are selected right away; the archive itself is generated
+    while its chunks are consumed.
+    """
     if log_type == LogType.CLUSTER:
         logger.debug("Returning cluster logs")
-        return Path(prepare_cluster_info_dump())
+        path_archive = Path(prepare_cluster_info_dump())
+        return Archive(name=path_archive.name, chunks=_read_and_remove_file(path_archive))
 
     start, end = _sanitize_datetime_range(start=start, end=end)
 
@@ -84,17 +105,17 @@ def get_archive(log_type: LogType | None, start: datetime | None, end: datetime
     return _archive_logs(telemetry_root=_PATH_TELEMETRY_ROOT, log_types=log_types, start=start, end=end)
 
 
-def _archive_logs(telemetry_root: Path, log_types: Iterable[LogType], start: datetime, end: datetime) -> Path:
+def _archive_logs(telemetry_root: Path, log_types: Iterable[LogType], start: datetime, end: datetime) -> Archive:
     """Archives logs for the provided log types.
 
     :param telemetry_root: Path to root telemetry backup directory.
     :param log_types: Types of logs to include in the created archive.
     :param start: Start of the datetime range to filter logs against.
     :param end: End of the datetime range to filter logs against.
-    :return Path: Path to the created archive.
+    :return Archive: The archive, streamed without being written to disk.
     """
     logger.debug(f"Archiving for log types: {log_types}.")
-    path_archive = Path("/tmp") / _gen_archive_name(prefix="-".join(log_types))  # noqa: S108
+    archive_name = _gen_archive_name(prefix="-".join(log_types))
 
     with tracer.start_as_current_span("filter-logs-by-dates"):
         path_src_to_arc: Mapping[Path, Path] = _get_archive_sources(
@@ -102,24 +123,42 @@ def _archive_logs(telemetry_root: Path, log_types: Iterable[LogType], start: dat
         )
 
     logger.debug(f"Source files to be archived: {', '.join(repr(str(src)) for src in path_src_to_arc)}")
-    logger.info(f"Archiving {', '.join(log_types)} at {repr(str(path_archive))}.")
+    logger.info(f"Streaming {', '.join(log_types)} as {repr(archive_name)}.")
 
-    with tracer.start_as_current_span("make-tar-gz"):
-        _create_archive(path_archive=path_archive, path_src_to_arc=path_src_to_arc)
+    return Archive(name=archive_name, chunks=_create_archive(path_src_to_arc=path_src_to_arc))
 
-    return path_archive
 
+def _create_archive(path_src_to_arc: Mapping[Path, Path]) -> Iterator[bytes]:
+    """Generates a tar.gz archive reflecting the provided path mapping, chunk by chunk.
 
-def _create_archive(path_archive: Path, path_src_to_arc: Mapping[Path, Path]):
-    """Creates tar.gz archive reflecting the provided path mapping.
-
-    :param path_archive:
     :param path_src_to_arc: Map of filesystem source paths to their corresponding in-archive relative paths (1:1).
+    :returns Iterator[bytes]: The compressed chunks of the archive.
+    """
+    # Not made current, as the chunks may be consumed from different threads
+    span = tracer.start_span("make-tar-gz")
+    try:
+        yield from stream_tar_gz(
+            path_src_to_arc=path_src_to_arc,
+            block_size=cfg.ARCHIVE_BLOCK_SIZE_KB * 1024,
+            compression_workers=cfg.ARCHIVE_COMPRESSION_WORKERS,
+            max_pending_blocks=cfg.ARCHIVE_MAX_PENDING_BLOCKS,
+        )
+    finally:
+        span.end()
+
+
+def _read_and_remove_file(path: Path) -> Iterator[bytes]:
+    """Reads a file chunk by chunk, then removes it.
+
+    :param path: Path to the file.
+    :returns Iterator[bytes]: The chunks of the file.
     """
-    with tarfile.open(name=path_archive, mode="w:gz", format=tarfile.PAX_FORMAT, compresslevel=1) as tar:
-        for path_fs, path_rel in path_src_to_arc.items():
-            logger.debug(f"Adding {repr(str(path_fs))} to the archive as {repr(str(path_rel))}")
-            tar.add(name=path_fs, arcname=path_rel, recursive=True)
+    try:
+        with path.open("rb") as file:
+            while chunk := file.read(_FILE_CHUNK_SIZE):
+                yield chunk
+    finally:
+        path.unlink(missing_ok=True)
 
 
 def _get_archive_sources(
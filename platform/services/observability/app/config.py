@@ -15,3 +15,9 @@ USE_KUBECONFIG = os.getenv("USE_KUBECONFIG", "False").lower() == "true"
 
 IMPT_RESOURCE_SERVICE_HOST = os.getenv("IMPT_RESOURCE_SERVICE_HOST", "10.0.0.0")
 IMPT_RESOURCE_SERVICE_PORT = int(os.getenv("IMPT_RESOURCE_SERVICE_PORT", "5000"))
+
+# Streaming of the log archives: size of the uncompressed blocks, number of threads compressing them in parallel and
+# maximum number of blocks compressed ahead of the client, which bounds the memory used by a download.
+ARCHIVE_BLOCK_SIZE_KB = int(os.getenv("ARCHIVE_BLOCK_SIZE_KB", "1024"))
+ARCHIVE_COMPRESSION_WORKERS = int(os.getenv("ARCHIVE_COMPRESSION_WORKERS", "2"))
+ARCHIVE_MAX_PENDING_BLOCKS = int(os.getenv("ARCHIVE_MAX_PENDING_BLOCKS", "8"))
@@ -10,9 +10,8 @@ from datetime import datetime
 from http import HTTPStatus
 
 from fastapi import HTTPException, Query
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 from opentelemetry import trace  # type: ignore[attr-defined]
-from starlette.background import BackgroundTask
 
 from endpoints.logs.router import logs_router
 
@@ -49,14 +48,13 @@ async def logs_endpoint(  # noqa: ANN201
 ):
     """GET logs endpoint."""
     try:
-        path_archive = get_telemetry_archive(log_type=log_type, start=start_date, end=end_date)
+        archive = get_telemetry_archive(log_type=log_type, start=start_date, end=end_date)
     except DateError as err:
         raise HTTPException(status_code=HTTPStatus.UNPROCESSABLE_ENTITY, detail=str(err)) from err
 
-    # Respond with scheduled background archive removal.
-    return FileResponse(
-        path_archive,
+    # The archive is generated while it is sent.
+    return StreamingResponse(
+        archive.chunks,
         media_type="application/octet-stream",
-        filename=path_archive.name,
-        background=BackgroundTask(path_archive.unlink),
+        headers={"Content-Disposition": f'attachment; filename="{archive.name}"'},
     )
@@ -0,0 +1,130 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+"""
+Benchmark of the log archive generation, on a synthetic tree of rotated OpenTelemetry log files.
+
+'file' writes the complete tar.gz to disk before reading it back, as the service did before the archives were
+streamed; 'stream' generates the archive chunk by chunk with `stream_tar_gz`, with 1 and with N compression threads.
+For each mode, the time to the first chunk, the total time, the peak disk usage of the archive and the peak Python
+memory allocations are reported.
+
+Usage: PYTHONPATH=app python tests/benchmarks/bench_log_archive.py [--files 50] [--file-size-mb 8] [--workers 4]
+"""
+
+import argparse
+import json
+import random
+import tarfile
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from common.archive import stream_tar_gz
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+def make_log_tree(root: Path, files: int, file_size: int) -> dict[Path, Path]:
+    """Writes rotated log files of JSON lines, returns the map of their paths to their in-archive paths."""
+    rng = random.Random(0)  # noqa: S311
+    services = ["director", "resource", "jobs-scheduler", "inference-gateway", "account-service"]
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    path_src_to_arc = {}
+    for i in range(files):
+        timestamp = start + timedelta(hours=i)
+        path = root / "geti" / "logs" / f"logs-{timestamp.strftime('%Y-%m-%dT%H-%M-%S.000')}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w") as file:
+            written = 0
+            while written < file_size:
+                line = json.dumps(
+                    {
+                        "timestamp": (timestamp + timedelta(milliseconds=written)).isoformat(),
+                        "service": rng.choice(services),
+                        "level": rng.choice(["INFO", "INFO", "INFO", "DEBUG", "WARNING"]),
+                        "trace_id": f"{rng.getrandbits(128):032x}",
+                        "message": f"Handled request {rng.randrange(10**6)} in {rng.random() * 100:.2f} ms",
+                    }
+                )
+                written += file.write(line + "\n")
+        path_src_to_arc[path] = path.relative_to(root)
+    return path_src_to_arc
+
+
+def file_archive(path_src_to_arc: dict[Path, Path], tmp_dir: Path) -> Iterator[bytes]:
+    """Writes the complete archive to disk, then reads it back."""
+    path_archive = tmp_dir / "archive.tar.gz"
+    with tarfile.open(name=path_archive, mode="w:gz", format=tarfile.PAX_FORMAT, compresslevel=1) as tar:
+        for path_fs, path_rel in path_src_to_arc.items():
+            tar.add(name=path_fs, arcname=path_rel, recursive=True)
+    try:
+        with path_archive.open("rb") as file:
+            while chunk := file.read(_CHUNK_SIZE):
+                yield chunk
+    finally:
+        path_archive.unlink()
+
+
+def measure(name: str, generate: Callable[[Path], Iterator[bytes]]) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        peak_disk = 0
+        done = threading.Event()
+
+        def watch_disk() -> None:
+            nonlocal peak_disk
+            while not done.wait(0.005):
+                size = sum(path.stat().st_size for path in tmp_dir.iterdir() if path.is_file())
+                peak_disk = max(peak_disk, size)
+
+        watcher = threading.Thread(target=watch_disk)
+        watcher.start()
+        tracemalloc.start()
+        start_time = time.perf_counter()
+        first_chunk_time = None
+        total_size = 0
+        for chunk in generate(tmp_dir):
+            if first_chunk_time is None:
+                first_chunk_time = time.perf_counter() - start_time
+            total_size += len(chunk)
+        total_time = time.perf_counter() - start_time
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        done.set()
+        watcher.join()
+
+    print(
+        f"{name:>18}: first chunk {first_chunk_time * 1000:8.1f} ms | total {total_time:6.2f} s | "
+        f"archive {total_size / 2**20:7.1f} MiB | peak disk {peak_disk / 2**20:7.1f} MiB | "
+        f"peak memory {peak_memory / 2**20:6.1f} MiB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=50, help="Number of log files")
+    parser.add_argument("--file-size-mb", type=float, default=8, help="Size of each log file, in MiB")
+    parser.add_argument("--workers", type=int, default=4, help="Compression threads of the parallel stream")
+    parser.add_argument("--block-size-kb", type=int, default=1024, help="Size of the streamed blocks, in KiB")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"Generating {args.files} log files of {args.file_size_mb} MiB...")
+        path_src_to_arc = make_log_tree(Path(tmp), files=args.files, file_size=int(args.file_size_mb * 2**20))
+
+        measure("file", lambda tmp_dir: file_archive(path_src_to_arc, tmp_dir))
+        for workers in (1, args.workers):
+            measure(
+                f"stream, {workers} thread{'s' if workers > 1 else ''}",
+                lambda _, workers=workers: stream_tar_gz(
+                    path_src_to_arc, block_size=args.block_size_kb * 1024, compression_workers=workers
+                ),
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""
+Unit tests for the common.archive module.
+"""
+
+import io
+import os
+import tarfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from common import archive
+from common.archive import stream_tar_gz
+
+_BLOCK_SIZE = 4096
+
+
+def make_log_tree(root: Path) -> dict[Path, Path]:
+    """Creates log files of various sizes, returns the map of their paths to their in-archive paths."""
+    path_src_to_arc = {}
+    for i, size in enumerate((0, 100, _BLOCK_SIZE, 10 * _BLOCK_SIZE + 7)):
+        path = root / "geti" / "logs" / f"logs-2024-01-0{i + 1}T00-00-00.000.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(os.urandom(size // 2).hex().encode()[:size])
+        path_src_to_arc[path] = path.relative_to(root)
+    return path_src_to_arc
+
+
+@pytest.mark.parametrize("compression_workers", (1, 3))
+def test_stream_tar_gz(tmp_path: Path, compression_workers: int):
+    """Tests that the streamed chunks form a valid tar.gz archive of the source files."""
+    path_src_to_arc = make_log_tree(tmp_path)
+
+    chunks = list(
+        stream_tar_gz(path_src_to_arc=path_src_to_arc, block_size=_BLOCK_SIZE, compression_workers=compression_workers)
+    )
+
+    # Each block of the tar stream is compressed into its own gzip member
+    assert len(chunks) > 10
+    with tarfile.open(fileobj=io.BytesIO(b"".join(chunks)), mode="r:gz") as tar:
+        assert sorted(tar.getnames()) == sorted(str(path_rel) for path_rel in path_src_to_arc.values())
+        for path_fs, path_rel in path_src_to_arc.items():
+            assert tar.extractfile(str(path_rel)).read() == path_fs.read_bytes()
+
+
+def test_stream_tar_gz_skips_removed_files(tmp_path: Path):
+    """Tests that the files removed before being archived are skipped."""
+    path_src_to_arc = make_log_tree(tmp_path)
+    path_removed = next(iter(path_src_to_arc))
+    path_removed.unlink()
+
+    with tarfile.open(fileobj=io.BytesIO(b"".join(stream_tar_gz(path_src_to_arc))), mode="r:gz") as tar:
+        assert len(tar.getnames()) == len(path_src_to_arc) - 1
+        assert str(path_src_to_arc[path_removed]) not in tar.getnames()
+
+
+def test_stream_tar_gz_bounded_and_cancellable(mocker, tmp_path: Path):
+    """Tests that the archive is not generated ahead of the consumer, and that closing the stream stops it."""
+    path_src_to_arc = make_log_tree(tmp_path)
+    compress_block_spy = mocker.spy(archive, "_compress_block")
+    max_pending_blocks = 2
+
+    chunks = stream_tar_gz(
+        path_src_to_arc=path_src_to_arc,
+        block_size=_BLOCK_SIZE // 4,
+        compression_workers=1,
+        max_pending_blocks=max_pending_blocks,
+    )
+    next(chunks)
+    time.sleep(0.2)
+
+    # The consumed block, the queued ones, and the one waiting for room in the queue
+    assert compress_block_spy.call_count <= max_pending_blocks + 2
+    chunks.close()
+    assert not any(thread.name == "tar-gz-writer" for thread in threading.enumerate())
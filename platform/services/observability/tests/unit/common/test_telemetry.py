@@ -14,7 +14,7 @@ from unittest.mock import Mock
 import pytest
 
 from common.telemetry import _PATH_TELEMETRY_ROOT as PATH_TELEMETRY_ROOT
-from common.telemetry import DateError, LogType, _datetime_from_otel_file_name, get_archive
+from common.telemetry import Archive, DateError, LogType, _datetime_from_otel_file_name, get_archive
 from common.telemetry import _archive_logs as archive_logs
 from common.telemetry import _fallback_datetime_range as fallback_datetime_range
 from common.telemetry import _filter_files_by_datetime as filter_files_by_datetime
@@ -27,18 +27,22 @@ from common.telemetry import _sanitize_datetime_range as sanitize_date_range
 _PATCHING_TARGET = "common.telemetry"
 
 
-def test_get_archive_type_cluster(mocker):
+def test_get_archive_type_cluster(mocker, tmp_path: Path):
     """Tests the _get_archive function against LogType.CLUSTER."""
-    path_archive_mock = "/path/archive.tar.gz"
+    path_archive_mock = tmp_path / "archive.tar.gz"
+    path_archive_mock.write_bytes(b"cluster info")
     prepare_cluster_info_dump_mock = mocker.patch(f"{_PATCHING_TARGET}.prepare_cluster_info_dump")
-    prepare_cluster_info_dump_mock.return_value = path_archive_mock
+    prepare_cluster_info_dump_mock.return_value = str(path_archive_mock)
     prepare_archive_logs = mocker.patch(f"{_PATCHING_TARGET}._archive_logs")
 
-    path_archive_actual = get_archive(LogType.CLUSTER, start=None, end=None)
+    archive_actual = get_archive(LogType.CLUSTER, start=None, end=None)
 
     prepare_cluster_info_dump_mock.assert_called_once_with()
     prepare_archive_logs.assert_not_called()
-    assert path_archive_actual == Path(path_archive_mock)
+    assert archive_actual.name == path_archive_mock.name
+    assert b"".join(archive_actual.chunks) == b"cluster info"
+    # The archive is removed once it has been read
+    assert not path_archive_mock.exists()
 
 
 @pytest.mark.parametrize(
@@ -56,7 +60,7 @@ def test_get_archive_type_cluster(mocker):
 )
 def test_get_archive_type_non_cluster(mocker, log_type: LogType, archive_logs_log_types_expected: tuple[LogType]):
     """Tests the _get_archive function against non-cluster log types."""
-    path_archive_mock = Path("/path/archive.tar.gz")
+    archive_mock = Mock(Archive)
     prepare_cluster_info_dump_mock = mocker.patch(f"{_PATCHING_TARGET}.prepare_cluster_info_dump")
     start_dt_mock = Mock(datetime)
     end_dt_mock = Mock(datetime)
@@ -66,9 +70,9 @@ def test_get_archive_type_non_cluster(mocker, log_type: LogType, archive_logs_lo
         f"{_PATCHING_TARGET}._sanitize_datetime_range", side_effect=[(start_dt_sanitized, end_dt_sanitized)]
     )
     prepare_archive_logs = mocker.patch(f"{_PATCHING_TARGET}._archive_logs")
-    prepare_archive_logs.return_value = path_archive_mock
+    prepare_archive_logs.return_value = archive_mock
 
-    path_archive_actual = get_archive(log_type=log_type, start=start_dt_mock, end=end_dt_mock)
+    archive_actual = get_archive(log_type=log_type, start=start_dt_mock, end=end_dt_mock)
 
     sanitize_date_range_mock.assert_called_once_with(start=start_dt_mock, end=end_dt_mock)
     prepare_archive_logs.assert_called_once_with(
@@ -78,7 +82,7 @@ def test_get_archive_type_non_cluster(mocker, log_type: LogType, archive_logs_lo
         end=end_dt_sanitized,
     )
     prepare_cluster_info_dump_mock.assert_not_called()
-    assert path_archive_actual == path_archive_mock
+    assert archive_actual == archive_mock
 
 
 @pytest.mark.parametrize(
@@ -134,18 +138,18 @@ def test_get_archive_type_non_cluster(mocker, log_type: LogType, archive_logs_lo
 def test_archive_logs(log_types: tuple[LogType], start: datetime, end: datetime, prefix_expected: str, mocker):
     """Tests the _archive_logs function."""
     archive_name_mock = "archive_name_mock.tar.gz"
-    path_archive_mock = Path(f"/tmp/{archive_name_mock}")
+    chunks_mock = iter([b"chunk"])
     sources_mock = {"/abs/src_a": "/rel/src_a", "/abs/src_b": "/rel/src_b"}
 
     gen_archive_name_mock = mocker.patch(f"{_PATCHING_TARGET}._gen_archive_name", return_value=archive_name_mock)
     get_archive_sources_mock = mocker.patch(f"{_PATCHING_TARGET}._get_archive_sources", return_value=sources_mock)
-    create_archive_mock = mocker.patch(f"{_PATCHING_TARGET}._create_archive")
+    create_archive_mock = mocker.patch(f"{_PATCHING_TARGET}._create_archive", return_value=chunks_mock)
 
-    path_archive_actual = archive_logs(telemetry_root=PATH_TELEMETRY_ROOT, log_types=log_types, start=start, end=end)
+    archive_actual = archive_logs(telemetry_root=PATH_TELEMETRY_ROOT, log_types=log_types, start=start, end=end)
 
-    assert path_archive_actual == path_archive_mock
+    assert archive_actual == Archive(name=archive_name_mock, chunks=chunks_mock)
     gen_archive_name_mock.assert_called_once_with(prefix=prefix_expected)
-    create_archive_mock.assert_called_once_with(path_archive=path_archive_mock, path_src_to_arc=sources_mock)
+    create_archive_mock.assert_called_once_with(path_src_to_arc=sources_mock)
     get_archive_sources_mock.assert_called_once_with(
         telemetry_root=PATH_TELEMETRY_ROOT, log_types=log_types, start=start, end=end
     )
@@ -4,7 +4,6 @@
 
 from datetime import datetime, timezone
 from http import HTTPStatus
-from pathlib import Path
 from urllib.parse import quote
 
 import pytest
@@ -14,7 +13,7 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.testclient import TestClient
 
 from common.endpoint_validation import handle_request_validation_error
-from common.telemetry import DateError
+from common.telemetry import Archive, DateError
 from common.utils import API_BASE_PATTERN
 
 router = APIRouter(prefix=f"{API_BASE_PATTERN}/logs")
@@ -38,14 +37,13 @@ _PATCHING_TARGET = "endpoints.logs.logs"
         (None, None, None),
     ),
 )
-def test_get_logs(mocker, tmp_path: Path, log_type_expected: LogType, start: datetime, end: datetime):
+def test_get_logs(mocker, log_type_expected: LogType, start: datetime, end: datetime):
     """Tests the GET /logs method against valid requests."""
     file_name = "mock_log_archive.tar.gz"
     file_content = "Nobody expects the Spanish Inquisition!"
-    path_file = tmp_path / file_name
-    path_file.write_text(file_content)
+    archive = Archive(name=file_name, chunks=iter([file_content[:10].encode(), file_content[10:].encode()]))
 
-    get_archive_mock = mocker.patch(f"{_PATCHING_TARGET}.get_telemetry_archive", return_value=path_file)
+    get_archive_mock = mocker.patch(f"{_PATCHING_TARGET}.get_telemetry_archive", return_value=archive)
 
     params = []
     if log_type_expected:
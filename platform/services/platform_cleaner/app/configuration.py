@@ -17,3 +17,10 @@ NAMESPACES = (PLATFORM_NAMESPACE,)
 
 # Inference services cleanup
 INFERENCE_SERVICE_AGE_THRESHOLD_HOURS = int(os.environ.get("INFERENCE_SERVICE_AGE_THRESHOLD_HOURS", "48"))
+
+# Not activated users deletion
+NOT_ACTIVATED_USERS_ORGANIZATION_WORKERS = int(os.environ.get("NOT_ACTIVATED_USERS_ORGANIZATION_WORKERS", "4"))
+NOT_ACTIVATED_USERS_STATUS_CHANGE_WORKERS = int(os.environ.get("NOT_ACTIVATED_USERS_STATUS_CHANGE_WORKERS", "8"))
+# Organizations swept by an interrupted run are recorded there, so that the next run resumes it. Disabled if empty.
+NOT_ACTIVATED_USERS_CHECKPOINT_PATH = os.environ.get("NOT_ACTIVATED_USERS_CHECKPOINT_PATH", "")
+NOT_ACTIVATED_USERS_DRY_RUN = os.environ.get("NOT_ACTIVATED_USERS_DRY_RUN", "false").lower() == "true"
@@ -3,8 +3,11 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 
+import functools
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from pathlib import Path
 
 from grpc_interfaces.account_service.client import AccountServiceClient
 from grpc_interfaces.account_service.enums import OrganizationStatus, UserStatus
@@ -12,6 +15,18 @@ from grpc_interfaces.account_service.pb.organization_status_pb2 import Organizat
 from grpc_interfaces.account_service.pb.user_pb2 import FindUserRequest, UserIdRequest
 from grpc_interfaces.account_service.pb.user_status_pb2 import UserStatusRequest
 
+from configuration import (
+    NOT_ACTIVATED_USERS_CHECKPOINT_PATH,
+    NOT_ACTIVATED_USERS_DRY_RUN,
+    NOT_ACTIVATED_USERS_ORGANIZATION_WORKERS,
+    NOT_ACTIVATED_USERS_STATUS_CHANGE_WORKERS,
+)
+from delete_not_activated_users.sweeper import (
+    OrganizationSweeper,
+    OrganizationSweepResult,
+    SweepCheckpoint,
+    SweepReport,
+)
 from geti_logger_tools.logger_config import initialize_logger
 
 logger = initialize_logger(__name__)
@@ -55,48 +70,131 @@ class ActivatedUsers:
         user_request = UserIdRequest(user_id=user_id, organization_id=organization_id)
         return self.account_service_client.get_user_by_id(user_id_request=user_request)
 
-    def delete_not_activated_users(self, days_until_deletion: int) -> None:
+    def _get_created_at(self, user: dict) -> str:
+        """Returns the creation timestamp of a listed user, only fetching the user if the listing lacks it."""
+        if "createdAt" in user:
+            return user["createdAt"]
+        return self._get_user_by_id(user["id"], user["organizationId"]).createdAt
+
+    def _sweep_organization(
+        self,
+        organization_id: str,
+        days_until_deletion: int,
+        status_change_executor: ThreadPoolExecutor,
+        dry_run: bool,
+    ) -> OrganizationSweepResult:
+        """
+        Deletes the not activated users of an organization, and the organization if no user is left.
+
+        :param organization_id: ID of the organization.
+        :param days_until_deletion: The number of days after which not activated users will be deleted.
+        :param status_change_executor: Executor sending the status changes of the users concurrently.
+        :param dry_run: If True, nothing is deleted.
+        :returns OrganizationSweepResult: The users and organization deleted, or to delete if running dry.
+        """
+        result = OrganizationSweepResult(organization_id=organization_id)
+        registered_users = self._get_registered_users(organization_id=organization_id)
+        logger.debug(f"{len(registered_users)} registered users found in organization {organization_id}")
+        if not registered_users:
+            return result
+
+        activated_users = self._get_activated_users(organization_id=organization_id)
+        logger.debug(f"{len(activated_users)} activated users found in organization {organization_id}")
+
+        result.expired_user_ids = [
+            user["id"]
+            for user in registered_users
+            if _days_difference_from_current_utc(timestamp_str=self._get_created_at(user)) >= days_until_deletion
+        ]
+        result.organization_expired = not activated_users and len(result.expired_user_ids) == len(registered_users)
+        if dry_run:
+            return result
+
+        futures = {
+            status_change_executor.submit(
+                self._change_user_status,
+                organization_id=organization_id,
+                user_id=user_id,
+                status=UserStatus.DELETED,
+            ): user_id
+            for user_id in result.expired_user_ids
+        }
+        failed_user_ids = []
+        for future in as_completed(futures):
+            user_id = futures[future]
+            try:
+                future.result()
+            except Exception as err:
+                logger.error("Failed to delete user %s in organization %s: %s", user_id, organization_id, str(err))
+                failed_user_ids.append(user_id)
+            else:
+                result.deleted_user_ids.append(user_id)
+                logger.info("Deleted user %s in organization %s", user_id, organization_id)
+        if failed_user_ids:
+            result.error = f"failed to delete users {', '.join(sorted(failed_user_ids))}"
+            return result
+
+        if result.organization_expired:
+            logger.debug(f"All platform users have been deleted. Deleting organization {organization_id}")
+            self._change_organization_status(organization_id=organization_id, status=OrganizationStatus.DELETED)
+            result.organization_deleted = True
+            logger.info("Deleted organization %s", organization_id)
+        return result
+
+    def delete_not_activated_users(self, days_until_deletion: int, dry_run: bool = False) -> SweepReport | None:
         """
         Deletes all non-activated users from all organizations if a user does not complete the registration
-        within the number of days defined in the `days_until_deletion` variable.
+        within the number of days defined in the `days_until_deletion` variable, and the organizations left without
+        users.
+
+        Organizations are swept concurrently and the status changes of their users are sent concurrently, within the
+        limits set in the configuration. If a checkpoint path is configured, the organizations already swept by an
+        interrupted run are skipped.
+
         :param days_until_deletion: The number of days after which not activated users will be deleted.
+        :param dry_run: If True, only reports the users and organizations that would be deleted.
+        :returns SweepReport | None: Report of the run, None if the organizations could not be listed.
         """
         try:
             organizations = self._get_all_organizations()
-            logger.debug(f"{len(organizations)} organizations found. Organizations: {organizations}")
-            for organization in organizations:
-                registered_users = self._get_registered_users(organization_id=organization["id"])
-                logger.debug(f"{len(registered_users)} registered users found. List of users: {registered_users}")
-
-                activated_users = self._get_activated_users(organization_id=organization["id"])
-                logger.debug(f"{len(activated_users)} activated users found. List of users: {activated_users}")
-
-                platform_users_left = len(registered_users + activated_users)
-
-                if registered_users:
-                    for user in registered_users:
-                        user_status = self._get_user_by_id(user["id"], user["organizationId"])
-                        days_since_creation = _days_difference_from_current_utc(timestamp_str=user_status.createdAt)
-                        if days_since_creation >= days_until_deletion:
-                            self._change_user_status(
-                                organization_id=organization["id"],
-                                user_id=user["id"],
-                                status=UserStatus.DELETED,
-                            )
-                            platform_users_left -= 1
-                            logger.info("Deleted user %s in organization %s", user["id"], organization["id"])
-                            logger.debug(f"Platform users left: {platform_users_left}")
-
-                    if platform_users_left == 0:
-                        logger.debug(
-                            f"All platform users have been deleted. Deleting organization {organization['id']}"
-                        )
-                        self._change_organization_status(
-                            organization_id=organization["id"], status=OrganizationStatus.DELETED
-                        )
-                        logger.info("Deleted organization %s", organization["id"])
         except Exception as e:
             logger.error("An error occurred during the deletion process: %s", str(e))
+            return None
+        logger.debug(f"{len(organizations)} organizations found.")
+
+        checkpoint = None
+        if NOT_ACTIVATED_USERS_CHECKPOINT_PATH:
+            checkpoint = SweepCheckpoint(
+                path=Path(NOT_ACTIVATED_USERS_CHECKPOINT_PATH),
+                parameters={"days_until_deletion": days_until_deletion},
+            )
+        with ThreadPoolExecutor(
+            max_workers=NOT_ACTIVATED_USERS_STATUS_CHANGE_WORKERS, thread_name_prefix="user-status-change"
+        ) as status_change_executor:
+            sweeper = OrganizationSweeper(
+                sweep_organization=functools.partial(
+                    self._sweep_organization,
+                    days_until_deletion=days_until_deletion,
+                    status_change_executor=status_change_executor,
+                    dry_run=dry_run,
+                ),
+                workers=NOT_ACTIVATED_USERS_ORGANIZATION_WORKERS,
+                dry_run=dry_run,
+                checkpoint=checkpoint,
+            )
+            report = sweeper.run([organization["id"] for organization in organizations])
+
+        if dry_run:
+            for result in report.results:
+                if result.expired_user_ids:
+                    logger.info(
+                        "Dry run: would delete users %s in organization %s%s",
+                        ", ".join(result.expired_user_ids),
+                        result.organization_id,
+                        ", and the organization" if result.organization_expired else "",
+                    )
+        logger.info("Deleting not activated users process finished: %s", report.summary())
+        return report
 
 
 def delete_not_activated_users(days_until_deletion: int = 30) -> None:
@@ -108,7 +206,9 @@ def delete_not_activated_users(days_until_deletion: int = 30) -> None:
     """
     active_users = ActivatedUsers()
     logger.info("Deleting not activated users process started.")
-    active_users.delete_not_activated_users(days_until_deletion=days_until_deletion)
+    active_users.delete_not_activated_users(
+        days_until_deletion=days_until_deletion, dry_run=NOT_ACTIVATED_USERS_DRY_RUN
+    )
 
 
 def main() -> None:
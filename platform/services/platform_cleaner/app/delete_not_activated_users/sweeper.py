@@ -0,0 +1,208 @@
+"""Module for sweeping organizations concurrently, with a resumable checkpoint and a timing report"""
+
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+import json
+import os
+import statistics
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from geti_logger_tools.logger_config import initialize_logger
+
+logger = initialize_logger(__name__)
+
+
+@dataclass
+class OrganizationSweepResult:
+    """
+    Outcome of the sweep of a single organization.
+
+    :param organization_id: ID of the organization.
+    :param expired_user_ids: IDs of the users whose registration expired, deleted unless running dry.
+    :param deleted_user_ids: IDs of the users actually deleted.
+    :param organization_expired: Whether the organization has no users left once the expired ones are deleted.
+    :param organization_deleted: Whether the organization was actually deleted.
+    :param error: Description of the error that interrupted the sweep of the organization, if any.
+    :param duration_seconds: Time spent sweeping the organization.
+    """
+
+    organization_id: str
+    expired_user_ids: list[str] = field(default_factory=list)
+    deleted_user_ids: list[str] = field(default_factory=list)
+    organization_expired: bool = False
+    organization_deleted: bool = False
+    error: str | None = None
+    duration_seconds: float = 0.0
+
+
+@dataclass
+class SweepReport:
+    """
+    Report of a sweep run over all organizations.
+
+    :param dry_run: Whether the run only reported what would be deleted.
+    :param results: Results of the organizations swept by this run.
+    :param resumed_organizations: Number of organizations already swept by the interrupted run that this one resumed.
+    :param duration_seconds: Total duration of the run.
+    """
+
+    dry_run: bool
+    results: list[OrganizationSweepResult] = field(default_factory=list)
+    resumed_organizations: int = 0
+    duration_seconds: float = 0.0
+
+    @property
+    def failed_organization_ids(self) -> list[str]:
+        return [result.organization_id for result in self.results if result.error is not None]
+
+    def summary(self) -> dict[str, float | int | bool]:
+        """Returns the counters and timings of the run."""
+        durations = [result.duration_seconds for result in self.results]
+        return {
+            "dry_run": self.dry_run,
+            "duration_seconds": round(self.duration_seconds, 3),
+            "organizations_swept": len(self.results),
+            "organizations_resumed": self.resumed_organizations,
+            "organizations_failed": len(self.failed_organization_ids),
+            "expired_users": sum(len(result.expired_user_ids) for result in self.results),
+            "deleted_users": sum(len(result.deleted_user_ids) for result in self.results),
+            "expired_organizations": sum(result.organization_expired for result in self.results),
+            "deleted_organizations": sum(result.organization_deleted for result in self.results),
+            "organization_p50_seconds": round(statistics.median(durations), 3) if durations else 0.0,
+            "organization_max_seconds": round(max(durations), 3) if durations else 0.0,
+        }
+
+
+class SweepCheckpoint:
+    """
+    Set of the organizations completely swept by a run, persisted to a JSON file so that an interrupted run can be
+    resumed by the next one. A checkpoint older than `max_age`, or recorded with other sweep parameters, is discarded.
+
+    :param path: Path to the checkpoint file.
+    :param parameters: Parameters of the sweep, which must match to resume from the checkpoint.
+    :param max_age: Maximum age of a resumable checkpoint.
+    """
+
+    def __init__(self, path: Path, parameters: dict, max_age: timedelta = timedelta(days=1)) -> None:
+        self.path = path
+        self._parameters = parameters
+        self._max_age = max_age
+        self._lock = threading.Lock()
+        self._started_at = datetime.now(timezone.utc)
+        self._completed: set[str] = set()
+
+    def load(self) -> set[str]:
+        """Loads the checkpoint of an interrupted run, returns the IDs of the organizations it completed."""
+        try:
+            content = json.loads(self.path.read_text())
+            started_at = datetime.fromisoformat(content["started_at"])
+            completed = set(content["completed_organization_ids"])
+            parameters = content["parameters"]
+        except FileNotFoundError:
+            return set()
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"Ignoring invalid checkpoint {repr(str(self.path))}")
+            return set()
+
+        if parameters != self._parameters or datetime.now(timezone.utc) - started_at > self._max_age:
+            logger.info(f"Ignoring stale checkpoint {repr(str(self.path))} from {started_at.isoformat()}")
+            return set()
+        with self._lock:
+            self._started_at = started_at
+            self._completed = completed
+        logger.info(f"Resuming the run started at {started_at.isoformat()}, {len(completed)} organizations done")
+        return set(completed)
+
+    def mark_completed(self, organization_id: str) -> None:
+        """Records an organization as completely swept."""
+        with self._lock:
+            self._completed.add(organization_id)
+            content = {
+                "started_at": self._started_at.isoformat(),
+                "parameters": self._parameters,
+                "completed_organization_ids": sorted(self._completed),
+            }
+            # Replace the file atomically, so that an interruption never leaves a truncated checkpoint
+            path_tmp = self.path.with_name(f".{self.path.name}.tmp")
+            path_tmp.write_text(json.dumps(content))
+            os.replace(path_tmp, self.path)
+
+    def clear(self) -> None:
+        """Removes the checkpoint, once the run is complete."""
+        with self._lock:
+            self.path.unlink(missing_ok=True)
+
+
+class OrganizationSweeper:
+    """
+    Runs a sweep function over organizations, `workers` organizations at a time.
+
+    The failure of an organization does not interrupt the sweep of the others. If a checkpoint is given, the
+    organizations completed by an interrupted run are skipped, and the checkpoint is removed once all the organizations
+    were swept successfully.
+
+    :param sweep_organization: Function sweeping the organization of the given ID.
+    :param workers: Maximum number of organizations swept concurrently.
+    :param dry_run: Whether the sweep function only reports what it would delete.
+    :param checkpoint: Optional checkpoint of the completed organizations.
+    """
+
+    def __init__(
+        self,
+        sweep_organization: Callable[[str], OrganizationSweepResult],
+        workers: int,
+        dry_run: bool = False,
+        checkpoint: SweepCheckpoint | None = None,
+    ) -> None:
+        self._sweep_organization = sweep_organization
+        self._workers = workers
+        self._dry_run = dry_run
+        self._checkpoint = checkpoint
+
+    def run(self, organization_ids: Sequence[str]) -> SweepReport:
+        """
+        Sweeps the given organizations.
+
+        :param organization_ids: IDs of the organizations to sweep.
+        :returns SweepReport: Report of the run.
+        """
+        start_time = time.perf_counter()
+        report = SweepReport(dry_run=self._dry_run)
+        # A dry run neither resumes nor records any progress
+        checkpoint = None if self._dry_run else self._checkpoint
+        completed = checkpoint.load() if checkpoint is not None else set()
+        pending_ids = [organization_id for organization_id in organization_ids if organization_id not in completed]
+        report.resumed_organizations = len(organization_ids) - len(pending_ids)
+
+        with ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="organization-sweeper") as executor:
+            futures = {
+                executor.submit(self._timed_sweep, organization_id): organization_id for organization_id in pending_ids
+            }
+            for future in as_completed(futures):
+                result = future.result()
+                report.results.append(result)
+                if result.error is not None:
+                    logger.error(f"Failed to sweep organization {result.organization_id}: {result.error}")
+                elif checkpoint is not None:
+                    checkpoint.mark_completed(result.organization_id)
+
+        if checkpoint is not None and not report.failed_organization_ids:
+            checkpoint.clear()
+        report.duration_seconds = time.perf_counter() - start_time
+        return report
+
+    def _timed_sweep(self, organization_id: str) -> OrganizationSweepResult:
+        start_time = time.perf_counter()
+        try:
+            result = self._sweep_organization(organization_id)
+        except Exception as err:
+            result = OrganizationSweepResult(organization_id=organization_id, error=str(err))
+        result.duration_seconds = time.perf_counter() - start_time
+        return result
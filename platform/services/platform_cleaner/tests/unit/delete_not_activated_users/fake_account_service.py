@@ -0,0 +1,160 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+"""
+In-process fake of the account service, serving the organization, user and status RPCs over a local gRPC server.
+
+The fake stores the organizations and users in memory and records the RPCs it receives; the status changes can be
+slowed down to observe their concurrency, or made to fail for given users.
+"""
+
+import threading
+import time
+from collections import Counter
+from concurrent import futures
+from dataclasses import dataclass
+from datetime import datetime
+
+import grpc
+from google.protobuf.timestamp_pb2 import Timestamp
+from grpc_interfaces.account_service.pb.organization_pb2 import ListOrganizationsResponse, OrganizationDataWithAdmins
+from grpc_interfaces.account_service.pb.organization_pb2_grpc import (
+    OrganizationServicer,
+    add_OrganizationServicer_to_server,
+)
+from grpc_interfaces.account_service.pb.organization_status_pb2 import OrganizationStatusResponse
+from grpc_interfaces.account_service.pb.organization_status_pb2_grpc import (
+    OrganizationStatusServicer,
+    add_OrganizationStatusServicer_to_server,
+)
+from grpc_interfaces.account_service.pb.user_common_pb2 import UserData
+from grpc_interfaces.account_service.pb.user_pb2 import ListUsersResponse
+from grpc_interfaces.account_service.pb.user_pb2_grpc import UserServicer, add_UserServicer_to_server
+from grpc_interfaces.account_service.pb.user_status_pb2 import UserStatusResponse
+from grpc_interfaces.account_service.pb.user_status_pb2_grpc import UserStatusServicer, add_UserStatusServicer_to_server
+
+
+@dataclass
+class FakeUser:
+    id: str
+    organization_id: str
+    status: str
+    created_at: datetime
+
+
+class FakeAccountService:
+    def __init__(self, status_change_delay: float = 0) -> None:
+        self.status_change_delay = status_change_delay
+        self.organization_statuses: dict[str, str] = {}
+        self.users: dict[str, FakeUser] = {}
+        self.failing_user_ids: set[str] = set()
+        self.calls: Counter[str] = Counter()
+        self.max_concurrent_status_changes = 0
+        self.host = "127.0.0.1"
+        self.port = 0
+        self._status_changes = 0
+        self._lock = threading.Lock()
+        self._server: grpc.Server | None = None
+
+    def add_organization(self, organization_id: str, users: list[tuple[str, datetime]]) -> None:
+        """Adds an organization with the given (status, creation time) users, identified by their index."""
+        self.organization_statuses[organization_id] = "ACT"
+        for i, (status, created_at) in enumerate(users):
+            user_id = f"{organization_id}-user-{i}"
+            self.users[user_id] = FakeUser(
+                id=user_id, organization_id=organization_id, status=status, created_at=created_at
+            )
+
+    def user_statuses(self, organization_id: str) -> dict[str, str]:
+        return {user.id: user.status for user in self.users.values() if user.organization_id == organization_id}
+
+    def start(self) -> None:
+        self._server = grpc.server(futures.ThreadPoolExecutor(max_workers=32))
+        add_OrganizationServicer_to_server(_Organization(self), self._server)
+        add_OrganizationStatusServicer_to_server(_OrganizationStatus(self), self._server)
+        add_UserServicer_to_server(_User(self), self._server)
+        add_UserStatusServicer_to_server(_UserStatus(self), self._server)
+        self.port = self._server.add_insecure_port(f"{self.host}:0")
+        self._server.start()
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.stop(grace=None)
+
+    def record_call(self, name: str) -> None:
+        with self._lock:
+            self.calls[name] += 1
+
+    def to_user_data(self, user: FakeUser) -> UserData:
+        created_at = Timestamp()
+        created_at.FromDatetime(user.created_at)
+        return UserData(id=user.id, organization_id=user.organization_id, status=user.status, created_at=created_at)
+
+    def change_user_status(self, request, context) -> UserStatusResponse:  # noqa: ANN001
+        with self._lock:
+            self._status_changes += 1
+            self.max_concurrent_status_changes = max(self.max_concurrent_status_changes, self._status_changes)
+        try:
+            time.sleep(self.status_change_delay)
+            if request.user_id in self.failing_user_ids:
+                context.abort(grpc.StatusCode.INTERNAL, "Status change failed")
+            with self._lock:
+                self.users[request.user_id].status = request.status
+        finally:
+            with self._lock:
+                self._status_changes -= 1
+        return UserStatusResponse(
+            id=request.user_id, status=request.status, organization_id=request.organization_id, user_id=request.user_id
+        )
+
+
+class _Organization(OrganizationServicer):
+    def __init__(self, service: FakeAccountService) -> None:
+        self._service = service
+
+    def find(self, request, context) -> ListOrganizationsResponse:  # noqa: ANN001
+        self._service.record_call("organization.find")
+        return ListOrganizationsResponse(
+            organizations=[
+                OrganizationDataWithAdmins(id=organization_id, status=status)
+                for organization_id, status in self._service.organization_statuses.items()
+            ]
+        )
+
+
+class _OrganizationStatus(OrganizationStatusServicer):
+    def __init__(self, service: FakeAccountService) -> None:
+        self._service = service
+
+    def change(self, request, context) -> OrganizationStatusResponse:  # noqa: ANN001
+        self._service.record_call("organization_status.change")
+        self._service.organization_statuses[request.organization_id] = request.status
+        return OrganizationStatusResponse(
+            id=request.organization_id, status=request.status, organization_id=request.organization_id
+        )
+
+
+class _User(UserServicer):
+    def __init__(self, service: FakeAccountService) -> None:
+        self._service = service
+
+    def find(self, request, context) -> ListUsersResponse:  # noqa: ANN001
+        self._service.record_call("user.find")
+        users = [
+            self._service.to_user_data(user)
+            for user in list(self._service.users.values())
+            if user.organization_id == request.organization_id and user.status == request.status
+        ]
+        return ListUsersResponse(users=users, total_matched_count=len(users))
+
+    def get_by_id(self, request, context) -> UserData:  # noqa: ANN001
+        self._service.record_call("user.get_by_id")
+        return self._service.to_user_data(self._service.users[request.user_id])
+
+
+class _UserStatus(UserStatusServicer):
+    def __init__(self, service: FakeAccountService) -> None:
+        self._service = service
+
+    def change(self, request, context) -> UserStatusResponse:  # noqa: ANN001
+        self._service.record_call("user_status.change")
+        return self._service.change_user_status(request, context)
@@ -135,7 +135,9 @@ def test_delete_not_activated_users(mock_active_user):
     delete_not_activated_users(days_until_deletion=days_until_deletion)
 
     mock_active_user.assert_called_once()
-    mock_instance.delete_not_activated_users.assert_called_once_with(days_until_deletion=days_until_deletion)
+    mock_instance.delete_not_activated_users.assert_called_once_with(
+        days_until_deletion=days_until_deletion, dry_run=False
+    )
 
 
 def test_main(mocker):
@@ -0,0 +1,164 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from grpc_interfaces.account_service.enums import OrganizationStatus, UserStatus
+
+from delete_not_activated_users.delete_not_activated_users import ActivatedUsers
+from delete_not_activated_users.sweeper import OrganizationSweeper, OrganizationSweepResult, SweepCheckpoint
+
+from tests.unit.delete_not_activated_users.fake_account_service import FakeAccountService
+
+DAYS_UNTIL_DELETION = 30
+MODULE = "delete_not_activated_users.delete_not_activated_users"
+
+NOW = datetime.utcnow().replace(microsecond=0)
+EXPIRED = NOW - timedelta(days=DAYS_UNTIL_DELETION + 1)
+RECENT = NOW - timedelta(days=1)
+
+
+@pytest.fixture
+def account_service(monkeypatch):
+    service = FakeAccountService()
+    service.start()
+    monkeypatch.setenv("ACCOUNT_SERVICE_HOST", service.host)
+    monkeypatch.setenv("ACCOUNT_SERVICE_PORT", str(service.port))
+    yield service
+    service.stop()
+
+
+@pytest.fixture
+def fxt_organizations(account_service):
+    # Only expired registrations: the users and the organization are deleted
+    account_service.add_organization(
+        "expired-org", [(UserStatus.REGISTERED, EXPIRED), (UserStatus.REGISTERED, EXPIRED)]
+    )
+    # An activated user is left: only the expired registration is deleted
+    account_service.add_organization("active-org", [(UserStatus.REGISTERED, EXPIRED), (UserStatus.ACTIVATED, EXPIRED)])
+    # A recent registration is left: only the expired registration is deleted
+    account_service.add_organization("recent-org", [(UserStatus.REGISTERED, EXPIRED), (UserStatus.REGISTERED, RECENT)])
+    # No registration: the activated users are not even listed
+    account_service.add_organization("no-registration-org", [(UserStatus.ACTIVATED, EXPIRED)])
+    return account_service
+
+
+def test_delete_not_activated_users(fxt_organizations):
+    report = ActivatedUsers().delete_not_activated_users(days_until_deletion=DAYS_UNTIL_DELETION)
+
+    assert fxt_organizations.organization_statuses == {
+        "expired-org": OrganizationStatus.DELETED,
+        "active-org": OrganizationStatus.ACTIVATED,
+        "recent-org": OrganizationStatus.ACTIVATED,
+        "no-registration-org": OrganizationStatus.ACTIVATED,
+    }
+    assert fxt_organizations.user_statuses("expired-org") == {
+        "expired-org-user-0": UserStatus.DELETED,
+        "expired-org-user-1": UserStatus.DELETED,
+    }
+    assert fxt_organizations.user_statuses("active-org") == {
+        "active-org-user-0": UserStatus.DELETED,
+        "active-org-user-1": UserStatus.ACTIVATED,
+    }
+    assert fxt_organizations.user_statuses("recent-org") == {
+        "recent-org-user-0": UserStatus.DELETED,
+        "recent-org-user-1": UserStatus.REGISTERED,
+    }
+    # The creation times come from the user listings, and organizations without registrations are listed once
+    assert fxt_organizations.calls["user.get_by_id"] == 0
+    assert fxt_organizations.calls["user.find"] == 3 * 2 + 1
+    summary = report.summary()
+    assert summary["organizations_swept"] == 4
+    assert summary["deleted_users"] == summary["expired_users"] == 4
+    assert summary["deleted_organizations"] == 1
+    assert summary["organizations_failed"] == 0
+
+
+def test_delete_not_activated_users_dry_run(fxt_organizations):
+    report = ActivatedUsers().delete_not_activated_users(days_until_deletion=DAYS_UNTIL_DELETION, dry_run=True)
+
+    assert fxt_organizations.calls["user_status.change"] == 0
+    assert fxt_organizations.calls["organization_status.change"] == 0
+    results = {result.organization_id: result for result in report.results}
+    assert results["expired-org"].expired_user_ids == ["expired-org-user-0", "expired-org-user-1"]
+    assert results["expired-org"].organization_expired
+    assert results["active-org"].expired_user_ids == ["active-org-user-0"]
+    assert not results["active-org"].organization_expired
+    assert not any(result.deleted_user_ids or result.organization_deleted for result in report.results)
+
+
+def test_delete_not_activated_users_concurrency(mocker, account_service):
+    mocker.patch(f"{MODULE}.NOT_ACTIVATED_USERS_ORGANIZATION_WORKERS", 2)
+    mocker.patch(f"{MODULE}.NOT_ACTIVATED_USERS_STATUS_CHANGE_WORKERS", 3)
+    account_service.status_change_delay = 0.05
+    for i in range(4):
+        account_service.add_organization(f"org-{i}", [(UserStatus.REGISTERED, EXPIRED)] * 3)
+
+    report = ActivatedUsers().delete_not_activated_users(days_until_deletion=DAYS_UNTIL_DELETION)
+
+    assert report.summary()["deleted_users"] == 12
+    # The status changes are sent concurrently, within the limit of the status change workers
+    assert account_service.max_concurrent_status_changes == 3
+    # 12 changes of 50 ms, 3 at a time
+    assert report.duration_seconds < 12 * account_service.status_change_delay
+
+
+def test_delete_not_activated_users_failure_is_isolated(mocker, tmp_path, fxt_organizations):
+    path_checkpoint = tmp_path / "checkpoint.json"
+    mocker.patch(f"{MODULE}.NOT_ACTIVATED_USERS_CHECKPOINT_PATH", str(path_checkpoint))
+    fxt_organizations.failing_user_ids.add("expired-org-user-1")
+
+    report = ActivatedUsers().delete_not_activated_users(days_until_deletion=DAYS_UNTIL_DELETION)
+
+    # The organization is kept since one of its users could not be deleted, the others are swept
+    assert report.failed_organization_ids == ["expired-org"]
+    assert fxt_organizations.organization_statuses["expired-org"] == OrganizationStatus.ACTIVATED
+    assert fxt_organizations.user_statuses("active-org")["active-org-user-0"] == UserStatus.DELETED
+    # The next run resumes from the checkpoint, and only sweeps the failed organization again
+    checkpoint = json.loads(path_checkpoint.read_text())
+    assert sorted(checkpoint["completed_organization_ids"]) == ["active-org", "no-registration-org", "recent-org"]
+
+    fxt_organizations.failing_user_ids.clear()
+    fxt_organizations.calls.clear()
+    report = ActivatedUsers().delete_not_activated_users(days_until_deletion=DAYS_UNTIL_DELETION)
+
+    assert [result.organization_id for result in report.results] == ["expired-org"]
+    assert report.resumed_organizations == 3
+    assert fxt_organizations.calls["user.find"] == 2
+    assert fxt_organizations.organization_statuses["expired-org"] == OrganizationStatus.DELETED
+    assert not path_checkpoint.exists()
+
+
+def test_sweep_checkpoint(tmp_path):
+    path = tmp_path / "checkpoint.json"
+    checkpoint = SweepCheckpoint(path=path, parameters={"days_until_deletion": 30})
+    assert checkpoint.load() == set()
+    checkpoint.mark_completed("org-1")
+    checkpoint.mark_completed("org-2")
+
+    assert SweepCheckpoint(path=path, parameters={"days_until_deletion": 30}).load() == {"org-1", "org-2"}
+    # A checkpoint of a run with other parameters, or too old, is not resumed
+    assert SweepCheckpoint(path=path, parameters={"days_until_deletion": 10}).load() == set()
+    assert SweepCheckpoint(path=path, parameters={"days_until_deletion": 30}, max_age=timedelta(0)).load() == set()
+    path.write_text("{")
+    assert SweepCheckpoint(path=path, parameters={"days_until_deletion": 30}).load() == set()
+
+    checkpoint.clear()
+    assert not path.exists()
+
+
+def test_organization_sweeper_dry_run_ignores_checkpoint(tmp_path):
+    checkpoint = SweepCheckpoint(path=tmp_path / "checkpoint.json", parameters={})
+    checkpoint.mark_completed("org-1")
+
+    report = OrganizationSweeper(
+        sweep_organization=lambda organization_id: OrganizationSweepResult(organization_id=organization_id),
+        workers=2,
+        dry_run=True,
+        checkpoint=checkpoint,
+    ).run(["org-1", "org-2"])
+
+    assert sorted(result.organization_id for result in report.results) == ["org-1", "org-2"]
+    assert json.loads(checkpoint.path.read_text())["completed_organization_ids"] == ["org-1"]